@@ -84,10 +84,100 @@ C64_BASIC_TOKENS = {
     0xCB: "GO"
 }
 
+# Satır başlığı: [link lo] [link hi] [satır no lo] [satır no hi]
+LINE_HEADER_SIZE = 4
+QUOTE = 0x22
+
+
+def hex_code(byte):
+    """Yazdırılamayan byte için varsayılan gösterim: [XX]"""
+    return f"[{byte:02X}]"
+
+
+def build_translation_table(tokens=C64_BASIC_TOKENS, special=hex_code, unknown_token=None):
+    """256 girişli byte → metin çeviri tablosu
+    
+    Args:
+        tokens: Token sözlüğü; None ise token açılmaz (tırnak içi tablo)
+        special: Yazdırılamayan byte'lar için byte → metin fonksiyonu
+        unknown_token: Tabloda olmayan $80+ byte'lar için format (örn. "TOKEN_{:02X}"),
+                       None ise special kullanılır
+    
+    Returns:
+        str.translate ile kullanılabilecek 256 elemanlı liste
+    """
+    table = []
+    for byte in range(256):
+        if tokens is not None and byte in tokens:
+            table.append(tokens[byte])
+        elif tokens is not None and byte >= 0x80 and unknown_token:
+            table.append(unknown_token.format(byte))
+        elif 0x20 <= byte <= 0x7E:
+            table.append(chr(byte))
+        else:
+            table.append(special(byte))
+    return table
+
+
+# Varsayılan tablolar: tırnak dışında token'lar açılır, tırnak içinde açılmaz
+TOKEN_TABLE = build_translation_table()
+QUOTE_TABLE = build_translation_table(tokens=None)
+
+
+def detokenize_line(line_data, token_table=TOKEN_TABLE, quote_table=QUOTE_TABLE):
+    """Tek satırın token byte'larını metne çevir (satır başlığı ve 0 sonlandırıcı hariç)
+    
+    Byte'lar latin-1 ile 1:1 karaktere açılıp tablo ile toplu çevrilir;
+    tırnaklar arasındaki parçalar quote_table ile çevrilir.
+    """
+    text = bytes(line_data).decode('latin-1')
+    if '"' not in text:
+        return text.translate(token_table)
+    parts = text.split('"')
+    return '"'.join(part.translate(quote_table if index & 1 else token_table)
+                    for index, part in enumerate(parts))
+
+
+def iter_basic_lines(data, start=0, token_table=TOKEN_TABLE, quote_table=QUOTE_TABLE):
+    """BASIC satırlarını sırayla üreten generator
+    
+    Args:
+        data: Token'lı BASIC verisi
+        start: İlk satırın data içindeki ofseti (PRG için 2)
+        token_table / quote_table: build_translation_table tabloları
+    
+    Yields:
+        (satır_no, metin, (başlangıç, bitiş)) - data[başlangıç:bitiş] satırın
+        başlık ve 0 sonlandırıcı dahil tokenize hali
+    """
+    data = bytes(data)
+    size = len(data)
+    pos = start
+    while pos + LINE_HEADER_SIZE <= size:
+        if data[pos] == 0 and data[pos + 1] == 0:  # Program sonu
+            break
+        line_number = data[pos + 2] | (data[pos + 3] << 8)
+        text_start = pos + LINE_HEADER_SIZE
+        text_end = data.find(0, text_start)
+        line_end = size if text_end < 0 else text_end + 1
+        if text_end < 0:
+            text_end = size
+        yield (line_number,
+               detokenize_line(data[text_start:text_end], token_table, quote_table),
+               (pos, line_end))
+        pos = line_end
+
+
 class BasicDetokenizer:
     def __init__(self):
         self.tokens = C64_BASIC_TOKENS
+        self.token_table = TOKEN_TABLE
+        self.quote_table = QUOTE_TABLE
         
+    def iter_lines(self, prg_data):
+        """PRG içindeki satırları (satır_no, metin, byte aralığı) olarak akıt"""
+        return iter_basic_lines(prg_data, 2, self.token_table, self.quote_table)
+    
     def detokenize_prg(self, prg_data):
         """PRG dosyasını BASIC koduna çevir"""
         try:
@@ -99,55 +189,7 @@ class BasicDetokenizer:
             if start_address != 0x0801:
                 return [f"ERROR: Not a BASIC program (start: ${start_address:04X}, expected: $0801)"]
             
-            # BASIC program data
-            data = prg_data[2:]  # Skip load address
-            lines = []
-            pos = 0
-            
-            while pos < len(data):
-                # Program end check
-                if pos + 1 < len(data) and data[pos] == 0x00 and data[pos + 1] == 0x00:
-                    break
-                
-                # Line structure: [next_line_addr_lo] [next_line_addr_hi] [line_no_lo] [line_no_hi] [tokens...] [0x00]
-                if pos + 4 >= len(data):
-                    break
-                
-                next_line_addr = data[pos] + (data[pos + 1] << 8)
-                line_number = data[pos + 2] + (data[pos + 3] << 8)
-                
-                # Invalid line
-                if next_line_addr == 0:
-                    break
-                
-                pos += 4  # Skip line header
-                
-                # Extract line tokens
-                line_text = f"{line_number} "
-                
-                while pos < len(data) and data[pos] != 0x00:
-                    byte = data[pos]
-                    
-                    if byte in self.tokens:
-                        # Token
-                        line_text += self.tokens[byte]
-                    elif byte == 0x22:  # Quote
-                        line_text += '"'
-                    elif byte >= 0x20 and byte <= 0x7E:
-                        # Printable ASCII
-                        line_text += chr(byte)
-                    else:
-                        # Non-printable
-                        line_text += f"[{byte:02X}]"
-                    
-                    pos += 1
-                
-                lines.append(line_text)
-                
-                # Skip line terminator
-                if pos < len(data) and data[pos] == 0x00:
-                    pos += 1
-            
+            lines = [f"{line_number} {text}" for line_number, text, _ in self.iter_lines(prg_data)]
             return lines if lines else ["ERROR: No BASIC lines found"]
             
         except Exception as e:
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch Scanner - Paralel disk imajı tarayıcı (headless)
+======================================================
+
+Bir klasör ağacındaki D64/D71/D81/T64/TAP/PRG/P00 dosyalarını bulur;
+imaj okuma, PRG çıkarma, disassembly ve decompile işlerini bir
+ProcessPoolExecutor üzerinden işçi süreçlere dağıtır.
+
+Her imaj bittiği anda çıktıları diske yazılır ve sonucu
+``batch_results.jsonl`` dosyasına bir satır olarak eklenir. Sonunda
+toplam verim (imaj/s, byte/s) ve aşama bazlı süreler raporlanır.
+
+KULLANIM:
+    python batch_scanner.py ./disks -o ./batch_out -j 8 -f asm,c
+    python main.py --batch --input-dir ./disks --output-dir ./batch_out --parallel 8
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_PATTERNS = ["*.d64", "*.d71", "*.d81", "*.t64", "*.tap", "*.prg", "*.p00"]
+DEFAULT_FORMATS = ["asm"]
+SUPPORTED_FORMATS = ["asm", "c", "qbasic", "pdsx", "pseudo", "commodorebasicv2", "sid", "gfx"]
+STAGES = ["read", "directory", "extract", "disassemble", "decompile", "sid", "graphics", "write"]
+RESULTS_FILE = "batch_results.jsonl"
+
+# Decompile çıktı uzantıları
+FORMAT_EXTENSIONS = {
+    "asm": ".asm",
+    "c": ".c",
+    "qbasic": "_qb.bas",
+    "pdsx": ".pdsx",
+    "pseudo": ".txt",
+    "commodorebasicv2": "_v2.bas",
+    "sid": ".sid",
+}
+# Tam metin arama indeksine giren çıktılar
+TEXT_OUTPUT_SUFFIXES = {".asm", ".c", ".bas", ".pdsx", ".txt"}
+
+
+def discover_files(input_dir: str, patterns: Optional[List[str]] = None,
+                   recursive: bool = True) -> List[str]:
+    """Klasör ağacında desenlere uyan dosyaları bulur (büyük/küçük harf duyarsız)."""
+    patterns = [p.strip().lower() for p in (patterns or DEFAULT_PATTERNS) if p.strip()]
+    found = []
+    if recursive:
+        walker = os.walk(input_dir)
+    else:
+        walker = [(input_dir, [], os.listdir(input_dir))]
+    for root, _dirs, files in walker:
+        for name in files:
+            lower = name.lower()
+            if any(fnmatch.fnmatch(lower, pattern) for pattern in patterns):
+                path = os.path.join(root, name)
+                if os.path.isfile(path):
+                    found.append(path)
+    found.sort()
+    return found
+
+
+def _safe_name(name: str) -> str:
+    """Dosya adını dosya sistemi için güvenli hale getirir."""
+    cleaned = re.sub(r'[^A-Za-z0-9._-]+', '_', name).strip('._')
+    return cleaned or "unnamed"
+
+
+def _extract_programs(path: str, timings: Dict[str, float]) -> List[Dict]:
+    """İmajdaki programları çıkarır: [{'name', 'data', 'raw'}] listesi."""
+    from d64_reader import (open_image, read_image, read_directory, read_t64_directory,
+                            read_tap_directory, extract_prg_file, extract_t64_prg,
+                            extract_tap_prg, extract_p00_prg, SECTOR_IMAGE_EXTS)
+
+    programs = []
+    ext = Path(path).suffix.lower()
+    t0 = time.perf_counter()
+
+    if ext in SECTOR_IMAGE_EXTS:
+        # Sektörlü imajlar kopyasız (mmap) açılır
+        image, ext = open_image(path)
+        try:
+            t1 = time.perf_counter()
+            timings["read"] += t1 - t0
+            entries = read_directory(image, ext)
+            t2 = time.perf_counter()
+            timings["directory"] += t2 - t1
+            for entry in entries:
+                if not entry["file_type"].startswith("PRG"):
+                    continue
+                data = extract_prg_file(image, entry["track"], entry["sector"], ext)
+                programs.append({"name": entry["filename"], "data": data, "raw": False})
+            timings["extract"] += time.perf_counter() - t2
+        finally:
+            image.close()
+        return programs
+
+    data, ext = read_image(path)
+    t1 = time.perf_counter()
+    timings["read"] += t1 - t0
+
+    if ext == ".t64":
+        entries = read_t64_directory(data)
+        t2 = time.perf_counter()
+        timings["directory"] += t2 - t1
+        for entry in entries:
+            body = extract_t64_prg(data, entry["offset"], entry["size"])
+            # T64 gövdesinde yükleme adresi yok, PRG başlığını ekle
+            prg = entry["start_addr"].to_bytes(2, "little") + bytes(body)
+            programs.append({"name": entry["filename"], "data": prg, "raw": False})
+        timings["extract"] += time.perf_counter() - t2
+
+    elif ext == ".tap":
+        entries = read_tap_directory(data)
+        t2 = time.perf_counter()
+        timings["directory"] += t2 - t1
+        for entry in entries:
+            # TAP verisi ham pulse verisidir, disassemble edilmez
+            raw = bytes(extract_tap_prg(data, entry["offset"], entry["size"]))
+            programs.append({"name": entry["filename"], "data": raw, "raw": True})
+        timings["extract"] += time.perf_counter() - t2
+
+    elif ext == ".p00":
+        programs.append({"name": Path(path).stem, "data": bytes(extract_p00_prg(data)), "raw": False})
+        timings["extract"] += time.perf_counter() - t1
+
+    else:
+        programs.append({"name": Path(path).stem, "data": bytes(data), "raw": False})
+        timings["extract"] += time.perf_counter() - t1
+    return programs
+
+
+def _convert_program(prg_data: bytes, formats: List[str], timings: Dict[str, float],
+                     use_cache: bool = True) -> Dict[str, str]:
+    """PRG verisini istenen formatlara çevirir: {format: metin}."""
+    from improved_disassembler import ImprovedDisassembler
+    from result_cache import get_default_cache, engines_version
+
+    result_cache = get_default_cache() if use_cache else None
+    start_addr = prg_data[0] | (prg_data[1] << 8)
+    code = prg_data[2:]
+    outputs = {}
+    for fmt in formats:
+        if fmt in ("sid", "gfx"):
+            continue  # SID/grafikler ayrı aşamalarda çıkarılır
+        stage = "disassemble" if fmt == "asm" else "decompile"
+        t0 = time.perf_counter()
+
+        def compute():
+            disassembler = ImprovedDisassembler(start_addr, code, output_format=fmt)
+            return disassembler.disassemble_to_format(code)
+
+        if result_cache:
+            key = result_cache.make_key(prg_data, "improved", fmt,
+                                        tool_version=engines_version(ImprovedDisassembler))
+            outputs[fmt] = result_cache.get_or_compute(key, compute)
+        else:
+            outputs[fmt] = compute()
+        timings[stage] += time.perf_counter() - t0
+    return outputs
+
+
+def _extract_sid_tunes(prg_data: bytes, name: str, timings: Dict[str, float]) -> List[bytes]:
+    """PRG içindeki SID müziklerini PSID v2 dosya içeriği olarak döndürür."""
+    from sid_converter import find_sid_tunes
+
+    t0 = time.perf_counter()
+    tunes = [tune.to_psid() for tune in find_sid_tunes(prg_data, name)]
+    timings["sid"] += time.perf_counter() - t0
+    return tunes
+
+
+def scan_image(path: str, output_dir: str, formats: List[str], use_cache: bool = True) -> Dict:
+    """Tek bir imajı işler ve sonuç sözlüğü döndürür (işçi süreçte çalışır)."""
+    timings = {stage: 0.0 for stage in STAGES}
+    result = {
+        "path": path,
+        "size": 0,
+        "programs": 0,
+        "program_bytes": 0,
+        "outputs": [],
+        "output_formats": {},
+        "errors": [],
+        "timings": timings,
+    }
+    # Motorların konsol çıktısı batch raporunu kirletmesin
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            result["size"] = os.path.getsize(path)
+            programs = _extract_programs(path, timings)
+        except Exception as e:
+            result["errors"].append(f"{type(e).__name__}: {e}")
+            return result
+
+        image_dir = os.path.join(output_dir, _safe_name(Path(path).name))
+        used_names = set()
+        for index, program in enumerate(programs):
+            data = program["data"]
+            result["programs"] += 1
+            result["program_bytes"] += len(data)
+
+            base = _safe_name(program["name"])
+            if base in used_names:
+                base = f"{base}_{index}"
+            used_names.add(base)
+
+            try:
+                outputs = {}
+                sid_files = []
+                if not program["raw"] and len(data) > 2:
+                    outputs = _convert_program(data, formats, timings, use_cache)
+                    if "sid" in formats:
+                        sid_files = _extract_sid_tunes(data, program["name"], timings)
+            except Exception as e:
+                result["errors"].append(f"{program['name']}: {type(e).__name__}: {e}")
+                outputs = {}
+                sid_files = []
+
+            t0 = time.perf_counter()
+            os.makedirs(image_dir, exist_ok=True)
+            prg_path = os.path.join(image_dir, base + (".tap.bin" if program["raw"] else ".prg"))
+            with open(prg_path, "wb") as f:
+                f.write(data)
+            result["outputs"].append(prg_path)
+            for fmt, text in outputs.items():
+                out_path = os.path.join(image_dir, base + FORMAT_EXTENSIONS.get(fmt, "." + fmt))
+                with open(out_path, "w", encoding="utf-8") as f:
+                    f.write(text if isinstance(text, str) else "\n".join(map(str, text)))
+                result["outputs"].append(out_path)
+                result["output_formats"][out_path] = fmt
+            for sid_index, sid_data in enumerate(sid_files):
+                suffix = f"_{sid_index}" if sid_index else ""
+                out_path = os.path.join(image_dir, base + suffix + FORMAT_EXTENSIONS["sid"])
+                with open(out_path, "wb") as f:
+                    f.write(sid_data)
+                result["outputs"].append(out_path)
+                result["output_formats"][out_path] = "sid"
+            timings["write"] += time.perf_counter() - t0
+
+            if "gfx" in formats and not program["raw"] and len(data) > 2:
+                from graphics_extractor import export_prg_graphics
+                t0 = time.perf_counter()
+                try:
+                    for out_path in export_prg_graphics(data, image_dir, base):
+                        result["outputs"].append(out_path)
+                        result["output_formats"][out_path] = "gfx"
+                except Exception as e:
+                    result["errors"].append(f"{program['name']}: gfx: {type(e).__name__}: {e}")
+                timings["graphics"] += time.perf_counter() - t0
+    return result
+
+
+class BatchReport:
+    """Batch çalışmasının verim ve aşama sürelerini toplar."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished = None
+        self.images = 0
+        self.failed = 0
+        self.bytes_read = 0
+        self.programs = 0
+        self.program_bytes = 0
+        self.stage_totals = {stage: 0.0 for stage in STAGES}
+
+    def add(self, result: Dict):
+        self.images += 1
+        if result["errors"]:
+            self.failed += 1
+        self.bytes_read += result["size"]
+        self.programs += result["programs"]
+        self.program_bytes += result["program_bytes"]
+        for stage, seconds in result["timings"].items():
+            self.stage_totals[stage] = self.stage_totals.get(stage, 0.0) + seconds
+
+    def finish(self):
+        self.finished = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return max(end - self.started, 1e-9)
+
+    def as_dict(self) -> Dict:
+        return {
+            "images": self.images,
+            "failed": self.failed,
+            "programs": self.programs,
+            "bytes_read": self.bytes_read,
+            "program_bytes": self.program_bytes,
+            "elapsed": self.elapsed,
+            "images_per_second": self.images / self.elapsed,
+            "bytes_per_second": self.bytes_read / self.elapsed,
+            "stage_totals": dict(self.stage_totals),
+        }
+
+    def format(self) -> str:
+        lines = [
+            "📊 Batch tarama raporu",
+            f"   İmaj: {self.images} (hatalı: {self.failed}), Program: {self.programs}",
+            f"   Okunan: {self.bytes_read} byte, Program verisi: {self.program_bytes} byte",
+            f"   Süre: {self.elapsed:.2f} s",
+            f"   Verim: {self.images / self.elapsed:.1f} imaj/s, "
+            f"{self.bytes_read / self.elapsed / 1024:.1f} KB/s",
+            "   Aşama süreleri (işçi süreleri toplamı):",
+        ]
+        for stage in STAGES:
+            lines.append(f"      {stage:<12} {self.stage_totals.get(stage, 0.0):8.3f} s")
+        return "\n".join(lines)
+
+
+def run_batch(input_dir: str, output_dir: str, formats: Optional[List[str]] = None,
+              patterns: Optional[List[str]] = None, recursive: bool = True,
+              workers: Optional[int] = None, progress=None,
+              use_cache: bool = True, track_db: Optional[str] = None) -> BatchReport:
+    """
+    Klasördeki tüm imajları paralel işler.
+
+    Args:
+        input_dir: Taranacak klasör
+        output_dir: Çıktı klasörü (batch_results.jsonl buraya yazılır)
+        formats: Çıktı formatları ('asm', 'c', 'qbasic', 'pdsx', ...)
+        patterns: Dosya desenleri (None ise DEFAULT_PATTERNS)
+        recursive: Alt klasörlere de in
+        workers: İşçi süreç sayısı (None ise CPU sayısı, 1 ise süreç havuzu kullanılmaz)
+        progress: Her sonuç için çağrılan fonksiyon (result, done, total)
+        use_cache: Çıktılar için logs/result_cache.db önbelleğini kullan
+        track_db: Verilirse her imaj ve çıktı DatabaseManager ile bu veritabanına
+                  kaydedilir (toplu transaction'larla, ana süreçte)
+
+    Returns:
+        BatchReport
+    """
+    formats = formats or DEFAULT_FORMATS
+    unknown = [fmt for fmt in formats if fmt not in SUPPORTED_FORMATS]
+    if unknown:
+        raise ValueError(f"Desteklenmeyen format: {unknown}. Desteklenen: {SUPPORTED_FORMATS}")
+    if "gfx" in formats:
+        from graphics_extractor import PIL_AVAILABLE
+        if not PIL_AVAILABLE:
+            raise ValueError("gfx formatı PNG yazmak için Pillow gerektirir")
+
+    files = discover_files(input_dir, patterns, recursive)
+    os.makedirs(output_dir, exist_ok=True)
+    report = BatchReport()
+    total = len(files)
+    database = None
+    if track_db:
+        from database_manager import DatabaseManager
+        database = DatabaseManager(track_db)
+
+    with open(os.path.join(output_dir, RESULTS_FILE), "w", encoding="utf-8") as results_file:
+        def record(result):
+            report.add(result)
+            if database:
+                _track_result(database, result)
+            results_file.write(json.dumps(result, ensure_ascii=False) + "\n")
+            results_file.flush()
+            if progress:
+                progress(result, report.images, total)
+
+        if workers == 1 or total <= 1:
+            for path in files:
+                record(scan_image(path, output_dir, formats, use_cache))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(scan_image, path, output_dir, formats, use_cache): path
+                           for path in files}
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {
+                            "path": futures[future], "size": 0, "programs": 0,
+                            "program_bytes": 0, "outputs": [], "output_formats": {},
+                            "errors": [f"{type(e).__name__}: {e}"],
+                            "timings": {stage: 0.0 for stage in STAGES},
+                        }
+                    record(result)
+
+    if database:
+        database.close()
+    report.finish()
+    return report
+
+
+def _track_result(database, result: Dict):
+    """
+    Batch sonucunu işlenmiş dosyalar veritabanına kaydeder.
+
+    Her çıkarılan .prg ayrı program olarak kaydedilir (referans/byte
+    indeksi); ardından gelen metin çıktıları o programın dönüşümleri olarak
+    tam metin arama indeksine girer.
+    """
+    path = result["path"]
+    file_id = database.add_processed_file(
+        Path(path).name, path, Path(path).suffix.lstrip(".").upper() or "BIN",
+        notes=f"batch: {result['programs']} program")
+    outputs = result["outputs"]
+    output_formats = result.get("output_formats", {})
+    elapsed = sum(result["timings"].values())
+    program_id = file_id
+    for out_path in outputs:
+        suffix = Path(out_path).suffix.lower()
+        if suffix == ".prg":
+            with open(out_path, "rb") as f:
+                data = f.read()
+            load_address = data[0] | (data[1] << 8) if len(data) > 1 else None
+            program_id = database.add_processed_file(
+                Path(out_path).name, out_path, "PRG", load_address,
+                notes=f"batch: {Path(path).name}", data=data)
+            continue
+        size = os.path.getsize(out_path) if os.path.exists(out_path) else 0
+        output_text = None
+        if suffix in TEXT_OUTPUT_SUFFIXES:
+            with open(out_path, encoding="utf-8", errors="replace") as f:
+                output_text = f.read()
+        # Uzantı değil istenen format anahtarı (qbasic/commodorebasicv2 ikisi de .bas)
+        target_format = output_formats.get(out_path, suffix.lstrip("."))
+        database.add_format_conversion(program_id, target_format, True,
+                                       size, elapsed / len(outputs), output_path=out_path,
+                                       output_text=output_text)
+    for error in result["errors"]:
+        database.add_format_conversion(file_id, "batch", False, error_message=error)
+
+
+def _print_progress(result, done, total):
+    status = "❌" if result["errors"] else "✅"
+    print(f"{status} [{done}/{total}] {result['path']} - {result['programs']} program")
+
+
+def main(argv=None) -> bool:
+    parser = argparse.ArgumentParser(description="Paralel C64 disk imajı tarayıcı")
+    parser.add_argument("input_dir", help="Taranacak klasör")
+    parser.add_argument("--output-dir", "-o", default="batch_output", help="Çıktı klasörü")
+    parser.add_argument("--formats", "-f", default=",".join(DEFAULT_FORMATS),
+                        help=f"Virgülle ayrılmış formatlar ({', '.join(SUPPORTED_FORMATS)})")
+    parser.add_argument("--file-filter", default=",".join(DEFAULT_PATTERNS),
+                        help="Virgülle ayrılmış dosya desenleri")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="İşçi süreç sayısı")
+    parser.add_argument("--no-recursive", action="store_true", help="Alt klasörlere inme")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Dosya bazlı ilerlemeyi gösterme")
+    parser.add_argument("--no-cache", action="store_true", help="Result cache kullanma")
+    parser.add_argument("--track-db", default=None,
+                        help="Sonuçları bu SQLite veritabanına kaydet (ör. logs/processed_files.db)")
+    args = parser.parse_args(argv)
+
+    report = run_batch(
+        args.input_dir,
+        args.output_dir,
+        formats=[fmt.strip() for fmt in args.formats.split(",") if fmt.strip()],
+        patterns=args.file_filter.split(","),
+        recursive=not args.no_recursive,
+        workers=args.jobs,
+        progress=None if args.quiet else _print_progress,
+        use_cache=not args.no_cache,
+        track_db=args.track_db,
+    )
+    print(report.format())
+    return report.failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -7,6 +7,8 @@ import struct
 import os
 from pathlib import Path
 
+from disk_geometry import sector_offset, block_to_track_sector, sectors_in_track
+
 class C1541PythonEmulator:
     def __init__(self):
         # C1541 sabitler
@@ -98,47 +100,30 @@ class C1541PythonEmulator:
     
     def get_sectors_per_track(self, track):
         """Track'teki sector sayısını döndür"""
-        area = self.get_track_area(track)
-        if area >= 0:
-            return self.TRACK_AREA_SectorsPerTrack[area]
-        return 0
+        return sectors_in_track(track, "d64")
     
     def track_sector_to_logical_position(self, track, sector):
-        """Track/Sector'u logical pozisyona çevir"""
-        if track < self.FIRST_TRACK or track >= self.END_TRACK:
-            return -1
-        
-        position = 0
-        
-        # Önceki track'lerin pozisyonunu hesapla
-        for t in range(self.FIRST_TRACK, track):
-            position += self.get_sectors_per_track(t) * self.BLOCK_SIZE
-        
-        # Sector pozisyonu ekle
-        position += sector * self.BLOCK_SIZE
-        
-        return position
+        """Track/Sector'u logical pozisyona çevir (disk_geometry tablosundan)"""
+        return sector_offset(track, sector, "d64")
     
     def logical_position_to_track_sector(self, position):
         """Logical pozisyonu track/sector'a çevir"""
-        current_pos = 0
-        
-        for track in range(self.FIRST_TRACK, self.END_TRACK):
-            sectors_per_track = self.get_sectors_per_track(track)
-            track_size = sectors_per_track * self.BLOCK_SIZE
-            
-            if current_pos + track_size > position:
-                # Bu track'te
-                sector_offset = position - current_pos
-                sector = sector_offset // self.BLOCK_SIZE
-                return track, sector
-            
-            current_pos += track_size
-        
-        return -1, -1
+        if position < 0:
+            return -1, -1
+        return block_to_track_sector(position // self.BLOCK_SIZE, "d64")
+    
+    @staticmethod
+    def _as_view(disk_data):
+        """disk_data'yı kopyalamadan memoryview'e çevir (bytes, bytearray, mmap, DiskImage)"""
+        if isinstance(disk_data, memoryview):
+            return disk_data
+        view = getattr(disk_data, "view", None)
+        if isinstance(view, memoryview):
+            return view
+        return memoryview(disk_data)
     
     def read_block(self, disk_data, track, sector):
-        """Disk'ten blok oku"""
+        """Disk'ten blok oku (memoryview verilirse kopyasız dilim döner)"""
         position = self.track_sector_to_logical_position(track, sector)
         if position < 0 or position + self.BLOCK_SIZE > len(disk_data):
             return None
@@ -148,6 +133,7 @@ class C1541PythonEmulator:
     def read_directory(self, disk_data):
         """Directory'yi oku"""
         entries = []
+        disk_data = self._as_view(disk_data)
         
         # Directory track 18, sector 1'den başlar
         track = 18
@@ -209,7 +195,9 @@ class C1541PythonEmulator:
     
     def read_file_data(self, disk_data, start_track, start_sector):
         """Dosya verisini oku"""
-        file_data = bytearray()
+        disk_data = self._as_view(disk_data)
+        # Bloklar memoryview olarak toplanır, tek kopya sondaki join'de yapılır
+        blocks = []
         track = start_track
         sector = start_sector
         
@@ -228,18 +216,19 @@ class C1541PythonEmulator:
                 # Son blok - sadece kullanılan byte'lar
                 used_bytes = next_sector - 1 if next_sector > 0 else 0
                 if used_bytes > 0:
-                    file_data.extend(block[2:2 + used_bytes])
+                    blocks.append(block[2:2 + used_bytes])
             else:
                 # Tam blok
-                file_data.extend(block[2:])
+                blocks.append(block[2:])
             
             track = next_track
             sector = next_sector
         
-        return bytes(file_data)
+        return b"".join(blocks)
     
     def read_bam(self, disk_data):
         """BAM (Block Availability Map) oku"""
+        disk_data = self._as_view(disk_data)
         bam_block = self.read_block(disk_data, 18, 0)
         if not bam_block:
             return None
@@ -31,10 +31,19 @@ Format-specific bilgi sağlama (C, QBasic, Python, Assembly)
 import json
 import os
 import re
-from typing import Dict, List, Optional, Tuple, Any, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 
+from c64_knowledge_base import get_knowledge_base, operand_addresses, parse_address
+
+# Satırdaki $XXXX adres literalleri
+ADDRESS_LITERAL = re.compile(r'\$([0-9A-Fa-f]+)')
+
+# Bilgi seviyesi başına önbelleğe alınan yorum sayısı
+COMMENT_CACHE_SIZE = 4096
+
 class KnowledgeLevel(Enum):
     """Bilgi verme seviyesi enumeration'ı"""
     NATURAL = "natural"          # Minimal bilgi, temiz kod
@@ -130,6 +139,12 @@ class EnhancedC64KnowledgeManager:
         print(f"📂 ROM Data Path: {self.rom_data_path}")
         print(f"🎯 Knowledge Level: {knowledge_level.value.upper()}")
         
+        # Derlenmiş ikili bilgi tabanı - int adresle O(1) arama
+        self.knowledge_base = get_knowledge_base(self.rom_data_path)
+        
+        # (hex adres, seviye) -> formatlanmış satır yorumu
+        self._address_comment = lru_cache(maxsize=COMMENT_CACHE_SIZE)(self._build_address_comment)
+        
         # TÜM VERİLERİ KAPSAMLI OLARAK YÜK
         self._load_all_comprehensive_data()
         self._print_comprehensive_stats()
@@ -461,7 +476,13 @@ class EnhancedC64KnowledgeManager:
         if knowledge_level is None:
             knowledge_level = self.knowledge_level
             
-        addr = self._normalize_address(address)
+        if self.knowledge_base:
+            record = self._lookup_knowledge_base(address)
+            if record:
+                return self._format_address_info(self._address_info_from_record(record),
+                                                 knowledge_level, record['source'])
+        
+        addr = self._normalize_address(str(address))
         
         # Tüm veri kaynaklarını kontrol et
         info_sources = [
@@ -486,6 +507,32 @@ class EnhancedC64KnowledgeManager:
                 
         return None
         
+    def _lookup_knowledge_base(self, address: Union[str, int]) -> Optional[Dict[str, Any]]:
+        """Derlenmiş bilgi tabanında ara - sembol veya tam başlangıç adresindeki bölge"""
+        address_int = parse_address(address)
+        if address_int is None:
+            return None
+        record = self.knowledge_base.symbol(address_int)
+        if record is None:
+            region = self.knowledge_base.region(address_int)
+            if region and region['start'] == address_int:
+                record = region
+        return record
+        
+    def _address_info_from_record(self, record: Dict[str, Any]) -> AddressInfo:
+        """Bilgi tabanı kaydını AddressInfo'ya dönüştür"""
+        return AddressInfo(
+            name=record['name'],
+            address=record['address'],
+            size=record.get('size', record['end'] - record['start'] + 1),
+            description=record.get('description', ''),
+            usage=record.get('usage', ''),
+            detailed_info=record.get('detailed_info'),
+            bit_info=record.get('bit_info') or record.get('bits'),
+            example=record.get('example'),
+            source_file=record['source_file'].rsplit('/', 1)[-1]
+        )
+        
     def _format_address_info(self, info: AddressInfo, level: KnowledgeLevel, source: str) -> str:
         """Adres bilgisini seviyeye göre formatla"""
         if level == KnowledgeLevel.NATURAL:
@@ -593,22 +640,11 @@ class EnhancedC64KnowledgeManager:
             return enhanced_line
             
         # Assembly adreslerini bul ve açıkla
-        addresses = re.findall(r'\$([0-9A-Fa-f]+)', enhanced_line)
         comments = []
-        
-        for addr_hex in addresses:
-            addr = f"${addr_hex.upper()}"
-            addr_info = self.get_comprehensive_address_info(addr, knowledge_level)
-            if addr_info:
-                if knowledge_level == KnowledgeLevel.DEBUG:
-                    comments.append(f"{addr}: {addr_info}")
-                else:
-                    # Kısa versiyon
-                    info_parts = addr_info.split(':')
-                    if len(info_parts) >= 2:
-                        comments.append(f"{addr}={info_parts[0].strip()}")
-                    else:
-                        comments.append(f"{addr}={addr_info[:30]}...")
+        for addr_hex in ADDRESS_LITERAL.findall(enhanced_line):
+            comment = self._address_comment(addr_hex.upper(), knowledge_level)
+            if comment:
+                comments.append(comment)
                         
         # Yorumları satıra ekle
         if comments:
@@ -622,6 +658,48 @@ class EnhancedC64KnowledgeManager:
                 
         return enhanced_line
         
+    def annotate_listing(self, instructions: Sequence, knowledge_level: KnowledgeLevel = None) -> List[str]:
+        """
+        Disassembly listesini toplu yorumla - enhance_assembly_line'ın
+        metin ayrıştırmayan karşılığı
+        
+        Args:
+            instructions: Disassembler'dan (adres, opcode, operand, mod)
+                kayıtları veya operand int/None değerleri
+            knowledge_level: Bilgi verme seviyesi
+            
+        Returns:
+            Her instruction için yorum ("" = yorum yok)
+        """
+        if knowledge_level is None:
+            knowledge_level = self.knowledge_level
+        if knowledge_level == KnowledgeLevel.NATURAL:
+            return [""] * len(instructions)
+        
+        addresses = operand_addresses(instructions)
+        # Her farklı adres bir kez aranır
+        comments = {}
+        for address in set(addresses):
+            if address is not None:
+                addr_hex = f"{address:02X}" if address < 0x100 else f"{address:04X}"
+                comments[address] = self._address_comment(addr_hex, knowledge_level) or ""
+        comments[None] = ""
+        return [comments[address] for address in addresses]
+        
+    def _build_address_comment(self, addr_hex: str, knowledge_level: KnowledgeLevel) -> Optional[str]:
+        """Tek adres için satır yorumu üret (lru_cache ile sarılır)"""
+        addr = f"${addr_hex}"
+        addr_info = self.get_comprehensive_address_info(addr, knowledge_level)
+        if not addr_info:
+            return None
+        if knowledge_level == KnowledgeLevel.DEBUG:
+            return f"{addr}: {addr_info}"
+        # Kısa versiyon
+        info_parts = addr_info.split(':')
+        if len(info_parts) >= 2:
+            return f"{addr}={info_parts[0].strip()}"
+        return f"{addr}={addr_info[:30]}..."
+        
     def enhance_basic_line(self, line: str, knowledge_level: KnowledgeLevel = None) -> str:
         """
         BASIC satırını bilgi ile zenginleştir
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+C64 Knowledge Base - Derlenmiş ikili adres bilgi tabanı
+======================================================
+
+c64_rom_data/ altındaki JSON dosyaları (zero page, KERNAL, BASIC, I/O,
+VIC-II, memory map) tek bir ikili dosyaya derlenir:
+
+    başlık | sembol indeksi (65536 x uint32) | bölge indeksi (65536 x uint32) | string tablosu
+
+Her indeks slotu string tablosundaki kayda (ofset + 1, 0 = boş) işaret eder.
+Kayıt: <uint16 isim uzunluğu><uint32 json uzunluğu><isim><json>.
+Dosya mmap ile tembel açılır; int adresle O(1) arama yapılır, JSON yalnızca
+istenen kayıt için çözülür.
+
+Kaynak dosyalar değişince (boyut/mtime parmak izi) dosya otomatik yeniden
+derlenir. Elle derlemek için:
+
+    python c64_knowledge_base.py [rom_data_dir] [output]
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import opcode_decoder
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_ROM_DATA_DIR = os.path.join(MODULE_DIR, "c64_rom_data")
+KNOWLEDGE_BASE_FILENAME = "c64_knowledge.bin"
+
+MAGIC = b"C64KB\x00"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<6sH16sI")    # magic, sürüm, kaynak parmak izi, kayıt sayısı
+RECORD_HEADER = struct.Struct("<HI")  # isim uzunluğu, json uzunluğu
+SLOT = struct.Struct("<I")
+ADDRESS_SPACE = 0x10000
+INDEX_SIZE = ADDRESS_SPACE * SLOT.size
+SYMBOL_INDEX_OFFSET = HEADER.size
+REGION_INDEX_OFFSET = SYMBOL_INDEX_OFFSET + INDEX_SIZE
+STRINGS_OFFSET = REGION_INDEX_OFFSET + INDEX_SIZE
+
+# Tekil adres/aralık kaynakları - aynı genişlikte tanımlarda öncelik sırasıyla
+SYMBOL_SOURCES = (
+    ("zeropage/zeropage_vars.json", "zeropage", "Zero Page"),
+    ("zeropage/system_pointers.json", "system_pointer", "System Pointers"),
+    ("memory_maps/special_addresses.json", "special_address", "Special Addresses"),
+    ("kernal/kernal_functions.json", "kernal", "KERNAL"),
+    ("kernal/kernal_routines.json", "kernal", "KERNAL Routines"),
+    ("basic/basic_functions.json", "basic", "BASIC"),
+    ("basic/basic_routines.json", "basic", "BASIC Routines"),
+    ("hardware/vic_registers.json", "hardware", "VIC-II"),
+    ("kernal/io_registers.json", "io_register", "I/O Registers"),
+)
+
+# Genel amaçlı adlar - yalnızca başka kaynağın tanımlamadığı adresleri doldurur
+FALLBACK_SYMBOL_SOURCES = (
+    ("zeropage/user_zeropage.json", "zeropage", "User Zero Page"),
+)
+
+# end_addr alanlı bellek bölgeleri - küçük bölge büyüğün üzerine yazılır
+REGION_SOURCES = (
+    ("memory_maps/c64_memory_map.json", "memory_area", "Memory Map"),
+    ("memory_maps/memory_areas.json", "memory_area", "Memory Areas"),
+)
+
+# Operandı bellek adresi olmayan modlar - yorumlanmaz
+NON_ADDRESS_MODES = frozenset((opcode_decoder.IMP, opcode_decoder.ACC, opcode_decoder.IMM))
+
+_ADDRESS_KEY = re.compile(r"^\$([0-9A-Fa-f]{1,4})(?:\s*-\s*\$([0-9A-Fa-f]{1,4}))?$")
+
+
+def parse_address(value, strict: bool = False) -> Optional[int]:
+    """
+    '$D020', '0xD020', '53280' veya int -> int adres (geçersizse None)
+
+    strict=True iken önek almamış hex ('D020', 'ADD') adres sayılmaz;
+    böylece sembol adlarıyla karışmaz.
+    """
+    if isinstance(value, int):
+        return value if 0 <= value < ADDRESS_SPACE else None
+    if not isinstance(value, str):
+        return None
+    text = value.strip().upper()
+    try:
+        if text.startswith("$"):
+            address = int(text[1:], 16)
+        elif text.startswith("0X"):
+            address = int(text[2:], 16)
+        elif text.isdigit():
+            address = int(text)
+        elif strict:
+            return None
+        else:
+            address = int(text, 16)
+    except ValueError:
+        return None
+    return address if 0 <= address < ADDRESS_SPACE else None
+
+
+def operand_addresses(instructions: Sequence) -> List[Optional[int]]:
+    """
+    Disassembler kayıtlarından yorumlanacak adresleri çıkar
+
+    Args:
+        instructions: (adres, opcode, operand, mod) kayıtları veya operand
+            int/None değerleri
+
+    Returns:
+        Her instruction için hedef adres; immediate/implied operandlar ve
+        operandsız instruction'lar için None. Branch'lerde hedef adres
+        hesaplanır.
+    """
+    addresses = []
+    append = addresses.append
+    non_address = NON_ADDRESS_MODES
+    relative = opcode_decoder.REL
+    for instruction in instructions:
+        if instruction is None or isinstance(instruction, int):
+            append(instruction)
+            continue
+        address, _, operand, mode = instruction
+        if operand is None or mode in non_address:
+            append(None)
+        elif mode == relative:
+            append((address + 2 + (operand - 256 if operand & 0x80 else operand)) & 0xFFFF)
+        else:
+            append(operand)
+    return addresses
+
+
+def _parse_key(key: str) -> Optional[Tuple[int, int]]:
+    """'$002B' veya '$002B-$002C' anahtarını (başlangıç, bitiş) aralığına çevir"""
+    match = _ADDRESS_KEY.match(key.strip())
+    if not match:
+        return None
+    start = int(match.group(1), 16)
+    end = int(match.group(2), 16) if match.group(2) else start
+    return (start, end) if start <= end else None
+
+
+def _source_files(rom_data_dir: Path) -> List[Path]:
+    sources = SYMBOL_SOURCES + FALLBACK_SYMBOL_SOURCES + REGION_SOURCES
+    return [rom_data_dir / relative for relative, _, _ in sources]
+
+
+def source_fingerprint(rom_data_dir) -> bytes:
+    """Kaynak JSON dosyalarının yol/boyut/mtime özeti (16 byte)"""
+    rom_data_dir = Path(rom_data_dir)
+    digest = hashlib.md5(f"v{FORMAT_VERSION}".encode())
+    for path in _source_files(rom_data_dir):
+        try:
+            stat = path.stat()
+            digest.update(f"{path.name}|{stat.st_size}|{stat.st_mtime_ns};".encode())
+        except OSError:
+            digest.update(f"{path.name}|-;".encode())
+    return digest.digest()
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️ {path.name} derlenemedi: {e}")
+        return {}
+
+
+_aliases: Dict[str, Dict[str, Tuple[int, ...]]] = {}
+_aliases_lock = threading.Lock()
+
+
+def symbol_addresses(name: str, rom_data_dir=DEFAULT_ROM_DATA_DIR) -> Tuple[int, ...]:
+    """
+    Sembol adına karşılık gelen adresler (büyük/küçük harf duyarsız)
+
+    İkili tabanda her adres için tek ad tutulur ($FFD2 -> BSOUT); burada
+    tüm kaynaklardaki adlar diğer adlar olarak da çözülür (CHROUT -> $FFD2).
+    """
+    rom_data_dir = str(rom_data_dir)
+    with _aliases_lock:
+        aliases = _aliases.get(rom_data_dir)
+        if aliases is None:
+            collected: Dict[str, set] = {}
+            for relative, _, _ in SYMBOL_SOURCES + FALLBACK_SYMBOL_SOURCES:
+                for key, entry in _load_json(Path(rom_data_dir) / relative).items():
+                    span = _parse_key(key)
+                    if not span or not isinstance(entry, dict) or not entry.get("name"):
+                        continue
+                    collected.setdefault(str(entry["name"]).upper(), set()).add(span[0])
+            aliases = {alias: tuple(sorted(addresses)) for alias, addresses in collected.items()}
+            _aliases[rom_data_dir] = aliases
+    return aliases.get(name.strip().upper(), ())
+
+
+def compile_knowledge_base(rom_data_dir=DEFAULT_ROM_DATA_DIR, output_path=None) -> str:
+    """
+    c64_rom_data JSON dosyalarını ikili bilgi tabanına derle
+
+    Args:
+        rom_data_dir: c64_rom_data klasörü
+        output_path: Çıktı dosyası (None ise rom_data_dir/c64_knowledge.bin)
+
+    Returns:
+        Yazılan dosyanın yolu
+    """
+    rom_data_dir = Path(rom_data_dir)
+    output_path = str(output_path or rom_data_dir / KNOWLEDGE_BASE_FILENAME)
+
+    strings = bytearray()
+    record_offsets: Dict[bytes, int] = {}
+
+    def add_record(name: str, record: Dict[str, Any]) -> int:
+        name_bytes = name.encode("utf-8")
+        json_bytes = json.dumps(record, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        key = name_bytes + b"\x00" + json_bytes
+        if key not in record_offsets:
+            record_offsets[key] = len(strings) + 1
+            strings.extend(RECORD_HEADER.pack(len(name_bytes), len(json_bytes)))
+            strings.extend(name_bytes)
+            strings.extend(json_bytes)
+        return record_offsets[key]
+
+    def make_record(key, entry, start, end, entry_type, source, relative):
+        record = dict(entry)
+        record.setdefault("description", "")
+        record.setdefault("address", key)
+        if "type" in record:
+            record["memory_type"] = record.pop("type")
+        record.update({
+            "type": entry_type,
+            "source": source,
+            "source_file": relative,
+            "start": start,
+            "end": end,
+        })
+        name = str(entry.get("name") or f"{entry_type}_{start:04X}")
+        record["name"] = name
+        return name, record
+
+    entries = []
+    for relative, entry_type, source in SYMBOL_SOURCES:
+        for key, entry in _load_json(rom_data_dir / relative).items():
+            span = _parse_key(key)
+            if not span or not isinstance(entry, dict):
+                continue
+            start, end = span
+            entries.append((end - start, len(entries), key, entry, start, end,
+                            entry_type, source, relative))
+
+    symbols = [0] * ADDRESS_SPACE
+    # Geniş aralıklar önce yazılır, dar (daha özel) tanımlar üzerine yazar;
+    # eşit genişlikte önce listelenen kaynak en son yazılır ve kazanır
+    for _, _, key, entry, start, end, entry_type, source, relative in sorted(entries, reverse=True,
+                                                                             key=lambda e: e[:2]):
+        offset = add_record(*make_record(key, entry, start, end, entry_type, source, relative))
+        symbols[start:end + 1] = [offset] * (end - start + 1)
+
+    for relative, entry_type, source in FALLBACK_SYMBOL_SOURCES:
+        for key, entry in _load_json(rom_data_dir / relative).items():
+            span = _parse_key(key)
+            if not span or not isinstance(entry, dict):
+                continue
+            start, end = span
+            if any(symbols[start:end + 1]):
+                continue
+            offset = add_record(*make_record(key, entry, start, end, entry_type, source, relative))
+            symbols[start:end + 1] = [offset] * (end - start + 1)
+
+    regions = []
+    for relative, entry_type, source in REGION_SOURCES:
+        for key, entry in _load_json(rom_data_dir / relative).items():
+            span = _parse_key(key)
+            if not span or not isinstance(entry, dict):
+                continue
+            start = span[0]
+            end = parse_address(entry.get("end_addr", span[1]))
+            if end is None or end < start:
+                end = span[1]
+            regions.append((end - start, len(regions), key, entry, start, end,
+                            entry_type, source, relative))
+
+    region_slots = [0] * ADDRESS_SPACE
+    # Büyük bölgeler önce yazılır, küçük (daha özel) bölgeler üzerine yazar;
+    # eşit boyutta önce listelenen kaynak en son yazılır ve kazanır
+    for _, _, key, entry, start, end, entry_type, source, relative in sorted(regions, reverse=True,
+                                                                             key=lambda r: r[:2]):
+        offset = add_record(*make_record(key, entry, start, end, entry_type, source, relative))
+        region_slots[start:end + 1] = [offset] * (end - start + 1)
+
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, source_fingerprint(rom_data_dir), len(record_offsets)))
+        f.write(struct.pack(f"<{ADDRESS_SPACE}I", *symbols))
+        f.write(struct.pack(f"<{ADDRESS_SPACE}I", *region_slots))
+        f.write(strings)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+class KnowledgeBase:
+    """
+    Derlenmiş bilgi tabanı okuyucusu
+
+    Dosya ilk aramada mmap ile açılır; sembol/bölge aramaları int adresle
+    indeks slotunu okur. Çözülen kayıtlar ofset bazında önbelleklenir.
+    """
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        self._file = None
+        self._map = None
+        self._records: Dict[int, Dict[str, Any]] = {}
+        self._names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def _open(self) -> mmap.mmap:
+        if self._map is None:
+            with self._lock:
+                if self._map is None:
+                    self._file = open(self.path, "rb")
+                    mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                    magic, version, _, _ = HEADER.unpack_from(mapped, 0)
+                    if magic != MAGIC or version != FORMAT_VERSION:
+                        mapped.close()
+                        self._file.close()
+                        self._file = None
+                        raise ValueError(f"Geçersiz bilgi tabanı dosyası: {self.path}")
+                    self._map = mapped
+        return self._map
+
+    @property
+    def fingerprint(self) -> bytes:
+        return HEADER.unpack_from(self._open(), 0)[2]
+
+    @property
+    def record_count(self) -> int:
+        return HEADER.unpack_from(self._open(), 0)[3]
+
+    def _slot(self, index_offset: int, address: int) -> int:
+        if not 0 <= address < ADDRESS_SPACE:
+            return 0
+        return SLOT.unpack_from(self._open(), index_offset + address * SLOT.size)[0]
+
+    def _name_at(self, slot: int) -> str:
+        name = self._names.get(slot)
+        if name is None:
+            data = self._open()
+            position = STRINGS_OFFSET + slot - 1
+            name_length, _ = RECORD_HEADER.unpack_from(data, position)
+            start = position + RECORD_HEADER.size
+            name = data[start:start + name_length].decode("utf-8")
+            self._names[slot] = name
+        return name
+
+    def _record_at(self, slot: int) -> Dict[str, Any]:
+        record = self._records.get(slot)
+        if record is None:
+            data = self._open()
+            position = STRINGS_OFFSET + slot - 1
+            name_length, json_length = RECORD_HEADER.unpack_from(data, position)
+            start = position + RECORD_HEADER.size + name_length
+            record = json.loads(data[start:start + json_length].decode("utf-8"))
+            self._records[slot] = record
+        return record
+
+    def symbol(self, address: int) -> Optional[Dict[str, Any]]:
+        """Adresi kapsayan sembol kaydı (zero page, KERNAL, BASIC, I/O...)"""
+        slot = self._slot(SYMBOL_INDEX_OFFSET, address)
+        return self._record_at(slot) if slot else None
+
+    def region(self, address: int) -> Optional[Dict[str, Any]]:
+        """Adresi kapsayan en küçük bellek bölgesi kaydı"""
+        slot = self._slot(REGION_INDEX_OFFSET, address)
+        return self._record_at(slot) if slot else None
+
+    def name(self, address: int) -> Optional[str]:
+        """Sembol adı - JSON çözmeden hızlı yol"""
+        slot = self._slot(SYMBOL_INDEX_OFFSET, address)
+        return self._name_at(slot) if slot else None
+
+    def lookup(self, address: int) -> Optional[Dict[str, Any]]:
+        """Önce sembol, yoksa bölge kaydı"""
+        return self.symbol(address) or self.region(address)
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._records.clear()
+            self._names.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def is_stale(path, rom_data_dir=DEFAULT_ROM_DATA_DIR) -> bool:
+    """Dosya yoksa, bozuksa veya kaynaklar değiştiyse True"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        magic, version, fingerprint, _ = HEADER.unpack(header)
+    except (OSError, struct.error):
+        return True
+    return (magic != MAGIC or version != FORMAT_VERSION
+            or fingerprint != source_fingerprint(rom_data_dir))
+
+
+_instances: Dict[str, KnowledgeBase] = {}
+_instances_lock = threading.Lock()
+
+
+def get_knowledge_base(rom_data_dir=DEFAULT_ROM_DATA_DIR, path=None) -> Optional[KnowledgeBase]:
+    """
+    Paylaşılan bilgi tabanı örneği - gerekirse önce derlenir
+
+    Derleme veya açma başarısız olursa None döner; çağıranlar JSON
+    yüklemesine geri döner.
+    """
+    path = str(path or Path(rom_data_dir) / KNOWLEDGE_BASE_FILENAME)
+    with _instances_lock:
+        instance = _instances.get(path)
+        if instance is not None:
+            return instance
+        if not os.path.isdir(rom_data_dir):
+            return None
+        try:
+            if is_stale(path, rom_data_dir):
+                compile_knowledge_base(rom_data_dir, path)
+            instance = KnowledgeBase(path)
+            instance._open()
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Bilgi tabanı kullanılamıyor: {e}")
+            return None
+        _instances[path] = instance
+        return instance
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    rom_dir = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_ROM_DATA_DIR
+    output = sys.argv[2] if len(sys.argv) > 2 else None
+    started = time.perf_counter()
+    written = compile_knowledge_base(rom_dir, output)
+    elapsed = time.perf_counter() - started
+    with KnowledgeBase(written) as kb:
+        print(f"✅ {written}: {kb.record_count} kayıt, {os.path.getsize(written)} byte, "
+              f"{elapsed * 1000:.1f} ms")
+        for address in (0x002B, 0xD020, 0xFFD2, 0xA000, 0xC000):
+            record = kb.lookup(address)
+            print(f"   ${address:04X}: {record['name'] if record else '-'}")
@@ -27,10 +27,13 @@ UYARI: Bu dosya artık Enhanced C64 Knowledge Manager'ı kullanır
 import json
 import os
 import re
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from c64_knowledge_base import get_knowledge_base, operand_addresses, parse_address
+
 # Enhanced C64 Knowledge Manager'ı import et
 from c64_enhanced_knowledge_manager import (
     EnhancedC64KnowledgeManager, 
@@ -40,6 +43,12 @@ from c64_enhanced_knowledge_manager import (
     OpcodeInfo
 )
 
+# Satırdaki adres literalleri: $00, $D000, 0x00, 0xD000
+ADDRESS_LITERAL = re.compile(r'(?:\$|0x)([0-9A-Fa-f]{1,4})\b')
+
+# Bilgi seviyesi başına önbelleğe alınan yorum sayısı
+COMMENT_CACHE_SIZE = 4096
+
 # Geriye uyumluluk için alias oluştur
 C64KnowledgeManager = EnhancedC64KnowledgeManager
 
@@ -130,6 +139,12 @@ class C64KnowledgeManager:
         self.cia_registers: Dict[str, AddressInfo] = {}
         self.basic_tokens: Dict[str, str] = {}
         
+        # Derlenmiş ikili bilgi tabanı - int adresle O(1) arama
+        self.knowledge_base = get_knowledge_base(self.full_data_path)
+        
+        # (adres, seviye) -> formatlanmış yorum
+        self._address_comment = lru_cache(maxsize=COMMENT_CACHE_SIZE)(self._build_address_comment)
+        
         # Veri yükleme
         self._load_all_data()
         
@@ -306,6 +321,21 @@ class C64KnowledgeManager:
         Returns:
             Formatlanmış adres bilgisi veya None
         """
+        if self.knowledge_base:
+            address_int = parse_address(address)
+            record = self.knowledge_base.symbol(address_int) if address_int is not None else None
+            if record:
+                info = AddressInfo(
+                    name=record['name'],
+                    address=record['address'],
+                    size=record.get('size', record['end'] - record['start'] + 1),
+                    description=record.get('description', ''),
+                    usage=record.get('usage', ''),
+                    detailed_info=record.get('detailed_info'),
+                    bit_info=record.get('bit_info') or record.get('bits')
+                )
+                return self._format_address_comment(info, knowledge_level)
+        
         # Adres formatını normalize et
         normalized_addr = self._normalize_address(address)
         
@@ -358,29 +388,12 @@ class C64KnowledgeManager:
         if knowledge_level == KnowledgeLevel.NATURAL:
             return enhanced_line
             
-        # Adres pattern'lerini bul ve açıkla
-        address_patterns = [
-            r'\$([0-9A-Fa-f]{1,4})\b',  # $00, $D000 vs
-            r'0x([0-9A-Fa-f]{1,4})\b',  # 0x00, 0xD000 vs
-        ]
-        
+        # Adres literallerini bul ve açıkla
         comments = []
-        
-        for pattern in address_patterns:
-            matches = re.finditer(pattern, enhanced_line)
-            for match in matches:
-                addr_hex = match.group(1).upper()
-                addr_formatted = f"${addr_hex.zfill(2 if len(addr_hex) <= 2 else 4)}"
-                
-                addr_info = self.get_address_info(addr_formatted, knowledge_level)
-                if addr_info:
-                    comments.append(addr_info)
-                    
-        # Opcode bilgisi ekle (eğer satırda opcode varsa)
-        opcode_match = re.match(r'^\s*([A-Z]{3})\s', enhanced_line)
-        if opcode_match and knowledge_level in [KnowledgeLevel.DEBUG]:
-            mnemonic = opcode_match.group(1)
-            # Opcode için ek bilgi (cycle timing vs.) eklenebilir
+        for match in ADDRESS_LITERAL.finditer(enhanced_line):
+            addr_info = self._address_comment(int(match.group(1), 16), knowledge_level)
+            if addr_info:
+                comments.append(addr_info)
             
         # Yorumları ekle
         if comments:
@@ -394,6 +407,33 @@ class C64KnowledgeManager:
                 
         return enhanced_line
         
+    def annotate_listing(self, instructions: Sequence,
+                         knowledge_level: KnowledgeLevel = KnowledgeLevel.BASIC) -> List[str]:
+        """
+        Disassembly listesini toplu yorumla - metin ayrıştırmadan
+        
+        Args:
+            instructions: Disassembler'dan (adres, opcode, operand, mod)
+                kayıtları veya operand int/None değerleri
+            knowledge_level: Bilgi verme seviyesi
+            
+        Returns:
+            Her instruction için yorum ("" = yorum yok)
+        """
+        if knowledge_level == KnowledgeLevel.NATURAL:
+            return [""] * len(instructions)
+        
+        addresses = operand_addresses(instructions)
+        # Her farklı adres bir kez aranır
+        comments = {address: self._address_comment(address, knowledge_level) or ""
+                    for address in set(addresses) if address is not None}
+        comments[None] = ""
+        return [comments[address] for address in addresses]
+        
+    def _build_address_comment(self, address: int, knowledge_level: KnowledgeLevel) -> Optional[str]:
+        """Tek adres için yorum üret (lru_cache ile sarılır)"""
+        return self.get_address_info(f"${address:04X}", knowledge_level)
+        
     def enhance_basic_line(self, line: str, knowledge_level: KnowledgeLevel = KnowledgeLevel.BASIC) -> str:
         """
         BASIC satırını bilgi ile zenginleştir
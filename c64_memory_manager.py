@@ -32,6 +32,8 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from c64_knowledge_base import get_knowledge_base
+
 class C64MemoryMapManager:
     """C64 Memory Map ve ROM rutinlerini yöneten sınıf"""
     
@@ -50,12 +52,18 @@ class C64MemoryMapManager:
         self.basic_tokens = {}           # Yeni: BASIC token database  
         self.system_pointers = {}        # Yeni: System pointer database
         self.unified_lookup = {}         # Yeni: Unified address lookup
+        self.knowledge_base = None       # Derlenmiş ikili bilgi tabanı (mmap, int arama)
         
         # Load all data
         self.load_all_data()
     
     def load_all_data(self):
         """Tüm C64 ROM ve memory map verilerini yükle"""
+        # Derlenmiş bilgi tabanı varsa JSON ayrıştırmasına gerek yok
+        self.knowledge_base = get_knowledge_base(self.rom_data_dir)
+        if self.knowledge_base:
+            self.logger.info("C64 bilgi tabanı yüklendi: %s", self.knowledge_base.path)
+            return
         try:
             self.load_kernal_routines()
             self.load_basic_routines()
@@ -225,6 +233,12 @@ class C64MemoryMapManager:
     
     def get_routine_info(self, address: int) -> Optional[Dict[str, Any]]:
         """Adres için rutin bilgisini al"""
+        if self.knowledge_base:
+            record = self.knowledge_base.symbol(address)
+            if record and record['type'] in ('kernal', 'basic'):
+                return dict(record)
+            return None
+        
         addr_str = str(address)
         
         # KERNAL rutini ara
@@ -243,6 +257,17 @@ class C64MemoryMapManager:
     
     def get_memory_info(self, address: int) -> Optional[Dict[str, Any]]:
         """Adres için memory bilgisini al"""
+        if self.knowledge_base:
+            record = self.knowledge_base.symbol(address)
+            if record:
+                return dict(record)
+            record = self.knowledge_base.region(address)
+            if record:
+                area = dict(record)
+                area['offset'] = address - record['start']
+                return area
+            return None
+        
         addr_str = str(address)
         
         # Zero page değişkeni ara
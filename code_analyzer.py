@@ -32,12 +32,16 @@ suggestions = analyzer.get_optimization_suggestions()
 
 import os
 import sys
+from array import array
+from bisect import bisect_left
 from typing import Dict, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass
 from enum import Enum
 
 # Import our components
 from enhanced_c64_memory_manager import EnhancedC64MemoryManager
+import linear_sweep
+import opcode_decoder
 
 class PatternType(Enum):
     """Tanınabilir pattern türleri"""
@@ -80,6 +84,107 @@ class AnalysisResult:
     data_structures: List[Dict]
     optimization_opportunities: List[str]
 
+class InstructionStream:
+    """
+    Tek geçişte çözülmüş instruction akışı (struct-of-arrays)
+    
+    Her instruction linear sweep ile bir kez çözülür; adres, opcode, uzunluk,
+    operand ve mnemonic paralel dizilerde tutulur. Pattern aramaları
+    by_mnemonic indeks listeleri üzerinden yapılır. Illegal opcode'lar
+    1 byte'lık '.BYTE' kaydı olarak tutulur.
+    """
+    
+    DATA_MNEMONIC = '.BYTE'
+    
+    def __init__(self, code: bytes, start_address: int):
+        self.code = code
+        self.start_address = start_address
+        self.addresses = array('i')
+        self.opcodes = array('B')
+        self.lengths = array('B')
+        self.modes = array('B')     # opcode_decoder adresleme modu
+        self.operands = array('i')  # Operand yoksa -1, branch'lerde hedef adres
+        self.mnemonics: List[str] = []
+        self.by_mnemonic: Dict[str, List[int]] = {}
+        self._sequences: Dict[Tuple[str, ...], List[int]] = {}
+        
+        legal = opcode_decoder.LEGAL
+        names = opcode_decoder.OPCODE_MNEMONICS
+        modes = opcode_decoder.MODE
+        for address, opcode, length, operand in linear_sweep.sweep(code, start_address).iter_range():
+            if operand is None:
+                if length > 1:  # Buffer sonunda eksik operand
+                    break
+                operand = -1
+            if legal[opcode]:
+                mnemonic = names[opcode]
+                if modes[opcode] == opcode_decoder.REL:
+                    operand = (address + 2 + (operand - 0x100 if operand & 0x80 else operand)) & 0xFFFF
+            else:
+                mnemonic = self.DATA_MNEMONIC
+            self.by_mnemonic.setdefault(mnemonic, []).append(len(self.mnemonics))
+            self.addresses.append(address)
+            self.opcodes.append(opcode)
+            self.lengths.append(length)
+            self.modes.append(modes[opcode])
+            self.operands.append(operand)
+            self.mnemonics.append(mnemonic)
+    
+    def __len__(self) -> int:
+        return len(self.mnemonics)
+    
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Eski liste arayüzü için instruction sözlüğü"""
+        address = self.addresses[index]
+        offset = address - self.start_address
+        operand = self.operands[index]
+        return {
+            'address': address,
+            'bytes': self.code[offset:offset + self.lengths[index]],
+            'length': self.lengths[index],
+            'mnemonic': self.mnemonics[index],
+            'operand': operand if operand >= 0 else None
+        }
+    
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+    
+    def indices(self, *mnemonics: str) -> List[int]:
+        """Verilen mnemonic'lerin sıralı instruction indeksleri"""
+        if len(mnemonics) == 1:
+            return self.by_mnemonic.get(mnemonics[0], [])
+        return sorted(i for mnemonic in mnemonics for i in self.by_mnemonic.get(mnemonic, ()))
+    
+    def sequence_indices(self, *mnemonics: str) -> List[int]:
+        """Ardışık mnemonic dizisinin başladığı indeksler (önbellekli)"""
+        if mnemonics not in self._sequences:
+            names = self.mnemonics
+            last = len(names) - len(mnemonics)
+            self._sequences[mnemonics] = [
+                i for i in self.by_mnemonic.get(mnemonics[0], ())
+                if i <= last and all(names[i + k] == m for k, m in enumerate(mnemonics[1:], 1))
+            ]
+        return self._sequences[mnemonics]
+    
+    @staticmethod
+    def find_next(indices: List[int], start: int, stop: int) -> int:
+        """Sıralı indices içinde [start, stop) aralığındaki ilk indeks, yoksa -1"""
+        pos = bisect_left(indices, start)
+        if pos < len(indices) and indices[pos] < stop:
+            return indices[pos]
+        return -1
+    
+    def memory_operands(self):
+        """Bellek adresi olan (immediate olmayan) operand'lar için (indeks, adres)"""
+        immediate = opcode_decoder.IMM
+        return ((i, operand) for i, (operand, mode) in enumerate(zip(self.operands, self.modes))
+                if operand >= 0 and mode != immediate)
+    
+    def data_addresses(self) -> List[int]:
+        """Instruction olarak çözülemeyen (illegal) byte adresleri"""
+        return [self.addresses[i] for i in self.by_mnemonic.get(self.DATA_MNEMONIC, ())]
+
+
 class CodeAnalyzer:
     """
     Gelişmiş 6502 kod analiz sistemi
@@ -98,7 +203,7 @@ class CodeAnalyzer:
         self.memory_manager = None
         
         # Analysis state
-        self.instructions = []  # Parsed instructions
+        self.instructions = InstructionStream(b"", start_address)  # Parsed instructions
         self.patterns = []
         self.subroutines = {}
         self.labels = {}
@@ -120,198 +225,92 @@ class CodeAnalyzer:
             return False
     
     def parse_instructions(self) -> bool:
-        """PRG data'sını instruction'lara ayrıştır"""
+        """PRG data'sını tek geçişte instruction akışına ayrıştır"""
         try:
-            # py65 kullanarak disassemble et
-            from py65.disassembler import Disassembler
-            
-            disasm = Disassembler()
-            pc = self.start_address
-            
-            for i in range(len(self.prg_data)):
-                if pc + i >= self.start_address + len(self.prg_data):
-                    break
-                
-                try:
-                    # Instruction parse et
-                    length, disasm_str = disasm.instruction_at(pc + i, self.prg_data[i:i+3])
-                    if length > 0:
-                        instruction = {
-                            'address': pc + i,
-                            'bytes': self.prg_data[i:i+length],
-                            'length': length,
-                            'disassembly': disasm_str,
-                            'mnemonic': disasm_str.split()[0] if disasm_str else '',
-                            'operand': self._extract_operand(disasm_str)
-                        }
-                        self.instructions.append(instruction)
-                        i += length - 1
-                except:
-                    # Parse edilemeyen byte'lar - data olabilir
-                    self.data_areas.append(pc + i)
-            
+            self.instructions = InstructionStream(self.prg_data, self.start_address)
+            self.data_areas = self.instructions.data_addresses()
             print(f"✅ {len(self.instructions)} instruction parse edildi")
             return True
             
         except Exception as e:
             print(f"❌ Instruction parsing hatası: {e}")
-            # Fallback - basit parsing
-            return self._fallback_parsing()
-    
-    def _fallback_parsing(self) -> bool:
-        """Basit fallback parsing"""
-        # Temel instruction recognition
-        pc = self.start_address
-        i = 0
-        
-        while i < len(self.prg_data):
-            opcode = self.prg_data[i]
-            
-            # Common opcodes ve length'leri
-            length = 1
-            mnemonic = "UNK"
-            
-            if opcode == 0xA9:  # LDA immediate
-                length = 2
-                mnemonic = "LDA"
-            elif opcode == 0x20:  # JSR
-                length = 3
-                mnemonic = "JSR"
-            elif opcode == 0x60:  # RTS
-                length = 1
-                mnemonic = "RTS"
-            elif opcode == 0x4C:  # JMP absolute
-                length = 3
-                mnemonic = "JMP"
-            elif opcode == 0x10:  # BPL
-                length = 2
-                mnemonic = "BPL"
-            # Daha fazla opcode eklenebilir
-            
-            instruction = {
-                'address': pc + i,
-                'bytes': self.prg_data[i:i+length],
-                'length': length,
-                'mnemonic': mnemonic,
-                'operand': None
-            }
-            
-            if length > 1:
-                if length == 2:
-                    instruction['operand'] = self.prg_data[i+1]
-                elif length == 3:
-                    instruction['operand'] = self.prg_data[i+1] + (self.prg_data[i+2] << 8)
-            
-            self.instructions.append(instruction)
-            i += length
-        
-        print(f"✅ Fallback: {len(self.instructions)} instruction parse edildi")
-        return True
+            return False
     
-    def _extract_operand(self, disasm_str: str) -> Optional[int]:
-        """Disassembly string'den operand'ı çıkar"""
-        if not disasm_str or ' ' not in disasm_str:
-            return None
-        
-        operand_part = disasm_str.split(' ', 1)[1]
-        
-        # $XXXX format
-        if operand_part.startswith('$'):
-            try:
-                return int(operand_part[1:], 16)
-            except:
-                pass
-        
-        # #$XX format  
-        if operand_part.startswith('#$'):
-            try:
-                return int(operand_part[2:], 16)
-            except:
-                pass
-        
-        return None
+    def _routine_name(self, address: int, default: str) -> str:
+        """Memory manager varsa adres için akıllı isim al"""
+        if self.memory_manager and hasattr(self.memory_manager, 'get_smart_variable_name'):
+            return self.memory_manager.get_smart_variable_name(address)
+        return default
     
     def detect_loop_patterns(self) -> List[CodePattern]:
         """Döngü pattern'lerini tespit et"""
         loop_patterns = []
+        stream = self.instructions
         
-        for i, instruction in enumerate(self.instructions):
-            # Counting loop pattern detection
-            if instruction['mnemonic'] in ['LDX', 'LDY', 'LDA'] and i + 3 < len(self.instructions):
-                # Pattern: LDX #count, loop:, ..., DEX, BNE loop
-                
-                if (instruction['mnemonic'] == 'LDX' and 
-                    self._find_dex_bne_pattern(i)):
-                    
-                    pattern = CodePattern(
-                        pattern_type=PatternType.COUNTING_LOOP,
-                        start_address=instruction['address'],
-                        end_address=self._find_loop_end(i),
-                        confidence=0.8,
-                        description="X register counting loop",
-                        high_level_equivalent=f"for (int x = {instruction.get('operand', 0)}; x > 0; x--)",
-                        optimization_suggestion="Consider using higher-level loop constructs"
-                    )
-                    loop_patterns.append(pattern)
+        # Pattern: LDX #count, loop:, ..., DEX, BNE loop
+        for i in stream.indices('LDX'):
+            if i + 3 < len(stream) and self._find_dex_bne_pattern(i):
+                operand = stream.operands[i]
+                pattern = CodePattern(
+                    pattern_type=PatternType.COUNTING_LOOP,
+                    start_address=stream.addresses[i],
+                    end_address=self._find_loop_end(i),
+                    confidence=0.8,
+                    description="X register counting loop",
+                    high_level_equivalent=f"for (int x = {max(operand, 0)}; x > 0; x--)",
+                    optimization_suggestion="Consider using higher-level loop constructs"
+                )
+                loop_patterns.append(pattern)
         
         return loop_patterns
     
     def _find_dex_bne_pattern(self, start_idx: int) -> bool:
         """DEX + BNE pattern'i bul"""
-        for i in range(start_idx + 1, min(start_idx + 20, len(self.instructions))):
-            if (i + 1 < len(self.instructions) and
-                self.instructions[i]['mnemonic'] == 'DEX' and
-                self.instructions[i + 1]['mnemonic'] == 'BNE'):
-                return True
-        return False
+        stream = self.instructions
+        return stream.find_next(stream.sequence_indices('DEX', 'BNE'), start_idx + 1, start_idx + 20) >= 0
     
     def _find_loop_end(self, start_idx: int) -> int:
         """Döngünün bitiş adresini bul"""
-        for i in range(start_idx + 1, min(start_idx + 30, len(self.instructions))):
-            if self.instructions[i]['mnemonic'] == 'BNE':
-                return self.instructions[i]['address']
-        return self.instructions[start_idx]['address']
+        stream = self.instructions
+        end_idx = stream.find_next(stream.indices('BNE'), start_idx + 1, start_idx + 30)
+        return stream.addresses[end_idx if end_idx >= 0 else start_idx]
     
     def detect_subroutine_patterns(self) -> List[CodePattern]:
         """Subroutine call pattern'lerini tespit et"""
         subroutine_patterns = []
+        stream = self.instructions
         
-        for instruction in self.instructions:
-            if instruction['mnemonic'] == 'JSR':
-                target_addr = instruction.get('operand')
-                if target_addr:
-                    # Memory manager ile routine ismi al
-                    routine_name = "unknown_routine"
-                    if self.memory_manager:
-                        routine_name = self.memory_manager.get_smart_variable_name(target_addr)
-                    
-                    pattern = CodePattern(
-                        pattern_type=PatternType.SUBROUTINE_CALL,
-                        start_address=instruction['address'],
-                        end_address=instruction['address'],
-                        confidence=1.0,
-                        description=f"Subroutine call to {routine_name}",
-                        high_level_equivalent=f"{routine_name}();",
-                        variables_used=[routine_name]
-                    )
-                    subroutine_patterns.append(pattern)
+        for i in stream.indices('JSR'):
+            target_addr = stream.operands[i]
+            if target_addr > 0:
+                # Memory manager ile routine ismi al
+                routine_name = self._routine_name(target_addr, "unknown_routine")
+                
+                pattern = CodePattern(
+                    pattern_type=PatternType.SUBROUTINE_CALL,
+                    start_address=stream.addresses[i],
+                    end_address=stream.addresses[i],
+                    confidence=1.0,
+                    description=f"Subroutine call to {routine_name}",
+                    high_level_equivalent=f"{routine_name}();",
+                    variables_used=[routine_name]
+                )
+                subroutine_patterns.append(pattern)
         
         return subroutine_patterns
     
     def detect_array_patterns(self) -> List[CodePattern]:
         """Array access pattern'lerini tespit et"""
         array_patterns = []
+        stream = self.instructions
         
-        for i, instruction in enumerate(self.instructions):
-            # Array indexing pattern: LDA data,X veya STA data,X
-            if (instruction['mnemonic'] in ['LDA', 'STA'] and 
-                i > 0 and 
-                self.instructions[i-1]['mnemonic'] in ['LDX', 'INX']):
-                
+        # Array indexing pattern: LDX/INX ardından LDA data,X veya STA data,X
+        for i in stream.indices('LDA', 'STA'):
+            if i > 0 and stream.mnemonics[i - 1] in ('LDX', 'INX'):
                 pattern = CodePattern(
                     pattern_type=PatternType.ARRAY_ACCESS,
-                    start_address=self.instructions[i-1]['address'],
-                    end_address=instruction['address'],
+                    start_address=stream.addresses[i - 1],
+                    end_address=stream.addresses[i],
                     confidence=0.7,
                     description="Array access with X indexing",
                     high_level_equivalent="array[x]",
@@ -324,46 +323,41 @@ class CodeAnalyzer:
     def detect_math_patterns(self) -> List[CodePattern]:
         """Matematik pattern'lerini tespit et"""
         math_patterns = []
-        
-        for i, instruction in enumerate(self.instructions):
-            # Multiplication pattern detection
-            if (instruction['mnemonic'] == 'CLC' and 
-                i + 2 < len(self.instructions) and
-                self.instructions[i + 1]['mnemonic'] == 'ADC' and
-                self.instructions[i + 2]['mnemonic'] == 'BCC'):
-                
-                pattern = CodePattern(
-                    pattern_type=PatternType.MATH_OPERATION,
-                    start_address=instruction['address'],
-                    end_address=self.instructions[i + 2]['address'],
-                    confidence=0.6,
-                    description="Addition with carry handling",
-                    high_level_equivalent="result = a + b;",
-                    optimization_suggestion="Use high-level arithmetic operators"
-                )
-                math_patterns.append(pattern)
+        stream = self.instructions
+        
+        # Multiplication pattern detection: CLC, ADC, BCC
+        for i in stream.sequence_indices('CLC', 'ADC', 'BCC'):
+            pattern = CodePattern(
+                pattern_type=PatternType.MATH_OPERATION,
+                start_address=stream.addresses[i],
+                end_address=stream.addresses[i + 2],
+                confidence=0.6,
+                description="Addition with carry handling",
+                high_level_equivalent="result = a + b;",
+                optimization_suggestion="Use high-level arithmetic operators"
+            )
+            math_patterns.append(pattern)
         
         return math_patterns
     
     def detect_screen_patterns(self) -> List[CodePattern]:
         """Screen manipulation pattern'lerini tespit et"""
         screen_patterns = []
+        stream = self.instructions
         
-        for instruction in self.instructions:
-            operand = instruction.get('operand')
-            if operand:
-                # Screen memory ($0400-$07FF) veya color memory ($D800-$DBFF)
-                if (0x0400 <= operand <= 0x07FF) or (0xD800 <= operand <= 0xDBFF):
-                    pattern = CodePattern(
-                        pattern_type=PatternType.SCREEN_MANIPULATION,
-                        start_address=instruction['address'],
-                        end_address=instruction['address'],
-                        confidence=0.9,
-                        description="Screen or color memory access",
-                        high_level_equivalent="screen_write()",
-                        optimization_suggestion="Use screen handling functions"
-                    )
-                    screen_patterns.append(pattern)
+        for i, operand in stream.memory_operands():
+            # Screen memory ($0400-$07FF) veya color memory ($D800-$DBFF)
+            if (0x0400 <= operand <= 0x07FF) or (0xD800 <= operand <= 0xDBFF):
+                pattern = CodePattern(
+                    pattern_type=PatternType.SCREEN_MANIPULATION,
+                    start_address=stream.addresses[i],
+                    end_address=stream.addresses[i],
+                    confidence=0.9,
+                    description="Screen or color memory access",
+                    high_level_equivalent="screen_write()",
+                    optimization_suggestion="Use screen handling functions"
+                )
+                screen_patterns.append(pattern)
         
         return screen_patterns
     
@@ -422,26 +416,26 @@ class CodeAnalyzer:
     
     def _calculate_complexity(self) -> float:
         """Kod karmaşıklığını hesapla"""
-        if not self.instructions:
+        stream = self.instructions
+        if not len(stream):
             return 0.0
         
         complexity = 0.0
         
         # Instruction çeşitliliği
-        unique_mnemonics = len(set(inst['mnemonic'] for inst in self.instructions))
+        unique_mnemonics = len(stream.by_mnemonic)
         complexity += unique_mnemonics * 0.1
         
         # Branch instruction'ları (karmaşıklık artırır)
-        branch_count = sum(1 for inst in self.instructions 
-                          if inst['mnemonic'] in ['BEQ', 'BNE', 'BCC', 'BCS', 'BMI', 'BPL'])
+        branch_count = len(stream.indices('BEQ', 'BNE', 'BCC', 'BCS', 'BMI', 'BPL'))
         complexity += branch_count * 0.3
         
         # Subroutine call'ları
-        jsr_count = sum(1 for inst in self.instructions if inst['mnemonic'] == 'JSR')
+        jsr_count = len(stream.indices('JSR'))
         complexity += jsr_count * 0.2
         
         # Normalize (0-10 scale)
-        max_complexity = len(self.instructions) * 0.5
+        max_complexity = len(stream) * 0.5
         normalized = min(complexity / max_complexity * 10, 10.0) if max_complexity > 0 else 0.0
         
         return normalized
@@ -458,10 +452,9 @@ class CodeAnalyzer:
             'user_ram': 0
         }
         
-        for instruction in self.instructions:
-            operand = instruction.get('operand')
-            if operand:
-                if 0x00 <= operand <= 0xFF:
+        for _, operand in self.instructions.memory_operands():
+            if operand > 0:
+                if operand <= 0xFF:
                     memory_usage['zero_page'] += 1
                 elif 0x0100 <= operand <= 0x01FF:
                     memory_usage['stack'] += 1
@@ -481,15 +474,12 @@ class CodeAnalyzer:
     def _build_subroutine_map(self) -> Dict[int, str]:
         """Subroutine map'i oluştur"""
         subroutine_map = {}
+        stream = self.instructions
         
-        for instruction in self.instructions:
-            if instruction['mnemonic'] == 'JSR':
-                addr = instruction.get('operand')
-                if addr:
-                    name = f"SUB_{addr:04X}"
-                    if self.memory_manager:
-                        name = self.memory_manager.get_smart_variable_name(addr)
-                    subroutine_map[addr] = name
+        for i in stream.indices('JSR'):
+            addr = stream.operands[i]
+            if addr > 0:
+                subroutine_map[addr] = self._routine_name(addr, f"SUB_{addr:04X}")
         
         return subroutine_map
     
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Code Flow - 6502 için recursive-descent akış analizi ve basic-block grafiği
+================================================================
+İki giriş yolu vardır:
+
+• FlowGraph.from_code()         - Ham byte'lar (PRG/bellek dökümü). Giriş
+  noktalarından deque worklist ile akış izlenir; her byte ofseti bitmap ile
+  işaretlenir ve en fazla bir kez çözülür (opcode_decoder tablosu).
+• FlowGraph.from_instructions() - Decompiler'ların ayrıştırdığı
+  (adres, mnemonic, operand) listesi. Tüm listeyi basic block'lara böler.
+
+Çıktı: basic block'lar, kenarlar (fall/branch/jump/indirect/dispatch),
+çağrı grafiği, JMP ($xxxx) vektörleri ve RTS dispatch tabloları
+(LDA hi,X / PHA / LDA lo,X / PHA / RTS hilesi).
+
+Py65ProfessionalDisassembler.auto_analyze ve decompiler_c, decompiler_cpp,
+decompiler_qbasic build_cfg bu modülü kullanır.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import opcode_decoder
+from opcode_decoder import ABS, ABX, ABY, IMM, IND, REL
+
+BRANCH_MNEMONICS = frozenset(('BPL', 'BMI', 'BVC', 'BVS', 'BCC', 'BCS', 'BNE', 'BEQ'))
+RETURN_MNEMONICS = frozenset(('RTS', 'RTI'))
+STOP_MNEMONICS = frozenset(('BRK', 'KIL'))
+
+# Kenar türleri (çağrılar kenar değil, call_graph'ta tutulur)
+EDGE_FALL = 'fall'
+EDGE_BRANCH = 'branch'
+EDGE_JUMP = 'jump'
+EDGE_INDIRECT = 'indirect'
+EDGE_DISPATCH = 'dispatch'
+EDGE_CALL = 'call'
+
+# RTS dispatch tablosu için üst sınır
+MAX_DISPATCH_ENTRIES = 256
+
+
+@dataclass
+class FlowInstruction:
+    """Akış analizinde tek instruction"""
+    address: int
+    mnemonic: str
+    length: int
+    operand: Optional[int]
+    mode: int
+    next_address: Optional[int] = None
+    target: Optional[int] = None
+    source: Any = None
+
+    @property
+    def is_terminator(self) -> bool:
+        """Akış bir sonraki instruction'a düşmüyor mu?"""
+        return (self.mnemonic == 'JMP' or self.mnemonic in RETURN_MNEMONICS
+                or self.mnemonic in STOP_MNEMONICS)
+
+    @property
+    def ends_block(self) -> bool:
+        """Bu instruction'dan sonra yeni block başlar mı?"""
+        return self.is_terminator or self.mnemonic in BRANCH_MNEMONICS
+
+    def as_tuple(self) -> Tuple:
+        """Decompiler'ların kullandığı (adres, mnemonic, operand) biçimi"""
+        if self.source is not None:
+            return self.source
+        return (self.address, self.mnemonic, self.target if self.target is not None else self.operand)
+
+
+@dataclass
+class BasicBlock:
+    """Tek girişli, tek çıkışlı instruction dizisi"""
+    start: int
+    end: int
+    instructions: List[FlowInstruction]
+    successors: List[Tuple[int, str]] = field(default_factory=list)
+    predecessors: List[int] = field(default_factory=list)
+    function: Optional[int] = None
+    reachable: bool = False
+
+    @property
+    def terminator(self) -> FlowInstruction:
+        return self.instructions[-1]
+
+
+class FlowGraph:
+    """Basic-block grafiği, çağrı grafiği ve atlama tabloları"""
+
+    def __init__(self):
+        self.instructions: Dict[int, FlowInstruction] = {}
+        self.blocks: Dict[int, BasicBlock] = {}
+        self.entry_points: List[int] = []
+        self.calls: Dict[int, int] = {}
+        self.call_graph: Dict[int, Set[int]] = {}
+        self.jump_tables: Dict[int, List[int]] = {}
+        self.external_targets: Set[int] = set()
+        self._targets: Dict[int, List[Tuple[int, str]]] = {}
+        self._block_of: Dict[int, int] = {}
+
+    # ------------------------------------------------------------------
+    # Giriş yolları
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_code(cls, code, base_address: int, entry_points=None,
+                  max_instructions: Optional[int] = None, allow_illegal: bool = False) -> 'FlowGraph':
+        """Ham koddan recursive-descent akış analizi
+
+        Args:
+            code: bytes, bytearray veya memoryview
+            base_address: code[0]'ın adresi
+            entry_points: Başlangıç adresleri (None ise base_address)
+            max_instructions: Çözülecek en fazla instruction (None = sınırsız)
+            allow_illegal: Illegal opcode'lar kod sayılsın mı
+        """
+        graph = cls()
+        size = len(code)
+        end_address = base_address + size
+        visited = bytearray(size)
+
+        def in_range(address):
+            return base_address <= address < end_address
+
+        def read_byte(address):
+            if in_range(address):
+                return code[address - base_address]
+            return None
+
+        entries = list(entry_points) if entry_points else [base_address]
+        graph.entry_points = [entry for entry in entries if in_range(entry)]
+        worklist = deque(graph.entry_points)
+
+        while worklist:
+            address = worklist.popleft()
+            recent = deque(maxlen=4)
+            while in_range(address):
+                offset = address - base_address
+                if visited[offset]:
+                    break
+                if max_instructions is not None and len(graph.instructions) >= max_instructions:
+                    worklist.clear()
+                    break
+                visited[offset] = 1
+
+                opcode = code[offset]
+                if not (allow_illegal or opcode_decoder.LEGAL[opcode]):
+                    break
+                length = opcode_decoder.LENGTH[opcode]
+                if offset + length > size:
+                    break
+                operand = None
+                if length == 2:
+                    operand = code[offset + 1]
+                elif length == 3:
+                    operand = code[offset + 1] | (code[offset + 2] << 8)
+
+                mode = opcode_decoder.MODE[opcode]
+                instr = FlowInstruction(address, opcode_decoder.OPCODE_MNEMONICS[opcode], length,
+                                        operand, mode, next_address=address + length)
+                if mode == REL:
+                    instr.target = (address + 2 + ((operand ^ 0x80) - 0x80)) & 0xFFFF
+                elif mode == ABS and instr.mnemonic in ('JMP', 'JSR'):
+                    instr.target = operand
+
+                graph.instructions[address] = instr
+                for target, kind in graph._control_targets(instr, recent, read_byte, in_range):
+                    if in_range(target):
+                        if not visited[target - base_address]:
+                            worklist.append(target)
+                    else:
+                        graph.external_targets.add(target)
+
+                recent.append(instr)
+                if instr.is_terminator:
+                    break
+                address = instr.next_address
+
+        graph._build_blocks()
+        return graph
+
+    @classmethod
+    def from_instructions(cls, instructions, entry_points=None) -> 'FlowGraph':
+        """Ayrıştırılmış (adres, mnemonic, operand) listesinden grafik
+
+        Tüm liste block'lara bölünür; erişilemeyen block'lar reachable=False
+        olarak kalır.
+        """
+        graph = cls()
+        ordered = sorted(instructions, key=lambda instr: instr[0])
+        known = {instr[0] for instr in ordered}
+
+        def in_range(address):
+            return address in known
+
+        recent = deque(maxlen=4)
+        for index, source in enumerate(ordered):
+            address, mnemonic, operand = source[0], source[1], source[2]
+            next_address = ordered[index + 1][0] if index + 1 < len(ordered) else None
+            mode, value = _listing_operand(mnemonic, operand)
+            instr = FlowInstruction(address, mnemonic, (next_address - address) if next_address else 1,
+                                    value, mode, next_address=next_address, source=source)
+            if mnemonic in BRANCH_MNEMONICS or (mnemonic in ('JMP', 'JSR') and mode == ABS):
+                instr.target = value
+            graph.instructions[address] = instr
+            for target, kind in graph._control_targets(instr, recent, lambda _: None, in_range):
+                if not in_range(target):
+                    graph.external_targets.add(target)
+            recent.append(instr)
+
+        if entry_points:
+            graph.entry_points = [entry for entry in entry_points if entry in known]
+        elif ordered:
+            graph.entry_points = [ordered[0][0]]
+        graph._build_blocks()
+        return graph
+
+    # ------------------------------------------------------------------
+    # Analiz
+    # ------------------------------------------------------------------
+
+    def _control_targets(self, instr, recent, read_byte, in_range) -> List[Tuple[int, str]]:
+        """Instruction'ın akış hedeflerini bul ve kaydet"""
+        mnemonic = instr.mnemonic
+        targets = []
+        if mnemonic in BRANCH_MNEMONICS and instr.target is not None:
+            targets.append((instr.target, EDGE_BRANCH))
+        elif mnemonic == 'JSR' and instr.target is not None:
+            self.calls[instr.address] = instr.target
+            targets.append((instr.target, EDGE_CALL))
+        elif mnemonic == 'JMP' and instr.mode == ABS and instr.target is not None:
+            targets.append((instr.target, EDGE_JUMP))
+        elif mnemonic == 'JMP' and instr.mode == IND and instr.operand is not None:
+            vector = instr.operand
+            # 6502 hatası: vektör sayfa sonundaysa yüksek byte aynı sayfadan okunur
+            low = read_byte(vector)
+            high = read_byte((vector & 0xFF00) | ((vector + 1) & 0xFF))
+            resolved = [] if low is None or high is None else [low | (high << 8)]
+            self.jump_tables[instr.address] = resolved
+            targets.extend((target, EDGE_INDIRECT) for target in resolved)
+        elif mnemonic == 'RTS':
+            resolved = _rts_dispatch_targets(recent, read_byte, in_range)
+            if resolved:
+                self.jump_tables[instr.address] = resolved
+                targets.extend((target, EDGE_DISPATCH) for target in resolved)
+        if targets:
+            self._targets[instr.address] = targets
+        return targets
+
+    def _build_blocks(self):
+        """Instruction'ları leader'lara göre basic block'lara böl"""
+        leaders = set(self.entry_points)
+        for targets in self._targets.values():
+            leaders.update(target for target, _ in targets if target in self.instructions)
+
+        current = None
+        previous = None
+        for address in sorted(self.instructions):
+            instr = self.instructions[address]
+            starts_block = (
+                current is None or address in leaders or previous.ends_block
+                or previous.next_address != address
+            )
+            if starts_block:
+                current = BasicBlock(address, address, [])
+                self.blocks[address] = current
+            current.instructions.append(instr)
+            current.end = address
+            self._block_of[address] = current.start
+            previous = instr
+
+        for block in self.blocks.values():
+            last = block.terminator
+            for target, kind in self._targets.get(last.address, []):
+                if kind != EDGE_CALL and target in self.blocks:
+                    block.successors.append((target, kind))
+            if not last.is_terminator and last.next_address in self.blocks:
+                block.successors.append((last.next_address, EDGE_FALL))
+            for target, _ in block.successors:
+                self.blocks[target].predecessors.append(block.start)
+
+        self._assign_functions()
+
+    def _assign_functions(self):
+        """Fonksiyon sınırlarını ve çağrı grafiğini çıkar"""
+        call_sites_by_block: Dict[int, List[int]] = {}
+        for block in self.blocks.values():
+            for instr in block.instructions:
+                if instr.address in self.calls:
+                    call_sites_by_block.setdefault(block.start, []).append(self.calls[instr.address])
+
+        functions = list(self.entry_points)
+        functions.extend(sorted(set(self.calls.values()) - set(functions)))
+        for function in functions:
+            if function not in self.blocks:
+                continue
+            callees = self.call_graph.setdefault(function, set())
+            seen = {function}
+            queue = deque([function])
+            while queue:
+                block = self.blocks[queue.popleft()]
+                block.reachable = True
+                if block.function is None:
+                    block.function = function
+                callees.update(call_sites_by_block.get(block.start, ()))
+                for target, _ in block.successors:
+                    if target not in seen:
+                        seen.add(target)
+                        queue.append(target)
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def block_at(self, address: int) -> Optional[BasicBlock]:
+        """Adresteki instruction'ı içeren block"""
+        start = self._block_of.get(address)
+        return self.blocks[start] if start is not None else None
+
+    def instruction_addresses(self) -> List[int]:
+        """Çözülmüş instruction adresleri (sıralı)"""
+        return sorted(self.instructions)
+
+    def functions(self) -> List[int]:
+        """Fonksiyon giriş adresleri"""
+        return sorted(self.call_graph)
+
+    def as_blocks(self) -> List[Tuple[int, int, List[Tuple]]]:
+        """Decompiler build_cfg biçimi: [(başlangıç, bitiş, [instr tuple])]"""
+        return [
+            (block.start, block.end, [instr.as_tuple() for instr in block.instructions])
+            for _, block in sorted(self.blocks.items())
+        ]
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Grafik istatistikleri"""
+        return {
+            'instructions': len(self.instructions),
+            'blocks': len(self.blocks),
+            'edges': sum(len(block.successors) for block in self.blocks.values()),
+            'functions': len(self.call_graph),
+            'jump_tables': len(self.jump_tables),
+            'unreachable_blocks': sum(1 for block in self.blocks.values() if not block.reachable),
+        }
+
+
+def _listing_operand(mnemonic, operand):
+    """Ayrıştırılmış metin operand'ından (mod, sayısal değer) çıkar"""
+    if isinstance(operand, int):
+        return (REL if mnemonic in BRANCH_MNEMONICS else ABS), operand
+    text = str(operand or '').strip()
+    if not text:
+        return opcode_decoder.IMP, None
+    if text.startswith('#'):
+        return IMM, _parse_number(text[1:])
+    if text.startswith('(') and mnemonic == 'JMP':
+        return IND, _parse_number(text.strip('()'))
+    value = _parse_number(text.split(',')[0])
+    if text.upper().endswith(',X'):
+        return ABX, value
+    if text.upper().endswith(',Y'):
+        return ABY, value
+    return ABS, value
+
+
+def _parse_number(text):
+    """'$1F', '31', '%101' biçimlerini sayıya çevir"""
+    text = text.strip()
+    try:
+        if text.startswith('$'):
+            return int(text[1:], 16)
+        if text.startswith('%'):
+            return int(text[1:], 2)
+        return int(text)
+    except ValueError:
+        return None
+
+
+def _rts_dispatch_targets(recent, read_byte, in_range) -> List[int]:
+    """LDA hi / PHA / LDA lo / PHA / RTS hilesinin hedeflerini çıkar"""
+    if len(recent) < 4:
+        return []
+    load_high, push_high, load_low, push_low = list(recent)[-4:]
+    if not (load_high.mnemonic == 'LDA' and push_high.mnemonic == 'PHA'
+            and load_low.mnemonic == 'LDA' and push_low.mnemonic == 'PHA'):
+        return []
+    if load_high.operand is None or load_low.operand is None:
+        return []
+
+    if load_high.mode == IMM and load_low.mode == IMM:
+        target = (((load_high.operand << 8) | load_low.operand) + 1) & 0xFFFF
+        return [target] if in_range(target) else []
+
+    if load_high.mode != load_low.mode or load_high.mode not in (ABX, ABY):
+        return []
+    high_table, low_table = load_high.operand, load_low.operand
+    # Bölünmüş tablolar: iki tablo arasındaki mesafe giriş sayısını sınırlar
+    count = min(abs(high_table - low_table) or 1, MAX_DISPATCH_ENTRIES)
+    targets = []
+    for index in range(count):
+        low = read_byte(low_table + index)
+        high = read_byte(high_table + index)
+        if low is None or high is None:
+            break
+        target = (((high << 8) | low) + 1) & 0xFFFF
+        if not in_range(target):
+            break
+        if target not in targets:
+            targets.append(target)
+    return targets
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    print("🔀 Code Flow Analyzer Test")
+    print("=" * 50)
+    # $C000: LDX #$00 / loop: INX / BNE loop / JSR $C00A / RTS / $C00A: RTS
+    sample = bytes([0xA2, 0x00, 0xE8, 0xD0, 0xFD, 0x20, 0x0A, 0xC0, 0x60, 0x00, 0x60])
+    flow = FlowGraph.from_code(sample, 0xC000)
+    for start, block in sorted(flow.blocks.items()):
+        successors = ", ".join(f"${t:04X}({k})" for t, k in block.successors)
+        print(f"   ${start:04X}-${block.end:04X} -> {successors or '-'}")
+    print(f"✅ {flow.get_statistics()}")
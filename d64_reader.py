@@ -1,8 +1,13 @@
 # d64_reader.py
+import mmap
 import struct
 from pathlib import Path
 import logging
 
+from disk_geometry import (D64_SECTORS_PER_TRACK, D71_SECTORS_PER_TRACK,
+                           D81_SECTORS_PER_TRACK, D84_SECTORS_PER_TRACK,
+                           get_offset_table, sector_offset)
+
 # Logging yapılandırması
 logging.basicConfig(filename='logs/d64_converter.log', level=logging.INFO,
                    format='%(asctime)s - %(levelname)s - %(message)s')
@@ -13,29 +18,201 @@ D71_SECTOR_COUNT = 1366  # Double-sided D64
 D81_SECTOR_COUNT = 3200
 D84_SECTOR_COUNT = 6400  # Double-sided D81
 
-# Sector sayıları track başına
-SECTOR_SIZES = [
-    21 if t <= 17 else 19 if t <= 24 else 18 if t <= 30 else 17
-    for t in range(1, 36)
-]
-D71_SECTOR_SIZES = SECTOR_SIZES + SECTOR_SIZES  # Her iki yüz için
-D81_SECTOR_SIZES = [40] * 80
-D84_SECTOR_SIZES = [40] * 160  # Double-sided
+# Sector sayıları track başına (ortak geometri tablolarından)
+SECTOR_SIZES = D64_SECTORS_PER_TRACK
+D71_SECTOR_SIZES = D71_SECTORS_PER_TRACK  # Her iki yüz için
+D81_SECTOR_SIZES = D81_SECTORS_PER_TRACK
+D84_SECTOR_SIZES = D84_SECTORS_PER_TRACK  # Double-sided
+
+# Sektör tabanlı disk imajları (mmap ile açılır)
+SECTOR_IMAGE_EXTS = (".d64", ".d71", ".d81", ".d84")
+SECTOR_SIZE = 256
+
+
+class DiskImage:
+    """mmap destekli, kopyasız disk imajı.
+
+    Veriyi belleğe kopyalamak yerine dosyayı mmap ile eşler ve sektörleri
+    memoryview dilimleri olarak sunar. ``len()``, indeksleme ve dilimleme
+    desteklediği için ``disk_data`` kabul eden tüm fonksiyonlara
+    (read_directory, extract_prg_file, C1541PythonEmulator.read_file_data ...)
+    doğrudan verilebilir.
+    """
+
+    def __init__(self, file_path, ext=None):
+        self.path = str(file_path)
+        self.ext = ext or Path(file_path).suffix.lower()
+        self._file = None
+        self._mmap = None
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+        except ValueError:
+            # Boş dosyalar mmap ile eşlenemez
+            self._view = memoryview(b"")
+
+    @classmethod
+    def from_bytes(cls, data, ext):
+        """Bellekteki veriden (bytes/bytearray) DiskImage oluşturur."""
+        image = cls.__new__(cls)
+        image.path = None
+        image.ext = ext
+        image._file = None
+        image._mmap = None
+        image._view = memoryview(data)
+        return image
+
+    @property
+    def view(self):
+        """Tüm imajın memoryview'i."""
+        return self._view
+
+    def __len__(self):
+        return len(self._view)
+
+    def __getitem__(self, key):
+        return self._view[key]
+
+    def __bytes__(self):
+        return self._view.tobytes()
+
+    def __buffer__(self, flags):
+        return self._view
+
+    def sector(self, track, sector):
+        """Sektörü 256 byte'lık memoryview olarak döndürür, geçersizse None."""
+        offset = get_sector_offset(track, sector, self.ext)
+        if offset < 0 or offset + SECTOR_SIZE > len(self._view):
+            return None
+        return self._view[offset:offset + SECTOR_SIZE]
+
+    def iter_chain(self, start_track, start_sector, max_sectors=200):
+        """T/S zincirini izler, her sektörün veri kısmını okundukça memoryview olarak üretir."""
+        return _iter_chain_blocks(self._view, start_track, start_sector, self.ext, max_sectors)
+
+    def read_chain(self, start_track, start_sector, max_sectors=200):
+        """T/S zincirindeki veriyi tek bir kopyayla bytes olarak döndürür."""
+        return b"".join(self.iter_chain(start_track, start_sector, max_sectors))
+
+    def close(self):
+        """mmap ve dosya tanıtıcısını kapatır.
+
+        sector()/iter_chain() ile alınmış memoryview'ler hâlâ yaşıyorsa mmap
+        kapatılamaz; bu durumda imaj açık ve kullanılabilir kalır ve
+        BufferError yükseltilir.
+        """
+        if self._mmap is not None:
+            if self._view is not None:
+                self._view.release()
+                self._view = None
+            try:
+                self._mmap.close()
+            except BufferError:
+                self._view = memoryview(self._mmap)
+                raise BufferError(
+                    "DiskImage kapatılamadı: sector()/iter_chain() memoryview'leri hâlâ kullanımda; "
+                    "önce release() edin veya bytes'a kopyalayın") from None
+            self._mmap = None
+        elif self._view is not None:
+            self._view.release()
+        self._view = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __repr__(self):
+        return f"DiskImage({self.path!r}, ext={self.ext!r}, size={len(self) if self._view is not None else 0})"
+
+
+def _as_view(disk_data):
+    """disk_data'yı (bytes, bytearray, mmap veya DiskImage) memoryview'e çevirir."""
+    if isinstance(disk_data, DiskImage):
+        return disk_data.view
+    if isinstance(disk_data, memoryview):
+        return disk_data
+    return memoryview(disk_data)
+
+
+def _iter_chain_blocks(disk_data, start_track, start_sector, ext, max_sectors=200):
+    """T/S zincirini izleyerek sektör veri kısımlarını memoryview olarak üretir.
+
+    Bağlantılar okundukça izlenir; zincir en fazla max_sectors sektör
+    boyunca yürünür (döngüsel zincirlere karşı koruma).
+    """
+    view = _as_view(disk_data)
+    size = len(view)
+    table = get_offset_table(ext)
+    table_len = len(table)
+
+    for _ in range(max_sectors):
+        index = (start_track << 8) | start_sector
+        offset = table[index] if 0 <= index < table_len else -1
+        if offset < 0:
+            raise ValueError(f"Geçersiz track/sector: {start_track}/{start_sector}")
 
-# Track offsetleri
-TRACK_OFFSETS = [0]
-for t in range(1, 35):
-    TRACK_OFFSETS.append(TRACK_OFFSETS[-1] + SECTOR_SIZES[t - 1])
+        if offset + SECTOR_SIZE > size:
+            raise ValueError(f"Disk veri sınırı aşıldı: {offset}")
 
-D71_TRACK_OFFSETS = TRACK_OFFSETS + [TRACK_OFFSETS[-1] + sector for sector in TRACK_OFFSETS[1:]]
+        next_track = view[offset]
+        next_sector = view[offset + 1]
 
-D81_TRACK_OFFSETS = [0]
-for t in range(1, 80):
-    D81_TRACK_OFFSETS.append(D81_TRACK_OFFSETS[-1] + D81_SECTOR_SIZES[t - 1])
+        # Son sector'da sadece kullanılan byte'ları al
+        if next_track == 0:
+            used_bytes = next_sector if next_sector > 0 else 254
+            yield view[offset + 2: offset + 2 + used_bytes]
+            return
+
+        # Tam sector
+        yield view[offset + 2: offset + SECTOR_SIZE]
+        start_track, start_sector = next_track, next_sector
+
+
+def _collect_chain_blocks(disk_data, start_track, start_sector, ext, max_sectors=200):
+    """T/S zincirini izleyip sektör veri kısımlarını kopyalamadan toplar.
+
+    (memoryview listesi, okunan sektör sayısı) döndürür; birleştirme
+    (tek kopya) çağırana bırakılır.
+    """
+    blocks = list(_iter_chain_blocks(disk_data, start_track, start_sector, ext, max_sectors))
+    return blocks, len(blocks)
+
+
+def _validate_image_size(ext, size):
+    """Format için minimum boyut kontrolü yapar."""
+    if ext == ".d64" and size < D64_SECTOR_COUNT * 256:
+        raise ValueError("Geçersiz D64 dosyası - boyut çok küçük")
+    elif ext == ".d71" and size < D71_SECTOR_COUNT * 256:
+        raise ValueError("Geçersiz D71 dosyası - boyut çok küçük")
+    elif ext == ".d81" and size < D81_SECTOR_COUNT * 256:
+        raise ValueError("Geçersiz D81 dosyası - boyut çok küçük")
+    elif ext == ".d84" and size < D84_SECTOR_COUNT * 256:
+        raise ValueError("Geçersiz D84 dosyası - boyut çok küçük")
+    elif ext == ".tap" and size < 20:
+        # TAP minimum header kontrolü
+        raise ValueError("Geçersiz TAP dosyası - boyut çok küçük")
+    elif ext == ".t64" and size < 64:
+        raise ValueError("Geçersiz T64 dosyası - boyut çok küçük")
+    elif ext == ".p00" and size < 26:
+        raise ValueError("Geçersiz P00 dosyası - boyut çok küçük")
+    elif ext == ".prg" and size < 3:
+        raise ValueError("Geçersiz PRG dosyası - boyut çok küçük")
+    elif ext in [".lnx", ".lynx"] and size < 32:
+        raise ValueError("Geçersiz LNX dosyası - boyut çok küçük")
+    elif ext == ".crt" and size < 64:
+        raise ValueError("Geçersiz CRT dosyası - boyut çok küçük")
+    elif ext == ".bin" and size < 1:
+        raise ValueError("Geçersiz BIN dosyası - boyut çok küçük")
+    elif ext == ".g64" and size < 256:
+        raise ValueError("Geçersiz G64 dosyası - boyut çok küçük")
 
-D84_TRACK_OFFSETS = [0]
-for t in range(1, 160):
-    D84_TRACK_OFFSETS.append(D84_TRACK_OFFSETS[-1] + D84_SECTOR_SIZES[t - 1])
 
 def read_image(file_path):
     """D64, D71, D81, D84, TAP, T64, P00, PRG, LNX, CRT, BIN dosyalarını okur."""
@@ -45,31 +222,7 @@ def read_image(file_path):
             data = bytearray(f.read())
         
         # Format validation
-        if ext == ".d64" and len(data) < D64_SECTOR_COUNT * 256:
-            raise ValueError("Geçersiz D64 dosyası - boyut çok küçük")
-        elif ext == ".d71" and len(data) < D71_SECTOR_COUNT * 256:
-            raise ValueError("Geçersiz D71 dosyası - boyut çok küçük")
-        elif ext == ".d81" and len(data) < D81_SECTOR_COUNT * 256:
-            raise ValueError("Geçersiz D81 dosyası - boyut çok küçük")
-        elif ext == ".d84" and len(data) < D84_SECTOR_COUNT * 256:
-            raise ValueError("Geçersiz D84 dosyası - boyut çok küçük")
-        elif ext == ".tap" and len(data) < 20:
-            # TAP minimum header kontrolü
-            raise ValueError("Geçersiz TAP dosyası - boyut çok küçük")
-        elif ext == ".t64" and len(data) < 64:
-            raise ValueError("Geçersiz T64 dosyası - boyut çok küçük")
-        elif ext == ".p00" and len(data) < 26:
-            raise ValueError("Geçersiz P00 dosyası - boyut çok küçük")
-        elif ext == ".prg" and len(data) < 3:
-            raise ValueError("Geçersiz PRG dosyası - boyut çok küçük")
-        elif ext in [".lnx", ".lynx"] and len(data) < 32:
-            raise ValueError("Geçersiz LNX dosyası - boyut çok küçük")
-        elif ext == ".crt" and len(data) < 64:
-            raise ValueError("Geçersiz CRT dosyası - boyut çok küçük")
-        elif ext == ".bin" and len(data) < 1:
-            raise ValueError("Geçersiz BIN dosyası - boyut çok küçük")
-        elif ext == ".g64" and len(data) < 256:
-            raise ValueError("Geçersiz G64 dosyası - boyut çok küçük")
+        _validate_image_size(ext, len(data))
         
         logging.info(f"Dosya okundu: {file_path}, Format: {ext}, Boyut: {len(data)} bytes")
         return data, ext
@@ -77,49 +230,28 @@ def read_image(file_path):
         logging.error(f"Dosya okuma hatası ({file_path}): {e}")
         raise Exception(f"Dosya okuma hatası: {e}")
 
-def get_sector_offset(track, sector, ext):
-    """Track ve sector için dosya ofsetini hesaplar."""
+def open_image(file_path):
+    """Dosyayı kopyalamadan mmap ile açar, (DiskImage, ext) döndürür.
+
+    read_image ile aynı doğrulamayı yapar; dönen DiskImage işi bitince
+    close() ile (veya ``with`` bloğu ile) kapatılmalıdır.
+    """
+    image = None
     try:
-        if ext == ".d64":
-            if not (1 <= track <= 35):
-                return -1
-            if sector >= SECTOR_SIZES[track - 1]:
-                return -1
-            index = TRACK_OFFSETS[track - 1] + sector
-            return index * 256
-        elif ext == ".d71":
-            if not (1 <= track <= 70):
-                return -1
-            # D71 iki taraflı: track 36-70 ikinci taraf
-            if track <= 35:
-                if sector >= SECTOR_SIZES[track - 1]:
-                    return -1
-                index = TRACK_OFFSETS[track - 1] + sector
-            else:
-                # İkinci taraf (track 36-70 -> track 1-35 ikinci taraf)
-                real_track = track - 35
-                if sector >= SECTOR_SIZES[real_track - 1]:
-                    return -1
-                index = TRACK_OFFSETS[34] + TRACK_OFFSETS[real_track - 1] + sector
-            return index * 256
-        elif ext == ".d81":
-            if not (1 <= track <= 80):
-                return -1
-            if sector >= D81_SECTOR_SIZES[track - 1]:
-                return -1
-            index = D81_TRACK_OFFSETS[track - 1] + sector
-            return index * 256
-        elif ext == ".d84":
-            if not (1 <= track <= 160):
-                return -1
-            if sector >= D84_SECTOR_SIZES[track - 1]:
-                return -1
-            index = D84_TRACK_OFFSETS[track - 1] + sector
-            return index * 256
-        return -1
+        ext = Path(file_path).suffix.lower()
+        image = DiskImage(file_path, ext)
+        _validate_image_size(ext, len(image))
+        logging.info(f"Dosya eşlendi (mmap): {file_path}, Format: {ext}, Boyut: {len(image)} bytes")
+        return image, ext
     except Exception as e:
-        logging.error(f"Sector offset hesaplama hatası: {e}")
-        return -1
+        if image is not None:
+            image.close()
+        logging.error(f"Dosya okuma hatası ({file_path}): {e}")
+        raise Exception(f"Dosya okuma hatası: {e}")
+
+def get_sector_offset(track, sector, ext):
+    """Track ve sector için dosya ofsetini hesaplar (disk_geometry tablosundan)."""
+    return sector_offset(track, sector, ext)
 
 def read_directory(disk_data, ext):
     """Disk formatına göre dosya dizinini okur."""
@@ -138,6 +270,7 @@ def read_directory(disk_data, ext):
             logging.warning(f"Directory okuma desteklenmiyor: {ext}")
             return dir_entries
 
+        disk_data = _as_view(disk_data)
         logging.info(f"Directory okunuyor: {ext}, Track: {track}, Sector: {sector}")
         sector_count = 0
         max_sectors = 50  # Sonsuz döngü koruması
@@ -362,36 +495,10 @@ def read_tap_directory(tap_data):
 def extract_prg_file(disk_data, start_track, start_sector, ext):
     """PRG dosyasını diskten çıkarır."""
     try:
-        blocks = []
-        sector_count = 0
-        max_sectors = 200  # Sonsuz döngü koruması
-        
-        while sector_count < max_sectors:
-            offset = get_sector_offset(start_track, start_sector, ext)
-            if offset < 0:
-                raise ValueError(f"Geçersiz track/sector: {start_track}/{start_sector}")
-                
-            if offset + 256 > len(disk_data):
-                raise ValueError(f"Disk veri sınırı aşıldı: {offset}")
-                
-            next_track = disk_data[offset]
-            next_sector = disk_data[offset + 1]
-            
-            # Son sector'da sadece kullanılan byte'ları al
-            if next_track == 0:
-                # Son sector - sadece kullanılan kısmı al
-                used_bytes = next_sector if next_sector > 0 else 254
-                blocks.append(disk_data[offset + 2: offset + 2 + used_bytes])
-                break
-            else:
-                # Tam sector
-                blocks.append(disk_data[offset + 2: offset + 256])
-                
-            start_track, start_sector = next_track, next_sector
-            sector_count += 1
-            
+        # Sektörler memoryview olarak toplanır, tek kopya join sırasında yapılır
+        blocks, sector_count = _collect_chain_blocks(disk_data, start_track, start_sector, ext)
         prg_data = b''.join(blocks)
-        logging.info(f"PRG çıkarıldı: {len(prg_data)} byte, {sector_count + 1} sector")
+        logging.info(f"PRG çıkarıldı: {len(prg_data)} byte, {sector_count} sector")
         return prg_data
         
     except Exception as e:
@@ -401,36 +508,10 @@ def extract_prg_file(disk_data, start_track, start_sector, ext):
 def extract_seq_file(disk_data, start_track, start_sector, ext):
     """SEQ (Sequential) dosyasını diskten çıkarır."""
     try:
-        blocks = []
-        sector_count = 0
-        max_sectors = 200  # Sonsuz döngü koruması
-        
-        while sector_count < max_sectors:
-            offset = get_sector_offset(start_track, start_sector, ext)
-            if offset < 0:
-                raise ValueError(f"Geçersiz track/sector: {start_track}/{start_sector}")
-                
-            if offset + 256 > len(disk_data):
-                raise ValueError(f"Disk veri sınırı aşıldı: {offset}")
-                
-            next_track = disk_data[offset]
-            next_sector = disk_data[offset + 1]
-            
-            # Son sector'da sadece kullanılan byte'ları al
-            if next_track == 0:
-                # Son sector - sadece kullanılan kısmı al
-                used_bytes = next_sector if next_sector > 0 else 254
-                blocks.append(disk_data[offset + 2: offset + 2 + used_bytes])
-                break
-            else:
-                # Tam sector
-                blocks.append(disk_data[offset + 2: offset + 256])
-                
-            start_track, start_sector = next_track, next_sector
-            sector_count += 1
-            
+        # Sektörler memoryview olarak toplanır, tek kopya join sırasında yapılır
+        blocks, sector_count = _collect_chain_blocks(disk_data, start_track, start_sector, ext)
         seq_data = b''.join(blocks)
-        logging.info(f"SEQ çıkarıldı: {len(seq_data)} byte, {sector_count + 1} sector")
+        logging.info(f"SEQ çıkarıldı: {len(seq_data)} byte, {sector_count} sector")
         return seq_data
         
     except Exception as e:
@@ -440,36 +521,10 @@ def extract_seq_file(disk_data, start_track, start_sector, ext):
 def extract_usr_file(disk_data, start_track, start_sector, ext):
     """USR dosyasını diskten çıkarır."""
     try:
-        blocks = []
-        sector_count = 0
-        max_sectors = 200  # Sonsuz döngü koruması
-        
-        while sector_count < max_sectors:
-            offset = get_sector_offset(start_track, start_sector, ext)
-            if offset < 0:
-                raise ValueError(f"Geçersiz track/sector: {start_track}/{start_sector}")
-                
-            if offset + 256 > len(disk_data):
-                raise ValueError(f"Disk veri sınırı aşıldı: {offset}")
-                
-            next_track = disk_data[offset]
-            next_sector = disk_data[offset + 1]
-            
-            # Son sector'da sadece kullanılan byte'ları al
-            if next_track == 0:
-                # Son sector - sadece kullanılan kısmı al
-                used_bytes = next_sector if next_sector > 0 else 254
-                blocks.append(disk_data[offset + 2: offset + 2 + used_bytes])
-                break
-            else:
-                # Tam sector
-                blocks.append(disk_data[offset + 2: offset + 256])
-                
-            start_track, start_sector = next_track, next_sector
-            sector_count += 1
-            
+        # Sektörler memoryview olarak toplanır, tek kopya join sırasında yapılır
+        blocks, sector_count = _collect_chain_blocks(disk_data, start_track, start_sector, ext)
         usr_data = b''.join(blocks)
-        logging.info(f"USR çıkarıldı: {len(usr_data)} byte, {sector_count + 1} sector")
+        logging.info(f"USR çıkarıldı: {len(usr_data)} byte, {sector_count} sector")
         return usr_data
         
     except Exception as e:
@@ -480,36 +535,10 @@ def extract_del_file(disk_data, start_track, start_sector, ext):
     """DEL (Deleted) dosyasını diskten çıkarır."""
     try:
         # DEL dosyaları silinmiş dosyalar - genellikle kurtarma için
-        blocks = []
-        sector_count = 0
-        max_sectors = 200  # Sonsuz döngü koruması
-        
-        while sector_count < max_sectors:
-            offset = get_sector_offset(start_track, start_sector, ext)
-            if offset < 0:
-                raise ValueError(f"Geçersiz track/sector: {start_track}/{start_sector}")
-                
-            if offset + 256 > len(disk_data):
-                raise ValueError(f"Disk veri sınırı aşıldı: {offset}")
-                
-            next_track = disk_data[offset]
-            next_sector = disk_data[offset + 1]
-            
-            # Son sector'da sadece kullanılan byte'ları al
-            if next_track == 0:
-                # Son sector - sadece kullanılan kısmı al
-                used_bytes = next_sector if next_sector > 0 else 254
-                blocks.append(disk_data[offset + 2: offset + 2 + used_bytes])
-                break
-            else:
-                # Tam sector
-                blocks.append(disk_data[offset + 2: offset + 256])
-                
-            start_track, start_sector = next_track, next_sector
-            sector_count += 1
-            
+        # Sektörler memoryview olarak toplanır, tek kopya join sırasında yapılır
+        blocks, sector_count = _collect_chain_blocks(disk_data, start_track, start_sector, ext)
         del_data = b''.join(blocks)
-        logging.info(f"DEL çıkarıldı: {len(del_data)} byte, {sector_count + 1} sector")
+        logging.info(f"DEL çıkarıldı: {len(del_data)} byte, {sector_count} sector")
         return del_data
         
     except Exception as e:
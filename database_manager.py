@@ -18,7 +18,12 @@ import json
 import os
 import hashlib
 import datetime
-from typing import Dict, List, Optional, Tuple
+import threading
+import weakref
+import re
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 import csv
 
 try:
@@ -27,28 +32,217 @@ try:
 except ImportError:
     PANDAS_AVAILABLE = False
 
+# Bekleyen yazmalar bu kadar satırda bir tek transaction ile commit edilir
+WRITE_BATCH_SIZE = 256
+# Hash hesaplamada okunan blok boyutu
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Sabit SQL metinleri: sqlite3 modülünün statement önbelleği her çağrıda
+# aynı hazırlanmış (prepared) statement'ı yeniden kullanır
+SQL_SELECT_FILE_BY_HASH = "SELECT id FROM processed_files WHERE file_hash = ?"
+SQL_TOUCH_FILE = """
+    UPDATE processed_files
+    SET last_processed = CURRENT_TIMESTAMP, notes = ?
+    WHERE id = ?
+"""
+SQL_INSERT_FILE = """
+    INSERT INTO processed_files
+    (filename, file_path, file_hash, file_size, source_format,
+     start_address, end_address, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_INSERT_CONVERSION = """
+    INSERT INTO format_conversions
+    (file_id, target_format, assembly_format, success, output_size,
+     processing_time, error_message, output_path)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_UPDATE_COUNTS = """
+    UPDATE processed_files
+    SET success_count = success_count + ?,
+        failure_count = failure_count + ?,
+        last_processed = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+# Arama indeksi: dönüşüm çıktıları ve program byte'ları contentless FTS5
+# tablolarında (rowid = format_conversions.id / processed_files.id), referans
+# verilen adresler program_refs tablosunda tutulur
+SQL_INSERT_OUTPUT_TEXT = "INSERT INTO output_fts (rowid, body) VALUES (?, ?)"
+SQL_INSERT_PROGRAM_BYTES = "INSERT INTO program_bytes_fts (rowid, hex) VALUES (?, ?)"
+SQL_INSERT_REFERENCE = """
+    INSERT OR IGNORE INTO program_refs (address, kind, file_id, name) VALUES (?, ?, ?, ?)
+"""
+SQL_MARK_INDEXED = "INSERT OR IGNORE INTO indexed_programs (file_id) VALUES (?)"
+SQL_IS_INDEXED = "SELECT 1 FROM indexed_programs WHERE file_id = ?"
+
+# BASIC anahtar kelime araması bu formatların çıktılarında yapılır
+BASIC_OUTPUT_FORMATS = ("basic", "petcat", "c64list", "enhanced_basic", "commodorebasicv2", "bas")
+# Oku-değiştir-yaz instruction'ları da yazma sayılır
+WRITE_MNEMONICS = frozenset(("STA", "STX", "STY", "INC", "DEC", "ASL", "LSR", "ROL", "ROR"))
+SEARCH_LIMIT = 500
+
+
+def _basic_program_end(prg_data) -> Optional[int]:
+    """BASIC satır zincirini izleyip programın bittiği ofseti döndür (BASIC değilse None)"""
+    load_address = prg_data[0] | (prg_data[1] << 8)
+    offset = 2
+    while offset + 1 < len(prg_data):
+        link = prg_data[offset] | (prg_data[offset + 1] << 8)
+        if link == 0:
+            return offset + 2
+        next_offset = link - load_address + 2
+        if next_offset <= offset + 4 or next_offset > len(prg_data):
+            return None
+        offset = next_offset
+    return None
+
+
+def extract_references(prg_data) -> List[Tuple[int, str]]:
+    """
+    PRG'nin mutlak adres referansları: [(adres, tür)]
+
+    Tür: 'call' (JSR), 'jump' (JMP), 'write' (store/RMW), 'read'.
+    $0801 BASIC programlarında yalnızca BASIC satırlarından sonraki makine
+    kodu taranır.
+    """
+    from linear_sweep import sweep
+    import opcode_decoder
+
+    if len(prg_data) < 3:
+        return []
+    start = 2
+    load_address = prg_data[0] | (prg_data[1] << 8)
+    if load_address == 0x0801:
+        start = _basic_program_end(prg_data) or 2
+    absolute_modes = (opcode_decoder.ABS, opcode_decoder.ABX, opcode_decoder.ABY, opcode_decoder.IND)
+    mnemonics = opcode_decoder.OPCODE_MNEMONICS
+    references = set()
+    for _address, opcode, operand, mode in sweep(bytes(prg_data[start:]),
+                                                 load_address + start - 2).records():
+        if mode not in absolute_modes or operand is None:
+            continue
+        mnemonic = mnemonics[opcode]
+        if mnemonic == "JSR":
+            kind = "call"
+        elif mnemonic == "JMP":
+            kind = "jump"
+        elif mnemonic in WRITE_MNEMONICS:
+            kind = "write"
+        else:
+            kind = "read"
+        references.add((operand, kind))
+    return sorted(references)
+
+
+@lru_cache(maxsize=65536)
+def _symbol_name(address: int) -> Optional[str]:
+    """Adresin bilgi tabanındaki sembol adı (KERNAL/BASIC/IO ...)"""
+    try:
+        from c64_knowledge_base import get_knowledge_base
+        knowledge_base = get_knowledge_base()
+    except ImportError:
+        return None
+    return knowledge_base.name(address) if knowledge_base else None
+
+
+@lru_cache(maxsize=1024)
+def _symbol_addresses(name: str) -> Tuple[int, ...]:
+    """Sembol adının tüm kaynaklardaki karşılıkları (CHROUT ve BSOUT -> $FFD2)"""
+    try:
+        from c64_knowledge_base import symbol_addresses
+    except ImportError:
+        return ()
+    return symbol_addresses(name)
+
+
+def _phrase_query(tokens: Sequence[str]) -> str:
+    """Token'ları FTS5 phrase sorgusuna çevir (sözdizimi karakterleri kaçışsız kalmaz)"""
+    return '"' + " ".join(token.replace('"', '""') for token in tokens) + '"'
+
+
+def parse_byte_pattern(pattern: str) -> List[str]:
+    """'20 D2 FF', '$20,$D2,$FF' veya '20d2ff' -> ['20', 'd2', 'ff']"""
+    digits = re.sub(r"0x|\$|[\s,]", "", pattern.lower())
+    if not digits or len(digits) % 2 or re.search(r"[^0-9a-f]", digits):
+        raise ValueError(f"Geçersiz byte deseni: {pattern!r}")
+    return [digits[i:i + 2] for i in range(0, len(digits), 2)]
+
+
+def _write_pending(conn, pending: List[Tuple[Tuple, Optional[str]]], fts_available: bool):
+    """Kuyruktaki dönüşüm satırlarını tek transaction ile yaz ve commit et"""
+    if pending:
+        rows = pending[:]
+        del pending[:]
+        counts: Dict[int, List[int]] = {}
+        cursor = conn.cursor()
+        for row, output_text in rows:
+            success_failure = counts.setdefault(row[0], [0, 0])
+            success_failure[0 if row[3] else 1] += 1
+            cursor.execute(SQL_INSERT_CONVERSION, row)
+            if output_text and fts_available:
+                cursor.execute(SQL_INSERT_OUTPUT_TEXT, (cursor.lastrowid, output_text))
+        conn.executemany(SQL_UPDATE_COUNTS,
+                         [(ok, failed, file_id) for file_id, (ok, failed) in counts.items()])
+    if conn.in_transaction:
+        conn.commit()
+
+
+def _close_connection(conn, pending: List[Tuple[Tuple, Optional[str]]], fts_available: bool):
+    """Kuyruğu boşalt ve bağlantıyı kapat (close(), çöp toplama veya çıkışta)"""
+    try:
+        _write_pending(conn, pending, fts_available)
+    finally:
+        conn.close()
+
+
 class DatabaseManager:
-    """İşlenmiş dosyalar için veritabanı yöneticisi"""
+    """İşlenmiş dosyalar için veritabanı yöneticisi
+
+    Tek, uzun ömürlü (WAL modunda) bir bağlantı kullanır. Format dönüşüm
+    kayıtları bellekteki bir yazma kuyruğunda toplanır ve ``batch_size``
+    satırda bir tek transaction ile yazılır; okuma metotları önce kuyruğu
+    boşaltır. Dosya kayıtları id döndürdüğü için hemen commit edilir;
+    çağrılar arasında açık yazma transaction'ı (ve SQLite yazma kilidi)
+    kalmaz, aynı veritabanını paylaşan GUI ve batch_scanner birbirini
+    bekletmez.
+    """
     
-    def __init__(self, db_path: str = "logs/processed_files.db"):
+    def __init__(self, db_path: str = "logs/processed_files.db",
+                 batch_size: int = WRITE_BATCH_SIZE):
         """
         Database Manager başlatma
         
         Args:
             db_path: SQLite veritabanı dosya yolu
+            batch_size: Commit başına en fazla bekleyen yazma sayısı
         """
         self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.RLock()
+        self._pending_conversions: List[Tuple[Tuple, Optional[str]]] = []
+        self.fts_available = True
         self.ensure_database_dir()
+        
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     timeout=30, cached_statements=128)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self.init_database()
+        # Örneği çıkışa kadar canlı tutmaz; kapatılmadan toplanırsa da kuyruk yazılır
+        self._finalizer = weakref.finalize(self, _close_connection, self._conn,
+                                           self._pending_conversions, self.fts_available)
     
     def ensure_database_dir(self):
         """Veritabanı dizinini oluştur"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
     
     def init_database(self):
         """Veritabanı tablolarını oluştur"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
             
             # Ana dosya tablosu
             cursor.execute("""
@@ -99,134 +293,190 @@ class DatabaseManager:
                 )
             """)
             
-            conn.commit()
+            # Arama/sıralama indeksleri (file_hash UNIQUE kısıtıyla zaten indeksli)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_filename ON processed_files (filename)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_last_processed ON processed_files (last_processed)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_conversions_file_id ON format_conversions (file_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_conversions_date ON format_conversions (conversion_date)")
+            
+            # Yapısal arama: program başına referans verilen adresler
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS program_refs (
+                    address INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    file_id INTEGER NOT NULL,
+                    name TEXT,
+                    PRIMARY KEY (address, kind, file_id)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_refs_name ON program_refs (name COLLATE NOCASE)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_refs_file_id ON program_refs (file_id)")
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS indexed_programs (
+                    file_id INTEGER PRIMARY KEY
+                )
+            """)
+            
+            # Tam metin arama (FTS5 yoksa bu aramalar devre dışı kalır)
+            try:
+                cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS output_fts USING fts5(body, content='')")
+                cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS program_bytes_fts USING fts5(hex, content='')")
+            except sqlite3.OperationalError as e:
+                self.fts_available = False
+                print(f"⚠️ SQLite FTS5 bulunamadı - içerik araması devre dışı: {e}")
     
     def calculate_file_hash(self, file_path: str) -> str:
-        """Dosya hash'i hesapla"""
+        """Dosya hash'i hesapla (bloklar halinde, dosyayı belleğe almadan)"""
         try:
-            with open(file_path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+            digest = hashlib.md5()
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            with open(file_path, 'rb', buffering=0) as f:
+                while True:
+                    size = f.readinto(buffer)
+                    if not size:
+                        break
+                    digest.update(view[:size])
+            return digest.hexdigest()
         except Exception:
             return ""
     
+    # === Yazma kuyruğu ===
+    
+    def _note_write_locked(self):
+        """Kuyruk eşiği aştıysa commit et"""
+        if len(self._pending_conversions) >= self.batch_size:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        _write_pending(self._conn, self._pending_conversions, self.fts_available)
+    
+    def flush(self):
+        """Bekleyen tüm yazmaları tek transaction ile veritabanına yaz"""
+        with self._lock:
+            self._flush_locked()
+    
+    def close(self):
+        """Kuyruğu boşalt ve bağlantıyı kapat"""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn = None
+            self._finalizer()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    @contextmanager
+    def _connection(self):
+        """Kuyruğu boşaltılmış paylaşılan bağlantı (başarıda commit, hatada rollback)"""
+        with self._lock:
+            self._flush_locked()
+            with self._conn:
+                yield self._conn
+    
+    def _query(self, sql: str, params: Tuple = ()) -> List[Dict]:
+        """Kuyruğu boşaltıp sorguyu çalıştır, satırları sözlük olarak döndür"""
+        with self._lock:
+            self._flush_locked()
+            cursor = self._conn.execute(sql, params)
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
     def add_processed_file(self, filename: str, file_path: str, 
                           source_format: str, start_address: int = None, 
-                          end_address: int = None, notes: str = "") -> int:
-        """İşlenmiş dosyayı veritabanına ekle"""
+                          end_address: int = None, notes: str = "",
+                          data: Optional[bytes] = None) -> int:
+        """İşlenmiş dosyayı veritabanına ekle
+        
+        Args:
+            data: Dosya içeriği elde varsa (ör. diskten çıkarılan PRG) hash
+                  ve boyut diskten okunmadan bundan hesaplanır
+        """
         
-        file_hash = self.calculate_file_hash(file_path)
-        file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+        if data is not None:
+            file_hash = hashlib.md5(data).hexdigest()
+            file_size = len(data)
+        else:
+            file_hash = self.calculate_file_hash(file_path)
+            file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        # id çağırana döndüğü için kuyruğa alınmaz; transaction çağrı içinde
+        # commit (hatada rollback) edilir, yazma kilidi açık kalmaz
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
             
             # Mevcut dosyayı kontrol et
-            cursor.execute("SELECT id FROM processed_files WHERE file_hash = ?", (file_hash,))
+            cursor.execute(SQL_SELECT_FILE_BY_HASH, (file_hash,))
             existing = cursor.fetchone()
             
             if existing:
                 # Mevcut dosyayı güncelle
-                cursor.execute("""
-                    UPDATE processed_files 
-                    SET last_processed = CURRENT_TIMESTAMP, notes = ?
-                    WHERE id = ?
-                """, (notes, existing[0]))
-                return existing[0]
+                cursor.execute(SQL_TOUCH_FILE, (notes, existing[0]))
+                file_id = existing[0]
             else:
                 # Yeni dosya ekle
-                cursor.execute("""
-                    INSERT INTO processed_files 
-                    (filename, file_path, file_hash, file_size, source_format, 
-                     start_address, end_address, notes)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (filename, file_path, file_hash, file_size, source_format,
-                     start_address, end_address, notes))
-                
-                return cursor.lastrowid
+                cursor.execute(SQL_INSERT_FILE, (filename, file_path, file_hash, file_size,
+                                                 source_format, start_address, end_address, notes))
+                file_id = cursor.lastrowid
+            
+            if data is not None and len(data) > 2:
+                self._index_program_locked(cursor, file_id, data)
+            return file_id
+    
+    def _index_program_locked(self, cursor, file_id: int, data: bytes):
+        """Program referanslarını ve byte'larını arama indeksine ekle (bir kez)"""
+        if cursor.execute(SQL_IS_INDEXED, (file_id,)).fetchone():
+            return
+        references = [(address, kind, file_id, _symbol_name(address))
+                      for address, kind in extract_references(data)]
+        cursor.executemany(SQL_INSERT_REFERENCE, references)
+        if self.fts_available:
+            cursor.execute(SQL_INSERT_PROGRAM_BYTES,
+                           (file_id, " ".join(f"{value:02x}" for value in data[2:])))
+        cursor.execute(SQL_MARK_INDEXED, (file_id,))
     
     def add_format_conversion(self, file_id: int, target_format: str, 
                             success: bool, output_size: int = 0,
                             processing_time: float = 0.0, error_message: str = "",
-                            output_path: str = "", assembly_format: str = ""):
-        """Format dönüşüm sonucu ekle"""
+                            output_path: str = "", assembly_format: str = "",
+                            output_text: Optional[str] = None):
+        """Format dönüşüm sonucu ekle (yazma kuyruğuna)
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO format_conversions 
-                (file_id, target_format, assembly_format, success, output_size,
-                 processing_time, error_message, output_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (file_id, target_format, assembly_format, success, output_size,
-                 processing_time, error_message, output_path))
-            
-            # Ana dosya tablosundaki sayaçları güncelle
-            if success:
-                cursor.execute("""
-                    UPDATE processed_files 
-                    SET success_count = success_count + 1,
-                        last_processed = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (file_id,))
-            else:
-                cursor.execute("""
-                    UPDATE processed_files 
-                    SET failure_count = failure_count + 1,
-                        last_processed = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (file_id,))
+        Args:
+            output_text: Verilirse çıktı metni tam metin arama indeksine eklenir
+        """
+        
+        with self._lock:
+            self._pending_conversions.append(((
+                file_id, target_format, assembly_format, success, output_size,
+                processing_time, error_message, output_path), output_text))
+            self._note_write_locked()
     
     def get_file_history(self, filename: str = None, file_hash: str = None) -> List[Dict]:
         """Dosya işlem geçmişini getir"""
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            if file_hash:
-                query = """
-                    SELECT pf.*, 
-                           GROUP_CONCAT(fc.target_format || ':' || fc.success) as conversions
-                    FROM processed_files pf
-                    LEFT JOIN format_conversions fc ON pf.id = fc.file_id
-                    WHERE pf.file_hash = ?
-                    GROUP BY pf.id
-                """
-                cursor.execute(query, (file_hash,))
-            elif filename:
-                query = """
-                    SELECT pf.*, 
-                           GROUP_CONCAT(fc.target_format || ':' || fc.success) as conversions
-                    FROM processed_files pf
-                    LEFT JOIN format_conversions fc ON pf.id = fc.file_id
-                    WHERE pf.filename LIKE ?
-                    GROUP BY pf.id
-                """
-                cursor.execute(query, (f"%{filename}%",))
-            else:
-                query = """
-                    SELECT pf.*, 
-                           GROUP_CONCAT(fc.target_format || ':' || fc.success) as conversions
-                    FROM processed_files pf
-                    LEFT JOIN format_conversions fc ON pf.id = fc.file_id
-                    GROUP BY pf.id
-                    ORDER BY pf.last_processed DESC
-                """
-                cursor.execute(query)
-            
-            columns = [desc[0] for desc in cursor.description]
-            results = []
-            
-            for row in cursor.fetchall():
-                row_dict = dict(zip(columns, row))
-                results.append(row_dict)
-            
-            return results
+        query = """
+            SELECT pf.*, 
+                   GROUP_CONCAT(fc.target_format || ':' || fc.success) as conversions
+            FROM processed_files pf
+            LEFT JOIN format_conversions fc ON pf.id = fc.file_id
+        """
+        if file_hash:
+            return self._query(query + " WHERE pf.file_hash = ? GROUP BY pf.id", (file_hash,))
+        if filename:
+            return self._query(query + " WHERE pf.filename LIKE ? GROUP BY pf.id",
+                               (f"%{filename}%",))
+        return self._query(query + " GROUP BY pf.id ORDER BY pf.last_processed DESC")
     
     def get_statistics(self) -> Dict:
         """İstatistikleri getir"""
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             
             stats = {}
@@ -305,7 +555,7 @@ class DatabaseManager:
             return False
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 # Ana dosya tablosu
                 files_df = pd.read_sql_query("""
                     SELECT filename, file_path, file_size, source_format, 
@@ -358,7 +608,7 @@ class DatabaseManager:
         try:
             os.makedirs(output_dir, exist_ok=True)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Processed files CSV
@@ -422,64 +672,135 @@ class DatabaseManager:
     def cleanup_old_records(self, days: int = 30) -> int:
         """Eski kayıtları temizle"""
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             
             # 30 günden eski kayıtları sil
+            age = f"-{int(days)} days"
             cursor.execute("""
                 DELETE FROM format_conversions 
-                WHERE conversion_date < datetime('now', '-{} days')
-            """.format(days))
+                WHERE conversion_date < datetime('now', ?)
+            """, (age,))
             
             deleted_conversions = cursor.rowcount
             
             cursor.execute("""
                 DELETE FROM processed_files 
-                WHERE processing_date < datetime('now', '-{} days')
+                WHERE processing_date < datetime('now', ?)
                 AND id NOT IN (SELECT DISTINCT file_id FROM format_conversions)
-            """.format(days))
+            """, (age,))
             
             deleted_files = cursor.rowcount
             
+            # Silinen dosyaların referans indeksi (contentless FTS satırları
+            # AUTOINCREMENT id'ler tekrar kullanılmadığından sorgularda elenir)
+            if deleted_files:
+                for table in ("program_refs", "indexed_programs"):
+                    cursor.execute(f"""
+                        DELETE FROM {table}
+                        WHERE file_id NOT IN (SELECT id FROM processed_files)
+                    """)
+            
             return deleted_conversions + deleted_files
     
+    def search_outputs(self, term: str, target_formats: Optional[Sequence[str]] = None,
+                       limit: int = SEARCH_LIMIT) -> List[Dict]:
+        """Tüm dönüşüm çıktılarında tam metin (phrase) arama"""
+        tokens = re.findall(r"\w+", term)
+        if not tokens or not self.fts_available:
+            return []
+        sql = """
+            SELECT pf.*, fc.target_format, fc.output_path, fc.id AS conversion_id
+            FROM output_fts
+            JOIN format_conversions fc ON fc.id = output_fts.rowid
+            JOIN processed_files pf ON pf.id = fc.file_id
+            WHERE output_fts MATCH ?
+        """
+        params: List = [_phrase_query(tokens)]
+        if target_formats:
+            sql += f" AND fc.target_format IN ({', '.join('?' * len(target_formats))})"
+            params.extend(target_formats)
+        sql += " ORDER BY output_fts.rank LIMIT ?"
+        params.append(limit)
+        return self._query(sql, tuple(params))
+    
+    def find_references(self, address: Optional[int] = None, name: Optional[str] = None,
+                        kind: Optional[str] = None, limit: int = SEARCH_LIMIT) -> List[Dict]:
+        """Bir adrese/sembole referans veren programlar (ör. $FFD2'yi çağıranlar)"""
+        if address is not None:
+            where, params = "r.address = ?", [address]
+        elif name:
+            # Bilgi tabanı adresi tek adla kaydeder; diğer adlar adrese çözülür
+            addresses = _symbol_addresses(name.strip().upper())
+            where = "(r.name = ? COLLATE NOCASE" + " OR r.address = ?" * len(addresses) + ")"
+            params = [name, *addresses]
+        else:
+            return []
+        if kind:
+            where += " AND r.kind = ?"
+            params.append(kind)
+        params.append(limit)
+        return self._query(f"""
+            SELECT pf.*, r.address AS ref_address, r.kind AS ref_kind, r.name AS ref_name
+            FROM program_refs r
+            JOIN processed_files pf ON pf.id = r.file_id
+            WHERE {where}
+            ORDER BY pf.last_processed DESC
+            LIMIT ?
+        """, tuple(params))
+    
+    def search_byte_pattern(self, pattern: str, limit: int = SEARCH_LIMIT) -> List[Dict]:
+        """Program byte'larında ardışık byte deseni ara (ör. '20 D2 FF')"""
+        if not self.fts_available:
+            return []
+        return self._query("""
+            SELECT pf.* FROM program_bytes_fts
+            JOIN processed_files pf ON pf.id = program_bytes_fts.rowid
+            WHERE program_bytes_fts MATCH ?
+            LIMIT ?
+        """, (_phrase_query(parse_byte_pattern(pattern)), limit))
+    
     def search_files(self, search_term: str, search_type: str = "filename") -> List[Dict]:
-        """Dosya arama"""
+        """Dosya arama
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            if search_type == "filename":
-                query = """
-                    SELECT * FROM processed_files 
-                    WHERE filename LIKE ?
-                    ORDER BY last_processed DESC
-                """
-                cursor.execute(query, (f"%{search_term}%",))
-            elif search_type == "format":
-                query = """
-                    SELECT DISTINCT pf.* FROM processed_files pf
-                    JOIN format_conversions fc ON pf.id = fc.file_id
-                    WHERE fc.target_format LIKE ?
-                    ORDER BY pf.last_processed DESC
-                """
-                cursor.execute(query, (f"%{search_term}%",))
-            elif search_type == "notes":
-                query = """
-                    SELECT * FROM processed_files 
-                    WHERE notes LIKE ?
-                    ORDER BY last_processed DESC
-                """
-                cursor.execute(query, (f"%{search_term}%",))
-            
-            columns = [desc[0] for desc in cursor.description]
-            results = []
-            
-            for row in cursor.fetchall():
-                row_dict = dict(zip(columns, row))
-                results.append(row_dict)
-            
-            return results
+        search_type: filename, format, notes, content (tüm çıktılarda metin),
+        symbol ($FFD2 / CHROUT), bytes (20 D2 FF), keyword (BASIC anahtar kelimesi)
+        """
+        
+        pattern = f"%{search_term}%"
+        if search_type == "filename":
+            return self._query("""
+                SELECT * FROM processed_files 
+                WHERE filename LIKE ?
+                ORDER BY last_processed DESC
+            """, (pattern,))
+        if search_type == "format":
+            return self._query("""
+                SELECT DISTINCT pf.* FROM processed_files pf
+                JOIN format_conversions fc ON pf.id = fc.file_id
+                WHERE fc.target_format LIKE ?
+                ORDER BY pf.last_processed DESC
+            """, (pattern,))
+        if search_type == "notes":
+            return self._query("""
+                SELECT * FROM processed_files 
+                WHERE notes LIKE ?
+                ORDER BY last_processed DESC
+            """, (pattern,))
+        if search_type == "content":
+            return self.search_outputs(search_term)
+        if search_type == "keyword":
+            return self.search_outputs(search_term, BASIC_OUTPUT_FORMATS)
+        if search_type == "bytes":
+            return self.search_byte_pattern(search_term)
+        if search_type == "symbol":
+            from c64_knowledge_base import parse_address
+            # Yalnızca $, 0x veya ondalık biçim adrestir - ADD/BEEF/FACE ad olarak aranır
+            address = parse_address(search_term, strict=True)
+            if address is not None:
+                return self.find_references(address=address)
+            return self.find_references(name=search_term.strip())
+        return []
 
 # Test fonksiyonu
 if __name__ == "__main__":
@@ -516,5 +837,6 @@ if __name__ == "__main__":
     stats = db.get_statistics()
     print(f"📊 Toplam dosya: {stats['total_files']}")
     print(f"📊 Format istatistikleri: {stats['format_stats']}")
+    db.close()
     
     print("✅ Database Manager test tamamlandı")
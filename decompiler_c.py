@@ -1,8 +1,9 @@
-import re
 import json
 import logging
 from datetime import datetime
 
+from decompiler_records import InstructionRecordsMixin
+
 # C64 Memory Manager import
 try:
     from c64_memory_manager import c64_memory_manager, get_routine_info, get_memory_info, format_routine_call, format_memory_access
@@ -39,11 +40,12 @@ class ASTNode:
         self.params = params or []
 
 # Decompiler sınıfı
-class Decompiler:
-    def __init__(self, disassembly_file, memory_map_file='memory_map.json'):
+class Decompiler(InstructionRecordsMixin):
+    def __init__(self, disassembly_file=None, memory_map_file='memory_map.json', instructions=None):
         logging.debug(f"Decompiler başlatılıyor: {disassembly_file}")
         try:
-            self.disassembly_lines = self.load_disassembly(disassembly_file)
+            self.disassembly_lines = self.load_disassembly(disassembly_file) if disassembly_file else []
+            self.instruction_records = list(instructions) if instructions is not None else None
             self.memory_map = self.load_memory_map(memory_map_file)
             self.opcode_map = self.load_opcode_map()
             self.ast = ASTNode('program')
@@ -53,6 +55,7 @@ class Decompiler:
             self.zeropage_vars = {}
             self.jump_tables = {}
             self.recursive_calls = set()
+            self.flow_graph = None
             self.line_number = 0  # C'de satır numarası kullanılmaz, ama izleme için tutuyoruz
         except Exception as e:
             logging.critical(f"Decompiler başlatma hatası: {str(e)}")
@@ -100,56 +103,28 @@ class Decompiler:
         """Disassembly satırlarını analiz et ve talimat listesi oluştur"""
         logging.debug("Disassembly satırları analiz ediliyor")
         try:
-            instructions = []
-            for line in self.disassembly_lines:
-                match = re.match(r'\$([0-9A-F]{4})(?:\s+[0-9A-F]{2})*\s*([A-Z]+)\s*(.*)', line)
-                if match:
-                    addr = int(match.group(1), 16)
-                    opcode = match.group(2)
-                    operand = match.group(3).strip() if match.group(3) else ''
-                    if operand.startswith('$'):
-                        operand = int(operand.replace('$', ''), 16)
-                    instructions.append((addr, opcode, operand))
-                    if opcode in ['JMP', 'BNE', 'BEQ', 'JSR']:
-                        if isinstance(operand, int):
-                            if operand in self.memory_map:
-                                self.labels[operand] = self.memory_map[operand]
-                            elif operand not in self.labels:
-                                self.labels[operand] = f"label_{operand:04x}"
-                            if opcode == 'JSR' and operand == addr:
-                                self.recursive_calls.add(operand)
-                    if opcode == 'JSR' and isinstance(operand, int):
-                        self.functions[operand] = f"func_{operand:04x}"
-                    if isinstance(operand, int) and 0x00 <= operand <= 0xFF:
-                        self.zeropage_vars[operand] = f"zvar_{operand:02x}"
-                    if opcode == 'JMP' and isinstance(operand, str) and '),Y' in operand:
-                        self.jump_tables[addr] = operand
+            instructions = self.load_instructions()
+            for addr, opcode, operand in instructions:
+                if opcode in ['JMP', 'BNE', 'BEQ', 'JSR']:
+                    if isinstance(operand, int):
+                        if operand in self.memory_map:
+                            self.labels[operand] = self.memory_map[operand]
+                        elif operand not in self.labels:
+                            self.labels[operand] = f"label_{operand:04x}"
+                        if opcode == 'JSR' and operand == addr:
+                            self.recursive_calls.add(operand)
+                if opcode == 'JSR' and isinstance(operand, int):
+                    self.functions[operand] = f"func_{operand:04x}"
+                if isinstance(operand, int) and 0x00 <= operand <= 0xFF:
+                    self.zeropage_vars[operand] = f"zvar_{operand:02x}"
+                if opcode == 'JMP' and isinstance(operand, str) and '),Y' in operand:
+                    self.jump_tables[addr] = operand
             logging.info(f"Toplam {len(instructions)} talimat ayrıştırıldı")
             return instructions
         except Exception as e:
             logging.critical(f"Disassembly ayrıştırma hatası: {str(e)}")
             raise
 
-    def build_cfg(self, instructions):
-        """Kontrol akış grafiği oluştur"""
-        logging.debug("CFG oluşturuluyor")
-        try:
-            blocks = []
-            current_block = []
-            for instr in instructions:
-                addr, op, operand = instr
-                current_block.append(instr)
-                if op in ['JMP', 'BNE', 'BEQ', 'RTS']:
-                    blocks.append((current_block[0][0], addr, current_block))
-                    current_block = []
-            if current_block:
-                blocks.append((current_block[0][0], current_block[-1][0], current_block))
-            logging.info(f"Toplam {len(blocks)} blok oluşturuldu")
-            return blocks
-        except Exception as e:
-            logging.critical(f"CFG oluşturma hatası: {str(e)}")
-            raise
-
     def detect_struct(self, block):
         """Struct pattern'larını tespit et"""
         try:
@@ -644,15 +619,3 @@ class Decompiler:
         except Exception as e:
             logging.critical(f"Kod üretme hatası: {str(e)}")
             raise
-
-    def decompile(self):
-        """Decompile işlemini gerçekleştir"""
-        logging.debug("Decompile işlemi başlatılıyor")
-        try:
-            instructions = self.parse_disassembly()
-            blocks = self.build_cfg(instructions)
-            self.build_ast(blocks)
-            return self.emit_code()
-        except Exception as e:
-            logging.critical(f"Decompile işlemi hatası: {str(e)}")
-            raise
\ No newline at end of file
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Decompiler kayıt girişi - C, C++ ve QBasic decompiler'larının ortak parçası
+===========================================================================
+
+Disassembler'dan gelen (adres, opcode, operand, mod) kayıtlarını veya
+disassembly metnini (adres, mnemonic, operand) talimat listesine çevirir,
+kontrol akış grafiğini kurar ve decompile akışını yürütür. Dile özgü
+parse_disassembly / build_ast / emit_code alt sınıflarda kalır.
+"""
+
+import re
+import logging
+
+import opcode_decoder
+from code_flow import FlowGraph
+from linear_sweep import decode_prg_records
+
+LISTING_LINE = re.compile(r'\$([0-9A-F]{4})(?:\s+[0-9A-F]{2})*\s*([A-Z]+)\s*(.*)')
+
+
+class InstructionRecordsMixin:
+    """
+    Decompiler sınıflarına yapısal kayıt girişi ekler
+
+    Alt sınıf ``instruction_records`` (None veya kayıt listesi) ve
+    ``disassembly_lines`` niteliklerini kurar; ``parse_disassembly``,
+    ``build_ast`` ve ``emit_code`` metotlarını sağlar.
+    """
+
+    @classmethod
+    def from_instructions(cls, instructions, memory_map_file='memory_map.json'):
+        """Disassembler'dan gelen (adres, opcode, operand, mod) kayıtlarıyla başlat
+
+        Disassembly metni yazılıp tekrar ayrıştırılmaz, geçici dosya gerekmez.
+        """
+        return cls(memory_map_file=memory_map_file, instructions=instructions)
+
+    def load_instructions(self):
+        """Talimat listesini yapısal kayıtlardan veya disassembly metninden oluştur"""
+        if self.instruction_records is not None:
+            return [opcode_decoder.listing_tuple(*record) for record in self.instruction_records]
+        instructions = []
+        for line in self.disassembly_lines:
+            match = LISTING_LINE.match(line)
+            if match:
+                addr = int(match.group(1), 16)
+                opcode = match.group(2)
+                operand = match.group(3).strip() if match.group(3) else ''
+                if operand.startswith('$'):
+                    operand = int(operand.replace('$', ''), 16)
+                instructions.append((addr, opcode, operand))
+        return instructions
+
+    def build_cfg(self, instructions):
+        """Kontrol akış grafiği oluştur"""
+        logging.debug("CFG oluşturuluyor")
+        try:
+            self.flow_graph = FlowGraph.from_instructions(instructions)
+            blocks = self.flow_graph.as_blocks()
+            logging.info(f"Toplam {len(blocks)} blok oluşturuldu")
+            return blocks
+        except Exception as e:
+            logging.critical(f"CFG oluşturma hatası: {str(e)}")
+            raise
+
+    def decompile(self, prg_data=None, start_address=None):
+        """Decompile işlemini gerçekleştir
+
+        Args:
+            prg_data: Verilirse PRG doğrudan çözülür (disassembly dosyası gerekmez)
+            start_address: Çözmeye başlanacak adres (None ise load address)
+        """
+        logging.debug("Decompile işlemi başlatılıyor")
+        try:
+            if prg_data is not None:
+                self.instruction_records = decode_prg_records(prg_data, start_address)
+            instructions = self.parse_disassembly()
+            blocks = self.build_cfg(instructions)
+            self.build_ast(blocks)
+            return self.emit_code()
+        except Exception as e:
+            logging.critical(f"Decompile işlemi hatası: {str(e)}")
+            raise
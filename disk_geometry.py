@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Disk Geometry - Commodore disk imajları için ortak track/sector tabloları
+
+D64, D71, D81 ve D84 formatları için track/sector -> byte ofset tabloları
+modül yüklenirken bir kez hesaplanır. Her tablo ``track * 256 + sector``
+ile indekslenen düz bir ``array('i')`` dizisidir; geçersiz track/sector
+çiftleri -1 içerir. Böylece T/S zinciri izlemek dallanmasız bir tablo
+okumasına indirgenir.
+
+d64_reader, enhanced_d64_reader, enhanced_disk_reader ve
+c1541_python_emulator bu modülü kullanır.
+"""
+
+from array import array
+
+SECTOR_SIZE = 256
+
+# Track başına sector sayıları
+D64_SECTORS_PER_TRACK = [
+    21 if t <= 17 else 19 if t <= 24 else 18 if t <= 30 else 17
+    for t in range(1, 36)
+]
+D71_SECTORS_PER_TRACK = D64_SECTORS_PER_TRACK + D64_SECTORS_PER_TRACK  # Her iki yüz için
+D81_SECTORS_PER_TRACK = [40] * 80
+D84_SECTORS_PER_TRACK = [40] * 160  # Double-sided
+
+
+def _build_offset_table(sectors_per_track):
+    """Track/sector -> byte ofset tablosu oluşturur (geçersiz: -1)."""
+    table = array('i', [-1]) * ((len(sectors_per_track) + 1) * 256)
+    block = 0
+    for track, sectors in enumerate(sectors_per_track, start=1):
+        base = track << 8
+        for sector in range(sectors):
+            table[base + sector] = block * SECTOR_SIZE
+            block += 1
+    return table
+
+
+def _build_block_table(sectors_per_track):
+    """Block numarası -> (track << 8 | sector) ters tablosu oluşturur."""
+    table = array('H')
+    for track, sectors in enumerate(sectors_per_track, start=1):
+        for sector in range(sectors):
+            table.append((track << 8) | sector)
+    return table
+
+
+_SECTORS_PER_TRACK = {
+    "d64": D64_SECTORS_PER_TRACK,
+    "d71": D71_SECTORS_PER_TRACK,
+    "d81": D81_SECTORS_PER_TRACK,
+    "d84": D84_SECTORS_PER_TRACK,
+}
+
+OFFSET_TABLES = {fmt: _build_offset_table(spt) for fmt, spt in _SECTORS_PER_TRACK.items()}
+BLOCK_TABLES = {fmt: _build_block_table(spt) for fmt, spt in _SECTORS_PER_TRACK.items()}
+
+# Boş tablo: desteklenmeyen formatlarda her arama -1 döner
+_EMPTY_TABLE = array('i')
+
+
+def normalize_format(fmt):
+    """'.d64', 'd64', 'D64' gibi yazımları 'd64' biçimine çevirir."""
+    if fmt is None:
+        return ""
+    fmt = getattr(fmt, "value", fmt)
+    return str(fmt).lower().lstrip(".")
+
+
+def get_offset_table(fmt):
+    """Format için track*256+sector indeksli ofset tablosunu döndürür."""
+    return OFFSET_TABLES.get(normalize_format(fmt), _EMPTY_TABLE)
+
+
+def get_sectors_per_track(fmt):
+    """Format için track başına sector sayısı listesini döndürür."""
+    return _SECTORS_PER_TRACK.get(normalize_format(fmt), [])
+
+
+def sector_offset(track, sector, fmt):
+    """Track/sector için byte ofsetini döndürür, geçersizse -1."""
+    table = OFFSET_TABLES.get(normalize_format(fmt), _EMPTY_TABLE)
+    if not (0 <= sector < 256):
+        return -1
+    index = (track << 8) | sector
+    if 0 <= index < len(table):
+        return table[index]
+    return -1
+
+
+def sector_block(track, sector, fmt):
+    """Track/sector için block numarasını döndürür, geçersizse -1."""
+    offset = sector_offset(track, sector, fmt)
+    return offset >> 8 if offset >= 0 else -1
+
+
+def block_to_track_sector(block, fmt):
+    """Block numarasını (track, sector) çiftine çevirir, geçersizse (-1, -1)."""
+    table = BLOCK_TABLES.get(normalize_format(fmt))
+    if table is None or not (0 <= block < len(table)):
+        return -1, -1
+    packed = table[block]
+    return packed >> 8, packed & 0xFF
+
+
+def sectors_in_track(track, fmt):
+    """Track'teki sector sayısını döndürür, geçersizse 0."""
+    sectors = _SECTORS_PER_TRACK.get(normalize_format(fmt), [])
+    if 1 <= track <= len(sectors):
+        return sectors[track - 1]
+    return 0
@@ -52,6 +52,7 @@ from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
 from data_loader import DataLoader
+from basic_detokenizer import QUOTE, build_translation_table
 
 # C64 Memory Manager import - KızılElma Plan uyarınca eklendi
 try:
@@ -250,6 +251,15 @@ class EnhancedBasicDecompiler:
             "POKE 54276": "sid_frequency_low",
             "POKE 54277": "sid_frequency_high"
         }
+        
+        # Byte → metin çeviri tabloları (token'lar ve özel karakter modu ile)
+        self._build_translation_tables()
+        
+    def _build_translation_tables(self):
+        """Token ve tırnak içi çeviri tablolarını yeniden oluştur"""
+        self.token_table = build_translation_table(self.basic_tokens, self.format_special_character,
+                                                   unknown_token="TOKEN_{:02X}")
+        self.quote_table = build_translation_table(None, self.format_special_character)
     
     def set_special_char_mode(self, mode: str):
         """Özel karakter görüntüleme modunu ayarla"""
@@ -257,6 +267,7 @@ class EnhancedBasicDecompiler:
                    SpecialCharacterMode.COLOR_NAMES, 
                    SpecialCharacterMode.ESCAPED]:
             self.special_char_mode = mode
+            self._build_translation_tables()
             self.logger.info(f"Özel karakter modu değiştirildi: {mode}")
         else:
             self.logger.warning(f"Geçersiz özel karakter modu: {mode}")
@@ -303,9 +314,8 @@ class EnhancedBasicDecompiler:
                     lines.append(line_data)
                 
                 # Move to next line
-                while pos < len(prg_data) and prg_data[pos] != 0:
-                    pos += 1
-                pos += 1  # Skip line terminator
+                line_end = prg_data.find(0, pos)
+                pos = (line_end if line_end >= 0 else len(prg_data)) + 1  # Skip line terminator
                 
             except Exception as e:
                 self.logger.error(f"Error parsing BASIC line at pos {pos}: {e}")
@@ -317,7 +327,7 @@ class EnhancedBasicDecompiler:
         """Tek BASIC satırını detaylı parse et"""
         
         pos = start_pos
-        content = ""
+        content_parts = []
         tokens = []
         variables = []
         sys_calls = []
@@ -325,15 +335,23 @@ class EnhancedBasicDecompiler:
         peek_operations = []
         goto_targets = []
         gosub_targets = []
+        token_table = self.token_table
+        in_quotes = False
         
         while pos < len(data) and data[pos] != 0:
             byte_val = data[pos]
             
+            # Tırnak içi: token açılmaz, PETSCII özel karakter olarak gösterilir
+            if in_quotes or byte_val == QUOTE:
+                if byte_val == QUOTE:
+                    in_quotes = not in_quotes
+                content_parts.append(self.quote_table[byte_val])
+            
             # BASIC token
-            if byte_val >= 0x80:
-                token_name = self.basic_tokens.get(byte_val, f"TOKEN_{byte_val:02X}")
+            elif byte_val >= 0x80:
+                token_name = token_table[byte_val]
                 tokens.append(token_name)
-                content += token_name
+                content_parts.append(token_name)
                 
                 # Special token handling
                 if byte_val == 0x9E:  # SYS token
@@ -341,7 +359,7 @@ class EnhancedBasicDecompiler:
                     sys_addr = self._extract_number(data, pos)
                     if sys_addr:
                         sys_calls.append(sys_addr)
-                        content += f" {sys_addr}"
+                        content_parts.append(f" {sys_addr}")
                         pos += len(str(sys_addr)) - 1
                 
                 elif byte_val == 0x97:  # POKE token  
@@ -350,7 +368,7 @@ class EnhancedBasicDecompiler:
                     if poke_info:
                         addr, value = poke_info
                         poke_operations.append((addr, value))
-                        content += f" {addr},{value}"
+                        content_parts.append(f" {addr},{value}")
                         pos += len(f"{addr},{value}") - 1
                 
                 elif byte_val == 0xC2:  # PEEK token
@@ -358,7 +376,7 @@ class EnhancedBasicDecompiler:
                     peek_addr = self._extract_number(data, pos)
                     if peek_addr:
                         peek_operations.append(peek_addr)
-                        content += f"({peek_addr})"
+                        content_parts.append(f"({peek_addr})")
                         pos += len(f"({peek_addr})") - 1
                 
                 elif byte_val == 0x89:  # GOTO token
@@ -366,7 +384,7 @@ class EnhancedBasicDecompiler:
                     goto_target = self._extract_number(data, pos)
                     if goto_target:
                         goto_targets.append(goto_target)
-                        content += f" {goto_target}"
+                        content_parts.append(f" {goto_target}")
                         pos += len(str(goto_target)) - 1
                 
                 elif byte_val == 0x8D:  # GOSUB token
@@ -374,27 +392,24 @@ class EnhancedBasicDecompiler:
                     gosub_target = self._extract_number(data, pos)
                     if gosub_target:
                         gosub_targets.append(gosub_target)
-                        content += f" {gosub_target}"
+                        content_parts.append(f" {gosub_target}")
                         pos += len(str(gosub_target)) - 1
             
-            # Regular character
+            # Regular character (özel karakterler tabloda moda göre formatlı)
             else:
-                if 32 <= byte_val <= 126:
-                    char = chr(byte_val)
-                    content += char
-                    
-                    # Variable detection
-                    if char.isalpha():
-                        var_name = self._extract_variable_name(data, pos)
-                        if var_name and var_name not in variables:
-                            variables.append(var_name)
-                else:
-                    # Özel karakter - moda göre formatla
-                    formatted_char = self.format_special_character(byte_val)
-                    content += formatted_char
+                char = token_table[byte_val]
+                content_parts.append(char)
+                
+                # Variable detection
+                if char.isalpha() and 32 <= byte_val <= 126:
+                    var_name = self._extract_variable_name(data, pos)
+                    if var_name and var_name not in variables:
+                        variables.append(var_name)
             
             pos += 1
         
+        content = "".join(content_parts)
+        
         return BasicLine(
             line_number=line_number,
             content=content,
@@ -44,7 +44,7 @@ class EnhancedC64MemoryManager(BASE_CLASS):
     def __init__(self, rom_data_dir="c64_rom_data"):
         # Base class varsa initialize et
         if BASE_CLASS != object:
-            super().__init__()
+            super().__init__(rom_data_dir)
         
         self.logger = logging.getLogger(__name__)
         self.rom_data_dir = Path(rom_data_dir)
@@ -160,7 +160,16 @@ class EnhancedC64MemoryManager(BASE_CLASS):
                 except ValueError:
                     return None
         
-        return self.unified_lookup.get(address)
+        result = self.unified_lookup.get(address)
+        if result is None and getattr(self, 'knowledge_base', None):
+            record = self.knowledge_base.symbol(address)
+            if record:
+                result = {
+                    'type': record['type'],
+                    'label': record['name'],
+                    'info': record
+                }
+        return result
     
     def get_basic_token_info(self, token: str) -> Optional[Dict[str, Any]]:
         """BASIC token bilgisini getir"""
@@ -36,6 +36,9 @@ import json
 from pathlib import Path
 import re
 
+from disk_geometry import sector_offset, sectors_in_track
+from basic_detokenizer import iter_basic_lines
+
 class EnhancedUniversalDiskReader:
     """
     Enhanced Universal Disk Reader v2.0
@@ -446,43 +449,11 @@ class EnhancedUniversalDiskReader:
     
     def get_track_sectors(self, track, disk_type="d64"):
         """Get number of sectors for a track"""
-        if disk_type == "d64" or disk_type == "d71":
-            if track <= 17:
-                return 21
-            elif track <= 24:
-                return 19
-            elif track <= 30:
-                return 18
-            else:
-                return 17
-        elif disk_type == "d81":
-            return 40
-        else:
-            return 21  # Default
+        return sectors_in_track(track, disk_type) or 21  # Default
     
     def track_sector_to_offset(self, track, sector, disk_type="d64"):
-        """Convert track/sector to byte offset"""
-        if disk_type == "d64":
-            offset = 0
-            for t in range(1, track):
-                offset += self.get_track_sectors(t, disk_type) * 256
-            offset += sector * 256
-            return offset
-        elif disk_type == "d71":
-            if track <= 35:
-                return self.track_sector_to_offset(track, sector, "d64")
-            else:
-                # Second side
-                base_offset = 35 * 21 * 256
-                offset = base_offset
-                for t in range(36, track):
-                    offset += self.get_track_sectors(t - 35, "d64") * 256
-                offset += sector * 256
-                return offset
-        elif disk_type == "d81":
-            return (track - 1) * 40 * 256 + sector * 256
-        
-        return 0
+        """Convert track/sector to byte offset (-1 if invalid)"""
+        return sector_offset(track, sector, disk_type)
     
     def read_directory_d64(self, disk_data, disk_type="d64"):
         """Read D64/D71/D81 directory"""
@@ -495,7 +466,7 @@ class EnhancedUniversalDiskReader:
         while dir_track != 0:
             offset = self.track_sector_to_offset(dir_track, dir_sector, disk_type)
             
-            if offset + 256 > len(disk_data):
+            if offset < 0 or offset + 256 > len(disk_data):
                 break
                 
             sector_data = disk_data[offset:offset + 256]
@@ -561,7 +532,7 @@ class EnhancedUniversalDiskReader:
         while track != 0:
             offset = self.track_sector_to_offset(track, sector, disk_type)
             
-            if offset + 256 > len(disk_data):
+            if offset < 0 or offset + 256 > len(disk_data):
                 break
                 
             sector_data = disk_data[offset:offset + 256]
@@ -918,48 +889,8 @@ class EnhancedUniversalDiskReader:
         return last_valid_pos if last_valid_pos > 0 else pos
     
     def _detokenize_basic_simple(self, basic_data):
-        """Simple BASIC detokenizer"""
-        # Basic token table (simplified)
-        tokens = {
-            0x80: "END", 0x81: "FOR", 0x82: "NEXT", 0x83: "DATA", 0x84: "INPUT",
-            0x85: "DIM", 0x86: "READ", 0x87: "LET", 0x88: "GOTO", 0x89: "RUN",
-            0x8A: "IF", 0x8B: "RESTORE", 0x8C: "GOSUB", 0x8D: "RETURN", 0x8E: "REM",
-            0x8F: "STOP", 0x90: "ON", 0x91: "WAIT", 0x92: "LOAD", 0x93: "SAVE",
-            0x94: "VERIFY", 0x95: "DEF", 0x96: "POKE", 0x97: "PRINT", 0x98: "CONT",
-            0x99: "LIST", 0x9A: "CLR", 0x9B: "CMD", 0x9C: "SYS", 0x9D: "OPEN",
-            0x9E: "CLOSE", 0x9F: "GET"
-        }
-        
-        result = ""
-        pos = 0
-        
-        while pos + 4 < len(basic_data):
-            # Skip next line pointer
-            pos += 2
-            
-            # Line number
-            line_num = struct.unpack('<H', basic_data[pos:pos + 2])[0]
-            pos += 2
-            
-            result += f"{line_num} "
-            
-            # Detokenize line
-            while pos < len(basic_data) and basic_data[pos] != 0:
-                byte = basic_data[pos]
-                
-                if byte in tokens:
-                    result += tokens[byte] + " "
-                elif byte >= 32 and byte <= 126:
-                    result += chr(byte)
-                else:
-                    result += f"[{byte:02X}]"
-                
-                pos += 1
-            
-            result += "\n"
-            pos += 1  # Skip line terminator
-        
-        return result
+        """Simple BASIC detokenizer - ortak basic_detokenizer çekirdeği"""
+        return ''.join(f"{line_num} {text}\n" for line_num, text, _ in iter_basic_lines(basic_data))
     
     def _find_sys_address(self, basic_text):
         """Find SYS address in BASIC text - DELEGATED TO HYBRID PROGRAM ANALYZER"""
@@ -22,6 +22,8 @@ from dataclasses import dataclass
 from enum import Enum
 import traceback
 
+from disk_geometry import sector_block
+
 class DiskFormat(Enum):
     """Desteklenen disk formatları"""
     D64 = "d64"    # 1541 - 35 track, 170KB
@@ -286,6 +288,8 @@ class EnhancedDiskReader:
             try:
                 # Track/Sector'ı block numarasına çevir
                 block_num = self._track_sector_to_block(current_track, current_sector, format_type)
+                if block_num < 0:
+                    break
                 block_offset = block_num * 256
                 
                 if block_offset + 256 > len(disk_data):
@@ -382,55 +386,8 @@ class EnhancedDiskReader:
         return result.strip()
     
     def _track_sector_to_block(self, track: int, sector: int, format_type: str) -> int:
-        """Track/Sector'ı block numarasına çevir"""
-        
-        geometry = self.disk_geometries[format_type]
-        block = 0
-        
-        if format_type == "D64":
-            for t in range(1, track):
-                if t <= 17:
-                    block += 21
-                elif t <= 24:
-                    block += 19
-                elif t <= 30:
-                    block += 18
-                else:
-                    block += 17
-            block += sector
-            
-        elif format_type == "D71":
-            if track <= 35:
-                # İlk taraf - D64 gibi
-                for t in range(1, track):
-                    if t <= 17:
-                        block += 21
-                    elif t <= 24:
-                        block += 19
-                    elif t <= 30:
-                        block += 18
-                    else:
-                        block += 17
-                block += sector
-            else:
-                # İkinci taraf
-                block = 683  # İlk taraf toplam block
-                for t in range(36, track):
-                    if (t - 35) <= 17:
-                        block += 21
-                    elif (t - 35) <= 24:
-                        block += 19
-                    elif (t - 35) <= 30:
-                        block += 18
-                    else:
-                        block += 17
-                block += sector
-                
-        elif format_type in ["D81", "D84"]:
-            # Her track'te 40 sector
-            block = (track - 1) * 40 + sector
-        
-        return block
+        """Track/Sector'ı block numarasına çevir (geçersizse -1)"""
+        return sector_block(track, sector, format_type)
     
     def read_t64(self, file_path: str) -> List[FileEntry]:
         """T64 tape archive oku"""
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Graphics Extractor - Charset ve bitmap grafik çıkarıcı
+======================================================
+PRG dosyalarında ve bellek dökümlerinde şunları bulur:
+
+• 2 KB karakter setleri   (VIC: $0800 hizalı)
+• 8 KB hi-res / multicolor bitmap'ler ($2000 hizalı) ve Koala Painter dosyaları
+• 1 KB screen RAM ve color RAM blokları ($0400 hizalı)
+
+VIC yalnızca hizalı adreslerden okuyabildiği için pencereler adrese göre
+hizalıdır; her tür için tüm pencereler tek seferde puanlanır. NumPy varsa
+pencereler tek bir (pencere, byte) dizisine yeniden şekillendirilir ve
+entropi (bincount) ile periyodiklik (lag-1/3/8/40 tekrar oranları)
+vektörel hesaplanır; yoksa aynı ölçütler saf Python ile hesaplanır.
+
+PNG dışa aktarma pdsX/c64_gui_engine.py'deki C64_COLORS paletini kullanır.
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from operator import eq
+from typing import Dict, List, Optional, Sequence
+
+# PIL - optional import
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    print("⚠️ PIL (Pillow) bulunamadı - grafik PNG dışa aktarma devre dışı")
+
+# NumPy - optional import
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+    print("⚠️ NumPy bulunamadı - grafik tarama saf Python ile çalışacak")
+
+CHARSET_SIZE = 2048
+BITMAP_SIZE = 8000
+SCREEN_SIZE = 1000
+KOALA_LOAD_ADDRESS = 0x6000
+KOALA_SIZE = 10001  # bitmap + screen + color + arka plan rengi
+
+# tür: (pencere boyu, hizalama, alt parça sayısı, ölçülecek tekrar gecikmeleri)
+# Tekrar oranları ve sıfır olmayan oranı her alt parçada ayrı ölçülür ve
+# en düşüğü alınır: yarısı kod olan pencere grafik sayılmaz.
+WINDOW_KINDS = {
+    'bitmap': (BITMAP_SIZE, 0x2000, 4, (1, 8)),
+    'charset': (CHARSET_SIZE, 0x0800, 2, (1, 3)),
+    'screen': (SCREEN_SIZE, 0x0400, 1, (1, 40)),
+}
+# Çakışmada öncelik: büyük blok küçük bloğu bastırır
+KIND_PRIORITY = ('koala', 'bitmap', 'charset', 'screen', 'color')
+
+# pdsX/c64_gui_engine.py C64_COLORS ile aynı (engine yüklenemezse)
+_FALLBACK_COLORS = {
+    0: "#000000", 1: "#FFFFFF", 2: "#880000", 3: "#AAFFEE",
+    4: "#CC44CC", 5: "#00CC55", 6: "#0000AA", 7: "#EEEE77",
+    8: "#DD8855", 9: "#664400", 10: "#FF7777", 11: "#333333",
+    12: "#777777", 13: "#AAFF66", 14: "#0088FF", 15: "#BBBBBB",
+}
+_palette_cache: List[int] = []
+
+
+@dataclass
+class GraphicsBlock:
+    """Bulunan grafik bloğu"""
+    kind: str          # charset, bitmap, koala, screen, color
+    offset: int        # Veri içindeki ofset
+    address: int       # C64 adresi
+    size: int
+    score: float
+    mode: str = ""     # bitmap için 'hires' / 'multicolor'
+    entropy: float = 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            'kind': self.kind, 'offset': self.offset, 'address': self.address,
+            'size': self.size, 'score': round(self.score, 3), 'mode': self.mode,
+            'entropy': round(self.entropy, 3),
+        }
+
+
+def c64_palette() -> List[int]:
+    """PIL 'P' modu için düz RGB palet listesi (C64_COLORS'tan)"""
+    if not _palette_cache:
+        try:
+            from pdsX.c64_gui_engine import C64_COLORS as colors
+        except Exception:
+            # Engine tkinter/pygame ister; batch işçilerinde bulunmayabilir
+            colors = _FALLBACK_COLORS
+        for index in range(16):
+            value = colors[index].lstrip("#")
+            _palette_cache.extend(int(value[i:i + 2], 16) for i in (0, 2, 4))
+    return _palette_cache
+
+
+# === Pencere özellikleri ===
+
+def _window_range(length: int, load_address: int, size: int, align: int):
+    """Hizalı pencerelerin (ilk ofset, sayı) çifti"""
+    first = (-load_address) % align
+    if length - first < size:
+        return first, 0
+    return first, (length - first - size) // align + 1
+
+
+def window_features(data, load_address: int, size: int, align: int, parts: int,
+                    lags: Sequence[int], use_numpy: Optional[bool] = None) -> List[Dict]:
+    """
+    Hizalı tüm pencereler için özellikleri tek geçişte hesapla
+
+    Returns:
+        Pencere başına {'offset', 'entropy', 'nonzero', 'distinct', 'top',
+        'mode', 'max', 'rep1', ...} sözlükleri. 'nonzero' ve 'repN'
+        alt parçaların en düşük değeridir.
+    """
+    first, count = _window_range(len(data), load_address, size, align)
+    if count == 0:
+        return []
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    part = size // parts
+
+    if use_numpy and NUMPY_AVAILABLE:
+        buf = np.frombuffer(bytes(data), dtype=np.uint8)[first:]
+        padded = np.zeros(count * align, dtype=np.uint8)
+        usable = min(len(buf), len(padded))
+        padded[:usable] = buf[:usable]
+        windows = padded.reshape(count, align)[:, :size]
+        split = windows[:, :part * parts].reshape(count, parts, part)
+        rows = np.arange(count, dtype=np.int64)[:, None] * 256
+        counts = np.bincount((rows + windows).ravel(), minlength=count * 256).reshape(count, 256)
+        p = counts / size
+        entropy = -(p * np.log2(np.where(p > 0, p, 1))).sum(axis=1)
+        columns = {
+            'entropy': entropy.tolist(),
+            'nonzero': (split != 0).mean(axis=2).min(axis=1).tolist(),
+            'distinct': (counts > 0).sum(axis=1).tolist(),
+            'top': (counts.max(axis=1) / size).tolist(),
+            'mode': counts.argmax(axis=1).tolist(),
+            'max': windows.max(axis=1).tolist(),
+        }
+        for lag in lags:
+            same = split[:, :, lag:] == split[:, :, :-lag]
+            columns[f'rep{lag}'] = same.mean(axis=2).min(axis=1).tolist()
+        return [dict({'offset': first + i * align}, **{key: values[i] for key, values in columns.items()})
+                for i in range(count)]
+
+    features = []
+    for index in range(count):
+        offset = first + index * align
+        window = bytes(data[offset:offset + size]).ljust(size, b"\x00")
+        chunks = [window[i * part:(i + 1) * part] for i in range(parts)]
+        counts = Counter(window)
+        top = max(counts.values())
+        mode = min(value for value, count in counts.items() if count == top)  # argmax gibi
+        feature = {
+            'offset': offset,
+            'entropy': -sum(c / size * math.log2(c / size) for c in counts.values()),
+            'nonzero': min(1 - chunk.count(0) / part for chunk in chunks),
+            'distinct': len(counts),
+            'top': top / size,
+            'mode': mode,
+            'max': max(window),
+        }
+        for lag in lags:
+            feature[f'rep{lag}'] = min(sum(map(eq, chunk[lag:], chunk[:-lag])) / (part - lag)
+                                       for chunk in chunks)
+        features.append(feature)
+    return features
+
+
+def even_pair_ratio(bitmap) -> float:
+    """00/11 bit çiftlerinin oranı - hi-res'te yüksek, multicolor'da düşük"""
+    data = bytes(bitmap)
+    if not data:
+        return 0.0
+    if NUMPY_AVAILABLE:
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+        return float((bits[0::2] == bits[1::2]).mean())
+    # Bir byte'taki eşit çift sayısı tablodan okunur
+    table = [sum(((value >> s) & 1) == ((value >> (s + 1)) & 1) for s in (0, 2, 4, 6))
+             for value in range(256)]
+    return sum(table[value] for value in data) / (len(data) * 4)
+
+
+# === Sınıflandırma ===
+
+def _is_charset(f: Dict) -> bool:
+    # Glyph'lerin boş satırları: en sık byte $00 (ters charset'te $FF)
+    return (f['mode'] in (0x00, 0xFF) and f['nonzero'] >= 0.3 and 1.5 <= f['entropy'] <= 6.5
+            and f['distinct'] >= 32 and f['rep1'] >= 0.25 and f['rep1'] >= f['rep3'])
+
+
+def _is_bitmap(f: Dict) -> bool:
+    return (f['nonzero'] >= 0.2 and 1.0 <= f['entropy'] <= 7.5 and f['distinct'] >= 4
+            and f['rep1'] >= 0.2 and f['rep8'] >= 0.15)
+
+
+def _is_screen(f: Dict) -> bool:
+    # Ekran kodları: baskın değer genelde boşluk ($20), $00/$FF değil
+    return (f['max'] > 15 and f['mode'] not in (0x00, 0xFF) and 2 <= f['distinct'] <= 128
+            and f['entropy'] <= 5.0 and f['top'] >= 0.15 and max(f['rep1'], f['rep40']) >= 0.3)
+
+
+def _is_color(f: Dict) -> bool:
+    return (f['max'] <= 15 and f['distinct'] >= 2 and f['nonzero'] >= 0.05
+            and max(f['rep1'], f['rep40']) >= 0.3)
+
+
+def _overlaps(block: GraphicsBlock, kept: List[GraphicsBlock]) -> bool:
+    return any(block.offset < other.offset + other.size and other.offset < block.offset + block.size
+               for other in kept)
+
+
+def find_graphics(data, load_address: int = 0) -> List[GraphicsBlock]:
+    """
+    Veri içindeki charset/bitmap/screen/color bloklarını bul
+
+    Args:
+        data: Yükleme adresi olmadan veri (PRG gövdesi veya bellek dökümü)
+        load_address: data[0]'ın C64 adresi
+    """
+    found = []
+    if load_address == KOALA_LOAD_ADDRESS and len(data) == KOALA_SIZE:
+        found.append(GraphicsBlock('koala', 0, load_address, KOALA_SIZE, 1.0, 'multicolor'))
+
+    for kind, (size, align, parts, lags) in WINDOW_KINDS.items():
+        for f in window_features(data, load_address, size, align, parts, lags):
+            offset = f['offset']
+            block = None
+            if kind == 'bitmap' and _is_bitmap(f):
+                window = data[offset:offset + BITMAP_SIZE]
+                mode = 'hires' if even_pair_ratio(window) >= 0.75 else 'multicolor'
+                block = GraphicsBlock(kind, offset, load_address + offset, size,
+                                      (f['rep1'] + f['rep8']) / 2, mode, f['entropy'])
+            elif kind == 'charset' and _is_charset(f):
+                block = GraphicsBlock(kind, offset, load_address + offset, size,
+                                      f['rep1'], entropy=f['entropy'])
+            elif kind == 'screen' and (_is_screen(f) or _is_color(f)):
+                block = GraphicsBlock('screen' if f['max'] > 15 else 'color', offset,
+                                      load_address + offset, size,
+                                      max(f['rep1'], f['rep40']), entropy=f['entropy'])
+            if block:
+                found.append(block)
+
+    kept = []
+    for block in sorted(found, key=lambda b: (KIND_PRIORITY.index(b.kind), b.offset)):
+        if not _overlaps(block, kept):
+            kept.append(block)
+    kept.sort(key=lambda b: b.offset)
+    return kept
+
+
+def analyze_prg(prg_data) -> Dict:
+    """PRG dosyasındaki grafikleri analiz et"""
+    if len(prg_data) < 3:
+        return {'load_address': 0, 'blocks': []}
+    load_address = prg_data[0] | (prg_data[1] << 8)
+    blocks = find_graphics(prg_data[2:], load_address)
+    return {'load_address': load_address, 'blocks': [block.as_dict() for block in blocks]}
+
+
+# === Piksel çözme (renk indeksi ızgaraları) ===
+
+def _bits(value: int) -> List[int]:
+    return [(value >> shift) & 1 for shift in range(7, -1, -1)]
+
+
+def charset_pixels(charset, fg: int = 14, bg: int = 6):
+    """2 KB charset -> 16x16 glyph'lik 128x128 ızgara"""
+    data = bytes(charset[:CHARSET_SIZE]).ljust(CHARSET_SIZE, b"\x00")
+    if NUMPY_AVAILABLE:
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8)).reshape(16, 16, 8, 8)
+        grid = bits.transpose(0, 2, 1, 3).reshape(128, 128)
+        return np.where(grid, fg, bg).astype(np.uint8)
+    rows = []
+    for y in range(128):
+        glyph_row, line = divmod(y, 8)
+        row = []
+        for glyph in range(glyph_row * 16, glyph_row * 16 + 16):
+            row += [fg if bit else bg for bit in _bits(data[glyph * 8 + line])]
+        rows.append(row)
+    return rows
+
+
+def screen_pixels(screen, charset, colors=None, fg: int = 14, bg: int = 6):
+    """Screen RAM'i charset ile 320x200 ızgaraya çiz (colors: color RAM)"""
+    screen = bytes(screen[:SCREEN_SIZE]).ljust(SCREEN_SIZE, b"\x20")
+    charset = bytes(charset[:CHARSET_SIZE]).ljust(CHARSET_SIZE, b"\x00")
+    colors = bytes(colors[:SCREEN_SIZE]) if colors is not None else bytes([fg]) * SCREEN_SIZE
+    if NUMPY_AVAILABLE:
+        glyphs = np.unpackbits(np.frombuffer(charset, dtype=np.uint8)).reshape(256, 8, 8)
+        cells = glyphs[np.frombuffer(screen, dtype=np.uint8)].reshape(25, 40, 8, 8)
+        bits = cells.transpose(0, 2, 1, 3).reshape(200, 320)
+        ink = np.frombuffer(colors, dtype=np.uint8).reshape(25, 40) & 0x0F
+        ink = np.repeat(np.repeat(ink, 8, axis=0), 8, axis=1)
+        return np.where(bits, ink, bg).astype(np.uint8)
+    rows = []
+    for y in range(200):
+        cell_row, line = divmod(y, 8)
+        row = []
+        for cell in range(cell_row * 40, cell_row * 40 + 40):
+            ink = colors[cell] & 0x0F
+            row += [ink if bit else bg for bit in _bits(charset[screen[cell] * 8 + line])]
+        rows.append(row)
+    return rows
+
+
+def bitmap_pixels(bitmap, screen=None, colors=None, background: int = 0,
+                  multicolor: bool = False):
+    """
+    8000 byte bitmap -> 320x200 ızgara
+
+    Hi-res: screen üst nibble = 1 bitleri, alt nibble = 0 bitleri
+    Multicolor: 00 = arka plan, 01 = screen üst, 10 = screen alt, 11 = color RAM
+    (160 piksel genişlik yatayda iki kat)
+    """
+    bitmap = bytes(bitmap[:BITMAP_SIZE]).ljust(BITMAP_SIZE, b"\x00")
+    screen = bytes(screen[:SCREEN_SIZE]) if screen is not None else bytes([0x10]) * SCREEN_SIZE
+    colors = bytes(colors[:SCREEN_SIZE]) if colors is not None else bytes([1]) * SCREEN_SIZE
+    if NUMPY_AVAILABLE:
+        cells = np.frombuffer(bitmap, dtype=np.uint8).reshape(25, 40, 8)
+        bits = np.unpackbits(cells.transpose(0, 2, 1).reshape(200, 40), axis=1)
+        scr = np.frombuffer(screen, dtype=np.uint8).reshape(25, 40)
+
+        def per_pixel(values):
+            return np.repeat(np.repeat(values, 8, axis=0), 8, axis=1)
+
+        if not multicolor:
+            return np.where(bits, per_pixel(scr >> 4), per_pixel(scr & 0x0F)).astype(np.uint8)
+        pairs = np.repeat((bits[:, 0::2] << 1) | bits[:, 1::2], 2, axis=1)
+        col = np.frombuffer(colors, dtype=np.uint8).reshape(25, 40) & 0x0F
+        choices = (np.full((200, 320), background & 0x0F, dtype=np.uint8),
+                   per_pixel(scr >> 4), per_pixel(scr & 0x0F), per_pixel(col))
+        return np.choose(pairs, choices).astype(np.uint8)
+
+    rows = []
+    for y in range(200):
+        cell_row, line = divmod(y, 8)
+        row = []
+        for cx in range(40):
+            cell = cell_row * 40 + cx
+            value = bitmap[cell * 8 + line]
+            upper, lower = screen[cell] >> 4, screen[cell] & 0x0F
+            if multicolor:
+                lookup = (background & 0x0F, upper, lower, colors[cell] & 0x0F)
+                for shift in (6, 4, 2, 0):
+                    color = lookup[(value >> shift) & 0x03]
+                    row += (color, color)
+            else:
+                row += [upper if bit else lower for bit in _bits(value)]
+        rows.append(row)
+    return rows
+
+
+def color_pixels(colors):
+    """1 KB color RAM -> 40x25 renk ızgarası"""
+    data = bytes(colors[:SCREEN_SIZE]).ljust(SCREEN_SIZE, b"\x00")
+    if NUMPY_AVAILABLE:
+        return (np.frombuffer(data, dtype=np.uint8).reshape(25, 40) & 0x0F).astype(np.uint8)
+    return [[value & 0x0F for value in data[row * 40:row * 40 + 40]] for row in range(25)]
+
+
+def block_pixels(block: GraphicsBlock, data, charset=None):
+    """Bloğu ızgaraya çöz: (ızgara, büyütme) - çizilemiyorsa None"""
+    chunk = data[block.offset:block.offset + block.size]
+    if block.kind == 'charset':
+        return charset_pixels(chunk), 2
+    if block.kind == 'koala':
+        return bitmap_pixels(chunk[:8000], chunk[8000:9000], chunk[9000:10000],
+                             chunk[10000], multicolor=True), 1
+    if block.kind == 'bitmap':
+        return bitmap_pixels(chunk, multicolor=block.mode == 'multicolor'), 1
+    if block.kind == 'color':
+        return color_pixels(chunk), 8
+    if block.kind == 'screen' and charset is not None:
+        return screen_pixels(chunk, charset), 1
+    return None
+
+
+# === PNG dışa aktarma ===
+
+def pixels_to_image(pixels, scale: int = 1):
+    """Renk indeksi ızgarasını C64 paletli PIL görüntüsüne çevir"""
+    if NUMPY_AVAILABLE:
+        grid = np.asarray(pixels, dtype=np.uint8)
+        if scale > 1:
+            grid = np.repeat(np.repeat(grid, scale, axis=0), scale, axis=1)
+        image = Image.fromarray(np.ascontiguousarray(grid), 'P')
+    else:
+        height, width = len(pixels), len(pixels[0])
+        image = Image.frombytes('P', (width, height), bytes(v for row in pixels for v in row))
+        if scale > 1:
+            image = image.resize((width * scale, height * scale), Image.NEAREST)
+    image.putpalette(c64_palette())
+    return image
+
+
+def export_png(blocks: List[GraphicsBlock], data, output_dir: str, base_name: str) -> List[str]:
+    """
+    Blokları toplu olarak PNG'ye yaz
+
+    Screen blokları aynı veride bulunan ilk charset ile çizilir.
+    """
+    if not PIL_AVAILABLE or not blocks:
+        return []
+    os.makedirs(output_dir, exist_ok=True)
+    base_name = re.sub(r"[^A-Za-z0-9._-]+", "_", base_name).strip("_") or "gfx"
+    charset = next((data[b.offset:b.offset + b.size] for b in blocks if b.kind == 'charset'), None)
+    written = []
+    for block in blocks:
+        decoded = block_pixels(block, data, charset)
+        if decoded is None:
+            continue
+        pixels, scale = decoded
+        path = os.path.join(output_dir, f"{base_name}_{block.kind}_{block.address:04X}.png")
+        pixels_to_image(pixels, scale).save(path, 'PNG')
+        written.append(path)
+    return written
+
+
+def export_prg_graphics(prg_data, output_dir: str, base_name: str) -> List[str]:
+    """PRG'deki tüm grafikleri bul ve PNG olarak yaz"""
+    if len(prg_data) < 3:
+        return []
+    load_address = prg_data[0] | (prg_data[1] << 8)
+    data = bytes(prg_data[2:])
+    return export_png(find_graphics(data, load_address), data, output_dir, base_name)
+
+
+if __name__ == "__main__":
+    import sys
+
+    for path in sys.argv[1:]:
+        with open(path, "rb") as f:
+            result = analyze_prg(f.read())
+        print(f"🖼️ {path} (yükleme ${result['load_address']:04X})")
+        for block in result['blocks']:
+            print(f"   {block['kind']:<8} ${block['address']:04X} {block['size']:5d} byte "
+                  f"skor {block['score']:.2f} {block['mode']}")
@@ -32,7 +32,7 @@ Version: 5.0 (X1 Integration + GUI Debug + Comprehensive Logging)
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
 from tkinter.font import Font
 import threading
 
@@ -84,6 +84,7 @@ import sys
 import json
 import subprocess
 import struct
+import sqlite3
 import datetime
 import logging
 from pathlib import Path
@@ -101,7 +102,9 @@ from unified_decompiler import UnifiedDecompiler
 from enhanced_c64_memory_manager import C64MemoryMapManager
 from code_analyzer import CodeAnalyzer, PatternType
 from database_manager import DatabaseManager
+from result_cache import get_default_cache, engine_version, engines_version
 from hybrid_program_analyzer import HybridProgramAnalyzer
+from hex_view import HexView
 
 # X1 GUI imports - safer imports with defaults
 try:
@@ -160,6 +163,11 @@ try:
 except ImportError:
     SIDConverter = None
 
+try:
+    import graphics_extractor
+except ImportError:
+    graphics_extractor = None
+
 try:
     from petcat_detokenizer import PetcatDetokenizer
 except ImportError:
@@ -3302,15 +3310,25 @@ Examples:
             self.command_entry.delete(0, tk.END)
 
 class HexEditor(tk.Frame):
-    """Interactive hex editor widget"""
+    """Interactive hex editor widget - sanallaştırılmış, yalnızca görünen satırlar çizilir"""
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
-        self.data = bytearray()
-        self.start_address = 0x0801
         self.bytes_per_row = 16
+        self.model = HexView(b"", 0x0801, self.bytes_per_row)
+        self.top_row = 0
+        self.visible_rows = 20
         self.setup_ui()
     
+    @property
+    def data(self):
+        """Düzenlenen veri (memoryview)"""
+        return self.model.view
+    
+    @property
+    def start_address(self):
+        return self.model.start_address
+    
     def setup_ui(self):
         """Setup hex editor interface"""
         # Header frame
@@ -3328,47 +3346,160 @@ class HexEditor(tk.Frame):
         tk.Label(header_frame, text="ASCII", bg=ModernStyle.BG_SECONDARY,
                 fg=ModernStyle.FG_SECONDARY, font=("Consolas", 10, "bold")).pack(side=tk.LEFT, padx=10)
         
-        # Scrollable hex area
-        self.hex_frame = scrolledtext.ScrolledText(self, 
-                                                  height=20, 
-                                                  bg=ModernStyle.BG_DARK,
-                                                  fg=ModernStyle.FG_PRIMARY,
-                                                  font=("Consolas", 10),
-                                                  insertbackground=ModernStyle.FG_ACCENT)
-        self.hex_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Adrese git
+        self.goto_var = tk.StringVar()
+        goto_entry = tk.Entry(header_frame, textvariable=self.goto_var, width=8,
+                              bg=ModernStyle.BG_DARK, fg=ModernStyle.FG_PRIMARY,
+                              insertbackground=ModernStyle.FG_ACCENT, font=("Consolas", 10))
+        goto_entry.pack(side=tk.RIGHT, padx=5)
+        goto_entry.bind('<Return>', lambda event: self.goto_address(self.goto_var.get()))
+        tk.Label(header_frame, text="Go $", bg=ModernStyle.BG_SECONDARY,
+                fg=ModernStyle.FG_SECONDARY, font=("Consolas", 10)).pack(side=tk.RIGHT)
+        
+        # Sanal hex alanı: Text yalnızca görünen satırları tutar, scrollbar modeli kaydırır
+        body_frame = tk.Frame(self, bg=ModernStyle.BG_DARK)
+        body_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.scrollbar = ttk.Scrollbar(body_frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.hex_frame = tk.Text(body_frame,
+                                 height=20,
+                                 wrap=tk.NONE,
+                                 bg=ModernStyle.BG_DARK,
+                                 fg=ModernStyle.FG_PRIMARY,
+                                 font=("Consolas", 10),
+                                 insertbackground=ModernStyle.FG_ACCENT)
+        self.hex_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.hex_frame.tag_configure("modified", foreground=ModernStyle.FG_ACCENT)
+        
+        self.hex_frame.bind('<Configure>', self.on_resize)
+        self.hex_frame.bind('<MouseWheel>', self.on_mousewheel)
+        self.hex_frame.bind('<Button-4>', lambda event: self.scroll_rows(-3))
+        self.hex_frame.bind('<Button-5>', lambda event: self.scroll_rows(3))
+        self.hex_frame.bind('<Prior>', lambda event: self.scroll_rows(-self.visible_rows) or "break")
+        self.hex_frame.bind('<Next>', lambda event: self.scroll_rows(self.visible_rows) or "break")
+        self.hex_frame.bind('<Double-Button-1>', self.on_double_click)
+        # Metin doğrudan düzenlenmez; değişiklikler patch() ile modele yazılır
+        self.hex_frame.bind('<Key>', self.on_key)
     
     def load_data(self, data: bytes, start_addr: int = 0x0801):
         """Load binary data into hex editor"""
-        self.data = bytearray(data)
-        self.start_address = start_addr
+        self.model.load(data, start_addr)
+        self.top_row = 0
         self.refresh_display()
     
     def refresh_display(self):
-        """Refresh hex editor display"""
+        """Refresh hex editor display - yalnızca görünen satırları biçimlendir"""
+        rows = self.model.format_rows(self.top_row, self.visible_rows)
+        self.model.pop_dirty_rows(self.top_row, self.top_row + self.visible_rows - 1)
         self.hex_frame.delete(1.0, tk.END)
-        
-        for row in range(0, len(self.data), self.bytes_per_row):
-            # Address column
-            addr = self.start_address + row
-            line = f"{addr:04X}: "
-            
-            # Hex bytes
-            hex_part = ""
-            ascii_part = ""
-            
-            for col in range(self.bytes_per_row):
-                if row + col < len(self.data):
-                    byte = self.data[row + col]
-                    hex_part += f"{byte:02X} "
-                    ascii_part += chr(byte) if 32 <= byte <= 126 else "."
-                else:
-                    hex_part += "   "
-                    ascii_part += " "
-            
-            line += hex_part + " | " + ascii_part + "\n"
-            self.hex_frame.insert(tk.END, line)
-            self.code_display.tag_configure("syntax_comment", foreground=ModernStyle.SYNTAX_COMMENT)
-            self.code_display.tag_configure("syntax_number", foreground=ModernStyle.SYNTAX_NUMBER)
+        self.hex_frame.insert(1.0, "\n".join(rows))
+        for row in self.model.modified_rows:
+            if self.top_row <= row < self.top_row + len(rows):
+                line = row - self.top_row + 1
+                self.hex_frame.tag_add("modified", f"{line}.0", f"{line}.end")
+        self.update_scrollbar()
+    
+    def refresh_dirty_rows(self):
+        """Yalnızca yamalanmış ve görünen satırları yeniden çiz"""
+        last = self.top_row + self.visible_rows - 1
+        for row in self.model.pop_dirty_rows(self.top_row, last):
+            line = row - self.top_row + 1
+            self.hex_frame.delete(f"{line}.0", f"{line}.end")
+            self.hex_frame.insert(f"{line}.0", self.model.format_row(row), ("modified",))
+    
+    def update_scrollbar(self):
+        total = max(1, self.model.row_count)
+        first = self.top_row / total
+        last = min(1.0, (self.top_row + self.visible_rows) / total)
+        self.scrollbar.set(first, last)
+    
+    def set_top_row(self, row: int):
+        max_top = max(0, self.model.row_count - self.visible_rows)
+        row = max(0, min(int(row), max_top))
+        if row != self.top_row:
+            self.top_row = row
+            self.refresh_display()
+    
+    def scroll_rows(self, delta: int):
+        self.set_top_row(self.top_row + delta)
+    
+    def on_scrollbar(self, action, value, unit=None):
+        """Scrollbar komutu: moveto / scroll"""
+        if action == tk.MOVETO:
+            self.set_top_row(float(value) * self.model.row_count)
+        elif action == tk.SCROLL:
+            step = self.visible_rows if unit == tk.PAGES else 1
+            self.scroll_rows(int(value) * step)
+    
+    def on_mousewheel(self, event):
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+        return "break"
+    
+    def on_key(self, event):
+        """Gezinme ve Ctrl kısayolları (kopyalama) serbest, yazma engelli"""
+        if event.keysym in ('Up', 'Down', 'Left', 'Right', 'Home', 'End') or event.state & 0x4:
+            return None
+        return "break"
+    
+    def on_resize(self, event):
+        line_height = max(1, Font(font=self.hex_frame.cget("font")).metrics("linespace"))
+        rows = max(1, event.height // line_height)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.refresh_display()
+    
+    def goto_address(self, address):
+        """Adrese atla - adres '$C000', '0xC000', 'C000' veya int olabilir"""
+        if isinstance(address, str):
+            text = address.strip().lstrip('$')
+            try:
+                address = int(text[2:], 16) if text.lower().startswith('0x') else int(text, 16)
+            except ValueError:
+                return False
+        row = self.model.row_of_address(address)
+        if row is None:
+            return False
+        self.set_top_row(row)
+        line = row - self.top_row + 1
+        column = 6 + ((address - self.model.start_address) % self.bytes_per_row) * 3
+        self.hex_frame.mark_set(tk.INSERT, f"{line}.{column}")
+        self.hex_frame.see(tk.INSERT)
+        return True
+    
+    def patch(self, address: int, values) -> bool:
+        """Veriyi yerinde değiştir ve yalnızca etkilenen satırları yeniden çiz"""
+        try:
+            self.model.patch(address, values)
+        except (IndexError, ValueError):
+            return False
+        self.refresh_dirty_rows()
+        return True
+    
+    def address_at_index(self, index) -> Optional[int]:
+        """Text indeksindeki hex hücresinin adresi"""
+        line, column = (int(part) for part in self.hex_frame.index(index).split('.'))
+        cell = (column - 6) // 3
+        if column < 6 or cell >= self.bytes_per_row:
+            return None
+        address = self.model.row_address(self.top_row + line - 1) + cell
+        return address if self.model.row_of_address(address) is not None else None
+    
+    def on_double_click(self, event):
+        """Hex hücresini düzenle"""
+        address = self.address_at_index(f"@{event.x},{event.y}")
+        if address is None:
+            return "break"
+        current = self.model.read(address)[0]
+        value = simpledialog.askstring("Hex Editor", f"${address:04X} yeni değer (hex):",
+                                       initialvalue=f"{current:02X}", parent=self)
+        if value:
+            try:
+                self.patch(address, bytes.fromhex(value.replace('$', '')))
+            except ValueError:
+                pass
+        return "break"
 
 class AnalysisPanel(tk.Frame):
     """Code analysis results panel"""
@@ -4229,6 +4360,11 @@ class D64ConverterGUI:
                 self.database_manager = None
                 self.log_message("DatabaseManager başlatılamadı", "WARNING")
             
+            # Result Cache (logs/result_cache.db)
+            self.result_cache = get_default_cache()
+            if self.result_cache:
+                self.log_message("Result cache yüklendi", "INFO")
+            
             # Hybrid Program Analyzer
             try:
                 self.hybrid_analyzer = HybridProgramAnalyzer()
@@ -4560,6 +4696,25 @@ class D64ConverterGUI:
         }
         self.log_message(f"🎯 Disassembly ayarları güncellendi: Format={output_format}, Illegal={use_illegal_opcodes}, Enhanced={enhanced_analysis}", "INFO")
     
+    def _conversion_engines(self, format_type):
+        """_convert_format_thread'in bu format için çağırdığı motorlar (önbellek sürümü için)"""
+        basic_formats = ('basic', 'c64list', 'hybrid_disasm')
+        if format_type == 'petcat':
+            return (PetcatDetokenizer,)
+        if format_type == 'enhanced_basic' or format_type.startswith('transpile_'):
+            return (EnhancedBasicDecompiler,)
+        engines = [type(self.basic_parser) if self.basic_parser else None] if format_type in basic_formats else []
+        if format_type == 'improved_disasm':
+            engines.append(ImprovedDisassembler)
+        # Decompiler sınıfları yalnızca import başarılıysa tanımlıdır
+        decompilers = {'dec_c': 'DecompilerC', 'dec_c2': 'DecompilerC2', 'dec_cpp': 'DecompilerCPP',
+                       'dec_qbasic': 'DecompilerQBasic'}
+        if format_type in decompilers:
+            engines.append(globals().get(decompilers[format_type]))
+        if format_type not in ('basic', 'c64list'):
+            engines.append(AdvancedDisassembler)
+        return tuple(engines)
+
     def convert_to_format(self, format_type, target_panel):
         """Format dönüştürme - DETAYLI LOG SİSTEMİ"""
         if not self.selected_entry:
@@ -4773,13 +4928,39 @@ class D64ConverterGUI:
                     source_format=source_format,
                     start_address=start_address,
                     end_address=start_address + len(code_data),
-                    notes=f"Size: {len(code_data)} bytes"
+                    notes=f"Size: {len(code_data)} bytes",
+                    data=prg_data
                 )
             
             result_code = ""
             
+            # ♻️ Result cache - aynı PRG/format/seçenek daha önce dönüştürüldüyse tekrar çalıştırma
+            cache_key = None
+            cached_result = None
+            result_cache = getattr(self, 'result_cache', None)
+            if result_cache:
+                cache_key = result_cache.make_key(
+                    prg_data,
+                    engine='gui',
+                    output_format=format_type,
+                    options={
+                        'start_address': start_address,
+                        'assembly_start': assembly_start_addr,
+                        'assembly_size': len(assembly_code_data),
+                        'use_py65': self.disassembly_panel.use_py65_disassembler.get() if hasattr(self.disassembly_panel, 'use_py65_disassembler') else False,
+                        'disassembly_options': dict(self.disassembly_options),
+                    },
+                    # Bu modül şablon metin üretir; motorlar proje içi bağımlılıklarıyla sürümlenir
+                    tool_version=engine_version(sys.modules[__name__]) + '/' +
+                                 engines_version(*self._conversion_engines(format_type)))
+                cached_result = result_cache.get(cache_key)
+            
             # Format'a göre işle
-            if start_address == 0x0801 and format_type in ['basic', 'petcat', 'c64list', 'enhanced_basic', 'transpile_qbasic', 'transpile_c', 'transpile_cpp', 'transpile_pdsx', 'transpile_python']:
+            if cached_result is not None:
+                result_code = cached_result
+                self.root.after(0, lambda: self.log_message(f"♻️ Result cache isabeti: {format_type} ({len(cached_result)} karakter)", "INFO"))
+            
+            elif start_address == 0x0801 and format_type in ['basic', 'petcat', 'c64list', 'enhanced_basic', 'transpile_qbasic', 'transpile_c', 'transpile_cpp', 'transpile_pdsx', 'transpile_python']:
                 # BASIC program - Enhanced BASIC Decompiler entegrasyonu
                 if format_type == 'basic':
                     if self.basic_parser:
@@ -5724,7 +5905,8 @@ class D64ConverterGUI:
                 success=success,
                 output_size=len(result_code),
                 processing_time=processing_time,
-                assembly_format=assembly_format
+                assembly_format=assembly_format,
+                output_text=result_code
             )
             
             self.root.after(0, lambda: self.update_status(f"{format_type} dönüştürme tamamlandı"))
@@ -5736,6 +5918,8 @@ class D64ConverterGUI:
             ])
             
             if is_success:
+                if cache_key and cached_result is None:
+                    result_cache.put(cache_key, result_code)
                 self.root.after(0, lambda: self.log_message(f"✅ {format_type} dönüştürme başarılı: {len(result_code)} karakter", "SUCCESS"))
             else:
                 self.root.after(0, lambda: self.log_message(f"❌ {format_type} dönüştürme başarısız - hata mesajı üretildi: {len(result_code)} karakter", "ERROR"))
@@ -6041,18 +6225,22 @@ class D64ConverterGUI:
             result_text = f"🔤 Charset Analysis\n"
             result_text += f"File: {entry.get('filename')}\n\n"
             
-            # Basit charset analizi
-            charset_data = []
-            for i in range(0, len(prg_data) - 8, 8):
-                chunk = prg_data[i:i+8]
-                if all(b < 0x100 for b in chunk):  # Valid charset data
-                    charset_data.append(i)
+            if graphics_extractor is None:
+                self.root.after(0, lambda: self.log_message("graphics_extractor modülü bulunamadı", "WARNING"))
+                return
             
-            if charset_data:
-                result_text += f"✅ Potential charset data found at {len(charset_data)} locations\n"
-                result_text += f"Addresses: {[f'${addr:04X}' for addr in charset_data[:10]]}\n"
+            # Charset / bitmap / screen / color RAM tespiti
+            analysis = graphics_extractor.analyze_prg(prg_data)
+            blocks = analysis['blocks']
+            if blocks:
+                result_text += f"✅ {len(blocks)} graphics block(s) found\n"
+                for block in blocks:
+                    mode = f" ({block['mode']})" if block['mode'] else ""
+                    result_text += (f"{block['kind']:<8} ${block['address']:04X}-"
+                                    f"${block['address'] + block['size'] - 1:04X}{mode} "
+                                    f"score {block['score']:.2f}\n")
             else:
-                result_text += "❌ No charset data found\n"
+                result_text += "❌ No charset/bitmap data found\n"
             
             self.root.after(0, lambda: self.log_message(result_text, "INFO"))
             self.root.after(0, lambda: self.decompiler_panel.update_code(result_text, "charset_analysis"))
@@ -7725,6 +7913,14 @@ Geliştirici: D64 Converter Team
         debug_radiobutton(search_frame, debug_name="Search Format Radio", text="Format", variable=search_type_var, value="format").pack(side=tk.LEFT, padx=5)
         debug_radiobutton(search_frame, debug_name="Search Notes Radio", text="Notlar", variable=search_type_var, value="notes").pack(side=tk.LEFT, padx=5)
         
+        # İçerik / yapısal arama (FTS5 + referans indeksi)
+        content_frame = debug_frame(search_window, debug_name="Search Content Frame", bg=ModernStyle.BG_PRIMARY)
+        content_frame.pack(fill=tk.X, padx=20)
+        debug_radiobutton(content_frame, debug_name="Search Content Radio", text="Çıktı Metni", variable=search_type_var, value="content").pack(side=tk.LEFT, padx=5)
+        debug_radiobutton(content_frame, debug_name="Search Symbol Radio", text="Adres/Sembol ($FFD2, CHROUT)", variable=search_type_var, value="symbol").pack(side=tk.LEFT, padx=5)
+        debug_radiobutton(content_frame, debug_name="Search Bytes Radio", text="Byte Deseni (20 D2 FF)", variable=search_type_var, value="bytes").pack(side=tk.LEFT, padx=5)
+        debug_radiobutton(content_frame, debug_name="Search Keyword Radio", text="BASIC Anahtar Kelime", variable=search_type_var, value="keyword").pack(side=tk.LEFT, padx=5)
+        
         # Arama sonuçları
         results_text = debug_scrolledtext(search_window, debug_name="Search Results Text", height=25, width=100,
                                                bg=ModernStyle.BG_DARK, fg=ModernStyle.FG_PRIMARY,
@@ -7739,22 +7935,45 @@ Geliştirici: D64 Converter Team
                 safe_messagebox("warning", "Warning", "Arama terimi girin")
                 return
             
-            results = self.database_manager.search_files(search_term, search_type)
-            
             results_text.delete(1.0, tk.END)
-            if results:
-                results_text.insert(tk.END, f"🔍 Arama sonuçları: '{search_term}' ({search_type})\n")
+            results_text.insert(tk.END, f"⏳ Aranıyor: '{search_term}' ({search_type})...")
+            threading.Thread(target=search_thread, args=(search_term, search_type), daemon=True).start()
+        
+        def search_thread(search_term, search_type):
+            # Sorgu arka planda; sonuçlar Tk ana thread'inde yazılır
+            try:
+                results = self.database_manager.search_files(search_term, search_type)
+                error = None
+            except (ValueError, sqlite3.Error) as e:
+                results, error = [], str(e)
+            self.root.after(0, lambda: show_results(search_term, search_type, results, error))
+        
+        def show_results(search_term, search_type, results, error):
+            if not results_text.winfo_exists():
+                return
+            results_text.delete(1.0, tk.END)
+            if error:
+                results_text.insert(tk.END, f"❌ Arama hatası: {error}")
+            elif results:
+                results_text.insert(tk.END, f"🔍 Arama sonuçları: '{search_term}' ({search_type}) - {len(results)} kayıt\n")
                 results_text.insert(tk.END, "=" * 60 + "\n\n")
                 
+                lines = []
                 for item in results:
-                    results_text.insert(tk.END, f"📁 {item['filename']}\n")
-                    results_text.insert(tk.END, f"   Format: {item['source_format']}\n")
-                    results_text.insert(tk.END, f"   Boyut: {item['file_size']} bytes\n")
-                    results_text.insert(tk.END, f"   Başarılı: {item['success_count']} | Başarısız: {item['failure_count']}\n")
-                    results_text.insert(tk.END, f"   Son işlem: {item['last_processed']}\n")
+                    lines.append(f"📁 {item['filename']}\n")
+                    lines.append(f"   Format: {item['source_format']}\n")
+                    if item.get('target_format'):
+                        lines.append(f"   Eşleşen çıktı: {item['target_format']} {item.get('output_path') or ''}\n")
+                    if item.get('ref_kind'):
+                        ref_name = f" ({item['ref_name']})" if item.get('ref_name') else ""
+                        lines.append(f"   Referans: ${item['ref_address']:04X}{ref_name} - {item['ref_kind']}\n")
+                    lines.append(f"   Boyut: {item['file_size']} bytes\n")
+                    lines.append(f"   Başarılı: {item['success_count']} | Başarısız: {item['failure_count']}\n")
+                    lines.append(f"   Son işlem: {item['last_processed']}\n")
                     if item['notes']:
-                        results_text.insert(tk.END, f"   Notlar: {item['notes']}\n")
-                    results_text.insert(tk.END, "\n")
+                        lines.append(f"   Notlar: {item['notes']}\n")
+                    lines.append("\n")
+                results_text.insert(tk.END, "".join(lines))
             else:
                 results_text.insert(tk.END, f"❌ '{search_term}' için sonuç bulunamadı")
         
@@ -7862,12 +8081,14 @@ Geliştirici: D64 Converter Team
         debug_button(button_frame, debug_name="Cancel Cleanup Button", text="❌ İptal", command=cleanup_window.destroy).pack(side=tk.LEFT, padx=10)
     
     def track_file_processing(self, filename: str, file_path: str, source_format: str, 
-                            start_address: int = None, end_address: int = None, notes: str = ""):
+                            start_address: int = None, end_address: int = None, notes: str = "",
+                            data: bytes = None):
         """Dosya işleme takibini veritabanına kaydet"""
         if self.database_manager:
             try:
                 file_id = self.database_manager.add_processed_file(
-                    filename, file_path, source_format, start_address, end_address, notes
+                    filename, file_path, source_format, start_address, end_address, notes,
+                    data=data
                 )
                 self.current_file_id = file_id
                 return file_id
@@ -7879,13 +8100,14 @@ Geliştirici: D64 Converter Team
     def track_format_conversion(self, target_format: str, success: bool, 
                               output_size: int = 0, processing_time: float = 0.0,
                               error_message: str = "", output_path: str = "", 
-                              assembly_format: str = ""):
-        """Format dönüşüm takibini veritabanına kaydet"""
+                              assembly_format: str = "", output_text: str = None):
+        """Format dönüşüm takibini veritabanına kaydet (çıktı metni arama indeksine girer)"""
         if self.database_manager and hasattr(self, 'current_file_id') and self.current_file_id:
             try:
                 self.database_manager.add_format_conversion(
                     self.current_file_id, target_format, success, output_size,
-                    processing_time, error_message, output_path, assembly_format
+                    processing_time, error_message, output_path, assembly_format,
+                    output_text=output_text
                 )
             except Exception as e:
                 self.log_message(f"Database conversion tracking error: {e}", "WARNING")
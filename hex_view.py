@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hex View - Sanallaştırılmış hex görünüm modeli
+==============================================
+Veri tek bir bytearray üzerinde memoryview ile tutulur; satırlar yalnızca
+görüntülenmek istendiğinde 256 girişli hex/ASCII tablolarıyla
+biçimlendirilir. 170 KB D64 imajı veya 64 KB bellek dökümü açılırken tüm
+satırlar üretilmez.
+
+Yerinde yama (patch) yapılan satırlar "dirty" olarak işaretlenir;
+görünüm yalnızca bu satırları yeniden çizer.
+
+Satır biçimi (gui_manager HexEditor ile aynı):
+    "0801: 0B 08 0A 00 ...  | ....."
+"""
+
+from typing import Iterable, List, Optional, Set
+
+# Byte -> "XX " ve byte -> yazdırılabilir ASCII (değilse '.')
+HEX_TABLE = tuple(f"{value:02X} " for value in range(256))
+ASCII_TABLE = bytes(value if 32 <= value <= 126 else 0x2E for value in range(256))
+
+
+class HexView:
+    """memoryview tabanlı hex görünüm modeli"""
+
+    def __init__(self, data=b"", start_address: int = 0, bytes_per_row: int = 16):
+        self.bytes_per_row = bytes_per_row
+        self.load(data, start_address)
+
+    def load(self, data, start_address: int = 0):
+        """
+        Veriyi yükle
+
+        Yazılabilir buffer'lar (bytearray, yazılabilir memoryview) kopyalanmadan
+        kullanılır; bytes gibi salt okunur veriler bir kez kopyalanır.
+        """
+        view = memoryview(data)
+        if view.readonly:
+            view = memoryview(bytearray(view))
+        self.view = view.cast("B")
+        self.start_address = start_address
+        self.dirty_rows: Set[int] = set()
+        self.modified_rows: Set[int] = set()
+
+    def __len__(self):
+        return len(self.view)
+
+    @property
+    def end_address(self) -> int:
+        """Son byte'tan sonraki adres"""
+        return self.start_address + len(self.view)
+
+    @property
+    def row_count(self) -> int:
+        return (len(self.view) + self.bytes_per_row - 1) // self.bytes_per_row
+
+    def row_of_address(self, address: int) -> Optional[int]:
+        """Adresi içeren satır (aralık dışındaysa None)"""
+        offset = address - self.start_address
+        if not 0 <= offset < len(self.view):
+            return None
+        return offset // self.bytes_per_row
+
+    def row_address(self, row: int) -> int:
+        return self.start_address + row * self.bytes_per_row
+
+    def format_row(self, row: int) -> str:
+        """Tek satırı biçimlendir"""
+        width = self.bytes_per_row
+        offset = row * width
+        chunk = self.view[offset:offset + width]
+        missing = width - len(chunk)
+        hex_part = "".join([HEX_TABLE[value] for value in chunk]) + "   " * missing
+        ascii_part = bytes(chunk).translate(ASCII_TABLE).decode("latin-1") + " " * missing
+        return f"{self.start_address + offset:04X}: {hex_part} | {ascii_part}"
+
+    def format_rows(self, first: int, count: int) -> List[str]:
+        """[first, first + count) aralığındaki satırları biçimlendir"""
+        last = min(self.row_count, first + count)
+        return [self.format_row(row) for row in range(max(0, first), last)]
+
+    def read(self, address: int, length: int = 1) -> bytes:
+        offset = address - self.start_address
+        return bytes(self.view[max(0, offset):max(0, offset + length)])
+
+    def patch(self, address: int, values: Iterable[int]) -> range:
+        """
+        Veriyi yerinde değiştir
+
+        Args:
+            address: İlk byte'ın adresi
+            values: Yeni byte değerleri
+
+        Returns:
+            Değişen satır aralığı
+
+        Raises:
+            IndexError: Yama veri aralığının dışına taşıyorsa
+            ValueError: Değer 0-255 dışındaysa
+        """
+        values = bytes(values)
+        offset = address - self.start_address
+        if offset < 0 or offset + len(values) > len(self.view):
+            raise IndexError(f"Yama aralık dışında: ${address:04X} (+{len(values)})")
+        if not values:
+            return range(0)
+        self.view[offset:offset + len(values)] = values
+        rows = range(offset // self.bytes_per_row,
+                     (offset + len(values) - 1) // self.bytes_per_row + 1)
+        self.dirty_rows.update(rows)
+        self.modified_rows.update(rows)
+        return rows
+
+    def pop_dirty_rows(self, first: int = 0, last: Optional[int] = None) -> List[int]:
+        """[first, last] aralığındaki dirty satırları al ve işaretlerini temizle"""
+        if last is None:
+            last = self.row_count - 1
+        rows = sorted(row for row in self.dirty_rows if first <= row <= last)
+        self.dirty_rows.difference_update(rows)
+        return rows
+
+    def tobytes(self) -> bytes:
+        return self.view.tobytes()
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import time
+
+    print("📋 Hex View Test")
+    print("=" * 50)
+    image = bytearray(range(256)) * 683  # ~170 KB D64 boyutu
+    started = time.perf_counter()
+    model = HexView(image, 0)
+    visible = model.format_rows(model.row_of_address(0x1234), 40)
+    elapsed = time.perf_counter() - started
+    print(f"✅ {len(model)} byte, {model.row_count} satır, 40 satır {elapsed * 1000:.2f} ms")
+    for line in visible[:3]:
+        print(f"   {line}")
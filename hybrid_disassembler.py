@@ -23,6 +23,8 @@ import re
 import struct
 import logging
 import disassembly_formatter
+from basic_detokenizer import (LINE_HEADER_SIZE, QUOTE_TABLE, build_translation_table,
+                               detokenize_line, iter_basic_lines)
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
@@ -71,6 +73,7 @@ class HybridDisassembler:
             0xC3: "LEN", 0xC4: "STR$", 0xC5: "VAL", 0xC6: "ASC", 0xC7: "CHR$",
             0xC8: "LEFT$", 0xC9: "RIGHT$", 0xCA: "MID$", 0xCB: "GO"
         }
+        self.token_table = build_translation_table(self.basic_tokens, unknown_token="TOKEN_{:02X}")
         
         # C64 memory regions
         # bu bölümler C64'ün bellek haritasını temsil etmeli ancak oldukca az c64_rom_data 
@@ -158,38 +161,21 @@ class HybridDisassembler:
         lines = []
         pos = 0
         
-        while pos < len(basic_data) - 1:
-            try:
-                # Next line pointer
-                next_line_ptr = basic_data[pos] + (basic_data[pos + 1] << 8)
-                pos += 2
-                
-                if next_line_ptr == 0:  # Program end
-                    break
-                
-                # Line number
-                line_number = basic_data[pos] + (basic_data[pos + 1] << 8)
-                pos += 2
-                
-                # Line content
-                line_start = pos
-                while pos < len(basic_data) and basic_data[pos] != 0:
-                    pos += 1
-                
-                line_data = basic_data[line_start:pos]
-                line_text = self.detokenize_basic_line(line_data)
-                
+        try:
+            for line_number, line_text, (line_start, line_end) in iter_basic_lines(
+                    basic_data, 0, self.token_table, QUOTE_TABLE):
                 lines.append({
                     "number": line_number,
                     "text": line_text,
-                    "raw_data": line_data
+                    "raw_data": bytes(basic_data[line_start + LINE_HEADER_SIZE:line_end]).rstrip(b"\x00")
                 })
-                
-                pos += 1  # Skip line terminator
-                
-            except Exception as e:
-                self.logger.error(f"BASIC line parse error at pos {pos}: {e}")
-                break
+                pos = line_end
+        except Exception as e:
+            self.logger.error(f"BASIC line parse error at pos {pos}: {e}")
+        
+        # Program sonu link pointer'ını (00 00) atla
+        if pos < len(basic_data) - 1:
+            pos += 2
         
         return {
             "lines": lines,
@@ -199,25 +185,7 @@ class HybridDisassembler:
     
     def detokenize_basic_line(self, line_data: bytes) -> str:
         """BASIC satırını detokenize et"""
-        
-        result = ""
-        pos = 0
-        
-        while pos < len(line_data):
-            byte_val = line_data[pos]
-            
-            if byte_val >= 0x80:  # BASIC token
-                token_name = self.basic_tokens.get(byte_val, f"TOKEN_{byte_val:02X}")
-                result += token_name
-            else:  # Regular character
-                if 32 <= byte_val <= 126:
-                    result += chr(byte_val)
-                else:
-                    result += f"[{byte_val:02X}]"
-            
-            pos += 1
-        
-        return result
+        return detokenize_line(line_data, self.token_table, QUOTE_TABLE)
     
     def find_sys_calls(self, basic_lines: List[Dict]) -> List[SysCall]:
         """BASIC'de SYS çağrılarını bul"""
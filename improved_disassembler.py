@@ -30,6 +30,8 @@ Gelişmiş C64 PRG dosyası disassembler - daha iyi format çıktıları
 import json
 import os
 from opcode_manager import OpcodeManager
+import opcode_decoder
+import linear_sweep
 
 # Assembly Formatters entegrasyonu
 try:
@@ -804,8 +806,11 @@ class ImprovedDisassembler:
         else:
             return f"// {mnemonic} {operand if operand is not None else ''}"
     
-    def determine_addressing_mode(self, mnemonic, operand, instruction_length):
+    def determine_addressing_mode(self, mnemonic, operand, instruction_length, opcode=None):
         """Addressing mode'u belirle"""
+        # Gerçek mod opcode tablosundan; illegal'ler .BYTE olarak işlenir
+        if opcode is not None and opcode_decoder.is_legal(opcode):
+            return opcode_decoder.addressing_mode_class(opcode)
         if instruction_length == 1:
             if mnemonic in ['ASL', 'LSR', 'ROL', 'ROR']:
                 return 'accumulator'
@@ -819,20 +824,39 @@ class ImprovedDisassembler:
             return 'absolute'
         return 'unknown'
     
-    def disassemble_to_format(self, prg_data):
-        """PRG dosyasını belirtilen formata çevir"""
+    @staticmethod
+    def split_prg(prg_data, default_start=None):
+        """PRG verisini (başlangıç adresi, kod) olarak ayır
+
+        2+ byte varsa ilk iki byte load address kabul edilir, tek byte'ta
+        default_start kullanılır.
+        """
+        if len(prg_data) >= 2:
+            return prg_data[0] + (prg_data[1] << 8), prg_data[2:]
+        return default_start, prg_data
+    
+    def sweep_prg(self, prg_data):
+        """disassemble_to_format'ın kullanacağı instruction sınırlarını hesapla
+
+        Aynı PRG birden fazla formata çevrilecekse sonuç sweep_result
+        olarak tekrar kullanılabilir.
+        """
+        start_addr, code_data = self.split_prg(prg_data, self.start_address)
+        return linear_sweep.sweep(code_data, start_addr)
+    
+    def disassemble_to_format(self, prg_data, sweep_result=None):
+        """PRG dosyasını belirtilen formata çevir
+
+        Args:
+            prg_data: PRG verisi
+            sweep_result: Aynı veri için önceden hesaplanmış sweep_prg sonucu
+        """
         if not prg_data or len(prg_data) < 1:  # Minimum 1 byte yeterli
             return "Hata: Geçersiz PRG verisi"
         
-        # Eğer PRG format header varsa (2+ bytes)
-        if len(prg_data) >= 2:
-            # PRG dosyasının başlangıç adresini al
-            start_addr = prg_data[0] + (prg_data[1] << 8)
-            code_data = prg_data[2:]
-        else:
-            # Tek byte durumu - mevcut start_address kullan
-            start_addr = self.start_address
-            code_data = prg_data
+        # Eğer PRG format header varsa (2+ bytes) başlangıç adresini al,
+        # tek byte durumunda mevcut start_address kullan
+        start_addr, code_data = self.split_prg(prg_data, self.start_address)
         
         # Parametreleri güncelle
         self.start_address = start_addr
@@ -844,142 +868,112 @@ class ImprovedDisassembler:
         # Header ekle
         output_lines.extend(self.header)
         
-        # Ana disassembly
-        pc = self.start_address
-        end_address = self.start_address + len(self.code)
+        # Ana disassembly - instruction sınırları ve operand'lar tek geçişte
+        if sweep_result is None:
+            sweep_result = linear_sweep.sweep(self.code, self.start_address)
         
-        while pc < end_address:
+        for pc, opcode, length, operand in sweep_result.iter_range():
             try:
-                if pc - self.start_address >= len(self.code):
+                template, length, mnemonic = self.opcodes[opcode]
+                if operand is None and length > 1:
+                    # Buffer sonunda eksik operand
                     break
                 
-                opcode = self.code[pc - self.start_address]
+                # Addressing mode'u belirle
+                addressing_mode = self.determine_addressing_mode(mnemonic, operand, length, opcode)
                 
-                if opcode in self.opcodes:
-                    template, length, mnemonic = self.opcodes[opcode]
-                    operand = None
-                    
-                    if length == 1:
-                        # Implied veya accumulator mode
-                        pass
-                    elif length == 2:
-                        if pc - self.start_address + 1 < len(self.code):
-                            operand = self.code[pc - self.start_address + 1]
-                        else:
-                            break
-                    elif length == 3:
-                        if pc - self.start_address + 2 < len(self.code):
-                            operand_lo = self.code[pc - self.start_address + 1]
-                            operand_hi = self.code[pc - self.start_address + 2]
-                            operand = operand_lo + (operand_hi << 8)
-                        else:
-                            break
-                    
-                    # Addressing mode'u belirle
-                    addressing_mode = self.determine_addressing_mode(mnemonic, operand, length)
-                    
-                    # Label kontrolü (JMP, JSR için)
-                    if mnemonic in ['JMP', 'JSR'] and operand is not None:
-                        self.labels[operand] = f"label_{operand:04X}"
-                    
-                    # Enhanced instruction translation
-                    enhanced_handled = False
-                    if self.enhanced_memory:
-                        try:
-                            # JSR instruction handling
-                            if mnemonic == 'JSR' and operand:
-                                from enhanced_c64_memory_manager import get_instruction_translation
-                                enhanced_line = get_instruction_translation('JSR', operand, self.output_format)
-                                if enhanced_line:
-                                    if self.output_format == 'c':
-                                        output_lines.append(f"    {enhanced_line};  // JSR ${operand:04X}")
-                                    elif self.output_format in ['qbasic', 'pdsx']:
-                                        output_lines.append(f"{enhanced_line}")
-                                    else:
-                                        output_lines.append(enhanced_line)
-                                    enhanced_handled = True
-                            
-                            # Memory access instruction handling
-                            elif mnemonic in ['LDA', 'STA', 'LDX', 'STX', 'LDY', 'STY'] and operand and length == 3:
-                                from enhanced_c64_memory_manager import get_format_translation
-                                access_type = 'write' if mnemonic.startswith('ST') else 'read'
-                                enhanced_ref = get_format_translation(operand, self.output_format, access_type)
-                                
+                # Label kontrolü (JMP, JSR için)
+                if mnemonic in ['JMP', 'JSR'] and operand is not None:
+                    self.labels[operand] = f"label_{operand:04X}"
+                
+                # Enhanced instruction translation
+                enhanced_handled = False
+                if self.enhanced_memory:
+                    try:
+                        # JSR instruction handling
+                        if mnemonic == 'JSR' and operand:
+                            from enhanced_c64_memory_manager import get_instruction_translation
+                            enhanced_line = get_instruction_translation('JSR', operand, self.output_format)
+                            if enhanced_line:
                                 if self.output_format == 'c':
-                                    if access_type == 'write':
-                                        reg = mnemonic[2] if len(mnemonic) > 2 else 'a'
-                                        output_lines.append(f"    {enhanced_ref}{reg.lower()};  // {mnemonic} ${operand:04X}")
-                                    else:
-                                        reg = mnemonic[2] if len(mnemonic) > 2 else 'a'
-                                        output_lines.append(f"    {reg.lower()} = {enhanced_ref};  // {mnemonic} ${operand:04X}")
+                                    output_lines.append(f"    {enhanced_line};  // JSR ${operand:04X}")
                                 elif self.output_format in ['qbasic', 'pdsx']:
-                                    if access_type == 'write':
-                                        reg = mnemonic[2] if len(mnemonic) > 2 else 'A'
-                                        output_lines.append(f"{enhanced_ref}{reg}")
-                                    else:
-                                        reg = mnemonic[2] if len(mnemonic) > 2 else 'A'
-                                        output_lines.append(f"{reg} = {enhanced_ref}")
+                                    output_lines.append(f"{enhanced_line}")
+                                else:
+                                    output_lines.append(enhanced_line)
                                 enhanced_handled = True
-                        except Exception as e:
-                            # Fallback to standard handling
-                            pass
-                    
-                    # Standard instruction handling (if not enhanced)
-                    if not enhanced_handled:
-                        if operand is not None:
-                            label_name = f"label_{operand:04X}"
+                        
+                        # Memory access instruction handling
+                        elif mnemonic in ['LDA', 'STA', 'LDX', 'STX', 'LDY', 'STY'] and operand and length == 3:
+                            from enhanced_c64_memory_manager import get_format_translation
+                            access_type = 'write' if mnemonic.startswith('ST') else 'read'
+                            enhanced_ref = get_format_translation(operand, self.output_format, access_type)
+                            
                             if self.output_format == 'c':
-                                output_lines.append(f"    {label_name}:")
-                        # Skip label generation for instructions without operands (like RTS)
-                    
-                    # Instruction'ı çevir
-                    if self.output_format == 'asm':
-                        if length == 1:
-                            output_lines.append(f"${pc:04X}: {mnemonic}")
-                        elif length == 2 and operand is not None:
-                            output_lines.append(f"${pc:04X}: {mnemonic} ${operand:02X}")
-                        elif length == 3 and operand is not None:
-                            output_lines.append(f"${pc:04X}: {mnemonic} ${operand:04X}")
-                        else:
-                            output_lines.append(f"${pc:04X}: {mnemonic}")
-                    else:
-                        try:
-                            translation = self.translate_6502_to_format(mnemonic, operand, addressing_mode)
-                            if translation and translation != "None":
-                                if self.output_format == 'c':
-                                    output_lines.append(f"    {translation}")
+                                if access_type == 'write':
+                                    reg = mnemonic[2] if len(mnemonic) > 2 else 'a'
+                                    output_lines.append(f"    {enhanced_ref}{reg.lower()};  // {mnemonic} ${operand:04X}")
                                 else:
-                                    output_lines.append(translation)
-                            else:
-                                # Fallback: Basic instruction format
-                                if self.output_format == 'c':
-                                    output_lines.append(f"    // {mnemonic} instruction")
+                                    reg = mnemonic[2] if len(mnemonic) > 2 else 'a'
+                                    output_lines.append(f"    {reg.lower()} = {enhanced_ref};  // {mnemonic} ${operand:04X}")
+                            elif self.output_format in ['qbasic', 'pdsx']:
+                                if access_type == 'write':
+                                    reg = mnemonic[2] if len(mnemonic) > 2 else 'A'
+                                    output_lines.append(f"{enhanced_ref}{reg}")
                                 else:
-                                    output_lines.append(f"REM {mnemonic} instruction")
-                        except Exception as e:
-                            # Error handling for translation issues
-                            import traceback
-                            output_lines.append(f"// Error at ${pc:04X}: {str(e)}")
-                            output_lines.append(f"// Debug: mnemonic={mnemonic}, operand={operand}, addressing_mode={addressing_mode}")
-                            output_lines.append(f"// Traceback: {traceback.format_exc()}")
-                            # Safe fallback
+                                    reg = mnemonic[2] if len(mnemonic) > 2 else 'A'
+                                    output_lines.append(f"{reg} = {enhanced_ref}")
+                            enhanced_handled = True
+                    except Exception as e:
+                        # Fallback to standard handling
+                        pass
+                
+                # Standard instruction handling (if not enhanced)
+                if not enhanced_handled:
+                    if operand is not None:
+                        label_name = f"label_{operand:04X}"
+                        if self.output_format == 'c':
+                            output_lines.append(f"    {label_name}:")
+                    # Skip label generation for instructions without operands (like RTS)
+                
+                # Instruction'ı çevir
+                if self.output_format == 'asm':
+                    if length == 1:
+                        output_lines.append(f"${pc:04X}: {mnemonic}")
+                    elif length == 2 and operand is not None:
+                        output_lines.append(f"${pc:04X}: {mnemonic} ${operand:02X}")
+                    elif length == 3 and operand is not None:
+                        output_lines.append(f"${pc:04X}: {mnemonic} ${operand:04X}")
+                    else:
+                        output_lines.append(f"${pc:04X}: {mnemonic}")
+                else:
+                    try:
+                        translation = self.translate_6502_to_format(mnemonic, operand, addressing_mode)
+                        if translation and translation != "None":
+                            if self.output_format == 'c':
+                                output_lines.append(f"    {translation}")
+                            else:
+                                output_lines.append(translation)
+                        else:
+                            # Fallback: Basic instruction format
                             if self.output_format == 'c':
                                 output_lines.append(f"    // {mnemonic} instruction")
                             else:
                                 output_lines.append(f"REM {mnemonic} instruction")
-                    
-                    pc += length
-                else:
-                    # Bilinmeyen opcode
-                    if self.output_format == 'asm':
-                        output_lines.append(f"${pc:04X}: .BYTE ${opcode:02X}")
-                    else:
-                        output_lines.append(f"// Unknown opcode: ${opcode:02X}")
-                    pc += 1
-            
+                    except Exception as e:
+                        # Error handling for translation issues
+                        import traceback
+                        output_lines.append(f"// Error at ${pc:04X}: {str(e)}")
+                        output_lines.append(f"// Debug: mnemonic={mnemonic}, operand={operand}, addressing_mode={addressing_mode}")
+                        output_lines.append(f"// Traceback: {traceback.format_exc()}")
+                        # Safe fallback
+                        if self.output_format == 'c':
+                            output_lines.append(f"    // {mnemonic} instruction")
+                        else:
+                            output_lines.append(f"REM {mnemonic} instruction")
+                
             except Exception as e:
                 output_lines.append(f"// Error at ${pc:04X}: {e}")
-                pc += 1
         
         # Footer ekle
         output_lines.extend(self.footer)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Linear Sweep - Büyük binary'ler için toplu instruction sınırı ön geçişi
+================================================================
+64 KB bellek dökümleri ve kartuş imajlarında byte byte dolaşmak yerine
+tüm buffer için opcode uzunlukları tek seferde çözülür; instruction
+başlangıçları ve operand değerleri dizi olarak hesaplanır. iter_range ile
+yalnızca istenen adres aralığı Python demetlerine çevrilir.
+
+NumPy varsa sınırlar pointer-doubling ile vektörel hesaplanır
+(O(n log n) vektör işlemi), yoksa opcode_decoder tablosuyla saf Python
+döngüsü kullanılır. İki yol da aynı sonucu üretir.
+
+Illegal opcode'lar motorlardaki gibi 1 byte'lık .BYTE kabul edilir.
+"""
+
+from array import array
+from bisect import bisect_left
+
+import opcode_decoder
+
+# NumPy - optional import
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+    print("⚠️ NumPy bulunamadı - linear sweep saf Python ile çalışacak")
+
+# Sweep uzunlukları: resmi opcode'lar tablodan, illegal'ler 1 byte
+SWEEP_LENGTHS = bytes(
+    opcode_decoder.LENGTH[op] if opcode_decoder.LEGAL[op] else 1
+    for op in range(256)
+)
+
+if NUMPY_AVAILABLE:
+    _SWEEP_LENGTHS_NP = np.frombuffer(SWEEP_LENGTHS, dtype=np.uint8).astype(np.int64)
+
+
+class SweepResult:
+    """Linear sweep sonucu: instruction başına paralel diziler
+
+    offsets  - Kod içindeki byte ofseti
+    opcodes  - Opcode byte'ı
+    lengths  - Instruction uzunluğu (SWEEP_LENGTHS)
+    operands - Operand değeri, yoksa veya buffer sonunda eksikse -1
+    """
+
+    def __init__(self, start_address, code, offsets, opcodes, lengths, operands):
+        self.start_address = start_address
+        self.code = code
+        self.offsets = offsets
+        self.opcodes = opcodes
+        self.lengths = lengths
+        self.operands = operands
+
+    def __len__(self):
+        return len(self.offsets)
+
+    @property
+    def truncated(self):
+        """Son instruction buffer sonunda kesilmiş mi?"""
+        if not len(self.offsets):
+            return False
+        last = len(self.offsets) - 1
+        return int(self.offsets[last]) + int(self.lengths[last]) > len(self.code)
+
+    def index_of_address(self, address):
+        """Adresteki veya adresten sonraki ilk instruction'ın indeksi"""
+        offset = address - self.start_address
+        if isinstance(self.offsets, array):
+            return bisect_left(self.offsets, offset)
+        return int(np.searchsorted(self.offsets, offset, side='left'))
+
+    def iter_range(self, start_address=None, end_address=None):
+        """(adres, opcode, uzunluk, operand) demetleri üretir; operand yoksa None
+
+        Args:
+            start_address: İlk adres (dahil), None ise baştan
+            end_address: Son adres (hariç), None ise sona kadar
+        """
+        first = 0 if start_address is None else self.index_of_address(start_address)
+        last = len(self) if end_address is None else self.index_of_address(end_address)
+        base = self.start_address
+        offsets = _to_list(self.offsets[first:last])
+        opcodes = _to_list(self.opcodes[first:last])
+        lengths = _to_list(self.lengths[first:last])
+        operands = _to_list(self.operands[first:last])
+        for offset, opcode, length, operand in zip(offsets, opcodes, lengths, operands):
+            yield base + offset, opcode, length, (operand if operand >= 0 else None)
+
+    def records(self, include_illegal=False):
+        """(adres, opcode, operand, mod) kayıtları - decompiler girişi için"""
+        mode_table = opcode_decoder.MODE
+        for address, opcode, length, operand in self.iter_range():
+            if include_illegal or opcode_decoder.LEGAL[opcode]:
+                yield address, opcode, operand, mode_table[opcode]
+
+
+def _to_list(values):
+    """NumPy dizisi veya array('i') -> Python int listesi"""
+    return values.tolist()
+
+
+def _sweep_python(code):
+    """Saf Python linear sweep"""
+    size = len(code)
+    lengths_table = SWEEP_LENGTHS
+    offsets = array('i')
+    opcodes = array('B')
+    lengths = array('B')
+    operands = array('i')
+
+    offset = 0
+    while offset < size:
+        opcode = code[offset]
+        length = lengths_table[opcode]
+        if offset + length > size:
+            operand = -1
+        elif length == 2:
+            operand = code[offset + 1]
+        elif length == 3:
+            operand = code[offset + 1] | (code[offset + 2] << 8)
+        else:
+            operand = -1
+        offsets.append(offset)
+        opcodes.append(opcode)
+        lengths.append(length)
+        operands.append(operand)
+        offset += length
+
+    return offsets, opcodes, lengths, operands
+
+
+def _sweep_numpy(code):
+    """NumPy ile vektörel linear sweep (pointer doubling)"""
+    buf = np.frombuffer(bytes(code), dtype=np.uint8)
+    size = len(buf)
+    if size == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty.astype(np.uint8), empty.astype(np.uint8), empty
+
+    byte_lengths = _SWEEP_LENGTHS_NP[buf]
+    # next[i]: i'deki instruction'dan sonraki ofset; size = bitiş sentinel'i
+    jump = np.minimum(np.arange(size, dtype=np.int64) + byte_lengths, size)
+    jump = np.append(jump, size)
+
+    # path[0:2^k] biliniyorsa jump^(2^k)[path] sonraki 2^k elemanı verir
+    path = np.zeros(1, dtype=np.int64)
+    while path[-1] < size:
+        path = np.concatenate((path, jump[path]))
+        jump = jump[jump]
+    offsets = path[path < size]
+
+    opcodes = buf[offsets]
+    lengths = byte_lengths[offsets]
+    padded = np.concatenate((buf, np.zeros(2, dtype=np.uint8))).astype(np.int64)
+    lo = padded[offsets + 1]
+    hi = padded[offsets + 2]
+    operands = np.where(lengths == 2, lo, np.where(lengths == 3, lo | (hi << 8), -1))
+    operands[offsets + lengths > size] = -1
+
+    return offsets, opcodes, lengths.astype(np.uint8), operands
+
+
+def sweep(code, start_address=0, use_numpy=None):
+    """Kod buffer'ının tamamı için instruction sınırlarını hesaplar
+
+    Args:
+        code: bytes, bytearray veya memoryview
+        start_address: Kodun yükleneceği adres
+        use_numpy: None ise NumPy varsa kullanılır
+
+    Returns:
+        SweepResult
+    """
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy and NUMPY_AVAILABLE:
+        arrays = _sweep_numpy(code)
+    else:
+        arrays = _sweep_python(code)
+    return SweepResult(start_address, code, *arrays)
+
+
+def decode_prg_records(prg_data, start_address=None):
+    """PRG verisini decompiler'ların kabul ettiği instruction kayıtlarına çevirir
+
+    Args:
+        prg_data: Load address dahil PRG verisi
+        start_address: Çözmeye başlanacak adres (None ise load address)
+
+    Returns:
+        [(adres, opcode, operand, mod), ...]
+    """
+    if not prg_data or len(prg_data) < 2:
+        return []
+    load_address = prg_data[0] | (prg_data[1] << 8)
+    code = prg_data[2:]
+    if start_address is None or not (load_address <= start_address < load_address + len(code)):
+        start_address = load_address
+    code = code[start_address - load_address:]
+    return list(sweep(code, start_address).records())
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    import time
+
+    print("⚡ Linear Sweep Test")
+    print("=" * 50)
+    sample = bytes([0xA9, 0x41, 0x20, 0xD2, 0xFF, 0xBD, 0x00, 0xD0, 0x60]) * 7282
+    started = time.perf_counter()
+    result = sweep(sample, 0x0801)
+    elapsed = time.perf_counter() - started
+    print(f"✅ {len(sample)} byte, {len(result)} instruction, {elapsed * 1000:.1f} ms "
+          f"({'NumPy' if NUMPY_AVAILABLE else 'Python'})")
+    for address, opcode, length, operand in result.iter_range(0x0801, 0x0810):
+        print(f"   ${address:04X}: {opcode_decoder.format_instruction(opcode, operand)}")
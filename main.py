@@ -438,7 +438,7 @@ def setup_comprehensive_argparse():
                        help="Batch processing mode")
     parser.add_argument("--recursive", action="store_true", 
                        help="Recursive directory processing")
-    parser.add_argument("--file-filter", type=str, default="*.d64,*.prg,*.t64", 
+    parser.add_argument("--file-filter", type=str, default="*.d64,*.d71,*.d81,*.prg,*.t64,*.tap,*.p00", 
                        help="File filter for batch processing")
     
     # Output options
@@ -683,6 +683,52 @@ def list_available_disassemblers():
     logger.info("      • Illegal/undocumented opcodes support")
     return True
 
+def run_batch_processing(args):
+    """Headless paralel batch tarama (batch_scanner.run_batch)"""
+    logger = logging.getLogger(__name__)
+    
+    try:
+        from batch_scanner import run_batch, SUPPORTED_FORMATS
+        
+        input_dir = args.input_dir
+        if not input_dir or not os.path.isdir(input_dir):
+            logger.error(f"❌ Geçersiz batch klasörü: {input_dir}")
+            return False
+        
+        output_dir = args.output_dir or args.output or "batch_output"
+        output_format = args.output_format or args.format or "asm"
+        if output_format not in SUPPORTED_FORMATS:
+            logger.error(f"❌ Batch modunda desteklenmeyen format: {output_format} "
+                         f"(desteklenenler: {', '.join(SUPPORTED_FORMATS)})")
+            return False
+        formats = ["asm"] if output_format == "asm" else ["asm", output_format]
+        
+        logger.info(f"📦 Batch processing: {input_dir} → {output_dir}")
+        logger.info(f"🔧 Formats: {', '.join(formats)}, Workers: {args.parallel}")
+        
+        def progress(result, done, total):
+            if args.quiet:
+                return
+            status = "❌" if result["errors"] else "✅"
+            logger.info(f"{status} [{done}/{total}] {result['path']} - {result['programs']} program")
+        
+        report = run_batch(
+            input_dir,
+            output_dir,
+            formats=formats,
+            patterns=args.file_filter.split(","),
+            recursive=args.recursive,
+            workers=args.parallel,
+            progress=progress,
+        )
+        for line in report.format().split("\n"):
+            logger.info(line)
+        return report.failed == 0
+        
+    except Exception as e:
+        logger.error(f"❌ Batch processing error: {e}")
+        return False
+
 def run_enhanced_file_processing(args):
     """Enhanced file processing with comprehensive logging"""
     logger = logging.getLogger(__name__)
@@ -1202,6 +1248,11 @@ def main():
             logger.info("      • Pseudo-code - Human-readable pseudocode")
             return True
             
+        # Batch processing mode
+        elif args.batch:
+            logger.info("📦 Batch processing mode")
+            return run_batch_processing(args)
+            
         # File processing mode
         elif args.input or args.file:
             logger.info("📁 File processing mode")
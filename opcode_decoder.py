@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Opcode Decoder - Tüm disassembler motorları için ortak 6502 opcode tablosu
+================================================================
+Tek bir kaynak tablodan (256 opcode, NMOS 6502 illegal'ler dahil) modül
+yüklenirken bir kez düz 256 elemanlı diziler üretilir:
+
+• MNEMONIC_ID   - MNEMONICS listesine indeks
+• LENGTH        - Instruction uzunluğu (1-3 byte)
+• MODE          - Adresleme modu (IMP, ACC, IMM, ZP, ... REL)
+• CYCLES        - Temel cycle sayısı
+• PAGE_PENALTY  - Sayfa geçişinde (branch'te: dallanmada) ek cycle
+• FLAGS_READ    - Okunan flag'ler (NV-BDIZC bit maskesi)
+• FLAGS_WRITTEN - Yazılan flag'ler
+• LEGAL         - Resmi (dokümante) opcode ise 1
+
+disassembler.py, opcode_manager.py (ImprovedDisassembler ve
+AdvancedDisassembler bu sınıfı kullanır) bu modülden beslenir.
+
+Tablolar istenirse D64_OPCODE_CACHE ortam değişkeniyle verilen pickle
+dosyasından yüklenir / dosyaya yazılır.
+"""
+
+import os
+import pickle
+from array import array
+
+# Adresleme modları
+IMP, ACC, IMM, ZP, ZPX, ZPY, ABS, ABX, ABY, IND, IZX, IZY, REL = range(13)
+
+MODE_NAMES = (
+    'implied', 'accumulator', 'immediate', 'zeropage', 'zeropage_x',
+    'zeropage_y', 'absolute', 'absolute_x', 'absolute_y', 'indirect',
+    'indirect_x', 'indirect_y', 'relative',
+)
+
+# Motorların translate_* fonksiyonlarının beklediği kaba sınıflar
+MODE_CLASSES = (
+    'implied', 'accumulator', 'immediate', 'zeropage', 'zeropage',
+    'zeropage', 'absolute', 'absolute', 'absolute', 'absolute',
+    'zeropage', 'zeropage', 'relative',
+)
+
+MODE_LENGTHS = (1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 2, 2, 2)
+
+# Operand yazım şablonları (branch'lerde ham offset byte'ı gösterilir)
+MODE_OPERAND_FORMATS = (
+    "", "A", "#$%02X", "$%02X", "$%02X,X", "$%02X,Y", "$%04X",
+    "$%04X,X", "$%04X,Y", "($%04X)", "($%02X,X)", "($%02X),Y", "$%02X",
+)
+
+_MODE_CODES = {
+    'imp': IMP, 'acc': ACC, 'imm': IMM, 'zp': ZP, 'zpx': ZPX, 'zpy': ZPY,
+    'abs': ABS, 'abx': ABX, 'aby': ABY, 'ind': IND, 'izx': IZX, 'izy': IZY,
+    'rel': REL,
+}
+
+# Flag bitleri
+FLAG_C = 0x01
+FLAG_Z = 0x02
+FLAG_I = 0x04
+FLAG_D = 0x08
+FLAG_B = 0x10
+FLAG_V = 0x40
+FLAG_N = 0x80
+FLAG_ALL = FLAG_N | FLAG_V | FLAG_B | FLAG_D | FLAG_I | FLAG_Z | FLAG_C
+
+_NZ = FLAG_N | FLAG_Z
+_NZC = FLAG_N | FLAG_Z | FLAG_C
+_NVZC = FLAG_N | FLAG_V | FLAG_Z | FLAG_C
+
+# 256 opcode: "MNEMONIC mod cycle" ('*' = sayfa geçişi/dallanma cezası)
+_OPCODE_SPEC = (
+    # 0x00
+    "BRK imp 7", "ORA izx 6", "KIL imp 0", "SLO izx 8", "NOP zp 3", "ORA zp 3", "ASL zp 5", "SLO zp 5",
+    "PHP imp 3", "ORA imm 2", "ASL acc 2", "ANC imm 2", "NOP abs 4", "ORA abs 4", "ASL abs 6", "SLO abs 6",
+    # 0x10
+    "BPL rel 2*", "ORA izy 5*", "KIL imp 0", "SLO izy 8", "NOP zpx 4", "ORA zpx 4", "ASL zpx 6", "SLO zpx 6",
+    "CLC imp 2", "ORA aby 4*", "NOP imp 2", "SLO aby 7", "NOP abx 4*", "ORA abx 4*", "ASL abx 7", "SLO abx 7",
+    # 0x20
+    "JSR abs 6", "AND izx 6", "KIL imp 0", "RLA izx 8", "BIT zp 3", "AND zp 3", "ROL zp 5", "RLA zp 5",
+    "PLP imp 4", "AND imm 2", "ROL acc 2", "ANC imm 2", "BIT abs 4", "AND abs 4", "ROL abs 6", "RLA abs 6",
+    # 0x30
+    "BMI rel 2*", "AND izy 5*", "KIL imp 0", "RLA izy 8", "NOP zpx 4", "AND zpx 4", "ROL zpx 6", "RLA zpx 6",
+    "SEC imp 2", "AND aby 4*", "NOP imp 2", "RLA aby 7", "NOP abx 4*", "AND abx 4*", "ROL abx 7", "RLA abx 7",
+    # 0x40
+    "RTI imp 6", "EOR izx 6", "KIL imp 0", "SRE izx 8", "NOP zp 3", "EOR zp 3", "LSR zp 5", "SRE zp 5",
+    "PHA imp 3", "EOR imm 2", "LSR acc 2", "ALR imm 2", "JMP abs 3", "EOR abs 4", "LSR abs 6", "SRE abs 6",
+    # 0x50
+    "BVC rel 2*", "EOR izy 5*", "KIL imp 0", "SRE izy 8", "NOP zpx 4", "EOR zpx 4", "LSR zpx 6", "SRE zpx 6",
+    "CLI imp 2", "EOR aby 4*", "NOP imp 2", "SRE aby 7", "NOP abx 4*", "EOR abx 4*", "LSR abx 7", "SRE abx 7",
+    # 0x60
+    "RTS imp 6", "ADC izx 6", "KIL imp 0", "RRA izx 8", "NOP zp 3", "ADC zp 3", "ROR zp 5", "RRA zp 5",
+    "PLA imp 4", "ADC imm 2", "ROR acc 2", "ARR imm 2", "JMP ind 5", "ADC abs 4", "ROR abs 6", "RRA abs 6",
+    # 0x70
+    "BVS rel 2*", "ADC izy 5*", "KIL imp 0", "RRA izy 8", "NOP zpx 4", "ADC zpx 4", "ROR zpx 6", "RRA zpx 6",
+    "SEI imp 2", "ADC aby 4*", "NOP imp 2", "RRA aby 7", "NOP abx 4*", "ADC abx 4*", "ROR abx 7", "RRA abx 7",
+    # 0x80
+    "NOP imm 2", "STA izx 6", "NOP imm 2", "SAX izx 6", "STY zp 3", "STA zp 3", "STX zp 3", "SAX zp 3",
+    "DEY imp 2", "NOP imm 2", "TXA imp 2", "XAA imm 2", "STY abs 4", "STA abs 4", "STX abs 4", "SAX abs 4",
+    # 0x90
+    "BCC rel 2*", "STA izy 6", "KIL imp 0", "AHX izy 6", "STY zpx 4", "STA zpx 4", "STX zpy 4", "SAX zpy 4",
+    "TYA imp 2", "STA aby 5", "TXS imp 2", "TAS aby 5", "SHY abx 5", "STA abx 5", "SHX aby 5", "AHX aby 5",
+    # 0xA0
+    "LDY imm 2", "LDA izx 6", "LDX imm 2", "LAX izx 6", "LDY zp 3", "LDA zp 3", "LDX zp 3", "LAX zp 3",
+    "TAY imp 2", "LDA imm 2", "TAX imp 2", "LAX imm 2", "LDY abs 4", "LDA abs 4", "LDX abs 4", "LAX abs 4",
+    # 0xB0
+    "BCS rel 2*", "LDA izy 5*", "KIL imp 0", "LAX izy 5*", "LDY zpx 4", "LDA zpx 4", "LDX zpy 4", "LAX zpy 4",
+    "CLV imp 2", "LDA aby 4*", "TSX imp 2", "LAS aby 4*", "LDY abx 4*", "LDA abx 4*", "LDX aby 4*", "LAX aby 4*",
+    # 0xC0
+    "CPY imm 2", "CMP izx 6", "NOP imm 2", "DCP izx 8", "CPY zp 3", "CMP zp 3", "DEC zp 5", "DCP zp 5",
+    "INY imp 2", "CMP imm 2", "DEX imp 2", "AXS imm 2", "CPY abs 4", "CMP abs 4", "DEC abs 6", "DCP abs 6",
+    # 0xD0
+    "BNE rel 2*", "CMP izy 5*", "KIL imp 0", "DCP izy 8", "NOP zpx 4", "CMP zpx 4", "DEC zpx 6", "DCP zpx 6",
+    "CLD imp 2", "CMP aby 4*", "NOP imp 2", "DCP aby 7", "NOP abx 4*", "CMP abx 4*", "DEC abx 7", "DCP abx 7",
+    # 0xE0
+    "CPX imm 2", "SBC izx 6", "NOP imm 2", "ISC izx 8", "CPX zp 3", "SBC zp 3", "INC zp 5", "ISC zp 5",
+    "INX imp 2", "SBC imm 2", "NOP imp 2", "SBC imm 2", "CPX abs 4", "SBC abs 4", "INC abs 6", "ISC abs 6",
+    # 0xF0
+    "BEQ rel 2*", "SBC izy 5*", "KIL imp 0", "ISC izy 8", "NOP zpx 4", "SBC zpx 4", "INC zpx 6", "ISC zpx 6",
+    "SED imp 2", "SBC aby 4*", "NOP imp 2", "ISC aby 7", "NOP abx 4*", "SBC abx 4*", "INC abx 7", "ISC abx 7",
+)
+
+# Resmi olmayan ama resmi mnemonic'i paylaşan opcode'lar (NOP varyantları hariç)
+_ILLEGAL_ALIASES = {0xEB}
+
+# Mnemonic -> (okunan flag'ler, yazılan flag'ler)
+_FLAG_EFFECTS = {
+    'ADC': (FLAG_C | FLAG_D, _NVZC), 'SBC': (FLAG_C | FLAG_D, _NVZC),
+    'AND': (0, _NZ), 'ORA': (0, _NZ), 'EOR': (0, _NZ),
+    'ASL': (0, _NZC), 'LSR': (0, _NZC), 'ROL': (FLAG_C, _NZC), 'ROR': (FLAG_C, _NZC),
+    'BIT': (0, FLAG_N | FLAG_V | FLAG_Z),
+    'BCC': (FLAG_C, 0), 'BCS': (FLAG_C, 0), 'BEQ': (FLAG_Z, 0), 'BNE': (FLAG_Z, 0),
+    'BMI': (FLAG_N, 0), 'BPL': (FLAG_N, 0), 'BVC': (FLAG_V, 0), 'BVS': (FLAG_V, 0),
+    'BRK': (FLAG_ALL, FLAG_B | FLAG_I), 'PHP': (FLAG_ALL, 0),
+    'PLP': (0, FLAG_ALL), 'RTI': (0, FLAG_ALL),
+    'CLC': (0, FLAG_C), 'SEC': (0, FLAG_C), 'CLD': (0, FLAG_D), 'SED': (0, FLAG_D),
+    'CLI': (0, FLAG_I), 'SEI': (0, FLAG_I), 'CLV': (0, FLAG_V),
+    'CMP': (0, _NZC), 'CPX': (0, _NZC), 'CPY': (0, _NZC),
+    'LDA': (0, _NZ), 'LDX': (0, _NZ), 'LDY': (0, _NZ),
+    'TAX': (0, _NZ), 'TAY': (0, _NZ), 'TXA': (0, _NZ), 'TYA': (0, _NZ), 'TSX': (0, _NZ),
+    'PLA': (0, _NZ), 'INX': (0, _NZ), 'INY': (0, _NZ), 'DEX': (0, _NZ), 'DEY': (0, _NZ),
+    'INC': (0, _NZ), 'DEC': (0, _NZ),
+    # Illegal opcode'lar
+    'SLO': (0, _NZC), 'RLA': (FLAG_C, _NZC), 'SRE': (0, _NZC),
+    'RRA': (FLAG_C | FLAG_D, _NVZC), 'ISC': (FLAG_C | FLAG_D, _NVZC),
+    'LAX': (0, _NZ), 'LAS': (0, _NZ), 'XAA': (0, _NZ), 'DCP': (0, _NZC),
+    'ANC': (0, _NZC), 'ALR': (0, _NZC), 'ARR': (FLAG_C | FLAG_D, _NVZC), 'AXS': (0, _NZC),
+}
+
+OFFICIAL_MNEMONICS = frozenset((
+    'ADC', 'AND', 'ASL', 'BCC', 'BCS', 'BEQ', 'BIT', 'BMI', 'BNE', 'BPL', 'BRK',
+    'BVC', 'BVS', 'CLC', 'CLD', 'CLI', 'CLV', 'CMP', 'CPX', 'CPY', 'DEC', 'DEX',
+    'DEY', 'EOR', 'INC', 'INX', 'INY', 'JMP', 'JSR', 'LDA', 'LDX', 'LDY', 'LSR',
+    'NOP', 'ORA', 'PHA', 'PHP', 'PLA', 'PLP', 'ROL', 'ROR', 'RTI', 'RTS', 'SBC',
+    'SEC', 'SED', 'SEI', 'STA', 'STX', 'STY', 'TAX', 'TAY', 'TSX', 'TXA', 'TXS',
+    'TYA',
+))
+
+CACHE_ENV_VAR = "D64_OPCODE_CACHE"
+
+
+def build_tables():
+    """Kaynak tablodan düz 256 elemanlı dizileri üretir."""
+    mnemonics = []
+    mnemonic_index = {}
+    tables = {
+        'mnemonic_id': array('B', bytes(256)),
+        'length': array('B', bytes(256)),
+        'mode': array('B', bytes(256)),
+        'cycles': array('B', bytes(256)),
+        'page_penalty': array('B', bytes(256)),
+        'flags_read': array('B', bytes(256)),
+        'flags_written': array('B', bytes(256)),
+        'legal': array('B', bytes(256)),
+    }
+
+    for opcode, spec in enumerate(_OPCODE_SPEC):
+        mnemonic, mode_code, cycles = spec.split()
+        if mnemonic not in mnemonic_index:
+            mnemonic_index[mnemonic] = len(mnemonics)
+            mnemonics.append(mnemonic)
+        mode = _MODE_CODES[mode_code]
+        flags_read, flags_written = _FLAG_EFFECTS.get(mnemonic, (0, 0))
+
+        tables['mnemonic_id'][opcode] = mnemonic_index[mnemonic]
+        tables['length'][opcode] = MODE_LENGTHS[mode]
+        tables['mode'][opcode] = mode
+        tables['cycles'][opcode] = int(cycles.rstrip('*'))
+        tables['page_penalty'][opcode] = 1 if cycles.endswith('*') else 0
+        tables['flags_read'][opcode] = flags_read
+        tables['flags_written'][opcode] = flags_written
+        tables['legal'][opcode] = int(
+            mnemonic in OFFICIAL_MNEMONICS
+            and opcode not in _ILLEGAL_ALIASES
+            and (mnemonic != 'NOP' or opcode == 0xEA)
+        )
+
+    tables['mnemonics'] = tuple(mnemonics)
+    tables['spec'] = _OPCODE_SPEC
+    return tables
+
+
+def save_tables(path, tables=None):
+    """Tabloları pickle dosyasına yazar."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'wb') as f:
+        pickle.dump(tables or build_tables(), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_tables(path):
+    """Pickle önbelleğinden tabloları yükler; yoksa/eskiyse None döner."""
+    try:
+        with open(path, 'rb') as f:
+            tables = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if not isinstance(tables, dict) or tables.get('spec') != _OPCODE_SPEC:
+        return None
+    return tables
+
+
+def _load_or_build():
+    """Ortam değişkeninde önbellek yolu varsa onu kullanır, yoksa tabloyu kurar."""
+    cache_path = os.environ.get(CACHE_ENV_VAR)
+    if not cache_path:
+        return build_tables()
+    tables = load_tables(cache_path)
+    if tables is None:
+        tables = build_tables()
+        try:
+            save_tables(cache_path, tables)
+        except OSError:
+            pass
+    return tables
+
+
+_TABLES = _load_or_build()
+
+MNEMONICS = _TABLES['mnemonics']
+MNEMONIC_ID = _TABLES['mnemonic_id']
+LENGTH = _TABLES['length']
+MODE = _TABLES['mode']
+CYCLES = _TABLES['cycles']
+PAGE_PENALTY = _TABLES['page_penalty']
+FLAGS_READ = _TABLES['flags_read']
+FLAGS_WRITTEN = _TABLES['flags_written']
+LEGAL = _TABLES['legal']
+
+# Opcode -> mnemonic (MNEMONICS[MNEMONIC_ID[op]] kısayolu)
+OPCODE_MNEMONICS = tuple(MNEMONICS[MNEMONIC_ID[op]] for op in range(256))
+
+# Opcode -> "%"-biçimli instruction şablonu ("LDA $%04X,X" gibi)
+TEMPLATES = tuple(
+    f"{OPCODE_MNEMONICS[op]} {MODE_OPERAND_FORMATS[MODE[op]]}".rstrip()
+    for op in range(256)
+)
+
+
+def is_legal(opcode):
+    """Opcode resmi 6502 instruction'ı mı?"""
+    return bool(LEGAL[opcode & 0xFF])
+
+
+def addressing_mode_name(opcode):
+    """Opcode'un adresleme modu adı ('absolute_x' gibi)."""
+    return MODE_NAMES[MODE[opcode & 0xFF]]
+
+
+def addressing_mode_class(opcode):
+    """Motor çevirileri için kaba adresleme sınıfı ('immediate', 'zeropage', ...)."""
+    return MODE_CLASSES[MODE[opcode & 0xFF]]
+
+
+def decode(code, offset=0):
+    """Verilen ofsetteki instruction'ı çözer.
+
+    Returns:
+        (opcode, length, operand) - operand yoksa/eksikse None
+    """
+    opcode = code[offset]
+    length = LENGTH[opcode]
+    operand = None
+    if length == 2:
+        if offset + 1 < len(code):
+            operand = code[offset + 1]
+    elif length == 3:
+        if offset + 2 < len(code):
+            operand = code[offset + 1] | (code[offset + 2] << 8)
+    return opcode, length, operand
+
+
+def format_instruction(opcode, operand=None):
+    """Opcode ve operand'ı assembly metnine çevirir."""
+    template = TEMPLATES[opcode]
+    if LENGTH[opcode] == 1:
+        return template
+    if operand is None:
+        return f".BYTE ${opcode:02X}"
+    return template % operand
+
+
+def listing_tuple(address, opcode, operand=None, mode=None):
+    """Yapısal instruction kaydını decompiler'ların (adres, mnemonic, operand)
+    biçimine çevirir.
+
+    Disassembly metnini ayrıştırmakla aynı sonucu verir: düz adresler int,
+    branch'lerde hedef adres, immediate '#$XX', indeksli/dolaylı modlar metin.
+    """
+    mnemonic = OPCODE_MNEMONICS[opcode]
+    if mode is None:
+        mode = MODE[opcode]
+    if operand is None:
+        return (address, mnemonic, 'A' if mode == ACC else '')
+    if mode == REL:
+        return (address, mnemonic, (address + 2 + ((operand ^ 0x80) - 0x80)) & 0xFFFF)
+    if mode in (ZP, ABS):
+        return (address, mnemonic, operand)
+    return (address, mnemonic, MODE_OPERAND_FORMATS[mode] % operand)
+
+
+def legacy_opcode_table(include_illegal=False):
+    """OpcodeManager uyumlu {opcode: (şablon, uzunluk, mnemonic)} sözlüğü.
+
+    include_illegal=False iken illegal opcode'lar eski davranıştaki gibi
+    (".BYTE $XX", 1, "UNKNOWN") olarak döner.
+    """
+    table = {}
+    for op in range(256):
+        if LEGAL[op] or include_illegal:
+            table[op] = (TEMPLATES[op], LENGTH[op], OPCODE_MNEMONICS[op])
+        else:
+            table[op] = (f".BYTE ${op:02X}", 1, "UNKNOWN")
+    return table
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    print("🧩 6502 Opcode Decoder Test")
+    print("=" * 50)
+    print(f"✅ Resmi opcode: {sum(LEGAL)}, illegal: {256 - sum(LEGAL)}")
+    print(f"✅ Mnemonic sayısı: {len(MNEMONICS)}")
+    for sample in (0xA9, 0xBD, 0x6C, 0xB1, 0xA7):
+        print(f"   ${sample:02X}: {TEMPLATES[sample]:<14} "
+              f"{addressing_mode_name(sample):<11} {CYCLES[sample]} cycle")
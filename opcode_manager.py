@@ -1,10 +1,19 @@
 """
-JSON dosyalarından tam 6502 opcode tablosu ve çeviri sistemi
+Tam 6502 opcode tablosu (opcode_decoder) ve JSON tabanlı çeviri sistemi
 """
 
 import json
 import os
 
+import opcode_decoder
+
+# Motorların kullandığı {opcode: (şablon, uzunluk, mnemonic)} tablosu
+_LEGACY_OPCODES = opcode_decoder.legacy_opcode_table()
+
+# Çeviri tablosu süreç başına bir kez okunur
+_translation_cache = None
+
+
 class OpcodeManager:
     def __init__(self):
         self.opcodes = {}
@@ -14,65 +23,39 @@ class OpcodeManager:
         self.create_full_opcode_table()
     
     def load_json_data(self):
-        """JSON dosyalarından opcode verilerini yükle"""
-        try:
-            # Hex opcode map dosyasını yükle
-            hex_map_path = os.path.join(os.path.dirname(__file__), 'hex_opcode_map.json')
-            if os.path.exists(hex_map_path):
-                with open(hex_map_path, 'r', encoding='utf-8') as f:
-                    hex_data = json.load(f)
-                    print(f"Hex opcode map yüklendi: {len(hex_data)} opcode")
-
-                    # Hex string'leri int'e çevir ve opcode tablosuna ekle
-                    for hex_str, opcode_info in hex_data.items():
-                        hex_value = int(hex_str, 16)
-                        mnemonic = opcode_info['mnemonic']
-                        length = opcode_info['length']
-                        description = opcode_info['description']
-
-                        # Format string'ini oluştur
-                        if length == 1:
-                            format_str = mnemonic
-                        elif length == 2:
-                            format_str = f"{mnemonic} $%02X"
-                        elif length == 3:
-                            format_str = f"{mnemonic} $%04X"
-                        else:
-                            format_str = f"{mnemonic} ???"
-
-                        self.opcodes[hex_value] = (format_str, length, mnemonic)
-
-        except Exception as e:
-            print(f"Hex opcode map yüklenirken hata: {e}")
+        """opcode_map.json dosyasından opcode çevirilerini yükle (bir kez)"""
+        global _translation_cache
+        if _translation_cache is None:
+            _translation_cache = {}
+            opcode_map_path = os.path.join(os.path.dirname(__file__), 'opcode_map.json')
+            if os.path.exists(opcode_map_path):
+                try:
+                    with open(opcode_map_path, 'r', encoding='utf-8') as f:
+                        translation_data = json.load(f)
 
-        # Opcode çevirileri için opcode_map.json dosyasını yükle
-        opcode_map_path = os.path.join(os.path.dirname(__file__), 'opcode_map.json')
-        if os.path.exists(opcode_map_path):
-            with open(opcode_map_path, 'r', encoding='utf-8') as f:
-                translation_data = json.load(f)
+                    # Çevirileri yükle
+                    for opcode_info in translation_data:
+                        opcode_name = opcode_info['opcode']
+                        _translation_cache[opcode_name] = {
+                            'c_equivalent': opcode_info.get('c_equivalent', f'{opcode_name}();'),
+                            'qbasic_equivalent': opcode_info.get('qbasic_equivalent', f'REM {opcode_name}'),
+                            'pdsx_equivalent': opcode_info.get('pdsx_equivalent', f'REM {opcode_name}'),
+                            'pseudo_equivalent': opcode_info.get('pseudo_equivalent', f'// {opcode_name}'),
+                            'commodorebasicv2_equivalent': opcode_info.get('commodorebasicv2_equivalent', f'REM {opcode_name}')
+                        }
 
-                # Çevirileri yükle
-                for opcode_info in translation_data:
-                    opcode_name = opcode_info['opcode']
-                    self.translations[opcode_name] = {
-                        'c_equivalent': opcode_info.get('c_equivalent', f'{opcode_name}();'),
-                        'qbasic_equivalent': opcode_info.get('qbasic_equivalent', f'REM {opcode_name}'),
-                        'pdsx_equivalent': opcode_info.get('pdsx_equivalent', f'REM {opcode_name}'),
-                        'pseudo_equivalent': opcode_info.get('pseudo_equivalent', f'// {opcode_name}'),
-                        'commodorebasicv2_equivalent': opcode_info.get('commodorebasicv2_equivalent', f'REM {opcode_name}')
-                    }
+                    print(f"Opcode çevirileri yüklendi: {len(_translation_cache)} opcode")
+                except Exception as e:
+                    print(f"Opcode çevirileri yüklenirken hata: {e}")
 
-                print(f"Opcode çevirileri yüklendi: {len(self.translations)} opcode")
+        self.translations = _translation_cache
 
     def create_full_opcode_table(self):
-        """Tam 256 opcode tablosu oluştur"""
-        # JSON'dan yüklenen opcode'lar zaten self.opcodes'a eklendi
-        # Bilinmeyen opcodes için .BYTE kullan
-        for i in range(256):
-            if i not in self.opcodes:
-                self.opcodes[i] = (f".BYTE ${i:02X}", 1, "UNKNOWN")
-        
-        print(f"Tam 6502 opcode tablosu tamamlandı: {len(self.opcodes)} opcode")
+        """Tam 256 opcode tablosu oluştur (opcode_decoder'dan)"""
+        # Resmi opcode'lar adresleme moduna göre şablonlanır,
+        # illegal opcode'lar .BYTE olarak kalır
+        self.opcodes = dict(_LEGACY_OPCODES)
+        self.addressing_modes = {op: opcode_decoder.addressing_mode_name(op) for op in range(256)}
     
     def get_opcode_info(self, opcode_hex):
         """Hex opcode için bilgi al"""
@@ -43,10 +43,13 @@ import json
 import threading
 import asyncio
 import ast
+import bisect
+import builtins
 import math
 import re
 import logging
 import struct as py_struct
+import array as py_array
 import os
 import time
 import random
@@ -63,6 +66,7 @@ import zipfile
 import datetime
 import argparse
 from collections import defaultdict, namedtuple, Counter
+from enum import IntEnum
 from types import SimpleNamespace
 from threading import Thread
 from abc import ABC, abstractmethod
@@ -559,60 +563,241 @@ class PdsXTypeError(PdsXException):
     pass
 
 # Enhanced Memory Manager
+# Arena yerleşimi: küçük bloklar 2'nin kuvveti boyut sınıflarına yuvarlanır,
+# büyük bloklar hizalanıp en iyi uyan serbest bloktan verilir
+ARENA_BASE = 0x10000000          # memory_pool adresleriyle (1000+) çakışmaz, 0 = NULL
+ARENA_INITIAL_SIZE = 64 * 1024
+ARENA_ALIGNMENT = 16
+SIZE_CLASSES = tuple(1 << shift for shift in range(4, 13))  # 16 .. 4096 byte
+
+# Tipli okuma/yazma biçimleri (little-endian, boyutlar _get_size ile uyumlu)
+MEMORY_FORMATS = {
+    type_name: py_struct.Struct("<" + code)
+    for type_name, code in (("BYTE", "B"), ("SHORT", "h"), ("INTEGER", "i"), ("LONG", "q"),
+                            ("SINGLE", "f"), ("DOUBLE", "d"), ("BOOLEAN", "?"), ("POINTER", "Q"))
+}
+
+Allocation = namedtuple("Allocation", ["size", "block_size", "type_info"])
+
+
+def _size_class(size):
+    """Boyutun sınıf indeksini döndür (büyük bloklar için None)"""
+    if size > SIZE_CLASSES[-1]:
+        return None
+    return max(0, (size - 1).bit_length() - 4)
+
+
 class MemoryManager:
-    """Gelişmiş bellek yönetimi ve işaretçi aritmetiği sistemi"""
-    def __init__(self):
-        self.heap = {}
+    """Gelişmiş bellek yönetimi ve işaretçi aritmetiği sistemi
+
+    Tüm bloklar tek bir bytearray arenasında yaşar; adresler ARENA_BASE +
+    ofset biçiminde gerçek tamsayılardır, bu yüzden işaretçi aritmetiği
+    bloklar arasında da çalışır. Serbest bırakılan bloklar boyut sınıfı
+    başına tutulan serbest listelerden yeniden kullanılır.
+    """
+    def __init__(self, initial_size: int = ARENA_INITIAL_SIZE):
+        self.arena = bytearray(initial_size)
+        self.top = 0                                   # bump ofseti
+        self.free_lists = [[] for _ in SIZE_CLASSES]   # sınıf başına ofset yığını
+        self.large_free = []                           # (blok boyutu, ofset), sıralı
+        self.starts = []                               # canlı blok adresleri, sıralı
         self.ref_counts = {}
         self.allocations = {}
         self.total_allocated = 0
         self.max_memory = 1024 * 1024 * 1024  # 1GB limit
         
     def allocate(self, size: int, type_info: str = "UNKNOWN") -> int:
-        """Bellek ayırma işlemi"""
+        """Bellek ayırma işlemi - sıfırlanmış bloğun adresini döndürür"""
+        size = int(size)
+        if size < 0:
+            raise PdsXRuntimeError(f"Geçersiz bellek boyutu: {size}")
         if self.total_allocated + size > self.max_memory:
             raise PdsXRuntimeError(f"Bellek sınırı aşıldı: {self.max_memory} bytes")
-            
-        ptr = id(bytearray(size))
-        self.heap[ptr] = bytearray(size)
+        
+        class_index = _size_class(size)
+        offset = None
+        if class_index is not None:
+            block_size = SIZE_CLASSES[class_index]
+            if self.free_lists[class_index]:
+                offset = self.free_lists[class_index].pop()
+        else:
+            block_size = -(-size // ARENA_ALIGNMENT) * ARENA_ALIGNMENT
+            position = bisect.bisect_left(self.large_free, (block_size, -1))
+            if position < len(self.large_free):
+                block_size, offset = self.large_free.pop(position)
+        
+        if offset is None:
+            offset = self._bump(block_size)
+        else:
+            self.arena[offset:offset + block_size] = bytes(block_size)
+        
+        ptr = ARENA_BASE + offset
+        bisect.insort(self.starts, ptr)
         self.ref_counts[ptr] = 1
-        self.allocations[ptr] = {"size": size, "type": type_info, "allocated_at": time.time()}
+        self.allocations[ptr] = Allocation(size, block_size, type_info)
         self.total_allocated += size
         return ptr
 
+    def _bump(self, block_size):
+        """Arenanın sonundan yeni blok ayırma, gerekirse arenayı büyütme"""
+        offset = self.top
+        needed = offset + block_size
+        if needed > len(self.arena):
+            capacity = max(needed, 2 * len(self.arena))
+            if capacity > self.max_memory:
+                capacity = needed
+            try:
+                self.arena.extend(bytes(capacity - len(self.arena)))
+            except BufferError:
+                raise PdsXRuntimeError("Arena büyütülemedi: açık memoryview görünümleri var")
+        self.top = needed
+        return offset
+
     def release(self, ptr: int):
-        """Bellek serbest bırakma işlemi"""
+        """Bellek serbest bırakma işlemi - blok serbest listeye döner"""
         if ptr in self.ref_counts:
             self.ref_counts[ptr] -= 1
             if self.ref_counts[ptr] == 0:
-                if ptr in self.allocations:
-                    self.total_allocated -= self.allocations[ptr]["size"]
-                    del self.allocations[ptr]
-                if ptr in self.heap:
-                    del self.heap[ptr]
                 del self.ref_counts[ptr]
+                allocation = self.allocations.pop(ptr)
+                self.total_allocated -= allocation.size
+                del self.starts[bisect.bisect_left(self.starts, ptr)]
+                offset = ptr - ARENA_BASE
+                class_index = _size_class(allocation.block_size)
+                if class_index is not None and SIZE_CLASSES[class_index] == allocation.block_size:
+                    self.free_lists[class_index].append(offset)
+                else:
+                    bisect.insort(self.large_free, (allocation.block_size, offset))
+
+    def retain(self, ptr: int):
+        """Referans sayısını artırma"""
+        if ptr not in self.ref_counts:
+            raise PdsXRuntimeError(f"Geçersiz işaretçi: {ptr}")
+        self.ref_counts[ptr] += 1
+
+    def find_allocation(self, address: int, length: int = 1):
+        """[address, address + length) aralığını içeren canlı bloğun adresi (yoksa None)"""
+        position = bisect.bisect_right(self.starts, address) - 1
+        if position < 0:
+            return None
+        ptr = self.starts[position]
+        if address + length <= ptr + self.allocations[ptr].size:
+            return ptr
+        return None
+
+    def contains(self, address: int, length: int = 1) -> bool:
+        return self.find_allocation(address, length) is not None
+
+    def remaining(self, address: int) -> int:
+        """Adresten bloğun sonuna kadar kalan byte sayısı"""
+        ptr = self.find_allocation(address)
+        if ptr is None:
+            raise PdsXRuntimeError(f"Geçersiz bellek erişimi: {address}")
+        return ptr + self.allocations[ptr].size - address
+
+    def _offset(self, address, length):
+        """Adresi doğrulayıp arena ofsetine çevirme"""
+        if self.find_allocation(address, length) is None:
+            raise PdsXRuntimeError(f"Geçersiz bellek erişimi: {address} (+{length})")
+        return address - ARENA_BASE
 
     def dereference(self, ptr: int):
-        """İşaretçi dereferansı"""
-        if ptr not in self.heap:
+        """İşaretçi dereferansı - bloğun kopyasız memoryview'i"""
+        if ptr not in self.allocations:
             raise PdsXRuntimeError(f"Geçersiz işaretçi: {ptr}")
-        return self.heap[ptr]
+        offset = ptr - ARENA_BASE
+        return memoryview(self.arena)[offset:offset + self.allocations[ptr].size]
+
+    def read(self, address: int, type_name: str = "DOUBLE", index: int = 0):
+        """Adresten tipli değer okuma (address + index * tip boyutu)"""
+        type_name = type_name.upper()
+        if type_name == "STRING":
+            return self.read_string(address)
+        fmt = MEMORY_FORMATS.get(type_name)
+        if fmt is None:
+            raise PdsXTypeError(f"Bellekten okunamayan tip: {type_name}")
+        address += index * fmt.size
+        return fmt.unpack_from(self.arena, self._offset(address, fmt.size))[0]
+
+    def write(self, address: int, value, type_name: str = "DOUBLE", index: int = 0):
+        """Adrese tipli değer yazma (address + index * tip boyutu)"""
+        type_name = type_name.upper()
+        if type_name == "STRING":
+            return self.write_string(address, value)
+        fmt = MEMORY_FORMATS.get(type_name)
+        if fmt is None:
+            raise PdsXTypeError(f"Belleğe yazılamayan tip: {type_name}")
+        address += index * fmt.size
+        try:
+            fmt.pack_into(self.arena, self._offset(address, fmt.size), value)
+        except py_struct.error as e:
+            raise PdsXTypeError(f"Tip dönüşümü başarısız: {e}")
+
+    def read_string(self, address: int) -> str:
+        """NUL ile biten UTF-8 metni okuma"""
+        ptr = self.find_allocation(address)
+        if ptr is None:
+            raise PdsXRuntimeError(f"Geçersiz bellek erişimi: {address}")
+        offset = address - ARENA_BASE
+        limit = ptr - ARENA_BASE + self.allocations[ptr].size
+        end = self.arena.find(0, offset, limit)
+        return self.arena[offset:limit if end < 0 else end].decode("utf-8", errors="replace")
+
+    def write_string(self, address: int, value: str):
+        """Metni UTF-8 olarak yazma (yer varsa NUL sonlandırıcıyla)"""
+        encoded = str(value).encode("utf-8")
+        ptr = self.find_allocation(address, len(encoded) or 1)
+        if ptr is None:
+            raise PdsXRuntimeError(f"Geçersiz bellek erişimi: {address} (+{len(encoded)})")
+        offset = address - ARENA_BASE
+        self.arena[offset:offset + len(encoded)] = encoded
+        if address + len(encoded) < ptr + self.allocations[ptr].size:
+            self.arena[offset + len(encoded)] = 0
 
     def set_value(self, ptr: int, value):
         """İşaretçi konumuna değer yazma"""
-        if ptr not in self.heap:
+        if ptr not in self.allocations:
             raise PdsXRuntimeError(f"Geçersiz işaretçi: {ptr}")
         
-        if isinstance(value, (int, float)):
-            self.heap[ptr][:8] = py_struct.pack('d', float(value))
+        if isinstance(value, bool):
+            self.write(ptr, value, "BOOLEAN")
+        elif isinstance(value, (int, float)):
+            self.write(ptr, float(value), "DOUBLE")
         elif isinstance(value, str):
-            encoded = value.encode('utf-8')
-            self.heap[ptr][:len(encoded)] = encoded
+            self.write_string(ptr, value)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            self.write_bytes(ptr, value)
         elif isinstance(value, (list, tuple)):
-            # Serialize complex data
-            serialized = pickle.dumps(value)
-            if len(serialized) <= len(self.heap[ptr]):
-                self.heap[ptr][:len(serialized)] = serialized
+            # Sayısal diziler double olarak art arda paketlenir
+            try:
+                packed = py_struct.pack(f"<{len(value)}d", *value)
+            except py_struct.error as e:
+                raise PdsXTypeError(f"Yalnızca sayısal diziler belleğe yazılabilir: {e}")
+            self.write_bytes(ptr, packed)
+        else:
+            raise PdsXTypeError(f"Belleğe yazılamayan değer: {type(value).__name__}")
+
+    def read_bytes(self, address: int, length: int) -> bytes:
+        offset = self._offset(address, length)
+        return bytes(self.arena[offset:offset + length])
+
+    def write_bytes(self, address: int, data):
+        with memoryview(data) as view:
+            view = view.cast("B")
+            offset = self._offset(address, len(view))
+            self.arena[offset:offset + len(view)] = view
+
+    def memset(self, address: int, value: int, length: int):
+        """Bellek bölgesini tek byte değeriyle doldurma"""
+        offset = self._offset(address, length)
+        self.arena[offset:offset + length] = bytes([int(value) & 0xFF]) * length
+
+    def memcpy(self, dest: int, src: int, length: int):
+        """Bellek bölgesini kopyalama (çakışan bölgeler güvenli)"""
+        dst_offset = self._offset(dest, length)
+        src_offset = self._offset(src, length)
+        with memoryview(self.arena) as view:
+            view[dst_offset:dst_offset + length] = view[src_offset:src_offset + length]
 
     def sizeof(self, obj):
         """Nesne boyutunu byte cinsinden döndürme"""
@@ -630,9 +815,11 @@ class MemoryManager:
         """Bellek kullanım istatistikleri"""
         return {
             "total_allocated": self.total_allocated,
-            "active_pointers": len(self.heap),
+            "active_pointers": len(self.ref_counts),
             "allocations": len(self.allocations),
-            "memory_usage_mb": self.total_allocated / (1024 * 1024)
+            "memory_usage_mb": self.total_allocated / (1024 * 1024),
+            "arena_size": len(self.arena),
+            "free_blocks": sum(map(len, self.free_lists)) + len(self.large_free)
         }
 
 # Enhanced Type System Classes
@@ -804,8 +991,18 @@ class UnionInstance:
         }
         return size_map.get(type_name.upper(), 8)
 
+# İlkel eleman tipleri için array.array tip kodları (boyutlar _get_size ile aynı)
+ARRAY_TYPECODES = {
+    "BYTE": "B", "SHORT": "h", "INTEGER": "i", "LONG": "q",
+    "SINGLE": "f", "DOUBLE": "d"
+}
+
 class ArrayInstance:
-    """Gelişmiş çok boyutlu dizi sınıfı"""
+    """Gelişmiş çok boyutlu dizi sınıfı
+
+    İlkel sayısal tipler (ARRAY_TYPECODES) sıfırla başlatılmış tek bir
+    array.array tamponunda tutulur; diğer tipler Python listesinde kalır.
+    """
     def __init__(self, dimensions, element_type, type_table, types):
         self.dimensions = dimensions
         self.element_type = element_type.upper()
@@ -818,7 +1015,13 @@ class ArrayInstance:
         for dim in dimensions:
             self.total_elements *= dim
         
-        self.elements = [None] * self.total_elements
+        self.typecode = None
+        if self.element_type not in types:
+            self.typecode = ARRAY_TYPECODES.get(self.element_type)
+        if self.typecode:
+            self.elements = py_array.array(self.typecode, [0]) * self.total_elements
+        else:
+            self.elements = [None] * self.total_elements
         
         # Calculate strides for efficient indexing
         self.strides = []
@@ -826,11 +1029,32 @@ class ArrayInstance:
         for dim in reversed(dimensions):
             self.strides.insert(0, stride)
             stride *= dim
+        # Eleman cinsinden adımlar bir kez hesaplanır
+        self.index_strides = tuple(s // self.element_size for s in self.strides)
+        self._index_layout = tuple(zip(self.dimensions, self.index_strides))
+
+    @property
+    def is_typed(self):
+        return self.typecode is not None
+
+    def __len__(self):
+        return self.total_elements
 
     def set_element(self, indices, value):
         """Dizi elemanına değer atama"""
         index = self._get_flat_index(indices)
         
+        if self.typecode:
+            # Tipli tampon kendi kontrolünü yapar; yalnızca başarısızsa dönüştür
+            try:
+                try:
+                    self.elements[index] = value
+                except TypeError:
+                    self.elements[index] = self._convert(value)
+            except OverflowError as e:
+                raise PdsXTypeError(f"Tip dönüşümü başarısız: {e}")
+            return
+        
         # Type checking for complex types
         if self.element_type in self.types:
             type_info = self.types[self.element_type]
@@ -842,12 +1066,7 @@ class ArrayInstance:
                     raise PdsXTypeError(f"UnionInstance bekleniyor")
         else:
             # Basic type conversion
-            expected_type = self.type_table.get(self.element_type, object)
-            if not isinstance(value, expected_type):
-                try:
-                    value = expected_type(value)
-                except Exception as e:
-                    raise PdsXTypeError(f"Tip dönüşümü başarısız: {e}")
+            value = self._convert(value)
         
         self.elements[index] = value
 
@@ -856,23 +1075,105 @@ class ArrayInstance:
         index = self._get_flat_index(indices)
         return self.elements[index]
 
+    def _convert(self, value):
+        """Değeri eleman tipine dönüştürme"""
+        expected_type = self.type_table.get(self.element_type, object)
+        if isinstance(value, expected_type):
+            return value
+        try:
+            return expected_type(value)
+        except Exception as e:
+            raise PdsXTypeError(f"Tip dönüşümü başarısız: {e}")
+
     def _get_flat_index(self, indices):
         """Çok boyutlu indeksi tek boyutlu indekse dönüştürme"""
         if len(indices) != len(self.dimensions):
             raise PdsXRuntimeError(f"Beklenen {len(self.dimensions)} indeks, {len(indices)} alındı")
         
-        # Bounds checking
-        for i, (idx, dim) in enumerate(zip(indices, self.dimensions)):
-            if not (0 <= idx < dim):
-                raise PdsXRuntimeError(f"İndeks sınır dışı: {idx} (boyut {i}, limit {dim})")
-        
-        # Calculate flat index
         flat_index = 0
-        for i, idx in enumerate(indices):
-            flat_index += idx * (self.strides[i] // self.element_size)
+        for idx, (dim, step) in zip(indices, self._index_layout):
+            if not 0 <= idx < dim:
+                self._raise_bounds_error(indices)
+            flat_index += idx * step
         
         return flat_index
 
+    def _raise_bounds_error(self, indices):
+        """Sınır dışı indeks için boyut numaralı hata (yalnızca hata yolunda)"""
+        for i, (idx, dim) in enumerate(zip(indices, self.dimensions)):
+            if not (0 <= idx < dim):
+                raise PdsXRuntimeError(f"İndeks sınır dışı: {idx} (boyut {i}, limit {dim})")
+
+    def _check_range(self, start, count):
+        """Düz indeks aralığını doğrulama, (start, stop) döndürür"""
+        if count is None:
+            count = self.total_elements - start
+        stop = start + count
+        if start < 0 or count < 0 or stop > self.total_elements:
+            raise PdsXRuntimeError(f"Dizi aralığı sınır dışı: {start}..{stop} (limit {self.total_elements})")
+        return start, stop
+
+    def fill(self, value, start=0, count=None):
+        """[start, start + count) düz aralığını tek değerle doldurma"""
+        start, stop = self._check_range(start, count)
+        if self.typecode:
+            try:
+                try:
+                    block = py_array.array(self.typecode, [value])
+                except TypeError:
+                    block = py_array.array(self.typecode, [self._convert(value)])
+            except OverflowError as e:
+                raise PdsXTypeError(f"Tip dönüşümü başarısız: {e}")
+            self.elements[start:stop] = block * (stop - start)
+        else:
+            if self.element_type not in self.types:
+                value = self._convert(value)
+            self.elements[start:stop] = [value] * (stop - start)
+
+    def copy_from(self, source, count=None, dst_start=0, src_start=0):
+        """Başka bir diziden (veya düz diziden) toplu kopyalama"""
+        if isinstance(source, ArrayInstance):
+            if count is None:
+                count = min(source.total_elements - src_start, self.total_elements - dst_start)
+            src_start, src_stop = source._check_range(src_start, count)
+            values = source.elements[src_start:src_stop]
+        else:
+            if count is None:
+                count = len(source) - src_start
+            values = source[src_start:src_start + count]
+        dst_start, dst_stop = self._check_range(dst_start, count)
+        
+        if self.typecode:
+            # Aynı tip kodlu tamponlar doğrudan, diğerleri dönüştürülerek kopyalanır
+            if not (isinstance(values, py_array.array) and values.typecode == self.typecode):
+                try:
+                    try:
+                        values = py_array.array(self.typecode, values)
+                    except TypeError:
+                        values = py_array.array(self.typecode, [self._convert(v) for v in values])
+                except OverflowError as e:
+                    raise PdsXTypeError(f"Tip dönüşümü başarısız: {e}")
+        elif not isinstance(values, list):
+            values = list(values)
+        self.elements[dst_start:dst_stop] = values
+
+    def get_slice(self, start=0, stop=None):
+        """Düz indeks aralığının kopyasını Python listesi olarak döndürme"""
+        start, stop = self._check_range(start, None if stop is None else stop - start)
+        return self.elements[start:stop].tolist() if self.typecode else self.elements[start:stop]
+
+    def buffer(self):
+        """Tipli dizinin kopyasız memoryview'i"""
+        if not self.typecode:
+            raise PdsXTypeError(f"{self.element_type} dizisi tipli tampon kullanmıyor")
+        return memoryview(self.elements)
+
+    def to_numpy(self):
+        """Tipli dizinin kopyasız NumPy görünümü (NumPy yoksa None)"""
+        if np is None or not self.typecode:
+            return None
+        return np.frombuffer(self.elements, dtype=self.typecode).reshape(self.dimensions)
+
     def _get_size(self, type_name):
         """Tip boyutunu hesaplama"""
         if type_name.upper() in self.types:
@@ -912,6 +1213,8 @@ class Pointer:
         """İşaretçi değerini okuma"""
         if self.address is None:
             raise PdsXRuntimeError("Null pointer dereference")
+        if self._in_arena():
+            return self.interpreter.memory_manager.read(self.address, self.target_type)
         if self.address not in self.interpreter.memory_pool:
             raise PdsXRuntimeError(f"Geçersiz işaretçi adresi: {self.address}")
         
@@ -938,7 +1241,8 @@ class Pointer:
         """İşaretçi değerini yazma"""
         if self.address is None:
             raise PdsXRuntimeError("Null pointer assignment")
-        if self.address not in self.interpreter.memory_pool:
+        in_arena = self._in_arena()
+        if not in_arena and self.address not in self.interpreter.memory_pool:
             raise PdsXRuntimeError(f"Geçersiz işaretçi adresi: {self.address}")
         
         # Type checking and conversion
@@ -958,6 +1262,9 @@ class Pointer:
                 except Exception as e:
                     raise PdsXTypeError(f"Tip dönüşümü başarısız: {e}")
         
+        if in_arena:
+            self.interpreter.memory_manager.write(self.address, value, self.target_type)
+            return
         self.interpreter.memory_pool[self.address]["value"] = value
 
     def add_offset(self, offset):
@@ -970,6 +1277,10 @@ class Pointer:
         else:
             new_address = self.address + offset * self.element_size
         
+        # Arena adresleri gerçek tamsayılardır; hedef herhangi bir canlı blokta olabilir
+        if self.interpreter.memory_manager.contains(new_address, self.element_size):
+            return Pointer(new_address, self.target_type, self.interpreter, self.dimensions)
+        
         if new_address not in self.interpreter.memory_pool:
             # Check if the new address is within bounds
             for addr, block in self.interpreter.memory_pool.items():
@@ -981,6 +1292,11 @@ class Pointer:
         
         return Pointer(new_address, self.target_type, self.interpreter, self.dimensions)
 
+    def _in_arena(self):
+        """Adres MemoryManager arenasında ve hedef tip doğrudan okunabilir mi"""
+        return ((self.target_type in MEMORY_FORMATS or self.target_type == "STRING")
+                and self.interpreter.memory_manager.contains(self.address))
+
     def _get_size(self, type_name):
         """Tip boyutunu hesaplama"""
         if hasattr(self, 'interpreter') and type_name.upper() in self.interpreter.types:
@@ -3551,6 +3867,377 @@ class LibXCore:
 
 # End of LibXCore class
 
+# Bytecode - komut satırları parse_program'da bir kez Instruction'a indirilir
+class Op(IntEnum):
+    """Komut işlem kodları (execute_command dal sırasıyla)"""
+    NOP = 0
+    DIM = 1
+    LET = 2
+    CALL = 3
+    PRINT = 4
+    IF = 5
+    FOR = 6
+    WHILE = 7
+    DO = 8
+    SELECT_CASE = 9
+    GOTO = 10
+    GOSUB = 11
+    RETURN = 12
+    MEMORY = 13
+    DATABASE = 14
+    API = 15
+    FILE = 16
+    ERROR = 17
+    DEBUG = 18
+    IMPORT = 19
+    EVENT = 20
+    TRIGGER = 21
+    PROLOG = 22
+    CLAZZ = 23
+    PIPE = 24
+    INPUT = 25
+    SQL = 26
+    ISAM = 27
+    CONNECT = 28
+    INCLUDE = 29
+    DATA = 30
+    ASSIGN = 31
+    EXPR = 32
+
+# (önekler, Op) - ilk eşleşen kazanır; sıra eski startswith zinciriyle aynı
+STATEMENT_PREFIXES = (
+    (("DIM",), Op.DIM),
+    (("LET",), Op.LET),
+    (("CALL",), Op.CALL),
+    (("PRINT",), Op.PRINT),
+    (("IF", "ELSEIF", "ELSE", "END IF"), Op.IF),
+    (("FOR", "NEXT", "END FOR", "EXIT FOR", "CONTINUE FOR"), Op.FOR),
+    (("WHILE", "WEND", "EXIT WHILE", "CONTINUE WHILE"), Op.WHILE),
+    (("DO", "LOOP", "EXIT DO", "CONTINUE DO"), Op.DO),
+    (("SELECT CASE", "CASE", "END SELECT"), Op.SELECT_CASE),
+    (("GOTO",), Op.GOTO),
+    (("GOSUB",), Op.GOSUB),
+    (("MALLOC", "FREE", "PTR_SET", "MEMCPY", "MEMSET"), Op.MEMORY),
+    (("DB_CONNECT", "DB_QUERY", "DB_CLOSE"), Op.DATABASE),
+    (("API_CONNECT", "API_DISCONNECT", "LOAD_DLL", "LOAD_API"), Op.API),
+    (("OPEN", "CLOSE", "READ", "WRITE", "SEEK"), Op.FILE),
+    (("ON ERROR", "RESUME", "ERROR"), Op.ERROR),
+    (("DEBUG", "TRACE", "STEP"), Op.DEBUG),
+    (("IMPORT",), Op.IMPORT),
+    (("EVENT",), Op.EVENT),
+    (("TRIGGER",), Op.TRIGGER),
+    (("FACT", "RULE", "QUERY", "ASSERT", "RETRACT"), Op.PROLOG),
+    (("CLAZZ",), Op.CLAZZ),
+    (("PIPE",), Op.PIPE),
+    (("INPUT",), Op.INPUT),
+    (("SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "DROP", "ALTER"), Op.SQL),
+    (("ISAM",), Op.ISAM),
+    (("CONNECT",), Op.CONNECT),
+    (("INCLUDE",), Op.INCLUDE),
+    (("READ", "RESTORE"), Op.DATA),
+)
+
+# Ön-ayrıştırılmış işlenenleri olmayan komutlar: Op -> (metod adı, scope_name alır mı)
+# Metotlar çağrı anında aranır; tanımsız olanlar eskisi gibi çalışma zamanı hatası verir
+LEGACY_HANDLERS = {
+    Op.DIM: ("_execute_dim", False),
+    Op.CALL: ("_execute_call", True),
+    Op.SELECT_CASE: ("_execute_select_case", True),
+    Op.RETURN: ("_execute_return", True),
+    Op.MEMORY: ("_execute_memory_operations", True),
+    Op.DATABASE: ("_execute_database_operations", True),
+    Op.API: ("_execute_api_operations", True),
+    Op.FILE: ("_execute_file_operations", True),
+    Op.ERROR: ("_execute_error_handling", True),
+    Op.DEBUG: ("_execute_debug_operations", False),
+    Op.IMPORT: ("_execute_import", False),
+    Op.EVENT: ("_execute_event", True),
+    Op.TRIGGER: ("_execute_trigger_event", True),
+    Op.PROLOG: ("_execute_prolog_operations", True),
+    Op.CLAZZ: ("_execute_clazz_operations", True),
+    Op.PIPE: ("_execute_pipe_operations", True),
+    Op.INPUT: ("_execute_enhanced_input", True),
+    Op.SQL: ("_execute_sql_command", True),
+    Op.ISAM: ("_execute_isam_command", True),
+    Op.CONNECT: ("_execute_db_connect", True),
+    Op.INCLUDE: ("_execute_include", True),
+    Op.DATA: ("_execute_data_operations", True),
+    Op.EXPR: ("_execute_expression_statement", True),
+}
+
+# op: Op, text: kaynak satır, scope: scope_name, args: ön-ayrıştırılmış işlenenler (yoksa None)
+Instruction = namedtuple("Instruction", ["op", "text", "scope", "args"])
+
+FOR_HEADER_PATTERN = re.compile(r"FOR\s+(\w+)\s*=\s*(.+?)\s+TO\s+(.+?)(?:\s+STEP\s+(.+))?$", re.IGNORECASE)
+LET_PATTERN = re.compile(r"LET\s+(.+?)\s*=\s*(.+)", re.IGNORECASE)
+DO_LOOP_PATTERN = re.compile(r"(DO|LOOP)(?:\s+(WHILE|UNTIL)\s+(.+))?$", re.IGNORECASE)
+INSTRUCTION_CACHE_LIMIT = 4096
+
+
+def classify_statement(command_upper):
+    """Büyük harfli komut satırının işlem kodu"""
+    if not command_upper or command_upper.startswith(("'", "//", "REM")):
+        return Op.NOP
+    for prefixes, op in STATEMENT_PREFIXES:
+        if command_upper.startswith(prefixes):
+            return op
+    if command_upper == "RETURN":
+        return Op.RETURN
+    if "=" in command_upper and not command_upper.startswith(("<=", ">=", "==", "!=")):
+        return Op.ASSIGN
+    return Op.EXPR
+
+
+def split_print_parts(print_expr):
+    """PRINT argümanlarını tırnak dışındaki virgüllerden böl"""
+    parts = []
+    current_part = ""
+    in_quotes = False
+    quote_char = None
+    
+    for char in print_expr:
+        if char in ('"', "'") and not in_quotes:
+            in_quotes = True
+            quote_char = char
+            current_part += char
+        elif char == quote_char and in_quotes:
+            in_quotes = False
+            quote_char = None
+            current_part += char
+        elif char == ',' and not in_quotes:
+            parts.append(current_part.strip())
+            current_part = ""
+        else:
+            current_part += char
+    
+    if current_part.strip():
+        parts.append(current_part.strip())
+    return tuple(part for part in parts if part)
+
+
+def parse_if(command):
+    """IF satırı -> ('IF', koşul) | ('IF', None) (THEN yok) | ('ELSE',) | ('END IF',) | None"""
+    command_upper = command.upper()
+    if command_upper.startswith("IF "):
+        then_index = command_upper.find(" THEN")
+        if then_index < 0:
+            return ("IF", None)
+        return ("IF", command[3:then_index].strip())
+    if command_upper.startswith("ELSE"):
+        return ("ELSE",)
+    if command_upper.startswith("END IF"):
+        return ("END IF",)
+    return None
+
+
+def parse_for(command):
+    """FOR satırı -> ('FOR', değişken, başlangıç, bitiş, adım) | ('NEXT', değişken|None) | ('END FOR',) | ('EXIT FOR',) | None"""
+    command_upper = command.upper()
+    if command_upper.startswith("FOR "):
+        match = FOR_HEADER_PATTERN.match(command.strip())
+        if not match:
+            return None
+        var_name, start_expr, end_expr, step_expr = match.groups()
+        return ("FOR", var_name, start_expr.strip(), end_expr.strip(), (step_expr or "1").strip())
+    if command_upper.startswith("NEXT"):
+        words = command.split()
+        return ("NEXT", words[1] if len(words) > 1 else None)
+    if command_upper == "END FOR":
+        return ("END FOR",)
+    if command_upper.startswith("EXIT FOR"):
+        return ("EXIT FOR",)
+    return None
+
+
+def parse_while(command):
+    """WHILE satırı -> ('WHILE', koşul) | ('WEND',) | ('EXIT WHILE',) | None"""
+    command_upper = command.upper()
+    if command_upper.startswith("WHILE "):
+        return ("WHILE", command[6:].strip())
+    if command_upper in ("WEND", "EXIT WHILE"):
+        return (command_upper,)
+    return None
+
+
+def parse_do_loop(command):
+    """DO/LOOP satırı -> ('DO'|'LOOP', 'WHILE'|'UNTIL'|None, koşul|None) | ('EXIT DO',) | None"""
+    if command.upper() == "EXIT DO":
+        return ("EXIT DO",)
+    match = DO_LOOP_PATTERN.match(command.strip())
+    if not match:
+        return None
+    kind, keyword, condition = match.groups()
+    return (kind.upper(), keyword.upper() if keyword else None, condition.strip() if condition else None)
+
+
+def parse_jump(command):
+    """GOTO/GOSUB satırının etiketi (yoksa None)"""
+    words = command.split()
+    return words[1] if len(words) > 1 else None
+
+
+def build_block_table(bytecode):
+    """
+    Statik blok eşleme tablosu: pc -> atlanacak pc (eşleşmeyenler için None)
+    
+    IF (koşul yanlış)  -> bloğun ilk ELSE'inden sonrası, yoksa END IF'ten sonrası
+    ELSE               -> END IF'ten sonrası
+    WHILE (yanlış) / EXIT WHILE -> WEND'den sonrası
+    DO (yanlış) / EXIT DO       -> LOOP'tan sonrası
+    EXIT FOR           -> NEXT / END FOR'dan sonrası
+    
+    Her yapı kendi türüyle iç içe sayılır (eski ileri tarama ile aynı);
+    kapanmamış bloklar programın sonuna atlar.
+    """
+    end = len(bytecode)
+    targets = [None] * end
+    if_blocks = []      # [IF pc, [ELSE pc'leri]]
+    stray_elses = []    # açık IF yokken görülen ELSE'ler - sonraki END IF'e bağlanır
+    while_blocks = []   # [WHILE pc, [EXIT WHILE pc'leri]]
+    do_blocks = []      # [DO pc, [EXIT DO pc'leri]]
+    for_blocks = []     # [EXIT FOR pc'leri]
+    
+    for pc, instruction in enumerate(bytecode):
+        op = instruction.op
+        if op == Op.IF:
+            line = instruction.text.upper()
+            if line.startswith("IF "):
+                if_blocks.append([pc, []])
+            elif line.startswith("END IF"):
+                if if_blocks:
+                    if_pc, elses = if_blocks.pop()
+                    targets[if_pc] = elses[0] + 1 if elses else pc + 1
+                else:
+                    elses = stray_elses
+                    stray_elses = []
+                for else_pc in elses:
+                    targets[else_pc] = pc + 1
+            elif line.startswith("ELSE"):
+                (if_blocks[-1][1] if if_blocks else stray_elses).append(pc)
+        
+        elif op == Op.WHILE:
+            line = instruction.text.upper()
+            if line.startswith("WHILE "):
+                while_blocks.append([pc, []])
+            elif line == "EXIT WHILE":
+                if while_blocks:
+                    while_blocks[-1][1].append(pc)
+                else:
+                    targets[pc] = end
+            elif line == "WEND" and while_blocks:
+                while_pc, exits = while_blocks.pop()
+                for exit_pc in exits + [while_pc]:
+                    targets[exit_pc] = pc + 1
+        
+        elif op == Op.DO and instruction.args:
+            kind = instruction.args[0]
+            if kind == "DO":
+                do_blocks.append([pc, []])
+            elif kind == "EXIT DO":
+                if do_blocks:
+                    do_blocks[-1][1].append(pc)
+                else:
+                    targets[pc] = end
+            elif kind == "LOOP" and do_blocks:
+                do_pc, exits = do_blocks.pop()
+                for exit_pc in exits + [do_pc]:
+                    targets[exit_pc] = pc + 1
+        
+        elif op == Op.FOR:
+            line = instruction.text.upper()
+            if line.startswith("FOR "):
+                for_blocks.append([])
+            elif line.startswith("EXIT FOR"):
+                if for_blocks:
+                    for_blocks[-1].append(pc)
+                else:
+                    targets[pc] = end
+            elif (line.startswith("NEXT") or line == "END FOR") and for_blocks:
+                for exit_pc in for_blocks.pop():
+                    targets[exit_pc] = pc + 1
+    
+    # Kapanmamış bloklar programın sonuna atlar
+    for if_pc, elses in if_blocks:
+        targets[if_pc] = elses[0] + 1 if elses else end
+        for else_pc in elses:
+            targets[else_pc] = end
+    for else_pc in stray_elses:
+        targets[else_pc] = end
+    for block_pc, exits in while_blocks + do_blocks:
+        for exit_pc in exits + [block_pc]:
+            targets[exit_pc] = end
+    for exits in for_blocks:
+        for exit_pc in exits:
+            targets[exit_pc] = end
+    return targets
+
+
+def compile_statement(command, scope_name=None):
+    """
+    Komut satırını Instruction'a indir
+    
+    Sık çalışan komutların (atama, PRINT, IF, FOR, WHILE, DO) işlenenleri burada
+    bir kez ayrıştırılır. Ayrıştırma hataları derleme sırasında değil, eski
+    davranışla aynı şekilde komut çalıştığında raporlanır.
+    """
+    command = command.strip()
+    op = classify_statement(command.upper())
+    args = None
+    if op == Op.ASSIGN:
+        target, expr = command.split("=", 1)
+        args = (target.strip(), expr.strip())
+    elif op == Op.LET:
+        match = LET_PATTERN.match(command)
+        if match:
+            args = match.groups()
+    elif op == Op.PRINT:
+        args = split_print_parts(command[5:].strip())
+    elif op == Op.IF:
+        args = parse_if(command)
+    elif op == Op.FOR:
+        args = parse_for(command)
+    elif op == Op.WHILE:
+        args = parse_while(command)
+    elif op == Op.DO:
+        args = parse_do_loop(command)
+    elif op in (Op.GOTO, Op.GOSUB):
+        args = parse_jump(command)
+    return Instruction(op, command, scope_name, args)
+
+# İfade derleyici - her ifade kaynağı bir kez sınıflandırılıp expr_cache'e alınır
+class Expr(IntEnum):
+    """Derlenmiş ifade türleri (evaluate_expression dal sırasıyla)"""
+    CONST = 0
+    CALL = 1
+    INDEX = 2
+    FIELD = 3
+    DEREF = 4
+    VAR = 5
+    COMPLEX = 6
+
+# kind: Expr, source: kaynak metin, payload: türe göre ön-hesaplanmış veri
+CompiledExpression = namedtuple("CompiledExpression", ["kind", "source", "payload"])
+
+EXPRESSION_CONSTANTS = {
+    'PI': math.pi,
+    'E': math.e,
+    'TRUE': True,
+    'FALSE': False
+}
+EXPR_CACHE_LIMIT = 4096
+FUNCTION_CALL_PATTERN = re.compile(r"([\w\$]+)\s*\((.*)\)")  # $ karakterini destekle
+ARRAY_INDEX_PATTERN = re.compile(r"(\w+)\(([\d, ]+)\)")
+FUNCTION_ARGS_PATTERN = re.compile(r"[a-zA-Z_]|[+\-*/]")
+
+
+def expression_names(code):
+    """Kod nesnesinin (iç içe comprehension/lambda dahil) başvurduğu adlar"""
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, "co_names"):
+            names.extend(name for name in expression_names(const) if name not in names)
+    return tuple(dict.fromkeys(names))
+
 # Main PDSX Interpreter Class
 class pdsXInterpreter:
     """Ana PDSX Yorumlayıcı Sınıfı - Tüm Özelliklerle Birleştirilmiş"""
@@ -3558,6 +4245,9 @@ class pdsXInterpreter:
     def __init__(self):
         # Core state
         self.program = []
+        self.bytecode = []  # self.program ile paralel Instruction listesi
+        self.instruction_cache = {}  # execute_command: (satır, scope) -> Instruction
+        self.block_targets = []  # pc -> eşleşen blok hedefi (build_block_table)
         self.program_counter = 0
         self.global_vars = {}
         self.scopes = [{}]  # Scope stack
@@ -3661,6 +4351,9 @@ class pdsXInterpreter:
         # Initialize operator table for complex expressions
         self.operator_table = self._init_operator_table()
         
+        # Op -> işleyici atlama tablosu
+        self.dispatch_table = self._init_dispatch_table()
+        
         # API connection system
         self.api_connections = {}
         
@@ -4119,6 +4812,21 @@ class pdsXInterpreter:
             '//': lambda x, y: x // y
         }
 
+    def _init_dispatch_table(self):
+        """Op ile indekslenen komut işleyici tablosu - her işleyici Instruction alır"""
+        table = [self._op_legacy] * len(Op)
+        table[Op.NOP] = self._op_nop
+        table[Op.LET] = self._op_assign
+        table[Op.ASSIGN] = self._op_assign
+        table[Op.PRINT] = self._op_print
+        table[Op.IF] = self._op_if
+        table[Op.FOR] = self._op_for
+        table[Op.WHILE] = self._op_while
+        table[Op.DO] = self._op_do_loop
+        table[Op.GOTO] = self._op_goto
+        table[Op.GOSUB] = self._op_gosub
+        return table
+
     def _pdf_read_text(self, file_path):
         """PDF metin okuma"""
         if not os.path.exists(file_path):
@@ -4466,11 +5174,12 @@ class pdsXInterpreter:
                         else:
                             raise PdsXSyntaxError(f"Geçersiz alan tanımı: {line}")
                 
-                # LABEL definitions
+                # LABEL definitions - hedef, etiketten sonraki komutun program indeksi
                 elif line_upper.startswith("LABEL "):
                     label_name = line[6:].strip()
-                    self.labels[label_name] = i
-                    self.modules[module_name]["labels"][label_name] = i
+                    self.labels[label_name] = len(self.program)
+                    self.goto_labels[label_name] = len(self.program)
+                    self.modules[module_name]["labels"][label_name] = len(self.program)
                 
                 # DATA statements
                 elif line_upper.startswith("DATA "):
@@ -4489,12 +5198,16 @@ class pdsXInterpreter:
                 # Regular program statements
                 else:
                     self.program.append((line, current_sub or current_function))
+                    self.bytecode.append(compile_statement(line, current_sub or current_function))
                     self.modules[module_name]["program"].append((line, current_sub or current_function))
                 
                 i += 1
                 
             except Exception as e:
                 raise PdsXSyntaxError(f"Satır {i+1} ayrıştırma hatası: {e}")
+        
+        # Blok eşleşmeleri bir kez çözülür; çalışma anında atlamalar O(1)
+        self.block_targets = build_block_table(self.bytecode)
 
     def _parse_parameters(self, params_str):
         """Parametre listesini ayrıştırma"""
@@ -4513,150 +5226,26 @@ class pdsXInterpreter:
         return params
 
     def execute_command(self, command, scope_name=None):
-        """Gelişmiş komut çalıştırma sistemi"""
-        command = command.strip()
-        if not command or command.startswith("'") or command.startswith("//") or command.upper().startswith("REM"):
+        """Gelişmiş komut çalıştırma sistemi - satır bir kez derlenip önbelleğe alınır"""
+        key = (command, scope_name)
+        instruction = self.instruction_cache.get(key)
+        if instruction is None:
+            if len(self.instruction_cache) >= INSTRUCTION_CACHE_LIMIT:
+                self.instruction_cache.clear()
+            instruction = self.instruction_cache[key] = compile_statement(command, scope_name)
+        return self.execute_instruction(instruction)
+
+    def execute_instruction(self, instruction):
+        """Derlenmiş komutu atlama tablosu üzerinden çalıştırma"""
+        if instruction.op == Op.NOP:
             return None
         
-        # Debug çıktısı kaldırıldı - sadece hata ayıklama modunda göster
-        # print(f"EXECUTE: '{command}' (PC: {self.program_counter})")
-        
-        command_upper = command.upper()
-        
         # Trace modu da varsayılan olarak kapalı
-        if hasattr(self, 'trace_mode') and self.trace_mode:
-            print(f"TRACE: Satır {self.program_counter + 1}: {command}")
+        if self.trace_mode:
+            print(f"TRACE: Satır {self.program_counter + 1}: {instruction.text}")
         
         try:
-            # Variable declaration - DIM
-            if command_upper.startswith("DIM"):
-                return self._execute_dim(command)
-            
-            # Assignment - LET
-            elif command_upper.startswith("LET"):
-                return self._execute_let(command, scope_name)
-            
-            # Method call - CALL
-            elif command_upper.startswith("CALL"):
-                return self._execute_call(command, scope_name)
-            
-            # Output - PRINT
-            elif command_upper.startswith("PRINT"):
-                return self._execute_print(command, scope_name)
-            
-            # Control flow
-            elif command_upper.startswith(("IF", "ELSEIF", "ELSE", "END IF")):
-                return self._execute_if(command, scope_name)
-            
-            elif command_upper.startswith(("FOR", "NEXT", "END FOR", "EXIT FOR", "CONTINUE FOR")):
-                print(f"DEBUG EXEC: FOR/NEXT detected: '{command}'")
-                return self._execute_for(command, scope_name)
-            
-            elif command_upper.startswith(("WHILE", "WEND", "EXIT WHILE", "CONTINUE WHILE")):
-                return self._execute_while(command, scope_name)
-            
-            elif command_upper.startswith(("DO", "LOOP", "EXIT DO", "CONTINUE DO")):
-                return self._execute_do_loop(command, scope_name)
-            
-            elif command_upper.startswith(("SELECT CASE", "CASE", "END SELECT")):
-                return self._execute_select_case(command, scope_name)
-            
-            # Jump statements
-            elif command_upper.startswith("GOTO"):
-                return self._execute_goto(command)
-            
-            elif command_upper.startswith("GOSUB"):
-                return self._execute_gosub(command)
-            
-            elif command_upper == "RETURN":
-                return self._execute_return(command, scope_name)
-            
-            # Function/Sub calls
-            elif command_upper.startswith("CALL "):
-                return self._execute_call(command, scope_name)
-            
-            # Memory operations
-            elif command_upper.startswith(("MALLOC", "FREE", "PTR_SET", "MEMCPY", "MEMSET")):
-                return self._execute_memory_operations(command, scope_name)
-            
-            # Database operations
-            elif command_upper.startswith(("DB_CONNECT", "DB_QUERY", "DB_CLOSE")):
-                return self._execute_database_operations(command, scope_name)
-            
-            # API operations
-            elif command_upper.startswith(("API_CONNECT", "API_DISCONNECT", "LOAD_DLL", "LOAD_API")):
-                return self._execute_api_operations(command, scope_name)
-            
-            # File operations
-            elif command_upper.startswith(("OPEN", "CLOSE", "READ", "WRITE", "SEEK")):
-                return self._execute_file_operations(command, scope_name)
-            
-            # Error handling
-            elif command_upper.startswith(("ON ERROR", "RESUME", "ERROR")):
-                return self._execute_error_handling(command, scope_name)
-            
-            # Debug operations
-            elif command_upper.startswith(("DEBUG", "TRACE", "STEP")):
-                return self._execute_debug_operations(command)
-            
-            # Module operations
-            elif command_upper.startswith("IMPORT"):
-                return self._execute_import(command)
-            
-            # Event system operations
-            elif command_upper.startswith("EVENT"):
-                return self._execute_event(command, scope_name)
-            
-            elif command_upper.startswith("TRIGGER"):
-                return self._execute_trigger_event(command, scope_name)
-            
-            # Prolog operations
-            elif command_upper.startswith(("FACT", "RULE", "QUERY", "ASSERT", "RETRACT")):
-                return self._execute_prolog_operations(command, scope_name)
-            
-            # CLAZZ dynamic class operations
-            elif command_upper.startswith("CLAZZ"):
-                return self._execute_clazz_operations(command, scope_name)
-            
-            # Pipeline operations
-            elif command_upper.startswith("PIPE"):
-                return self._execute_pipe_operations(command, scope_name)
-            
-            # Enhanced PRINT with Python-like features
-            elif command_upper.startswith("PRINT"):
-                return self._execute_enhanced_print(command, scope_name)
-            
-            # Enhanced INPUT with Python-like features
-            elif command_upper.startswith("INPUT"):
-                return self._execute_enhanced_input(command, scope_name)
-            
-            # SQL Database operations
-            elif command_upper.startswith(("SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "DROP", "ALTER")):
-                return self._execute_sql_command(command, scope_name)
-            
-            # ISAM File operations
-            elif command_upper.startswith("ISAM"):
-                return self._execute_isam_command(command, scope_name)
-            
-            # Database connection commands
-            elif command_upper.startswith("CONNECT"):
-                return self._execute_db_connect(command, scope_name)
-            
-            # Include system
-            elif command_upper.startswith("INCLUDE"):
-                return self._execute_include(command, scope_name)
-            
-            # Data operations
-            elif command_upper.startswith(("READ", "RESTORE")):
-                return self._execute_data_operations(command, scope_name)
-            
-            # Expression evaluation (assignment without LET)
-            elif "=" in command and not command_upper.startswith(("<=", ">=", "==", "!=")):
-                return self._execute_assignment(command, scope_name)
-            
-            # Function call without assignment
-            else:
-                return self._execute_expression_statement(command, scope_name)
+            return self.dispatch_table[instruction.op](instruction)
                 
         except PdsXException:
             raise
@@ -4673,6 +5262,48 @@ class pdsXInterpreter:
                 self.running = False
                 raise PdsXRuntimeError(error_msg)
 
+    def _op_nop(self, instruction):
+        return None
+
+    def _op_legacy(self, instruction):
+        """Ön-ayrıştırma yapılmayan komutlar: metin tabanlı işleyiciye devret"""
+        method_name, takes_scope = LEGACY_HANDLERS[instruction.op]
+        handler = getattr(self, method_name)
+        if takes_scope:
+            return handler(instruction.text, instruction.scope)
+        return handler(instruction.text)
+
+    def _op_assign(self, instruction):
+        """LET / atama - hedef ve ifade derlemede ayrılmıştır"""
+        if instruction.args is None:
+            raise PdsXSyntaxError(f"Geçersiz LET sözdizimi: {instruction.text}")
+        target, expr = instruction.args
+        value = self.evaluate_expression(expr, instruction.scope)
+        return self._assign_value(target, value)
+
+    def _op_print(self, instruction):
+        return self._print_parts(instruction.args, instruction.scope)
+
+    def _op_if(self, instruction):
+        return self._run_if(instruction.args, instruction.scope, instruction.text)
+
+    def _op_for(self, instruction):
+        return self._run_for(instruction.args, instruction.scope)
+
+    def _op_while(self, instruction):
+        return self._run_while(instruction.args, instruction.scope)
+
+    def _op_do_loop(self, instruction):
+        return self._run_do_loop(instruction.args, instruction.scope)
+
+    def _op_goto(self, instruction):
+        return self._jump_to_label(instruction.args)
+
+    def _op_gosub(self, instruction):
+        target = self._jump_to_label(instruction.args, "Subroutine label")
+        self.gosub_stack.append(self.program_counter + 1)
+        return target
+
     def _execute_dim(self, command):
         """DIM komutunu çalıştırma"""
         # Support multiple patterns:
@@ -4738,14 +5369,11 @@ class pdsXInterpreter:
 
     def _execute_let(self, command, scope_name=None):
         """LET komutunu çalıştırma"""
-        match = re.match(r"LET\s+(.+?)\s*=\s*(.+)", command, re.IGNORECASE)
+        match = LET_PATTERN.match(command)
         if not match:
             raise PdsXSyntaxError(f"Geçersiz LET sözdizimi: {command}")
         
-        target, expr = match.groups()
-        value = self.evaluate_expression(expr, scope_name)
-        
-        return self._assign_value(target, value)
+        return self._op_assign(Instruction(Op.LET, command, scope_name, match.groups()))
 
     def _execute_assignment(self, command, scope_name=None):
         """Atama komutunu çalıştırma"""
@@ -4754,9 +5382,7 @@ class pdsXInterpreter:
             raise PdsXSyntaxError(f"Geçersiz atama sözdizimi: {command}")
         
         target, expr = [p.strip() for p in parts]
-        value = self.evaluate_expression(expr, scope_name)
-        
-        return self._assign_value(target, value)
+        return self._op_assign(Instruction(Op.ASSIGN, command, scope_name, (target, expr)))
 
     def _assign_value(self, target, value):
         """Değer atama işlemi"""
@@ -4810,51 +5436,25 @@ class pdsXInterpreter:
 
     def _execute_print(self, command, scope_name=None):
         """PRINT komutunu çalıştırma - basitleştirilmiş"""
-        print_expr = command[5:].strip()
-        
-        if not print_expr:
+        return self._print_parts(split_print_parts(command[5:].strip()), scope_name)
+
+    def _print_parts(self, parts, scope_name=None):
+        """Önceden bölünmüş PRINT argümanlarını değerlendirip yazdırma"""
+        if not parts:
             print()
             return None
         
-        # Basit tokenization - virgül ile ayır
-        parts = []
-        current_part = ""
-        in_quotes = False
-        quote_char = None
-        
-        for char in print_expr:
-            if char in ('"', "'") and not in_quotes:
-                in_quotes = True
-                quote_char = char
-                current_part += char
-            elif char == quote_char and in_quotes:
-                in_quotes = False
-                quote_char = None
-                current_part += char
-            elif char == ',' and not in_quotes:
-                parts.append(current_part.strip())
-                current_part = ""
-            else:
-                current_part += char
-        
-        if current_part.strip():
-            parts.append(current_part.strip())
-        
-        # Evaluate each part
         output_parts = []
         for part in parts:
-            part = part.strip()
-            if part:
-                try:
-                    value = self.evaluate_expression(part, scope_name)
-                    output_parts.append(str(value))
-                except Exception as e:
-                    print(f"PRINT ERROR in part '{part}': {e}")
-                    output_parts.append(f"[ERROR:{part}]")
+            try:
+                value = self.evaluate_expression(part, scope_name)
+                output_parts.append(str(value))
+            except Exception as e:
+                print(f"PRINT ERROR in part '{part}': {e}")
+                output_parts.append(f"[ERROR:{part}]")
         
         # Join and print
-        output = " ".join(output_parts)
-        print(output)
+        print(" ".join(output_parts))
         
         return None
 
@@ -4997,14 +5597,7 @@ class pdsXInterpreter:
                 size = int(size_str)
                 type_name = type_name or "BYTE"
                 
-                addr = self.next_address
-                self.memory_pool[addr] = {
-                    "value": None,
-                    "type": type_name,
-                    "size": size,
-                    "refs": 1
-                }
-                self.next_address += size
+                addr = self.memory_manager.allocate(size, type_name.upper())
                 self.current_scope()[var_name] = Pointer(addr, type_name, self)
                 return None
             else:
@@ -5016,7 +5609,10 @@ class pdsXInterpreter:
                 ptr_name = match.group(1)
                 ptr = self._get_variable(ptr_name)
                 
-                if isinstance(ptr, Pointer) and ptr.address and ptr.address in self.memory_pool:
+                if isinstance(ptr, Pointer) and ptr.address in self.memory_manager.allocations:
+                    self.memory_manager.release(ptr.address)
+                    ptr.address = None
+                elif isinstance(ptr, Pointer) and ptr.address and ptr.address in self.memory_pool:
                     self.memory_pool[ptr.address]["refs"] -= 1
                     if self.memory_pool[ptr.address]["refs"] <= 0:
                         del self.memory_pool[ptr.address]
@@ -5075,7 +5671,7 @@ class pdsXInterpreter:
                 else:
                     # Direct address assignment
                     addr = self.evaluate_expression(expr, scope_name)
-                    if isinstance(addr, int) and addr in self.memory_pool:
+                    if isinstance(addr, int) and (addr in self.memory_pool or self.memory_manager.contains(addr)):
                         ptr.address = addr
                     else:
                         raise PdsXRuntimeError(f"Geçersiz adres: {addr}")
@@ -5084,82 +5680,184 @@ class pdsXInterpreter:
             else:
                 raise PdsXSyntaxError(f"Geçersiz PTR_SET sözdizimi: {command}")
         
-        # Add MEMCPY and MEMSET implementations here...
+        elif command_upper.startswith(("MEMSET", "MEMCPY")):
+            # MEMSET hedef, değer[, uzunluk] / MEMCPY hedef, kaynak[, uzunluk]
+            # Dizi operandlarında uzunluk eleman sayısı, arena adreslerinde byte sayısıdır;
+            # A(i, j) başlangıç elemanını seçer
+            op_name = command_upper[:6]
+            args = self._split_arguments(command[6:])
+            if len(args) not in (2, 3):
+                raise PdsXSyntaxError(f"Geçersiz {op_name} sözdizimi: {command}")
+            count = int(self.evaluate_expression(args[2], scope_name)) if len(args) == 3 else None
+            target, start = self._resolve_memory_operand(args[0], scope_name)
+            
+            if op_name == "MEMSET":
+                value = self.evaluate_expression(args[1], scope_name)
+                if isinstance(target, ArrayInstance):
+                    target.fill(value, start, count)
+                elif self.memory_manager.contains(target):
+                    if count is None:
+                        count = self.memory_manager.remaining(target)
+                    self.memory_manager.memset(target, value, count)
+                else:
+                    self.memory_pool[target]["value"] = value
+                return None
+            
+            source, src_start = self._resolve_memory_operand(args[1], scope_name)
+            if isinstance(target, ArrayInstance):
+                if not isinstance(source, ArrayInstance):
+                    raise PdsXTypeError(f"MEMCPY kaynağı bir dizi olmalı: {args[1]}")
+                target.copy_from(source, count, start, src_start)
+            elif isinstance(source, ArrayInstance):
+                raise PdsXTypeError(f"MEMCPY hedefi bir dizi olmalı: {args[0]}")
+            elif self.memory_manager.contains(target) and self.memory_manager.contains(source):
+                if count is None:
+                    count = min(self.memory_manager.remaining(target), self.memory_manager.remaining(source))
+                self.memory_manager.memcpy(target, source, count)
+            elif target not in self.memory_pool or source not in self.memory_pool:
+                raise PdsXRuntimeError(f"MEMCPY arena ve memory_pool adreslerini karıştıramaz: {command}")
+            else:
+                self.memory_pool[target]["value"] = self.memory_pool[source]["value"]
+            return None
         
         raise PdsXSyntaxError(f"Bilinmeyen bellek operasyonu: {command}")
 
+    def _resolve_memory_operand(self, operand, scope_name=None):
+        """MEMSET/MEMCPY operandını çözme: (dizi, düz başlangıç) veya (bellek adresi, None)"""
+        match = re.match(r"(\w+)\s*(?:\((.*)\))?$", operand)
+        value = None
+        if match:
+            value = self.current_scope().get(match.group(1), self.global_vars.get(match.group(1)))
+        if isinstance(value, ArrayInstance):
+            if match.group(2) is None:
+                return value, 0
+            indices = [int(self.evaluate_expression(arg, scope_name))
+                       for arg in self._split_arguments(match.group(2))]
+            return value, value._get_flat_index(indices)
+        
+        address = value.address if isinstance(value, Pointer) else self.evaluate_expression(operand, scope_name)
+        if address not in self.memory_pool and not self.memory_manager.contains(address):
+            raise PdsXRuntimeError(f"Geçersiz bellek adresi: {address}")
+        return address, None
+
     def evaluate_expression(self, expr, scope_name=None):
-        """Gelişmiş ifade değerlendirme sistemi"""
-        expr = expr.strip()
-        
+        """Gelişmiş ifade değerlendirme sistemi - derlenmiş ifadeler expr_cache'te tutulur"""
+        compiled = self.expr_cache.get(expr)
         try:
-            # String literals
-            if (expr.startswith('"') and expr.endswith('"')) or (expr.startswith("'") and expr.endswith("'")):
-                result = expr[1:-1]
-            
-            # Numeric literals - check this first
-            elif self._is_numeric(expr):
-                result = float(expr) if "." in expr else int(expr)
-            
-            # Boolean literals
-            elif expr.upper() in ("TRUE", "FALSE"):
-                result = expr.upper() == "TRUE"
-            
-            # Function calls - check before array access
-            elif "(" in expr and ")" in expr and self._looks_like_function_call(expr):
-                result = self._evaluate_function_call(expr, scope_name)
-            
-            # Array element access
-            elif "(" in expr and ")" in expr:
-                match = re.match(r"(\w+)\(([\d, ]+)\)", expr)
-                if match:
-                    var_name, indices_str = match.groups()
-                    indices = [int(i.strip()) for i in indices_str.split(",")]
-                    array = self._get_variable(var_name)
-                    
-                    if isinstance(array, ArrayInstance):
-                        result = array.get_element(indices)
-                    else:
-                        # Fallback to function call
-                        result = self._evaluate_function_call(expr, scope_name)
-                else:
-                    result = self._evaluate_function_call(expr, scope_name)
-            
-            # Struct/Class field access
-            elif "." in expr and not any(op in expr for op in ["<=", ">=", "==", "!="]) and not self._is_numeric(expr):
-                parts = expr.split(".")
-                instance = self._get_variable(parts[0])
-                
-                for field in parts[1:]:
-                    if isinstance(instance, (StructInstance, UnionInstance, ClassInstance)):
-                        instance = instance.get_field(field)
-                    else:
-                        raise PdsXTypeError(f"Geçersiz alan erişimi: {expr}")
-                
-                result = instance
-            
-            # Pointer dereference
-            elif expr.startswith("*"):
-                ptr_name = expr[1:].strip()
-                ptr = self._get_variable(ptr_name)
-                
-                if isinstance(ptr, Pointer):
-                    result = ptr.dereference()
-                else:
-                    raise PdsXTypeError(f"{ptr_name} bir işaretçi değil")
-            
-            # Variable access
-            elif expr.isidentifier():
-                result = self._get_variable(expr)
-            
-            # Complex expressions
-            else:
-                result = self._evaluate_complex_expression(expr, scope_name)
-            
-            return result
+            if compiled is None:
+                compiled = self.compile_expression(expr.strip())
+                if len(self.expr_cache) >= EXPR_CACHE_LIMIT:
+                    self.expr_cache.clear()
+                self.expr_cache[expr] = compiled
+            return self._evaluate_compiled(compiled, scope_name)
             
         except Exception as e:
-            raise PdsXRuntimeError(f"İfade değerlendirme hatası '{expr}': {e}")
+            raise PdsXRuntimeError(f"İfade değerlendirme hatası '{expr.strip()}': {e}")
+
+    def compile_expression(self, expr):
+        """
+        İfadeyi bir kez sınıflandırıp CompiledExpression'a çevirme
+        
+        Literal'ler sabite, karmaşık ifadeler kod nesnesine ve başvurdukları ad
+        listesine (slot) indirgenir. Çalışma anına bağlı kararlar (kullanıcı
+        fonksiyonu mu, dizi mi) değerlendirmede verilir.
+        """
+        # String literals
+        if (expr.startswith('"') and expr.endswith('"')) or (expr.startswith("'") and expr.endswith("'")):
+            return CompiledExpression(Expr.CONST, expr, expr[1:-1])
+        
+        # Numeric literals - check this first
+        if self._is_numeric(expr):
+            return CompiledExpression(Expr.CONST, expr, float(expr) if "." in expr else int(expr))
+        
+        # Boolean literals
+        if expr.upper() in ("TRUE", "FALSE"):
+            return CompiledExpression(Expr.CONST, expr, expr.upper() == "TRUE")
+        
+        # Function calls / array element access
+        if "(" in expr and ")" in expr:
+            match = FUNCTION_CALL_PATTERN.match(expr)
+            func_name = call_args = None
+            if match:
+                func_name, args_str = match.groups()
+                call_args = tuple(arg.strip() for arg in self._split_arguments(args_str)) if args_str.strip() else ()
+                if func_name.upper() in self.function_table or \
+                        (args_str.strip() and FUNCTION_ARGS_PATTERN.search(args_str)):
+                    return CompiledExpression(Expr.CALL, expr, (func_name, call_args))
+            
+            array_name = indices = None
+            array_match = ARRAY_INDEX_PATTERN.match(expr)
+            if array_match:
+                array_name, indices_str = array_match.groups()
+                indices = tuple(int(i.strip()) for i in indices_str.split(","))
+            return CompiledExpression(Expr.INDEX, expr, (func_name, call_args, array_name, indices))
+        
+        # Struct/Class field access
+        if "." in expr and not any(op in expr for op in ["<=", ">=", "==", "!="]) and not self._is_numeric(expr):
+            return CompiledExpression(Expr.FIELD, expr, tuple(expr.split(".")))
+        
+        # Pointer dereference
+        if expr.startswith("*"):
+            return CompiledExpression(Expr.DEREF, expr, expr[1:].strip())
+        
+        # Variable access
+        if expr.isidentifier():
+            return CompiledExpression(Expr.VAR, expr, expr)
+        
+        # Complex expressions
+        try:
+            code = compile(expr, '<string>', 'eval')
+        except Exception as e:
+            raise PdsXRuntimeError(f"Karmaşık ifade hatası '{expr}': {e}")
+        names = expression_names(code)
+        fixed = {"__builtins__": builtins}
+        fixed.update((name, EXPRESSION_CONSTANTS[name]) for name in names if name in EXPRESSION_CONSTANTS)
+        slots = tuple(name for name in names if name not in EXPRESSION_CONSTANTS)
+        return CompiledExpression(Expr.COMPLEX, expr, (code, fixed, slots))
+
+    def _evaluate_compiled(self, compiled, scope_name=None):
+        """Derlenmiş ifadeyi değerlendirme"""
+        kind = compiled.kind
+        payload = compiled.payload
+        
+        if kind == Expr.VAR:
+            return self._get_variable(payload)
+        
+        if kind == Expr.CONST:
+            return payload
+        
+        if kind == Expr.COMPLEX:
+            return self._evaluate_complex(compiled, scope_name)
+        
+        if kind == Expr.CALL:
+            return self._call_function_by_name(payload[0], payload[1], scope_name)
+        
+        if kind == Expr.INDEX:
+            func_name, call_args, array_name, indices = payload
+            # Kullanıcı fonksiyonu dizi erişiminden önce gelir
+            if func_name is not None and func_name in self.functions:
+                return self._call_function_by_name(func_name, call_args, scope_name)
+            if array_name is not None:
+                array = self._get_variable(array_name)
+                if isinstance(array, ArrayInstance):
+                    return array.get_element(list(indices))
+            # Fallback to function call
+            return self._evaluate_function_call(compiled.source, scope_name)
+        
+        if kind == Expr.FIELD:
+            instance = self._get_variable(payload[0])
+            for field in payload[1:]:
+                if isinstance(instance, (StructInstance, UnionInstance, ClassInstance)):
+                    instance = instance.get_field(field)
+                else:
+                    raise PdsXTypeError(f"Geçersiz alan erişimi: {compiled.source}")
+            return instance
+        
+        # Pointer dereference
+        ptr = self._get_variable(payload)
+        if isinstance(ptr, Pointer):
+            return ptr.dereference()
+        raise PdsXTypeError(f"{payload} bir işaretçi değil")
 
     def _is_numeric(self, value):
         """Sayısal değer kontrolü"""
@@ -5208,21 +5906,21 @@ class pdsXInterpreter:
 
     def _evaluate_function_call(self, expr, scope_name=None):
         """Fonksiyon çağrısını değerlendirme"""
-        match = re.match(r"([\w\$]+)\s*\((.*)\)", expr)  # $ karakterini destekle
+        match = FUNCTION_CALL_PATTERN.match(expr)
         if not match:
             raise PdsXSyntaxError(f"Geçersiz fonksiyon çağrısı: {expr}")
         
         func_name, args_str = match.groups()
-        
-        # Parse arguments
-        args = []
-        if args_str.strip():
-            args = [self.evaluate_expression(arg.strip(), scope_name) 
-                   for arg in self._split_arguments(args_str)]
+        arg_exprs = [arg.strip() for arg in self._split_arguments(args_str)] if args_str.strip() else []
+        return self._call_function_by_name(func_name, arg_exprs, scope_name)
+
+    def _call_function_by_name(self, func_name, arg_exprs, scope_name=None):
+        """Argüman ifadelerini değerlendirip yerleşik veya kullanıcı fonksiyonunu çağırma"""
+        args = [self.evaluate_expression(arg, scope_name) for arg in arg_exprs]
         
         # Built-in function
-        if func_name.upper() in self.function_table:
-            func = self.function_table[func_name.upper()]
+        func = self.function_table.get(func_name.upper())
+        if func is not None:
             return func(*args)
         
         # User-defined function
@@ -5234,27 +5932,36 @@ class pdsXInterpreter:
 
     def _evaluate_complex_expression(self, expr, scope_name=None):
         """Karmaşık matematiksel ifadeleri değerlendirme"""
-        # Create namespace for evaluation
-        namespace = {}
-        namespace.update(self.global_vars)
-        namespace.update(self.current_scope())
-        namespace.update(self.function_table)
-        
-        # Add mathematical constants
-        namespace.update({
-            'PI': math.pi,
-            'E': math.e,
-            'TRUE': True,
-            'FALSE': False
-        })
+        compiled = self.expr_cache.get(expr)
+        if compiled is None or compiled.kind != Expr.COMPLEX:
+            compiled = self.compile_expression(expr.strip())
+        if compiled.kind != Expr.COMPLEX:
+            return self._evaluate_compiled(compiled, scope_name)
+        return self._evaluate_complex(compiled, scope_name)
+
+    def _evaluate_complex(self, compiled, scope_name=None):
+        """
+        Derlenmiş karmaşık ifade - yalnızca ifadenin kullandığı adlar (slot'lar)
+        çözülür; öncelik eskisi gibi sabit > fonksiyon > yerel > global
+        """
+        code, fixed, slots = compiled.payload
+        namespace = dict(fixed)
+        if slots:
+            scope = self.scopes[-1]
+            global_vars = self.global_vars
+            function_table = self.function_table
+            for name in slots:
+                if name in function_table:
+                    namespace[name] = function_table[name]
+                elif name in scope:
+                    namespace[name] = scope[name]
+                elif name in global_vars:
+                    namespace[name] = global_vars[name]
         
         try:
-            # Use AST for safe evaluation
-            tree = ast.parse(expr, mode='eval')
-            compiled = compile(tree, '<string>', 'eval')
-            return eval(compiled, namespace)
+            return eval(code, namespace)
         except Exception as e:
-            raise PdsXRuntimeError(f"Karmaşık ifade hatası '{expr}': {e}")
+            raise PdsXRuntimeError(f"Karmaşık ifade hatası '{compiled.source}': {e}")
 
     def _get_variable(self, name):
         """Değişken değerini alma"""
@@ -5363,15 +6070,16 @@ class pdsXInterpreter:
         print(f"Tanımlanan fonksiyonlar: {len(self.functions)}")
         print("=" * 50)
         
+        bytecode = self.bytecode
+        execute = self.execute_instruction
+        program_length = len(bytecode)
         try:
-            while self.running and self.program_counter < len(self.program):
+            while self.running and self.program_counter < program_length:
                 if self.debug_mode:
                     self._debug_step()
                 
-                command, scope_name = self.program[self.program_counter]
-                # Debug çıktısı kaldırıldı - sadece hata ayıklama modunda göster
-                # print(f"EXEC ORDER: PC={self.program_counter}, CMD='{command}'")
-                result = self.execute_command(command, scope_name)
+                # Komutlar parse_program'da derlendi - burada yalnızca atlama tablosu
+                result = execute(bytecode[self.program_counter])
                 
                 # Handle control flow
                 if isinstance(result, int):
@@ -5380,7 +6088,7 @@ class pdsXInterpreter:
                     self.program_counter += 1
                 
                 # Check for infinite loops
-                if self.program_counter > len(self.program) * 1000:
+                if self.program_counter > program_length * 1000:
                     raise PdsXRuntimeError("Sonsuz döngü tespit edildi")
             
             print("\nProgram başarıyla tamamlandı.")
@@ -5439,63 +6147,69 @@ class pdsXInterpreter:
     # Control Flow Implementations
     def _execute_if(self, command, scope_name=None):
         """IF komutunu çalıştırma - basit implementasyon"""
-        command_upper = command.upper()
+        return self._run_if(parse_if(command), scope_name, command)
+
+    def _run_if(self, args, scope_name=None, command=""):
+        """Ön-ayrıştırılmış IF/ELSE/END IF"""
+        if args is None:
+            return None
+        kind = args[0]
         
-        if command_upper.startswith("IF "):
-            # IF condition THEN parsing
-            if " THEN" in command_upper:
-                condition_part = command[3:command.upper().find(" THEN")].strip()
-                
-                # Evaluate condition
-                try:
-                    condition_result = self.evaluate_expression(condition_part, scope_name)
-                    print(f"🔹 IF: Condition '{condition_part}' = {condition_result}")
-                    
-                    # If condition is false, skip to ELSE or END IF
-                    if not condition_result:
-                        # Skip to matching ELSE or END IF
-                        level = 1
-                        pc = self.program_counter + 1
-                        while pc < len(self.program) and level > 0:
-                            line = self.program[pc][0].strip().upper()
-                            if line.startswith("IF "):
-                                level += 1
-                            elif line.startswith("END IF"):
-                                level -= 1
-                                if level == 0:
-                                    return pc + 1  # Jump to after END IF
-                            elif line.startswith("ELSE") and level == 1:
-                                return pc + 1  # Jump to ELSE block
-                            pc += 1
-                        return pc
-                    
-                except Exception as e:
-                    print(f"🔹 IF: Condition evaluation error: {e}")
-                    return None
-            else:
+        if kind == "IF":
+            condition_part = args[1]
+            if condition_part is None:
                 print(f"🔹 IF: Missing THEN in '{command}'")
+                return None
+            
+            # Evaluate condition
+            try:
+                condition_result = self.evaluate_expression(condition_part, scope_name)
+                if self.trace_mode:
+                    print(f"🔹 IF: Condition '{condition_part}' = {condition_result}")
                 
-        elif command_upper.startswith("ELSE"):
-            # ELSE - skip to END IF
-            level = 1
-            pc = self.program_counter + 1
-            while pc < len(self.program) and level > 0:
-                line = self.program[pc][0].strip().upper()
-                if line.startswith("IF "):
-                    level += 1
-                elif line.startswith("END IF"):
-                    level -= 1
-                    if level == 0:
-                        return pc + 1  # Jump to after END IF
-                pc += 1
-            return pc
-            
-        elif command_upper.startswith("END IF"):
-            # END IF - just continue
-            pass
+                # If condition is false, skip to ELSE block or after END IF
+                if not condition_result:
+                    return self._block_target()
+                
+            except Exception as e:
+                print(f"🔹 IF: Condition evaluation error: {e}")
+                return None
+                
+        elif kind == "ELSE":
+            # ELSE - skip to after END IF
+            return self._block_target()
             
         return None
 
+    def _block_target(self):
+        """Geçerli komutun parse_program'da çözülmüş blok hedefi"""
+        pc = self.program_counter
+        if pc < len(self.block_targets):
+            target = self.block_targets[pc]
+            if target is not None:
+                return target
+        return len(self.bytecode)
+
+    def _jump_to_label(self, label, kind="Label"):
+        """Etiketin program indeksi (GOTO/GOSUB hedefi)"""
+        if label in self.goto_labels:
+            return self.goto_labels[label]
+        raise PdsXRuntimeError(f"{kind} bulunamadı: {label}")
+
+    def _execute_goto(self, command):
+        """GOTO komutunu çalıştırma"""
+        return self._op_goto(compile_statement(command))
+
+    def _execute_gosub(self, command):
+        """GOSUB komutunu çalıştırma"""
+        return self._op_gosub(compile_statement(command))
+
+    def _execute_return(self, command, scope_name=None):
+        """RETURN komutunu çalıştırma - GOSUB'dan dönüş"""
+        if self.gosub_stack:
+            return self.gosub_stack.pop()
+        return None
+
     def _execute_for(self, command, scope_name):
         """FOR döngüsü çalıştırma"""
         # REM: Karmaşık FOR kodu devre dışı - basit implementasyon yapılacak
@@ -5595,59 +6309,54 @@ class pdsXInterpreter:
         #     self.program_counter = pc - 1
         #     self.loop_stack.pop()
         
-        # GELİŞMİŞ FOR İMPLEMENTASYONU - İç içe döngüler ve recursion destekli
-        print(f"🔄 FOR HANDLER: '{command}'")
-        command_upper = command.upper()
+        return self._run_for(parse_for(command), scope_name)
+
+    def _run_for(self, args, scope_name=None):
+        """Ön-ayrıştırılmış FOR/NEXT/END FOR/EXIT FOR - iç içe döngüler ve recursion destekli"""
+        trace = self.trace_mode
         
         # FOR stack'i initialize et
         if not hasattr(self, 'for_stack'):
             self.for_stack = []
         
-        if command_upper.startswith("FOR "):
-            # FOR parsing: FOR i = 1 TO 3 [STEP 1]
-            parts = command.split()
-            if len(parts) >= 6 and parts[2] == "=" and parts[4].upper() == "TO":
-                var_name = parts[1]
-                start_val = int(parts[3])
-                end_val = int(parts[5])
-                step_val = 1
-                
-                # STEP kontrolü
-                if len(parts) >= 8 and parts[6].upper() == "STEP":
-                    step_val = int(parts[7])
-                
+        if args is None:
+            return None
+        kind = args[0]
+        
+        if kind == "FOR":
+            # FOR i = 1 TO 3 [STEP 1]
+            _, var_name, start_expr, end_expr, step_expr = args
+            start_val = self.evaluate_expression(start_expr, scope_name)
+            end_val = self.evaluate_expression(end_expr, scope_name)
+            step_val = self.evaluate_expression(step_expr, scope_name)
+            
+            if trace:
                 print(f"🔄 FOR[{len(self.for_stack)}]: {var_name} = {start_val} TO {end_val} STEP {step_val}")
+            
+            # Değişkeni current scope'a set et
+            self.current_scope()[var_name] = start_val
+            
+            # Loop info sakla - nested level tracking ile
+            loop_info = {
+                "type": "FOR",
+                "var": var_name,
+                "start": start_val,
+                "end": end_val,
+                "step": step_val,
+                "start_pc": self.program_counter + 1,
+                "level": len(self.for_stack),  # nested level
+                "scope_backup": dict(self.current_scope())  # scope backup for recursion
+            }
+            self.for_stack.append(loop_info)
                 
-                # Değişkeni current scope'a set et
-                self.current_scope()[var_name] = start_val
-                
-                # Loop info sakla - nested level tracking ile
-                loop_info = {
-                    "type": "FOR",
-                    "var": var_name,
-                    "start": start_val,
-                    "end": end_val,
-                    "step": step_val,
-                    "start_pc": self.program_counter + 1,
-                    "level": len(self.for_stack),  # nested level
-                    "scope_backup": dict(self.current_scope())  # scope backup for recursion
-                }
-                self.for_stack.append(loop_info)
-                print(f"🔄 FOR: Loop stack depth: {len(self.for_stack)}, info: {loop_info}")
-                
-        elif command_upper.startswith("NEXT"):
+        elif kind == "NEXT":
             # NEXT [variable] - son FOR'u işle veya belirtilen variable'ı
-            print(f"🔄 NEXT: Stack depth: {len(getattr(self, 'for_stack', []))}")
-            
-            if not hasattr(self, 'for_stack') or not self.for_stack:
+            if not self.for_stack:
                 raise PdsXRuntimeError("NEXT without FOR")
                 
             # Variable ismi belirtilmişse o FOR'u bul
-            target_var = None
-            if len(command.split()) > 1:
-                target_var = command.split()[1]
-                print(f"🔄 NEXT: Target variable: {target_var}")
-                
+            target_var = args[1]
+            if target_var is not None and self.for_stack[-1]["var"] != target_var:
                 # Stack'te geriye doğru ara
                 target_index = -1
                 for i in range(len(self.for_stack) - 1, -1, -1):
@@ -5661,68 +6370,51 @@ class pdsXInterpreter:
                 # Hedef FOR'dan sonraki tüm FOR'ları kapat
                 while len(self.for_stack) > target_index + 1:
                     closed_loop = self.for_stack.pop()
-                    print(f"🔄 NEXT: Closing nested FOR {closed_loop['var']}")
+                    if trace:
+                        print(f"🔄 NEXT: Closing nested FOR {closed_loop['var']}")
             
             # Son FOR'u işle
             loop_info = self.for_stack[-1]
             var_name = loop_info["var"]
             
             # Değişkeni artır
-            current_val = self.current_scope()[var_name]
-            new_val = current_val + loop_info["step"]
-            self.current_scope()[var_name] = new_val
+            scope = self.current_scope()
+            current_val = scope[var_name]
+            step = loop_info["step"]
+            new_val = current_val + step
+            scope[var_name] = new_val
             
-            print(f"🔄 NEXT[{loop_info['level']}]: {var_name}: {current_val} -> {new_val} (end: {loop_info['end']}, step: {loop_info['step']})")
+            if trace:
+                print(f"🔄 NEXT[{loop_info['level']}]: {var_name}: {current_val} -> {new_val} (end: {loop_info['end']}, step: {step})")
             
             # Döngü devam kontrolü
-            should_continue = False
-            if loop_info["step"] > 0:
-                should_continue = new_val <= loop_info["end"]
-            else:
-                should_continue = new_val >= loop_info["end"]
-                
-            if should_continue:
-                # Döngü devam et
-                print(f"🔄 NEXT: Döngü devam, PC: {loop_info['start_pc']}'ya git")
+            if (new_val <= loop_info["end"]) if step > 0 else (new_val >= loop_info["end"]):
                 return loop_info["start_pc"]
-            else:
-                # Döngü bitir
-                print(f"🔄 NEXT: Döngü[{loop_info['level']}] bitti")
-                self.for_stack.pop()
+            
+            # Döngü bitir
+            self.for_stack.pop()
                 
-        elif command_upper == "END FOR":
+        elif kind == "END FOR":
             # END FOR - son FOR'u kapat (NEXT gibi ama increment yapmadan)
-            print(f"🔄 END FOR: Stack depth: {len(getattr(self, 'for_stack', []))}")
-            
-            if not hasattr(self, 'for_stack') or not self.for_stack:
+            if not self.for_stack:
                 raise PdsXRuntimeError("END FOR without FOR")
                 
             loop_info = self.for_stack.pop()
-            print(f"🔄 END FOR: FOR {loop_info['var']} döngüsü kapatıldı")
+            if trace:
+                print(f"🔄 END FOR: FOR {loop_info['var']} döngüsü kapatıldı")
             
-        elif command_upper.startswith("EXIT FOR"):
+        elif kind == "EXIT FOR":
             # EXIT FOR - mevcut FOR'dan çık
-            print(f"🔄 EXIT FOR: Stack depth: {len(getattr(self, 'for_stack', []))}")
-            
-            if not hasattr(self, 'for_stack') or not self.for_stack:
+            if not self.for_stack:
                 raise PdsXRuntimeError("EXIT FOR without FOR")
                 
             # Son FOR'u kapat
             loop_info = self.for_stack.pop()
-            print(f"🔄 EXIT FOR: FOR {loop_info['var']} döngüsünden çıkıldı")
-            
-            # Eşleşen NEXT veya END FOR'u bul ve oraya atla
-            level = 1
-            pc = self.program_counter + 1
-            while pc < len(self.program) and level > 0:
-                line = self.program[pc].strip().upper()
-                if line.startswith("FOR "):
-                    level += 1
-                elif line.startswith("NEXT") or line == "END FOR":
-                    level -= 1
-                    if level == 0:
-                        return pc + 1  # NEXT/END FOR'dan sonraki satıra git
-                pc += 1
+            if trace:
+                print(f"🔄 EXIT FOR: FOR {loop_info['var']} döngüsünden çıkıldı")
+            
+            # Eşleşen NEXT / END FOR'dan sonraki satıra git
+            return self._block_target()
                 
         return None
 
@@ -5781,96 +6473,88 @@ class pdsXInterpreter:
 
     def _execute_while(self, command, scope_name):
         """WHILE döngüsü çalıştırma"""
-        command_upper = command.upper()
-        
-        if command_upper.startswith("WHILE "):
-            # WHILE condition
-            condition_expr = command[6:].strip()
-            condition = self.evaluate_expression(condition_expr, scope_name)
-            
-            if not condition:
-                # Skip to WEND
-                level = 1
-                pc = self.program_counter + 1
-                while pc < len(self.program) and level > 0:
-                    line = self.program[pc].strip().upper()
-                    if line.startswith("WHILE "):
-                        level += 1
-                    elif line == "WEND":
-                        level -= 1
-                    pc += 1
-                
-                self.program_counter = pc - 1
-            else:
-                # Store loop info
-                loop_info = {
-                    "type": "WHILE",
-                    "start_pc": self.program_counter
-                }
-                self.loop_stack.append(loop_info)
+        return self._run_while(parse_while(command), scope_name)
+
+    def _run_while(self, args, scope_name=None):
+        """Ön-ayrıştırılmış WHILE/WEND/EXIT WHILE - hedefler block_targets'tan"""
+        if args is None:
+            return None
+        kind = args[0]
+        pc = self.program_counter
+        
+        if kind == "WHILE":
+            # WHILE condition - WEND buraya döner, koşul her turda burada değerlendirilir
+            in_loop = bool(self.loop_stack) and self.loop_stack[-1].get("start_pc") == pc \
+                and self.loop_stack[-1]["type"] == "WHILE"
+            if not self.evaluate_expression(args[1], scope_name):
+                if in_loop:
+                    self.loop_stack.pop()
+                # Skip past WEND
+                return self._block_target()
+            if not in_loop:
+                self.loop_stack.append({"type": "WHILE", "start_pc": pc})
                 
-        elif command_upper == "WEND":
+        elif kind == "WEND":
             if not self.loop_stack or self.loop_stack[-1]["type"] != "WHILE":
                 raise PdsXRuntimeError("WEND without WHILE")
+            return self.loop_stack[-1]["start_pc"]
             
-            loop_info = self.loop_stack[-1]
-            self.program_counter = loop_info["start_pc"] - 1
-            
-        elif command_upper == "EXIT WHILE":
+        elif kind == "EXIT WHILE":
             if not self.loop_stack or self.loop_stack[-1]["type"] != "WHILE":
                 raise PdsXRuntimeError("EXIT WHILE without WHILE")
-            
-            # Find matching WEND
-            level = 1
-            pc = self.program_counter + 1
-            while pc < len(self.program) and level > 0:
-                line = self.program[pc].strip().upper()
-                if line.startswith("WHILE "):
-                    level += 1
-                elif line == "WEND":
-                    level -= 1
-                pc += 1
-            
-            self.program_counter = pc - 1
             self.loop_stack.pop()
+            return self._block_target()
+        
+        return None
 
     def _execute_do_loop(self, command, scope_name):
         """DO...LOOP döngüsü çalıştırma"""
-        command_upper = command.upper()
-        
-        if command_upper.startswith("DO"):
-            # Store loop info
-            loop_info = {
-                "type": "DO",
-                "start_pc": self.program_counter
-            }
-            self.loop_stack.append(loop_info)
+        return self._run_do_loop(parse_do_loop(command), scope_name)
+
+    def _run_do_loop(self, args, scope_name=None):
+        """Ön-ayrıştırılmış DO [WHILE|UNTIL koşul] / LOOP [WHILE|UNTIL koşul] / EXIT DO"""
+        if args is None:
+            return None
+        kind = args[0]
+        pc = self.program_counter
+        
+        if kind == "DO":
+            in_loop = bool(self.loop_stack) and self.loop_stack[-1].get("start_pc") == pc \
+                and self.loop_stack[-1]["type"] == "DO"
+            keyword, condition_expr = args[1], args[2]
+            if keyword is not None:
+                condition = bool(self.evaluate_expression(condition_expr, scope_name))
+                if condition != (keyword == "WHILE"):
+                    if in_loop:
+                        self.loop_stack.pop()
+                    # Skip past LOOP
+                    return self._block_target()
+            if not in_loop:
+                self.loop_stack.append({"type": "DO", "start_pc": pc, "tested": keyword is not None})
             
-        elif command_upper.startswith("LOOP"):
+        elif kind == "LOOP":
             if not self.loop_stack or self.loop_stack[-1]["type"] != "DO":
                 raise PdsXRuntimeError("LOOP without DO")
             
-            # Check for WHILE/UNTIL condition
-            if "WHILE" in command_upper:
-                condition_expr = command_upper.split("WHILE", 1)[1].strip()
-                condition = self.evaluate_expression(condition_expr, scope_name)
-                if condition:
-                    loop_info = self.loop_stack[-1]
-                    self.program_counter = loop_info["start_pc"]
-                else:
-                    self.loop_stack.pop()
-            elif "UNTIL" in command_upper:
-                condition_expr = command_upper.split("UNTIL", 1)[1].strip()
-                condition = self.evaluate_expression(condition_expr, scope_name)
-                if not condition:
-                    loop_info = self.loop_stack[-1]
-                    self.program_counter = loop_info["start_pc"]
-                else:
+            loop_info = self.loop_stack[-1]
+            keyword, condition_expr = args[1], args[2]
+            if keyword is not None:
+                condition = bool(self.evaluate_expression(condition_expr, scope_name))
+                if condition != (keyword == "WHILE"):
                     self.loop_stack.pop()
-            else:
-                # Infinite loop back to DO
-                loop_info = self.loop_stack[-1]
-                self.program_counter = loop_info["start_pc"]
+                    return None
+            # Koşullu DO başında yeniden değerlendirilir; değilse gövdeye dön
+            if loop_info.get("tested"):
+                return loop_info["start_pc"]
+            return loop_info["start_pc"] + 1
+        
+        elif kind == "EXIT DO":
+            if not self.loop_stack or self.loop_stack[-1]["type"] != "DO":
+                raise PdsXRuntimeError("EXIT DO without DO")
+            self.loop_stack.pop()
+            return self._block_target()
+        
+        return None
 
     def _execute_prolog_operations(self, command, scope_name):
         """Gelişmiş Prolog komutlarını çalıştırma"""
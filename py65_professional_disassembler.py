@@ -37,6 +37,8 @@ from dataclasses import dataclass
 from enum import Enum
 from data_loader import DataLoader
 import disassembly_formatter
+import opcode_decoder
+from code_flow import FlowGraph, FlowInstruction
 
 # py65 kütüphanesini güvenli import
 try:
@@ -73,6 +75,33 @@ class AddressingMode(Enum):
     ZERO_PAGE_X = "zpx"
     ZERO_PAGE_Y = "zpy"
 
+# opcode_decoder modu -> AddressingMode (FlowGraph kayıtlarından sonuç üretirken)
+DECODER_MODES = {
+    opcode_decoder.IMP: AddressingMode.IMPLIED,
+    opcode_decoder.ACC: AddressingMode.ACCUMULATOR,
+    opcode_decoder.IMM: AddressingMode.IMMEDIATE,
+    opcode_decoder.ZP: AddressingMode.ZERO_PAGE,
+    opcode_decoder.ZPX: AddressingMode.ZERO_PAGE_X,
+    opcode_decoder.ZPY: AddressingMode.ZERO_PAGE_Y,
+    opcode_decoder.ABS: AddressingMode.ABSOLUTE,
+    opcode_decoder.ABX: AddressingMode.ABSOLUTE_X,
+    opcode_decoder.ABY: AddressingMode.ABSOLUTE_Y,
+    opcode_decoder.IND: AddressingMode.INDIRECT,
+    opcode_decoder.IZX: AddressingMode.INDIRECT_X,
+    opcode_decoder.IZY: AddressingMode.INDIRECT_Y,
+    opcode_decoder.REL: AddressingMode.RELATIVE,
+}
+
+
+def flow_instruction_text(instr: FlowInstruction) -> str:
+    """FlowGraph kaydını py65 biçiminde instruction metnine çevir (branch'te hedef adres)"""
+    if instr.mode == opcode_decoder.REL:
+        return f"{instr.mnemonic} ${instr.target:04X}"
+    operand_format = opcode_decoder.MODE_OPERAND_FORMATS[instr.mode]
+    if instr.operand is None:
+        return f"{instr.mnemonic} {operand_format}".rstrip()
+    return f"{instr.mnemonic} {operand_format % instr.operand}"
+
 class InstructionType(Enum):
     """Instruction type classification"""
     SEQUENTIAL = "sequential"
@@ -166,6 +195,7 @@ class Py65ProfessionalDisassembler:
         self.code_blocks: List[Tuple[int, int]] = []
         self.data_blocks: List[Tuple[int, int]] = []
         self.visited_addresses: set = set()
+        self.flow_graph: Optional[FlowGraph] = None
         
         # C64 ROM Data integration using DataLoader
         try:
@@ -587,53 +617,12 @@ class Py65ProfessionalDisassembler:
             # Get raw instruction data
             length, instruction = self.disassembler.instruction_at(address)
             
-            # Parse instruction
-            mnemonic, operand = self._parse_instruction(instruction)
-            
             # Get bytes
             bytes_data = []
             for i in range(length):
                 bytes_data.append(self.mpu.ByteAt(address + i))
             
-            # Analyze code flow
-            flow_info = self.analyze_code_flow(address, instruction, mnemonic, operand)
-            
-            # Get addressing mode
-            addressing_mode = self._get_addressing_mode(operand)
-            
-            # Get symbol
-            symbol = self.get_symbol(address)
-            
-            # Generate comment
-            comment = self._generate_comment(address, instruction, mnemonic, operand)
-            
-            # Get cycle count (basic estimation)
-            cycle_count = self._estimate_cycle_count(mnemonic, addressing_mode)
-            
-            result = DisassemblyResult(
-                address=address,
-                bytes=bytes_data,
-                instruction=instruction,
-                mnemonic=mnemonic,
-                operand=operand,
-                addressing_mode=addressing_mode,
-                length=length,
-                symbol=symbol,
-                comment=comment,
-                flow_info=flow_info,
-                cycle_count=cycle_count
-            )
-            
-            # Update statistics
-            self.stats['total_instructions'] += 1
-            if flow_info.is_branch:
-                self.stats['branch_instructions'] += 1
-            if flow_info.is_jump:
-                self.stats['jump_instructions'] += 1
-            if flow_info.is_call:
-                self.stats['call_instructions'] += 1
-            
-            return result
+            return self._build_result(address, bytes_data, instruction)
             
         except Exception as e:
             logger.error(f"Error disassembling instruction at ${address:04X}: {e}")
@@ -650,6 +639,53 @@ class Py65ProfessionalDisassembler:
                 comment="Illegal or unknown opcode"
             )
     
+    def _build_result(self, address: int, bytes_data: List[int], instruction: str,
+                      addressing_mode: Optional[AddressingMode] = None) -> DisassemblyResult:
+        """Çözülmüş instruction metninden sembol, yorum ve akış bilgisiyle sonuç üret"""
+        # Parse instruction
+        mnemonic, operand = self._parse_instruction(instruction)
+        
+        # Analyze code flow
+        flow_info = self.analyze_code_flow(address, instruction, mnemonic, operand)
+        
+        # Get addressing mode
+        if addressing_mode is None:
+            addressing_mode = self._get_addressing_mode(operand)
+        
+        # Get symbol
+        symbol = self.get_symbol(address)
+        
+        # Generate comment
+        comment = self._generate_comment(address, instruction, mnemonic, operand)
+        
+        # Get cycle count (basic estimation)
+        cycle_count = self._estimate_cycle_count(mnemonic, addressing_mode)
+        
+        result = DisassemblyResult(
+            address=address,
+            bytes=bytes_data,
+            instruction=instruction,
+            mnemonic=mnemonic,
+            operand=operand,
+            addressing_mode=addressing_mode,
+            length=len(bytes_data),
+            symbol=symbol,
+            comment=comment,
+            flow_info=flow_info,
+            cycle_count=cycle_count
+        )
+        
+        # Update statistics
+        self.stats['total_instructions'] += 1
+        if flow_info.is_branch:
+            self.stats['branch_instructions'] += 1
+        if flow_info.is_jump:
+            self.stats['jump_instructions'] += 1
+        if flow_info.is_call:
+            self.stats['call_instructions'] += 1
+        
+        return result
+    
     def _estimate_cycle_count(self, mnemonic: str, addressing_mode: AddressingMode) -> int:
         """Estimate cycle count for instruction"""
         # Basic cycle count estimation
@@ -695,42 +731,36 @@ class Py65ProfessionalDisassembler:
         """
         Automatic code analysis with flow following
         
+        Akış code_flow.FlowGraph ile izlenir (deque worklist, bitmap visited);
+        her adres bir kez çözülür, sonuç self.flow_graph'ta saklanır. Listeleme
+        de grafiğin instruction kayıtlarından kurulur; py65 ile ikinci kez
+        çözülmez.
+        
         Args:
             start_address: Starting address
-            max_length: Maximum analysis length
+            max_length: Maximum number of instructions to analyze
             
         Returns:
-            List of disassembly results
+            List of disassembly results (address order)
         """
-        results = []
-        to_visit = [start_address]
-        visited = set()
-        
         logger.info(f"Starting auto-analysis from ${start_address:04X}")
         
-        while to_visit and len(results) < max_length:
-            address = to_visit.pop(0)
-            
-            if address in visited or address < 0 or address >= self.memory_size:
-                continue
-            
-            visited.add(address)
-            result = self.disassemble_instruction(address)
-            results.append(result)
-            
-            # Add flow targets to visit queue
-            if result.flow_info:
-                for target in result.flow_info.targets:
-                    if target not in visited:
-                        to_visit.append(target)
-            
-            # Continue with next sequential instruction if not a jump
-            if result.flow_info and not result.flow_info.is_jump:
-                next_addr = address + result.length
-                if next_addr not in visited:
-                    to_visit.append(next_addr)
+        memory_image = bytes(self.memory[0:self.memory_size])
+        self.flow_graph = FlowGraph.from_code(
+            memory_image, 0, entry_points=[start_address], max_instructions=max_length)
         
-        logger.info(f"Auto-analysis complete. Analyzed {len(results)} instructions")
+        results = []
+        instructions = self.flow_graph.instructions
+        for address in self.flow_graph.instruction_addresses():
+            instr = instructions[address]
+            results.append(self._build_result(
+                address, list(memory_image[address:address + instr.length]),
+                flow_instruction_text(instr), DECODER_MODES[instr.mode]))
+            self.visited_addresses.add(address)
+        
+        stats = self.flow_graph.get_statistics()
+        logger.info(f"Auto-analysis complete. Analyzed {len(results)} instructions, "
+                    f"{stats['blocks']} blocks, {stats['functions']} functions")
         return results
     
     def generate_assembly_listing(self, results: List[DisassemblyResult], 
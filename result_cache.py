@@ -0,0 +1,315 @@
+"""
+🗃️ D64 Converter - Result Cache
+=======================================
+Disassembly ve decompile çıktıları için içerik adresli disk önbelleği.
+
+Anahtar: (PRG içerik hash'i, motor adı, çıktı formatı, seçenekler, araç sürümü)
+Depolama: logs/result_cache.db (processed_files.db'nin yanında, SQLite)
+
+Features:
+- İçerik adresli anahtarlar (aynı PRG hangi diskten gelirse gelsin tek kayıt)
+- zlib sıkıştırılmış çıktı saklama
+- LRU + toplam boyut/kayıt sayısı tabanlı temizleme
+- Motor kaynak dosyası değişince otomatik geçersizleşme (engine_version)
+- Thread-safe (GUI thread'leri) ve çok süreçli kullanım (WAL)
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+# Çıktı formatı veya motor davranışı değiştiğinde artırılır
+TOOL_VERSION = "5.3"
+
+DEFAULT_CACHE_PATH = "logs/result_cache.db"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 100000
+# Boyut kontrolü tablo taraması gerektirdiği için her N yazmada bir yapılır
+EVICT_CHECK_INTERVAL = 64
+
+_engine_versions: Dict[str, str] = {}
+_local_imports: Dict[str, Tuple[Any, ...]] = {}
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def content_hash(data) -> str:
+    """PRG içeriğinin MD5 hash'i (DatabaseManager.calculate_file_hash ile aynı)."""
+    return hashlib.md5(bytes(data)).hexdigest()
+
+
+def engine_version(engine: Any) -> str:
+    """Motor sınıfı/modülü için TOOL_VERSION + kaynak dosya hash'i döndürür.
+
+    Motorun kaynak kodu değiştiğinde eski önbellek kayıtları kendiliğinden
+    kullanılmaz hale gelir.
+    """
+    module = engine if inspect.ismodule(engine) else inspect.getmodule(engine)
+    name = getattr(module, "__name__", str(engine))
+    if name not in _engine_versions:
+        fingerprint = ""
+        try:
+            source_file = inspect.getsourcefile(module)
+            with open(source_file, "rb") as f:
+                fingerprint = hashlib.md5(f.read()).hexdigest()[:12]
+        except (TypeError, OSError):
+            pass
+        _engine_versions[name] = f"{TOOL_VERSION}:{fingerprint}"
+    return _engine_versions[name]
+
+
+def _module_of(engine: Any):
+    return engine if inspect.ismodule(engine) else inspect.getmodule(engine)
+
+
+def _is_project_module(module) -> bool:
+    source_file = getattr(module, "__file__", None)
+    return bool(source_file) and os.path.dirname(os.path.abspath(source_file)) == PROJECT_DIR
+
+
+def _project_imports(module) -> Tuple[Any, ...]:
+    """Modülün global isimlerinden ulaşılan proje içi modüller"""
+    name = module.__name__
+    if name not in _local_imports:
+        found = {}
+        for value in list(vars(module).values()):
+            if inspect.ismodule(value):
+                dependency = value
+            elif inspect.isclass(value) or inspect.isfunction(value):
+                dependency = sys.modules.get(getattr(value, "__module__", None))
+            else:
+                continue
+            if dependency is not None and dependency is not module and _is_project_module(dependency):
+                found[dependency.__name__] = dependency
+        _local_imports[name] = tuple(found.values())
+    return _local_imports[name]
+
+
+def engines_version(*engines: Any) -> str:
+    """Birden çok motorun birleşik sürümü.
+
+    Her motor modülünün proje içi bağımlılıkları da (örn. AdvancedDisassembler
+    → improved_disassembler → opcode_decoder) parmak izine dahil edilir;
+    None verilen (yüklenemeyen) motorlar atlanır.
+    """
+    modules = {}
+    pending = [_module_of(engine) for engine in engines if engine is not None]
+    while pending:
+        module = pending.pop()
+        if module is None or module.__name__ in modules:
+            continue
+        modules[module.__name__] = module
+        pending.extend(_project_imports(module))
+    combined = ";".join(f"{name}={engine_version(modules[name])}" for name in sorted(modules))
+    return f"{TOOL_VERSION}:{hashlib.md5(combined.encode('utf-8')).hexdigest()[:12]}"
+
+
+class ResultCache:
+    """Disassembly/decompile çıktıları için LRU disk önbelleği"""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Result Cache başlatma
+
+        Args:
+            db_path: SQLite önbellek dosyası
+            max_bytes: Sıkıştırılmış çıktıların toplam üst sınırı
+            max_entries: Kayıt sayısı üst sınırı
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_check = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.init_database()
+
+    def init_database(self):
+        """Önbellek tablosunu oluştur"""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    cache_key TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    engine TEXT NOT NULL,
+                    output_format TEXT NOT NULL,
+                    tool_version TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    payload_size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_results_last_access ON results (last_access)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_results_content_hash ON results (content_hash)")
+
+    @staticmethod
+    def make_key(data, engine: str, output_format: str,
+                 options: Optional[Dict] = None, tool_version: str = TOOL_VERSION) -> Dict[str, str]:
+        """Önbellek anahtarı oluştur
+
+        Args:
+            data: PRG verisi (load address dahil) veya hazır içerik hash'i
+            engine: Motor adı ('improved', 'advanced', 'unified', ...)
+            output_format: Çıktı formatı
+            options: Çıktıyı etkileyen seçenekler (JSON'a çevrilebilir olmalı)
+            tool_version: Araç/motor sürümü
+
+        Returns:
+            Anahtar bileşenleri ve 'cache_key' içeren sözlük
+        """
+        digest = data if isinstance(data, str) else content_hash(data)
+        canonical_options = json.dumps(options or {}, sort_keys=True, default=str)
+        raw = "\x00".join([digest, engine, output_format, canonical_options, tool_version])
+        return {
+            "cache_key": hashlib.sha256(raw.encode("utf-8")).hexdigest(),
+            "content_hash": digest,
+            "engine": engine,
+            "output_format": output_format,
+            "tool_version": tool_version,
+        }
+
+    def get(self, key: Dict[str, str]) -> Optional[str]:
+        """Önbellekteki çıktıyı getir, yoksa None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM results WHERE cache_key = ?", (key["cache_key"],)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE results SET last_access = ? WHERE cache_key = ?",
+                    (time.time(), key["cache_key"]))
+            self.hits += 1
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, key: Dict[str, str], output: str):
+        """Çıktıyı önbelleğe yaz ve gerekiyorsa eski kayıtları temizle"""
+        payload = zlib.compress(output.encode("utf-8"), 6)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO results
+                (cache_key, content_hash, engine, output_format, tool_version,
+                 payload, payload_size, created, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key["cache_key"], key["content_hash"], key["engine"],
+                  key["output_format"], key["tool_version"], payload,
+                  len(payload), now, now))
+            self._puts_since_check += 1
+            if self._puts_since_check >= EVICT_CHECK_INTERVAL:
+                self._evict_locked()
+
+    def evict(self):
+        """Sınırlar aşıldıysa LRU temizliğini hemen çalıştır"""
+        with self._lock, self._conn:
+            self._evict_locked()
+
+    def get_or_compute(self, key: Dict[str, str], compute) -> str:
+        """Önbellekte varsa döndür, yoksa compute() ile üret ve kaydet"""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        output = compute()
+        if isinstance(output, str) and output:
+            self.put(key, output)
+        return output
+
+    def _evict_locked(self):
+        """LRU sırasına göre boyut/kayıt sınırına inene kadar sil"""
+        self._puts_since_check = 0
+        total_bytes, total_entries = self._conn.execute(
+            "SELECT COALESCE(SUM(payload_size), 0), COUNT(*) FROM results").fetchone()
+        if total_bytes <= self.max_bytes and total_entries <= self.max_entries:
+            return
+
+        # Sınırın %90'ına inene kadar en eski erişilenleri sil
+        target_bytes = int(self.max_bytes * 0.9)
+        target_entries = int(self.max_entries * 0.9)
+        victims = []
+        cursor = self._conn.execute(
+            "SELECT cache_key, payload_size FROM results ORDER BY last_access ASC, rowid ASC")
+        for cache_key, size in cursor:
+            if total_bytes <= target_bytes and total_entries <= target_entries:
+                break
+            victims.append((cache_key,))
+            total_bytes -= size
+            total_entries -= 1
+        self._conn.executemany("DELETE FROM results WHERE cache_key = ?", victims)
+
+    def invalidate(self, content_hash_value: str = None) -> int:
+        """Bir PRG'nin (veya tümünün) kayıtlarını sil"""
+        with self._lock, self._conn:
+            if content_hash_value:
+                cursor = self._conn.execute(
+                    "DELETE FROM results WHERE content_hash = ?", (content_hash_value,))
+            else:
+                cursor = self._conn.execute("DELETE FROM results")
+            return cursor.rowcount
+
+    def get_statistics(self) -> Dict:
+        """Önbellek istatistikleri"""
+        with self._lock:
+            total_bytes, total_entries = self._conn.execute(
+                "SELECT COALESCE(SUM(payload_size), 0), COUNT(*) FROM results").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": total_entries,
+            "bytes": total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        """Bağlantıyı kapat"""
+        with self._lock:
+            self._conn.close()
+
+
+def get_default_cache() -> Optional[ResultCache]:
+    """Süreç başına paylaşılan varsayılan önbellek (açılamazsa None)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = ResultCache()
+            except sqlite3.Error as e:
+                print(f"⚠️ Result cache açılamadı: {e}")
+                return None
+        return _default_cache
+
+
+# Test fonksiyonu
+if __name__ == "__main__":
+    print("🗃️ D64 Converter Result Cache Test")
+    print("=" * 50)
+
+    cache = get_default_cache()
+    key = cache.make_key(bytes.fromhex("0108a94120d2ff60"), "test", "asm")
+    cache.put(key, "LDA #$41\nJSR $FFD2\nRTS")
+    print(f"✅ Önbellekten okundu: {cache.get(key)!r}")
+    print(f"📊 İstatistik: {cache.get_statistics()}")
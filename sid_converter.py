@@ -1,102 +1,329 @@
 # sid_converter.py
-import struct
+"""
+SID Converter - SID müzik çıkarma motoru
+========================================
+Byte byte tarama yerine:
+
+• Gömülü PSID/RSID dosyaları ``bytes.find`` (mmap üzerinde ``mmap.find``)
+  ile bulunur ve başlıkları ayrıştırılır.
+• Başlıksız player'lar imza indeksiyle bulunur: ``$D400-$D418`` yazan
+  store instruction'ları (STA/STX/STY abs, STA abs,X/Y) önce regex ile
+  ön-elenir, sonra ortak linear sweep disassembler ile instruction
+  sınırına denk geldikleri doğrulanır. Init/play adresleri player
+  başındaki ``JMP init / JMP play`` tablosundan hesaplanır; tablo yoksa
+  init yükleme adresi, play 0 (init kendi IRQ'sunu kurar) kabul edilir.
+• Çıktı, hesaplanan adreslerle gerçek PSID v2 başlığı (0x7C byte) taşır.
+
+Tarama C seviyesinde regex/find ile yapıldığından batch taramada her
+dosya için çalıştırılabilir (bkz. batch_scanner ``sid`` formatı).
+"""
+
 import logging
+import mmap
 import os
+import re
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from linear_sweep import sweep
 
 # Logging yapılandırması
 logging.basicConfig(filename='logs/d64_converter.log', level=logging.ERROR)
 
+PSID_MAGICS = (b"PSID", b"RSID")
+# magic, version, dataOffset, load, init, play, songs, startSong, speed,
+# name, author, released, flags, startPage, pageLength, reserved
+PSID_V2_HEADER = struct.Struct(">4s7HI32s32s32sHBBH")
+PSID_V1_HEADER = struct.Struct(">4s7HI32s32s32s")
+PSID_V2_DATA_OFFSET = PSID_V2_HEADER.size  # 0x7C
+PSID_V1_DATA_OFFSET = PSID_V1_HEADER.size  # 0x76
+PSID_FLAGS_PAL_6581 = 0x0014  # bit 2-3: PAL, bit 4-5: MOS6581
+
+SID_FIRST_REGISTER = 0xD400
+SID_LAST_REGISTER = 0xD418
+MIN_SID_WRITES = 4       # Player sayılması için en az SID yazma sayısı
+MIN_SID_REGISTERS = 3    # ... ve en az farklı register sayısı
+JMP_TABLE_WINDOW = 0x100  # JMP tablosu player başından bu kadar içeride aranır
+
+SID_STORE_OPCODES = frozenset((0x8C, 0x8D, 0x8E, 0x99, 0x9D))
+# STY/STA/STX abs, STA abs,Y, STA abs,X -> $D400-$D418
+SID_WRITE_PATTERN = re.compile(rb"[\x8C\x8D\x8E\x99\x9D][\x00-\x18]\xD4")
+# JMP init / JMP play
+JMP_TABLE_PATTERN = re.compile(rb"\x4C..\x4C..", re.S)
+# IRQ vektörü yazımı: $0314/$0315 veya $FFFE/$FFFF
+IRQ_VECTOR_PATTERN = re.compile(rb"[\x8C\x8D\x8E](?:[\x14\x15]\x03|[\xFE\xFF]\xFF)")
+
+
+@dataclass
+class SIDTune:
+    """Çıkarılan SID müziği"""
+    load_address: int
+    init_address: int
+    play_address: int
+    data: bytes                 # Yükleme adresi olmadan C64 verisi
+    name: str = ""
+    author: str = ""
+    released: str = ""
+    songs: int = 1
+    start_song: int = 1
+    source_offset: int = 0      # Kaynak veri içindeki ofset
+    sid_writes: int = 0
+    registers: Tuple[int, ...] = ()
+    embedded: bool = False      # Kaynakta hazır PSID/RSID başlığı vardı
+    installs_irq: bool = False
+
+    @property
+    def end_address(self) -> int:
+        return self.load_address + len(self.data) - 1
+
+    def to_psid(self) -> bytes:
+        """PSID v2 dosya içeriği (yükleme adresi veri başında, HVSC düzeni)"""
+        header = build_psid_header(0, self.init_address, self.play_address,
+                                   self.name, self.author, self.released,
+                                   self.songs, self.start_song)
+        return header + struct.pack("<H", self.load_address) + self.data
+
+    def as_dict(self) -> Dict:
+        return {
+            'sid_found': True,
+            'load_address': self.load_address,
+            'end_address': self.end_address,
+            'init_address': self.init_address,
+            'play_address': self.play_address,
+            'songs': self.songs,
+            'name': self.name,
+            'offset': self.source_offset,
+            'sid_writes': self.sid_writes,
+            'registers': list(self.registers),
+            'embedded': self.embedded,
+            'installs_irq': self.installs_irq,
+        }
+
+
+def _text_field(text: str) -> bytes:
+    return text.encode("latin-1", "replace")[:32].ljust(32, b"\x00")
+
+
+def _field_text(raw: bytes) -> str:
+    return raw.split(b"\x00", 1)[0].decode("latin-1")
+
+
+def build_psid_header(load_address: int, init_address: int, play_address: int,
+                      name: str = "", author: str = "", released: str = "",
+                      songs: int = 1, start_song: int = 1,
+                      flags: int = PSID_FLAGS_PAL_6581) -> bytes:
+    """PSID v2 başlığı (load_address 0 ise yükleme adresi verinin ilk 2 byte'ıdır)"""
+    return PSID_V2_HEADER.pack(
+        b"PSID", 2, PSID_V2_DATA_OFFSET, load_address, init_address, play_address,
+        songs, start_song, 0, _text_field(name), _text_field(author),
+        _text_field(released), flags, 0, 0, 0)
+
+
+def parse_psid_header(data, offset: int = 0) -> Optional[Dict]:
+    """offset'teki PSID/RSID başlığını ayrıştır, geçersizse None"""
+    raw = bytes(data[offset:offset + PSID_V2_DATA_OFFSET])
+    if len(raw) < PSID_V1_DATA_OFFSET or raw[:4] not in PSID_MAGICS:
+        return None
+    (magic, version, data_offset, load, init, play, songs, start_song, speed,
+     name, author, released) = PSID_V1_HEADER.unpack_from(raw)
+    if not 1 <= version <= 4 or data_offset not in (PSID_V1_DATA_OFFSET, PSID_V2_DATA_OFFSET):
+        return None
+    if data_offset == PSID_V2_DATA_OFFSET and len(raw) < PSID_V2_DATA_OFFSET:
+        return None
+    return {
+        'magic': magic.decode("ascii"), 'version': version, 'data_offset': data_offset,
+        'load_address': load, 'init_address': init, 'play_address': play,
+        'songs': songs, 'start_song': start_song, 'speed': speed,
+        'name': _field_text(name), 'author': _field_text(author),
+        'released': _field_text(released),
+    }
+
+
+def find_embedded_sids(data) -> List[Tuple[int, Dict]]:
+    """Veri içindeki PSID/RSID başlıklarını find ile bul: [(ofset, başlık)]"""
+    found = []
+    for magic in PSID_MAGICS:
+        position = data.find(magic)
+        while position != -1:
+            header = parse_psid_header(data, position)
+            if header:
+                found.append((position, header))
+            position = data.find(magic, position + 1)
+    found.sort(key=lambda item: item[0])
+    return found
+
+
+def sid_write_sites(code, load_address: int) -> List[Tuple[int, int]]:
+    """
+    SID register'larına yazan instruction'lar: [(adres, register)]
+
+    Regex imza indeksi aday ofsetleri verir; yalnızca linear sweep ile
+    instruction başlangıcı olduğu doğrulananlar tutulur.
+    """
+    hits = [match.start() for match in SID_WRITE_PATTERN.finditer(code)]
+    if len(hits) < MIN_SID_WRITES:
+        return []
+    boundaries = set(sweep(code, load_address).offsets)
+    return [(load_address + offset, SID_FIRST_REGISTER + code[offset + 1])
+            for offset in hits if offset in boundaries]
+
+
+def find_entry_points(code, load_address: int) -> Tuple[int, int, bool]:
+    """
+    (init, play, irq_kuruyor) adreslerini hesapla
+
+    Player başındaki ilk ``JMP/JMP`` tablosu (hedefleri yüklü aralıkta)
+    init ve play adreslerini verir.
+    """
+    end_address = load_address + len(code)
+    installs_irq = IRQ_VECTOR_PATTERN.search(code) is not None
+    for match in JMP_TABLE_PATTERN.finditer(code, 0, JMP_TABLE_WINDOW + 6):
+        table = match.group()
+        targets = (table[1] | (table[2] << 8), table[4] | (table[5] << 8))
+        if all(load_address <= target < end_address for target in targets):
+            init = load_address + match.start()
+            return init, init + 3, installs_irq
+    # Tablo yok: init yükleme adresi, play'i init'in kurduğu IRQ çağırır
+    return load_address, 0, installs_irq
+
+
+def detect_sid_tune(prg_data, name: str = "") -> Optional[SIDTune]:
+    """Başlıksız PRG içindeki SID player'ını tespit et"""
+    if len(prg_data) < 3:
+        return None
+    load_address = prg_data[0] | (prg_data[1] << 8)
+    code = bytes(prg_data[2:])
+    sites = sid_write_sites(code, load_address)
+    registers = tuple(sorted({register for _, register in sites}))
+    if len(sites) < MIN_SID_WRITES or len(registers) < MIN_SID_REGISTERS:
+        return None
+    init, play, installs_irq = find_entry_points(code, load_address)
+    return SIDTune(load_address, init, play, code, name=name, source_offset=0,
+                   sid_writes=len(sites), registers=registers,
+                   installs_irq=installs_irq)
+
+
+def _embedded_tune(data, offset: int, header: Dict, end: int) -> Optional[SIDTune]:
+    payload = bytes(data[offset + header['data_offset']:end])
+    load_address = header['load_address']
+    if load_address == 0:
+        if len(payload) < 2:
+            return None
+        load_address = payload[0] | (payload[1] << 8)
+        payload = payload[2:]
+    return SIDTune(load_address, header['init_address'] or load_address,
+                   header['play_address'], payload, name=header['name'],
+                   author=header['author'], released=header['released'],
+                   songs=max(1, header['songs']), start_song=max(1, header['start_song']),
+                   source_offset=offset, embedded=True)
+
+
+def find_sid_tunes(data, name: str = "", prg: bool = True) -> List[SIDTune]:
+    """
+    Veri içindeki tüm SID müziklerini bul
+
+    Args:
+        data: bytes, bytearray veya mmap
+        name: Başlıkta kullanılacak isim
+        prg: True ise gömülü PSID yoksa veri PRG kabul edilip player aranır
+    """
+    embedded = find_embedded_sids(data)
+    tunes = []
+    for index, (offset, header) in enumerate(embedded):
+        end = embedded[index + 1][0] if index + 1 < len(embedded) else len(data)
+        tune = _embedded_tune(data, offset, header, end)
+        if tune:
+            tunes.append(tune)
+    if not tunes and prg:
+        tune = detect_sid_tune(data, name)
+        if tune:
+            tunes.append(tune)
+    return tunes
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("_") or "sid"
+
+
 class SIDConverter:
-    def __init__(self):
-        self.header = b"PSID" + struct.pack("<H", 2) + struct.pack("<H", 0x76)
+    def __init__(self, output_dir: str = "sid_files"):
+        self.output_dir = output_dir
 
-    def convert_to_sid(self, sid_data, output_path):
-        """SID verisini .sid formatına çevirir."""
+    def write_tune(self, tune: SIDTune, output_path: str) -> bool:
+        """SIDTune'u PSID v2 dosyası olarak yaz"""
         try:
             with open(output_path, "wb") as f:
-                f.write(self.header + sid_data)
+                f.write(tune.to_psid())
             logging.info(f"SID dosyası oluşturuldu: {output_path}")
+            return True
         except Exception as e:
             logging.error(f"SID çevirme hatası: {e}")
+            return False
+
+    def convert_to_sid(self, sid_data, output_path, name: str = "") -> bool:
+        """SID verisini .sid formatına çevirir (PSID/RSID dosyası veya player içeren PRG)."""
+        tunes = find_sid_tunes(sid_data, name or Path(output_path).stem)
+        if not tunes:
+            logging.error(f"SID player bulunamadı: {output_path}")
+            return False
+        return self.write_tune(tunes[0], output_path)
+
+    def analyze_sid(self, prg_data) -> Dict:
+        """PRG verisindeki SID müziğini analiz et (dosya yazmaz)."""
+        tunes = find_sid_tunes(prg_data)
+        if not tunes:
+            return {'sid_found': False, 'tunes': []}
+        result = tunes[0].as_dict()
+        result['tunes'] = [tune.as_dict() for tune in tunes]
+        return result
+
+    def _save_tunes(self, tunes: List[SIDTune], base_name: str) -> int:
+        os.makedirs(self.output_dir, exist_ok=True)
+        saved = 0
+        for tune in tunes:
+            suffix = f"_{tune.source_offset:04x}" if tune.embedded else ""
+            output_path = os.path.join(self.output_dir, f"{_safe_name(base_name)}{suffix}.sid")
+            saved += self.write_tune(tune, output_path)
+        return saved
 
     def convert_d64_sid(self, d64_path):
         """D64 dosyasındaki SID'leri çıkarır."""
+        from d64_reader import open_image, read_directory, extract_prg_file
+
         try:
-            # sid_files klasörünü oluştur
-            os.makedirs("sid_files", exist_ok=True)
-            
-            with open(d64_path, "rb") as f:
-                data = f.read()
-            
-            # SID header'larını ara ($1000-$2000 arasında)
-            sid_found = False
-            for i in range(0, len(data) - 4):
-                if data[i:i+4] == b"PSID":
-                    # SID bulundu
-                    sid_data = data[i:i+2048]  # 2KB SID data
-                    base_name = os.path.splitext(os.path.basename(d64_path))[0]
-                    output_path = f"sid_files/{base_name}_{i:04x}.sid"
-                    self.convert_to_sid(sid_data, output_path)
-                    sid_found = True
-            
-            # Eğer PSID header bulunamazsa, müzik verisini ara
-            if not sid_found:
-                # $1000-$2000 bölgesindeki veriyi kontrol et
-                for i in range(0x1000, min(0x2000, len(data))):
-                    if data[i] != 0:  # Boş olmayan veri
-                        # 1KB'lık blokları SID olarak kaydet
-                        sid_data = data[i:i+1024]
-                        base_name = os.path.splitext(os.path.basename(d64_path))[0]
-                        output_path = f"sid_files/{base_name}_music_{i:04x}.sid"
-                        self.convert_to_sid(sid_data, output_path)
-                        sid_found = True
-                        break
-            
-            return sid_found
-            
+            base_name = os.path.splitext(os.path.basename(d64_path))[0]
+            image, ext = open_image(d64_path)
+            try:
+                saved = 0
+                for entry in read_directory(image, ext):
+                    if not entry["file_type"].startswith("PRG"):
+                        continue
+                    data = extract_prg_file(image, entry["track"], entry["sector"], ext)
+                    name = entry["filename"]
+                    saved += self._save_tunes(find_sid_tunes(data, name), f"{base_name}_{name}")
+            finally:
+                image.close()
+            return saved > 0
+
         except Exception as e:
             logging.error(f"D64 SID çevirme hatası: {e}")
             return False
 
     def convert_prg_sid(self, prg_path):
-        """PRG dosyasındaki SID'leri çıkarır."""
+        """PRG (veya .sid) dosyasındaki SID'leri çıkarır."""
         try:
-            # sid_files klasörünü oluştur
-            os.makedirs("sid_files", exist_ok=True)
-            
+            base_name = os.path.splitext(os.path.basename(prg_path))[0]
             with open(prg_path, "rb") as f:
-                data = f.read()
-            
-            # PRG header'ı atla (2 byte)
-            if len(data) > 2:
-                data = data[2:]
-            
-            # SID header'larını ara
-            sid_found = False
-            for i in range(0, len(data) - 4):
-                if data[i:i+4] == b"PSID":
-                    # SID bulundu
-                    sid_data = data[i:i+2048]  # 2KB SID data
-                    base_name = os.path.splitext(os.path.basename(prg_path))[0]
-                    output_path = f"sid_files/{base_name}_{i:04x}.sid"
-                    self.convert_to_sid(sid_data, output_path)
-                    sid_found = True
-            
-            # Eğer PSID header bulunamazsa, müzik verisini ara
-            if not sid_found and len(data) > 512:
-                # İlk 512 byte'tan sonrasını kontrol et
-                for i in range(512, len(data)):
-                    if data[i] != 0:  # Boş olmayan veri
-                        # 1KB'lık blokları SID olarak kaydet
-                        sid_data = data[i:i+1024]
-                        base_name = os.path.splitext(os.path.basename(prg_path))[0]
-                        output_path = f"sid_files/{base_name}_music_{i:04x}.sid"
-                        self.convert_to_sid(sid_data, output_path)
-                        sid_found = True
-                        break
-            
-            return sid_found
-            
+                try:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    return False  # Boş dosya
+                with data:
+                    tunes = find_sid_tunes(data, base_name)
+            return self._save_tunes(tunes, base_name) > 0
+
         except Exception as e:
             logging.error(f"PRG SID çevirme hatası: {e}")
-            return False
\ No newline at end of file
+            return False
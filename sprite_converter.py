@@ -3,22 +3,141 @@
 """
 Sprite Converter for C64
 C64 sprite verilerini PNG formatına çeviren modül
+
+Aday ofsetler (63 byte adımlı ve 64 byte hizalı VIC sprite blokları) tek
+seferde prefix-sum ile puanlanır; NumPy varsa vektörel, yoksa saf Python
+ile aynı sonuç üretilir. Pikseller bit maskeleriyle çözülür ve dizi
+tekrarıyla büyütülür; sprite sheet tek görüntü yazımıyla kaydedilir.
 """
 
 import os
 import logging
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 # PIL import - güvenli yükleme
 try:
-    from PIL import Image, ImageDraw
+    from PIL import Image
     PIL_AVAILABLE = True
     print("✅ PIL (Pillow) yüklendi - Sprite conversion aktif")
 except ImportError:
     PIL_AVAILABLE = False
     print("⚠️ PIL (Pillow) bulunamadı - Sprite conversion devre dışı")
 
+# NumPy - optional import
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+    print("⚠️ NumPy bulunamadı - sprite tarama saf Python ile çalışacak")
+
+SPRITE_SIZE = 63     # 24x21 bit, satır başına 3 byte
+SPRITE_BLOCK = 64    # VIC sprite pointer'ı 64 byte'lık bloğu gösterir
+SPRITE_WIDTH = 24
+SPRITE_HEIGHT = 21
+
+
+def _prefix_sums(values) -> List[int]:
+    """Başında 0 olan kümülatif toplam"""
+    return [0] + list(accumulate(values))
+
+
+def score_offsets(data: bytes, offsets: Sequence[int], use_numpy: Optional[bool] = None):
+    """
+    Verilen ofsetlerdeki 63 byte'lık adayların sıfır olmayan ve $FF byte
+    sayılarını tek geçişte hesapla
+
+    Returns:
+        (nonzero_counts, full_counts) - ofsetlerle aynı sırada
+    """
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy and NUMPY_AVAILABLE:
+        buf = np.frombuffer(bytes(data), dtype=np.uint8)
+        starts = np.asarray(offsets, dtype=np.int64)
+        nonzero = np.concatenate(([0], np.cumsum(buf != 0)))
+        full = np.concatenate(([0], np.cumsum(buf == 0xFF)))
+        return ((nonzero[starts + SPRITE_SIZE] - nonzero[starts]).tolist(),
+                (full[starts + SPRITE_SIZE] - full[starts]).tolist())
+
+    nonzero = _prefix_sums(byte != 0 for byte in data)
+    full = _prefix_sums(byte == 0xFF for byte in data)
+    return ([nonzero[offset + SPRITE_SIZE] - nonzero[offset] for offset in offsets],
+            [full[offset + SPRITE_SIZE] - full[offset] for offset in offsets])
+
+
+def is_sprite_score(nonzero: int, full: int) -> bool:
+    """En az %10 veri ve %90'dan az $FF - is_valid_sprite_data ile aynı ölçüt"""
+    return nonzero >= SPRITE_SIZE * 0.1 and full < SPRITE_SIZE * 0.9
+
+
+def sprite_pixels(sprite_data: bytes, multicolor: bool = False):
+    """
+    Sprite'ı 21x24 renk indeksi ızgarasına çöz
+
+    Hi-res: 0 = arka plan, 1 = sprite rengi
+    Multicolor: 2 bitlik çiftler (0 = arka plan, 1 = MC0, 2 = sprite rengi,
+    3 = MC1), yatayda iki kat genişletilir
+
+    Returns:
+        NumPy varsa (21, 24) uint8 dizi, yoksa satır listesi
+    """
+    data = bytes(sprite_data[:SPRITE_SIZE]).ljust(SPRITE_SIZE, b"\x00")
+    if NUMPY_AVAILABLE:
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8).reshape(SPRITE_HEIGHT, 3), axis=1)
+        if not multicolor:
+            return bits
+        pairs = (bits[:, 0::2] << 1) | bits[:, 1::2]
+        return np.repeat(pairs, 2, axis=1)
+
+    rows = []
+    for y in range(SPRITE_HEIGHT):
+        row_bits = int.from_bytes(data[y * 3:y * 3 + 3], "big")
+        if multicolor:
+            row = []
+            for x in range(0, SPRITE_WIDTH, 2):
+                value = (row_bits >> (22 - x)) & 0x03
+                row += (value, value)
+        else:
+            row = [(row_bits >> (23 - x)) & 0x01 for x in range(SPRITE_WIDTH)]
+        rows.append(row)
+    return rows
+
+
+def sprite_sheet_pixels(sprites: Sequence, columns: int = 8, spacing: int = 1):
+    """
+    Çözülmüş sprite ızgaralarını tek bir sheet ızgarasında birleştir
+
+    Returns:
+        (yükseklik, genişlik, ızgara) - ızgara NumPy dizisi veya satır listesi
+    """
+    count = len(sprites)
+    columns = max(1, min(columns, count or 1))
+    rows = (count + columns - 1) // columns
+    cell_w = SPRITE_WIDTH + spacing
+    cell_h = SPRITE_HEIGHT + spacing
+    width = columns * cell_w - spacing
+    height = max(0, rows * cell_h - spacing)
+
+    if NUMPY_AVAILABLE:
+        tiles = np.zeros((rows * columns, cell_h, cell_w), dtype=np.uint8)
+        if count:
+            tiles[:count, :SPRITE_HEIGHT, :SPRITE_WIDTH] = np.asarray(sprites, dtype=np.uint8)
+        grid = tiles.reshape(rows, columns, cell_h, cell_w).transpose(0, 2, 1, 3)
+        return height, width, grid.reshape(rows * cell_h, columns * cell_w)[:height, :width]
+
+    grid = [[0] * width for _ in range(height)]
+    for index, sprite in enumerate(sprites):
+        top = (index // columns) * cell_h
+        left = (index % columns) * cell_w
+        for y, row in enumerate(sprite):
+            grid[top + y][left:left + SPRITE_WIDTH] = list(row)
+    return height, width, grid
+
+
 class SpriteConverter:
     """C64 Sprite Converter"""
     
@@ -60,49 +179,62 @@ class SpriteConverter:
         
         return data[offset:offset + sprite_size]
     
+    @property
+    def palette(self) -> List[int]:
+        """PIL 'P' modu için düz RGB palet listesi"""
+        return [channel for index in range(16) for channel in self.colors[index]]
+    
+    def render_sprite_image(self, pixels, color_map: Sequence[int], scale: int = 8,
+                            size: Optional[Tuple[int, int]] = None):
+        """
+        Renk indeksi ızgarasını büyütülmüş PIL görüntüsüne çevir
+        
+        Args:
+            pixels: sprite_pixels / sprite_sheet_pixels çıktısı
+            color_map: Piksel değeri -> C64 renk numarası
+            scale: Büyütme katsayısı
+            size: (genişlik, yükseklik) - saf Python ızgarası için
+        """
+        if NUMPY_AVAILABLE:
+            indices = np.asarray(color_map, dtype=np.uint8)[np.asarray(pixels, dtype=np.uint8)]
+            indices = np.repeat(np.repeat(indices, scale, axis=0), scale, axis=1)
+            image = Image.fromarray(np.ascontiguousarray(indices), 'P')
+        else:
+            width, height = size or (len(pixels[0]) if pixels else 0, len(pixels))
+            raw = bytes(color_map[value] for row in pixels for value in row)
+            image = Image.frombytes('P', (width, height), raw)
+            image = image.resize((width * scale, height * scale), Image.NEAREST)
+        image.putpalette(self.palette)
+        return image.convert('RGB')
+    
+    def _color_map(self, color1: int, color2: int, multicolor: bool,
+                   mc_color0: int, mc_color1: int) -> Tuple[int, ...]:
+        if multicolor:
+            return (color2, mc_color0, color1, mc_color1)
+        return (color2, color1)
+    
     def sprite_to_png(self, sprite_data: bytes, output_path: str, 
-                     color1: int = 1, color2: int = 0, multicolor: bool = False) -> bool:
-        """Sprite verisini PNG formatına çevir"""
+                     color1: int = 1, color2: int = 0, multicolor: bool = False,
+                     mc_color0: int = 11, mc_color1: int = 12) -> bool:
+        """
+        Sprite verisini PNG formatına çevir
+        
+        Args:
+            color1: Sprite rengi
+            color2: Arka plan rengi
+            multicolor: Multicolor sprite ($D01C)
+            mc_color0/mc_color1: Ortak multicolor renkleri ($D025/$D026)
+        """
         if not PIL_AVAILABLE:
             self.logger.warning("PIL mevcut değil - PNG conversion yapılamaz")
             return False
         
         try:
-            # Image oluştur
             scale = 8  # 8x büyütme
-            img_width = self.sprite_width * scale
-            img_height = self.sprite_height * scale
-            
-            img = Image.new('RGB', (img_width, img_height), self.colors[color2])
-            draw = ImageDraw.Draw(img)
-            
-            # Sprite verilerini çözümle
-            for y in range(self.sprite_height):
-                row_offset = y * 3  # Her satır 3 byte
-                if row_offset + 2 >= len(sprite_data):
-                    break
-                
-                # 3 byte'ı birleştir (24 bit)
-                byte1 = sprite_data[row_offset]
-                byte2 = sprite_data[row_offset + 1] 
-                byte3 = sprite_data[row_offset + 2]
-                
-                row_bits = (byte1 << 16) | (byte2 << 8) | byte3
-                
-                # Her bit için pixel çiz
-                for x in range(self.sprite_width):
-                    bit_pos = 23 - x  # MSB'den başla
-                    if row_bits & (1 << bit_pos):
-                        # Pixel aktif
-                        pixel_color = self.colors[color1]
-                        
-                        # Büyütülmüş pixel çiz
-                        x1 = x * scale
-                        y1 = y * scale
-                        x2 = x1 + scale
-                        y2 = y1 + scale
-                        
-                        draw.rectangle([x1, y1, x2, y2], fill=pixel_color)
+            pixels = sprite_pixels(sprite_data, multicolor)
+            color_map = self._color_map(color1, color2, multicolor, mc_color0, mc_color1)
+            img = self.render_sprite_image(pixels, color_map, scale,
+                                           (self.sprite_width, self.sprite_height))
             
             # PNG olarak kaydet
             img.save(output_path, 'PNG')
@@ -113,8 +245,67 @@ class SpriteConverter:
             self.logger.error(f"Sprite PNG conversion hatası: {e}")
             return False
     
-    def convert_prg_sprites(self, prg_data: bytes, output_dir: str = "png_files") -> List[str]:
-        """PRG dosyasından sprite'ları çıkart ve PNG'ye çevir"""
+    def save_sprite_sheet(self, sprites: Sequence[bytes], output_path: str, columns: int = 8,
+                          scale: int = 4, color1: int = 1, color2: int = 0,
+                          multicolor: bool = False, mc_color0: int = 11,
+                          mc_color1: int = 12) -> bool:
+        """Birden fazla sprite'ı tek görüntüde (tek yazımla) kaydet"""
+        if not PIL_AVAILABLE:
+            self.logger.warning("PIL mevcut değil - PNG conversion yapılamaz")
+            return False
+        if not sprites:
+            return False
+        
+        try:
+            height, width, grid = sprite_sheet_pixels(
+                [sprite_pixels(sprite, multicolor) for sprite in sprites], columns)
+            color_map = self._color_map(color1, color2, multicolor, mc_color0, mc_color1)
+            img = self.render_sprite_image(grid, color_map, scale, (width, height))
+            img.save(output_path, 'PNG')
+            self.logger.info(f"{len(sprites)} sprite sheet olarak kaydedildi: {output_path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Sprite sheet hatası: {e}")
+            return False
+    
+    def find_sprite_candidates(self, code_data: bytes, load_address: Optional[int] = None,
+                               aligned: bool = False) -> List[Dict[str, int]]:
+        """
+        Sprite adaylarını tek geçişte puanla
+        
+        Args:
+            code_data: PRG header'ı olmadan veri
+            load_address: Yükleme adresi (hizalı tarama için gerekli)
+            aligned: True ise 64 byte hizalı VIC sprite blokları, değilse 63 byte adımlar
+            
+        Returns:
+            Geçerli adaylar: offset (code_data içinde), address, nonzero
+        """
+        limit = len(code_data) - SPRITE_SIZE + 1
+        if limit <= 0:
+            return []
+        base = load_address or 0
+        if aligned:
+            offsets = range((-base) % SPRITE_BLOCK, limit, SPRITE_BLOCK)
+        else:
+            offsets = range(0, limit, SPRITE_SIZE)
+        if not offsets:
+            return []
+        
+        nonzero, full = score_offsets(code_data, offsets)
+        return [{'offset': offset, 'address': base + offset, 'nonzero': count}
+                for offset, count, full_count in zip(offsets, nonzero, full)
+                if is_sprite_score(count, full_count)]
+    
+    def convert_prg_sprites(self, prg_data: bytes, output_dir: str = "png_files",
+                            sheet: bool = False, aligned: bool = False) -> List[str]:
+        """
+        PRG dosyasından sprite'ları çıkart ve PNG'ye çevir
+        
+        Args:
+            sheet: True ise tüm sprite'lar tek sprite_sheet.png dosyasına yazılır
+            aligned: True ise 64 byte hizalı VIC sprite blokları taranır
+        """
         if not PIL_AVAILABLE:
             self.logger.warning("PIL mevcut değil - sprite conversion yapılamaz")
             return []
@@ -122,45 +313,42 @@ class SpriteConverter:
         # Çıktı dizinini oluştur
         Path(output_dir).mkdir(exist_ok=True)
         
-        converted_files = []
-        sprite_size = 63
-        
         # PRG header'ı atla (2 byte)
         if len(prg_data) < 2:
             self.logger.error("Geçersiz PRG dosyası")
             return []
         
+        load_address = prg_data[0] | (prg_data[1] << 8)
         code_data = prg_data[2:]
+        candidates = self.find_sprite_candidates(code_data, load_address, aligned)
+        sprites = [code_data[c['offset']:c['offset'] + SPRITE_SIZE] for c in candidates]
         
-        # Olası sprite konumlarını ara
-        for offset in range(0, len(code_data) - sprite_size + 1, sprite_size):
-            sprite_data = code_data[offset:offset + sprite_size]
-            
-            # Sprite verisi olup olmadığını kontrol et
-            if self.is_valid_sprite_data(sprite_data):
-                sprite_num = offset // sprite_size
-                output_file = os.path.join(output_dir, f"sprite_{sprite_num:03d}.png")
-                
+        converted_files = []
+        if sheet:
+            output_file = os.path.join(output_dir, "sprite_sheet.png")
+            if self.save_sprite_sheet(sprites, output_file):
+                converted_files.append(output_file)
+        else:
+            for candidate, sprite_data in zip(candidates, sprites):
+                if aligned:
+                    name = f"sprite_{candidate['address']:04X}.png"
+                else:
+                    name = f"sprite_{candidate['offset'] // SPRITE_SIZE:03d}.png"
+                output_file = os.path.join(output_dir, name)
                 if self.sprite_to_png(sprite_data, output_file):
                     converted_files.append(output_file)
         
-        self.logger.info(f"{len(converted_files)} sprite PNG'ye çevrildi")
+        self.logger.info(f"{len(sprites)} sprite PNG'ye çevrildi")
         return converted_files
     
     def is_valid_sprite_data(self, sprite_data: bytes) -> bool:
         """Sprite verisi geçerli mi kontrol et"""
-        if len(sprite_data) != 63:
+        if len(sprite_data) != SPRITE_SIZE:
             return False
         
-        # Tamamı 0 veya 255 değilse sprite olabilir
-        zero_count = sprite_data.count(0)
-        full_count = sprite_data.count(255)
-        
-        # En az %10 veri olmalı
-        min_data = len(sprite_data) * 0.1
-        data_count = len(sprite_data) - zero_count
-        
-        return data_count >= min_data and full_count < len(sprite_data) * 0.9
+        # En az %10 veri olmalı, tamamı 255 olmamalı
+        data_count = len(sprite_data) - sprite_data.count(0)
+        return is_sprite_score(data_count, sprite_data.count(255))
     
     def analyze_sprites(self, prg_data: bytes) -> dict:
         """PRG dosyasındaki sprite'ları analiz et"""
@@ -168,26 +356,35 @@ class SpriteConverter:
             'total_sprites': 0,
             'valid_sprites': 0,
             'sprite_locations': [],
+            'vic_block_locations': [],
             'file_size': len(prg_data)
         }
         
         if len(prg_data) < 2:
             return analysis
         
+        load_address = prg_data[0] | (prg_data[1] << 8)
         code_data = prg_data[2:]
-        sprite_size = 63
+        analysis['total_sprites'] = max(0, (len(code_data) - SPRITE_SIZE) // SPRITE_SIZE + 1)
         
-        for offset in range(0, len(code_data) - sprite_size + 1, sprite_size):
-            sprite_data = code_data[offset:offset + sprite_size]
-            analysis['total_sprites'] += 1
-            
-            if self.is_valid_sprite_data(sprite_data):
-                analysis['valid_sprites'] += 1
-                analysis['sprite_locations'].append({
-                    'offset': offset + 2,  # PRG header dahil
-                    'sprite_num': offset // sprite_size,
-                    'data_density': (len(sprite_data) - sprite_data.count(0)) / len(sprite_data)
-                })
+        for candidate in self.find_sprite_candidates(code_data, load_address):
+            analysis['sprite_locations'].append({
+                'offset': candidate['offset'] + 2,  # PRG header dahil
+                'sprite_num': candidate['offset'] // SPRITE_SIZE,
+                'data_density': candidate['nonzero'] / SPRITE_SIZE
+            })
+        analysis['valid_sprites'] = len(analysis['sprite_locations'])
+        
+        # VIC sprite pointer'larının gösterebileceği 64 byte hizalı bloklar
+        for candidate in self.find_sprite_candidates(code_data, load_address, aligned=True):
+            address = candidate['address']
+            analysis['vic_block_locations'].append({
+                'offset': candidate['offset'] + 2,
+                'address': address,
+                'bank': (address >> 14) & 0x03,
+                'pointer': (address & 0x3FFF) // SPRITE_BLOCK,
+                'data_density': candidate['nonzero'] / SPRITE_SIZE
+            })
         
         self.logger.info(f"Sprite analizi: {analysis['valid_sprites']}/{analysis['total_sprites']} valid")
         return analysis
@@ -15,21 +15,353 @@ import tkinter as tk
 import re
 from typing import Dict, List, Tuple, Optional
 
+# (tag, başlangıç sütunu, bitiş sütunu)
+Token = Tuple[str, int, int]
+
+# Görünür alanın üstünde/altında önceden renklendirilecek satır sayısı
+VIEWPORT_MARGIN = 50
+
+
+class AsmTokenizer:
+    """6502 Assembly satır tokenizer'ı - tek birleşik regex, kelime sınıfı önbelleği"""
+
+    OPCODES = frozenset({
+        'ADC', 'AND', 'ASL', 'BCC', 'BCS', 'BEQ', 'BIT', 'BMI', 'BNE', 'BPL',
+        'BRK', 'BVC', 'BVS', 'CLC', 'CLD', 'CLI', 'CLV', 'CMP', 'CPX', 'CPY',
+        'DEC', 'DEX', 'DEY', 'EOR', 'INC', 'INX', 'INY', 'JMP', 'JSR', 'LDA',
+        'LDX', 'LDY', 'LSR', 'NOP', 'ORA', 'PHA', 'PHP', 'PLA', 'PLP', 'ROL',
+        'ROR', 'RTI', 'RTS', 'SBC', 'SEC', 'SED', 'SEI', 'STA', 'STX', 'STY',
+        'TAX', 'TAY', 'TSX', 'TXA', 'TXS', 'TYA'
+    })
+
+    DIRECTIVES = frozenset({
+        'ORG', 'BYTE', 'WORD', 'TEXT', 'INCLUDE', 'DEFINE', 'EQU',
+        '.pc', '.byte', '.word', '.text', '.include', '.define', '.macro', '.endm',
+        '*=', 'DB', 'DW', 'DS', 'ALIGN', '!byte', '!word', '!text', '!fill'
+    })
+
+    C64_MEMORY = frozenset({
+        '$0000', '$0001', '$0002', '$00BA', '$00C1', '$00C2',  # Zero page
+        '$0200', '$0300', '$0400', '$0800', '$0801',          # BASIC areas
+        '$A000', '$A002', '$A004', '$A006', '$A008',          # BASIC ROM
+        '$D000', '$D010', '$D020', '$D021', '$D400', '$D800', # I/O
+        '$DC00', '$DD00', '$FFFE', '$FFFA', '$FFFC',          # Hardware
+        '$4000', '$6000', '$8000', '$C000', '$E000'           # Memory banks
+    })
+
+    TASS_DIRECTIVES = frozenset({
+        '*=', '.proc', '.pend', '.block', '.bend', '.page', '.align',
+        '.fill', '.text', '.shift', '.shiftl', '.enc', '.cpu'
+    })
+
+    KICKASS_DIRECTIVES = frozenset({
+        '.pc', '.pseudopc', '.namespace', '.filenamespace', '.import',
+        '.importonce', '.label', '.const', '.var', '.eval', '.print',
+        '.error', '.warning', '.macro', '.function', '.return'
+    })
+
+    # Yorum, string ve kelimeler tek geçişte; yorum/string içindeki kelimeler ayrıca sınıflanmaz
+    TOKEN_PATTERN = re.compile(r'(?P<comment>;.*)|(?P<string>"[^"]*")|(?P<word>[^\s;"]+)')
+    HEX_PATTERN = re.compile(r'(?:\$|0[xX]|#\$)[0-9A-Fa-f]+$')
+    DECIMAL_PATTERN = re.compile(r'[+-]?\d+$')
+
+    def __init__(self):
+        self.opcodes = set(self.OPCODES)
+        self.directives = set(self.DIRECTIVES)
+        self.c64_memory = set(self.C64_MEMORY)
+        self.tass_directives = set(self.TASS_DIRECTIVES)
+        self.kickass_directives = set(self.KICKASS_DIRECTIVES)
+        self._word_tags: Dict[str, Optional[str]] = {}
+
+    def classify_word(self, word: str) -> Optional[str]:
+        """Kelimenin tag'ini bul (önbellekli)"""
+        try:
+            return self._word_tags[word]
+        except KeyError:
+            pass
+
+        word_upper = word.upper()
+        if word.endswith(':'):
+            tag = 'label'
+        elif word_upper in self.opcodes:
+            tag = 'opcode'
+        elif any(word_upper in directives or word in directives
+                 for directives in (self.directives, self.tass_directives,
+                                    self.kickass_directives)):
+            tag = 'directive'
+        elif word_upper in self.c64_memory:
+            tag = 'memory'
+        elif self.HEX_PATTERN.match(word):
+            tag = 'hex'
+        elif word.startswith('#'):
+            tag = 'immediate'
+        elif word_upper in ('A', 'X', 'Y'):
+            tag = 'register'
+        elif self.DECIMAL_PATTERN.match(word):
+            tag = 'number'
+        else:
+            tag = None
+
+        self._word_tags[word] = tag
+        return tag
+
+    def tokenize_line(self, line: str) -> List[Token]:
+        """Tek satırı (tag, başlangıç, bitiş) token'larına ayır"""
+        tokens = []
+        for match in self.TOKEN_PATTERN.finditer(line):
+            kind = match.lastgroup
+            tag = self.classify_word(match.group()) if kind == 'word' else kind
+            if tag:
+                tokens.append((tag, match.start(), match.end()))
+        return tokens
+
+
+class BasicTokenizer:
+    """C64 BASIC satır tokenizer'ı - tek birleşik regex"""
+
+    BASIC_KEYWORDS = frozenset({
+        'PRINT', 'INPUT', 'IF', 'THEN', 'ELSE', 'FOR', 'TO', 'NEXT', 'STEP',
+        'GOSUB', 'RETURN', 'GOTO', 'ON', 'RUN', 'LIST', 'NEW', 'LOAD', 'SAVE',
+        'GET', 'POKE', 'PEEK', 'SYS', 'LET', 'DIM', 'DATA', 'READ', 'RESTORE',
+        'REM', 'STOP', 'END', 'CONT', 'CLR', 'DEF', 'FN', 'AND', 'OR', 'NOT',
+        'ABS', 'ATN', 'COS', 'EXP', 'INT', 'LOG', 'RND', 'SGN', 'SIN', 'SQR',
+        'TAN', 'ASC', 'CHR$', 'LEFT$', 'LEN', 'MID$', 'RIGHT$', 'STR$', 'VAL'
+    })
+
+    BASIC_FUNCTIONS = frozenset({
+        'SIN', 'COS', 'TAN', 'ATN', 'EXP', 'LOG', 'ABS', 'SGN', 'SQR', 'INT',
+        'RND', 'ASC', 'LEN', 'VAL', 'POS', 'FRE', 'USR', 'PEEK', 'CHR$',
+        'LEFT$', 'RIGHT$', 'MID$', 'STR$', 'TIME$'
+    })
+
+    LINE_NUMBER_PATTERN = re.compile(r'\s*(\d+)')
+    # REM satır sonuna kadar yorumdur; string içindeki REM yorum başlatmaz
+    TOKEN_PATTERN = re.compile(
+        r'(?P<basic_string>"[^"]*")'
+        r'|(?P<basic_comment>\bREM\b.*)'
+        r'|(?P<word>\b[A-Z][A-Z0-9]*\$?)'
+        r'|(?P<basic_number>\b\d+(?:\.\d+)?\b)',
+        re.IGNORECASE)
+
+    def __init__(self):
+        self.basic_keywords = set(self.BASIC_KEYWORDS)
+        self.basic_functions = set(self.BASIC_FUNCTIONS)
+
+    def tokenize_line(self, line: str) -> List[Token]:
+        """Tek BASIC satırını (tag, başlangıç, bitiş) token'larına ayır"""
+        tokens = []
+        position = 0
+        line_number = self.LINE_NUMBER_PATTERN.match(line)
+        if line_number:
+            tokens.append(('line_number', line_number.start(1), line_number.end(1)))
+            position = line_number.end()
+
+        for match in self.TOKEN_PATTERN.finditer(line, position):
+            kind = match.lastgroup
+            if kind == 'word':
+                word = match.group().upper()
+                if word in self.basic_keywords:
+                    kind = 'basic_keyword'
+                elif word in self.basic_functions:
+                    kind = 'basic_function'
+                else:
+                    continue
+            tokens.append((kind, match.start(), match.end()))
+        return tokens
+
+
+class LineTokenCache:
+    """
+    Satır bazlı token önbelleği
+
+    update() yeni metni önceki satırlarla karşılaştırır; ortak baş ve son
+    kısım korunur, yalnızca değişen satır aralığı yeniden tokenize edilir.
+    """
+
+    def __init__(self, tokenize_line):
+        self.tokenize_line = tokenize_line
+        self.lines: List[str] = []
+        self.tokens: List[List[Token]] = []
+
+    def __len__(self):
+        return len(self.lines)
+
+    def update(self, lines: List[str]) -> Tuple[int, int, int]:
+        """
+        Önbelleği yeni satırlarla eşitle
+
+        Returns:
+            (ilk değişen satır indeksi, eski aralık sonu, yeni aralık sonu);
+            değişiklik yoksa ilk == son
+        """
+        old = self.lines
+        limit = min(len(old), len(lines))
+        first = 0
+        while first < limit and old[first] == lines[first]:
+            first += 1
+        old_end, new_end = len(old), len(lines)
+        while old_end > first and new_end > first and old[old_end - 1] == lines[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+
+        tokenize = self.tokenize_line
+        self.tokens[first:old_end] = [tokenize(line) for line in lines[first:new_end]]
+        self.lines = list(lines)
+        return first, old_end, new_end
+
+    def invalidate(self):
+        self.lines = []
+        self.tokens = []
+
+
 class SyntaxHighlighter:
-    """Base syntax highlighter sınıfı"""
-    
-    def __init__(self, text_widget: tk.Text):
+    """
+    Base syntax highlighter sınıfı
+
+    Metin bir kez tokenize edilip satır bazında önbelleklenir; tag'ler yalnızca
+    görünür alan + VIEWPORT_MARGIN satır için uygulanır. Düzenlemelerde sadece
+    değişen satırlar yeniden tokenize edilir.
+    """
+
+    # Alt sınıfın yönettiği tag'ler (satır temizliğinde yalnızca bunlar silinir)
+    TAGS: Tuple[str, ...] = ()
+
+    def __init__(self, text_widget: tk.Text, auto_bind: bool = True):
         self.text_widget = text_widget
+        self.margin = VIEWPORT_MARGIN
+        self.cache = LineTokenCache(self.tokenize_line)
+        # Satır indeksi -> tag'leri widget'a uygulandı mı
+        self._applied: List[bool] = []
+        # Bekleyen after_idle çağrıları: tam senkronizasyon ve yalnızca viewport
+        self._highlight_after_id = None
+        self._viewport_after_id = None
+        self._scroll_command = None
+        self._scroll_target = ''
         self.setup_tags()
-        
+        if auto_bind:
+            self.bind_events()
+
     def setup_tags(self):
         """Syntax highlighting tag'lerini yapılandır"""
         pass
-    
+
+    def tokenize_line(self, line: str) -> List[Token]:
+        """Satırı token'lara ayır - alt sınıflar uygular"""
+        return []
+
+    def bind_events(self):
+        """Düzenleme ve kaydırma olaylarına bağlan
+
+        Her düzenleme senkronizasyonunda widget'ın edit_modified bayrağı
+        sıfırlanır; aksi halde Tk sonraki düzenlemelerde <<Modified>> üretmez.
+        """
+        widget = self.text_widget
+        widget.bind('<<Modified>>', self._schedule_highlight, add='+')
+        for sequence in ('<Configure>', '<MouseWheel>', '<Button-4>', '<Button-5>', '<KeyRelease>'):
+            widget.bind(sequence, self._schedule_viewport, add='+')
+        self._install_scroll_hook()
+
+    def _install_scroll_hook(self):
+        """yscrollcommand'ı sarmala - scrollbar ile kaydırmada da viewport güncellensin"""
+        widget = self.text_widget
+        current = str(widget.cget('yscrollcommand'))
+        if self._scroll_command and current == self._scroll_command:
+            return
+        self._scroll_target = current
+        self._scroll_command = widget.register(self._on_yscroll)
+        widget.configure(yscrollcommand=self._scroll_command)
+
+    def _on_yscroll(self, first, last):
+        if self._scroll_target:
+            widget = self.text_widget
+            widget.tk.call(*widget.tk.splitlist(self._scroll_target), first, last)
+        self._schedule_viewport()
+
+    def _schedule_highlight(self, event=None):
+        """<<Modified>> - düzenlenen satırları bir sonraki boşta senkronize et"""
+        widget = self.text_widget
+        # Bayrağın sıfırlanması da <<Modified>> üretir; o olay yok sayılır
+        if event is not None and not widget.edit_modified():
+            return
+        if self._viewport_after_id is not None:
+            widget.after_cancel(self._viewport_after_id)
+            self._viewport_after_id = None
+        if self._highlight_after_id is None:
+            self._highlight_after_id = widget.after_idle(self._run_highlight)
+
+    def _schedule_viewport(self, event=None):
+        # Bekleyen senkronizasyon viewport'u da günceller
+        if self._highlight_after_id is None and self._viewport_after_id is None:
+            self._viewport_after_id = self.text_widget.after_idle(self._run_viewport)
+
+    def _run_highlight(self):
+        self._highlight_after_id = None
+        # Tk <<Modified>>'ı yalnızca bayrak değiştiğinde üretir; sıfırlanmazsa
+        # sonraki düzenlemeler olay üretmez
+        self.text_widget.edit_modified(False)
+        self.highlight()
+
+    def _run_viewport(self):
+        self._viewport_after_id = None
+        self.update_viewport()
+
     def highlight(self, start="1.0", end="end"):
-        """Text'i highlight et"""
-        pass
-    
+        """
+        Text'i highlight et - değişen satırları yeniden tokenize eder ve
+        görünür alanı renklendirir
+
+        start/end verilirse o aralıktaki satırlar yeniden renklendirilir.
+        """
+        if self._scroll_command is not None:
+            self._install_scroll_hook()
+        self.sync()
+        if (start, end) != ("1.0", "end"):
+            first = int(self.text_widget.index(start).split('.')[0]) - 1
+            last = int(self.text_widget.index(end).split('.')[0])
+            self._applied[first:last] = [False] * len(self._applied[first:last])
+        self.update_viewport()
+
+    def sync(self):
+        """Widget içeriğini token önbelleğiyle eşitle"""
+        lines = self.text_widget.get("1.0", "end-1c").split('\n')
+        first, old_end, new_end = self.cache.update(lines)
+        self._applied[first:old_end] = [False] * (new_end - first)
+
+    def visible_line_range(self) -> Tuple[int, int]:
+        """Görünür satırlar + margin (1 tabanlı, dahil)"""
+        widget = self.text_widget
+        top = int(widget.index("@0,0").split('.')[0])
+        bottom = int(widget.index(f"@0,{widget.winfo_height()}").split('.')[0])
+        return max(1, top - self.margin), min(len(self.cache), bottom + self.margin)
+
+    def update_viewport(self):
+        """Görünür alandaki henüz renklendirilmemiş satırlara tag uygula"""
+        first, last = self.visible_line_range()
+        self.apply_lines(first, last)
+
+    def apply_lines(self, first: int, last: int):
+        """[first, last] satırlarının tag'lerini önbellekten uygula (1 tabanlı)"""
+        widget = self.text_widget
+        applied = self._applied
+        tokens = self.cache.tokens
+        for line_num in range(first, last + 1):
+            index = line_num - 1
+            if applied[index]:
+                continue
+            line_start = f"{line_num}.0"
+            line_end = f"{line_num}.end"
+            for tag in self.TAGS:
+                widget.tag_remove(tag, line_start, line_end)
+            for tag, start, end in tokens[index]:
+                widget.tag_add(tag, f"{line_num}.{start}", f"{line_num}.{end}")
+            applied[index] = True
+
+    def reset(self):
+        """Önbelleği ve uygulanmış tag'leri sıfırla"""
+        self.cache.invalidate()
+        self._applied = []
+        self.clear_tags()
+
     def clear_tags(self, start="1.0", end="end"):
         """Tüm tag'leri temizle"""
         for tag in self.text_widget.tag_names():
@@ -39,48 +371,19 @@ class SyntaxHighlighter:
 class Assembly6502Highlighter(SyntaxHighlighter):
     """6502 Assembly syntax highlighter"""
     
-    def __init__(self, text_widget: tk.Text):
-        # 6502 Assembly keywords
-        self.opcodes = {
-            'ADC', 'AND', 'ASL', 'BCC', 'BCS', 'BEQ', 'BIT', 'BMI', 'BNE', 'BPL',
-            'BRK', 'BVC', 'BVS', 'CLC', 'CLD', 'CLI', 'CLV', 'CMP', 'CPX', 'CPY',
-            'DEC', 'DEX', 'DEY', 'EOR', 'INC', 'INX', 'INY', 'JMP', 'JSR', 'LDA',
-            'LDX', 'LDY', 'LSR', 'NOP', 'ORA', 'PHA', 'PHP', 'PLA', 'PLP', 'ROL',
-            'ROR', 'RTI', 'RTS', 'SBC', 'SEC', 'SED', 'SEI', 'STA', 'STX', 'STY',
-            'TAX', 'TAY', 'TSX', 'TXA', 'TXS', 'TYA'
-        }
-        
-        # Assembly directives
-        self.directives = {
-            'ORG', 'BYTE', 'WORD', 'TEXT', 'INCLUDE', 'DEFINE', 'EQU',
-            '.pc', '.byte', '.word', '.text', '.include', '.define', '.macro', '.endm',
-            '*=', 'DB', 'DW', 'DS', 'ALIGN', '!byte', '!word', '!text', '!fill'
-        }
-        
-        # C64 memory locations
-        self.c64_memory = {
-            '$0000', '$0001', '$0002', '$00BA', '$00C1', '$00C2',  # Zero page
-            '$0200', '$0300', '$0400', '$0800', '$0801',          # BASIC areas
-            '$A000', '$A002', '$A004', '$A006', '$A008',          # BASIC ROM
-            '$D000', '$D010', '$D020', '$D021', '$D400', '$D800', # I/O
-            '$DC00', '$DD00', '$FFFE', '$FFFA', '$FFFC',          # Hardware
-            '$4000', '$6000', '$8000', '$C000', '$E000'           # Memory banks
-        }
-        
-        # 64tass specific
-        self.tass_directives = {
-            '*=', '.proc', '.pend', '.block', '.bend', '.page', '.align',
-            '.fill', '.text', '.shift', '.shiftl', '.enc', '.cpu'
-        }
-        
-        # KickAssembler specific  
-        self.kickass_directives = {
-            '.pc', '.pseudopc', '.namespace', '.filenamespace', '.import',
-            '.importonce', '.label', '.const', '.var', '.eval', '.print',
-            '.error', '.warning', '.macro', '.function', '.return'
-        }
-        
-        super().__init__(text_widget)
+    TAGS = ('opcode', 'directive', 'hex', 'immediate', 'comment', 'label',
+            'memory', 'string', 'number', 'register', 'default')
+    
+    def __init__(self, text_widget: tk.Text, auto_bind: bool = True):
+        self.tokenizer = AsmTokenizer()
+        # Geriye uyumluluk: anahtar kelime kümeleri tokenizer ile paylaşılır
+        self.opcodes = self.tokenizer.opcodes
+        self.directives = self.tokenizer.directives
+        self.c64_memory = self.tokenizer.c64_memory
+        self.tass_directives = self.tokenizer.tass_directives
+        self.kickass_directives = self.tokenizer.kickass_directives
+        
+        super().__init__(text_widget, auto_bind)
     
     def setup_tags(self):
         """6502 Assembly syntax highlighting tag'lerini yapılandır"""
@@ -134,145 +437,34 @@ class Assembly6502Highlighter(SyntaxHighlighter):
         self.text_widget.tag_configure('default', 
                                      foreground='#000000')
     
-    def highlight(self, start="1.0", end="end"):
-        """6502 Assembly syntax highlighting uygula"""
-        # Önce mevcut tag'leri temizle
-        self.clear_tags(start, end)
-        
-        # Text içeriğini al
-        content = self.text_widget.get(start, end)
-        lines = content.split('\n')
-        
-        current_line = 1
-        for line in lines:
-            self.highlight_line(line, current_line)
-            current_line += 1
+    def tokenize_line(self, line: str) -> List[Token]:
+        return self.tokenizer.tokenize_line(line)
     
     def highlight_line(self, line: str, line_num: int):
         """Tek bir satırı highlight et"""
-        # Boş satırları atla
-        if not line.strip():
-            return
-        
-        # Comment satırları
-        comment_match = re.search(r';.*$', line)
-        if comment_match:
-            start_pos = f"{line_num}.{comment_match.start()}"
-            end_pos = f"{line_num}.{comment_match.end()}"
-            self.text_widget.tag_add('comment', start_pos, end_pos)
-        
-        # String literals
-        string_pattern = r'"[^"]*"'
-        for match in re.finditer(string_pattern, line):
-            start_pos = f"{line_num}.{match.start()}"
-            end_pos = f"{line_num}.{match.end()}"
-            self.text_widget.tag_add('string', start_pos, end_pos)
-        
-        # Words'leri analiz et
-        words = re.findall(r'\S+', line)
-        current_pos = 0
-        
-        for word in words:
-            # Word'ün pozisyonunu bul
-            word_start = line.find(word, current_pos)
-            if word_start == -1:
-                continue
-            
-            word_end = word_start + len(word)
-            current_pos = word_end
-            
-            start_pos = f"{line_num}.{word_start}"
-            end_pos = f"{line_num}.{word_end}"
-            
-            # Word analizi
-            word_upper = word.upper()
-            
-            # Label check (word ends with :)
-            if word.endswith(':'):
-                self.text_widget.tag_add('label', start_pos, end_pos)
-            
-            # Opcode check
-            elif word_upper in self.opcodes:
-                self.text_widget.tag_add('opcode', start_pos, end_pos)
-            
-            # Directive check
-            elif (word_upper in self.directives or 
-                  word_upper in self.tass_directives or 
-                  word_upper in self.kickass_directives):
-                self.text_widget.tag_add('directive', start_pos, end_pos)
-            
-            # Memory location check
-            elif word.upper() in self.c64_memory:
-                self.text_widget.tag_add('memory', start_pos, end_pos)
-            
-            # Hex number check
-            elif self.is_hex_number(word):
-                self.text_widget.tag_add('hex', start_pos, end_pos)
-            
-            # Immediate value check
-            elif word.startswith('#'):
-                self.text_widget.tag_add('immediate', start_pos, end_pos)
-            
-            # Register check
-            elif word_upper in ['A', 'X', 'Y']:
-                self.text_widget.tag_add('register', start_pos, end_pos)
-            
-            # Decimal number check
-            elif self.is_decimal_number(word):
-                self.text_widget.tag_add('number', start_pos, end_pos)
+        for tag, start, end in self.tokenize_line(line):
+            self.text_widget.tag_add(tag, f"{line_num}.{start}", f"{line_num}.{end}")
     
     def is_hex_number(self, word: str) -> bool:
         """Hex sayı kontrolü"""
-        if word.startswith('$'):
-            try:
-                int(word[1:], 16)
-                return True
-            except ValueError:
-                return False
-        elif word.startswith('0x') or word.startswith('0X'):
-            try:
-                int(word[2:], 16)
-                return True
-            except ValueError:
-                return False
-        elif word.startswith('#$'):
-            try:
-                int(word[2:], 16)
-                return True
-            except ValueError:
-                return False
-        return False
+        return bool(AsmTokenizer.HEX_PATTERN.match(word))
     
     def is_decimal_number(self, word: str) -> bool:
         """Decimal sayı kontrolü"""
-        try:
-            int(word)
-            return True
-        except ValueError:
-            return False
+        return bool(AsmTokenizer.DECIMAL_PATTERN.match(word))
 
 class C64BasicHighlighter(SyntaxHighlighter):
     """C64 BASIC syntax highlighter"""
     
-    def __init__(self, text_widget: tk.Text):
-        # C64 BASIC keywords
-        self.basic_keywords = {
-            'PRINT', 'INPUT', 'IF', 'THEN', 'ELSE', 'FOR', 'TO', 'NEXT', 'STEP',
-            'GOSUB', 'RETURN', 'GOTO', 'ON', 'RUN', 'LIST', 'NEW', 'LOAD', 'SAVE',
-            'GET', 'POKE', 'PEEK', 'SYS', 'LET', 'DIM', 'DATA', 'READ', 'RESTORE',
-            'REM', 'STOP', 'END', 'CONT', 'CLR', 'DEF', 'FN', 'AND', 'OR', 'NOT',
-            'ABS', 'ATN', 'COS', 'EXP', 'INT', 'LOG', 'RND', 'SGN', 'SIN', 'SQR',
-            'TAN', 'ASC', 'CHR$', 'LEFT$', 'LEN', 'MID$', 'RIGHT$', 'STR$', 'VAL'
-        }
-        
-        # C64 BASIC functions
-        self.basic_functions = {
-            'SIN', 'COS', 'TAN', 'ATN', 'EXP', 'LOG', 'ABS', 'SGN', 'SQR', 'INT',
-            'RND', 'ASC', 'LEN', 'VAL', 'POS', 'FRE', 'USR', 'PEEK', 'CHR$',
-            'LEFT$', 'RIGHT$', 'MID$', 'STR$', 'TIME$'
-        }
+    TAGS = ('basic_keyword', 'basic_function', 'line_number', 'basic_string',
+            'basic_comment', 'basic_number')
+    
+    def __init__(self, text_widget: tk.Text, auto_bind: bool = True):
+        self.tokenizer = BasicTokenizer()
+        self.basic_keywords = self.tokenizer.basic_keywords
+        self.basic_functions = self.tokenizer.basic_functions
         
-        super().__init__(text_widget)
+        super().__init__(text_widget, auto_bind)
     
     def setup_tags(self):
         """C64 BASIC syntax highlighting tag'lerini yapılandır"""
@@ -303,73 +495,22 @@ class C64BasicHighlighter(SyntaxHighlighter):
         self.text_widget.tag_configure('basic_number', 
                                      foreground='#FF6600')
     
-    def highlight(self, start="1.0", end="end"):
-        """C64 BASIC syntax highlighting uygula"""
-        # Önce mevcut tag'leri temizle
-        self.clear_tags(start, end)
-        
-        # Text içeriğini al
-        content = self.text_widget.get(start, end)
-        lines = content.split('\n')
-        
-        current_line = 1
-        for line in lines:
-            self.highlight_basic_line(line, current_line)
-            current_line += 1
+    def tokenize_line(self, line: str) -> List[Token]:
+        return self.tokenizer.tokenize_line(line)
     
     def highlight_basic_line(self, line: str, line_num: int):
         """Tek bir BASIC satırını highlight et"""
-        if not line.strip():
-            return
-        
-        # Line number check (başta sayı varsa)
-        line_number_match = re.match(r'^\s*(\d+)', line)
-        if line_number_match:
-            start_pos = f"{line_num}.{line_number_match.start(1)}"
-            end_pos = f"{line_num}.{line_number_match.end(1)}"
-            self.text_widget.tag_add('line_number', start_pos, end_pos)
-        
-        # REM comment
-        rem_match = re.search(r'\bREM\b.*$', line, re.IGNORECASE)
-        if rem_match:
-            start_pos = f"{line_num}.{rem_match.start()}"
-            end_pos = f"{line_num}.{rem_match.end()}"
-            self.text_widget.tag_add('basic_comment', start_pos, end_pos)
-            return  # REM sonrası hiçbir şey highlight etme
-        
-        # String literals
-        string_pattern = r'"[^"]*"'
-        for match in re.finditer(string_pattern, line):
-            start_pos = f"{line_num}.{match.start()}"
-            end_pos = f"{line_num}.{match.end()}"
-            self.text_widget.tag_add('basic_string', start_pos, end_pos)
-        
-        # Keywords ve functions
-        word_pattern = r'\b[A-Z][A-Z0-9$]*\b'
-        for match in re.finditer(word_pattern, line, re.IGNORECASE):
-            word = match.group().upper()
-            start_pos = f"{line_num}.{match.start()}"
-            end_pos = f"{line_num}.{match.end()}"
-            
-            if word in self.basic_keywords:
-                self.text_widget.tag_add('basic_keyword', start_pos, end_pos)
-            elif word in self.basic_functions:
-                self.text_widget.tag_add('basic_function', start_pos, end_pos)
-        
-        # Numbers
-        number_pattern = r'\b\d+(\.\d+)?\b'
-        for match in re.finditer(number_pattern, line):
-            start_pos = f"{line_num}.{match.start()}"
-            end_pos = f"{line_num}.{match.end()}"
-            self.text_widget.tag_add('basic_number', start_pos, end_pos)
+        for tag, start, end in self.tokenize_line(line):
+            self.text_widget.tag_add(tag, f"{line_num}.{start}", f"{line_num}.{end}")
 
 class HybridHighlighter(SyntaxHighlighter):
     """Hybrid highlighter - hem Assembly hem BASIC destekler"""
     
-    def __init__(self, text_widget: tk.Text):
-        self.asm_highlighter = Assembly6502Highlighter(text_widget)
-        self.basic_highlighter = C64BasicHighlighter(text_widget)
-        super().__init__(text_widget)
+    def __init__(self, text_widget: tk.Text, auto_bind: bool = True):
+        self.asm_highlighter = Assembly6502Highlighter(text_widget, auto_bind=False)
+        self.basic_highlighter = C64BasicHighlighter(text_widget, auto_bind=False)
+        self.active = None
+        super().__init__(text_widget, auto_bind)
     
     def setup_tags(self):
         """Her iki highlighter'ın tag'lerini setup et"""
@@ -378,13 +519,26 @@ class HybridHighlighter(SyntaxHighlighter):
     
     def highlight(self, start="1.0", end="end"):
         """İçeriğe göre uygun highlighter'ı seç"""
-        content = self.text_widget.get(start, end)
+        if self._scroll_command is not None:
+            self._install_scroll_hook()
         
-        # BASIC mi Assembly mi kontrol et
-        if self.detect_basic(content):
-            self.basic_highlighter.highlight(start, end)
+        # BASIC mi Assembly mi kontrol et - tespit için ilk 10 satır yeterli
+        if self.detect_basic(self.text_widget.get("1.0", "11.0")):
+            target = self.basic_highlighter
         else:
-            self.asm_highlighter.highlight(start, end)
+            target = self.asm_highlighter
+        
+        # Mod değiştiyse önceki highlighter'ın tag'leri ve önbelleği atılır
+        if target is not self.active:
+            if self.active is not None:
+                self.active.reset()
+            self.active = target
+        target.highlight(start, end)
+    
+    def update_viewport(self):
+        """Aktif highlighter'ın görünür alanını güncelle"""
+        if self.active is not None:
+            self.active.update_viewport()
     
     def detect_basic(self, content: str) -> bool:
         """İçeriğin BASIC mi Assembly mi olduğunu tespit et"""
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplu listing yorumlama testi - annotate_listing ve satır bazlı karşılığı
+"""
+
+from c64_enhanced_knowledge_manager import EnhancedC64KnowledgeManager, KnowledgeLevel
+from c64_knowledge_base import operand_addresses
+import c64_knowledge_manager
+from linear_sweep import sweep
+
+# $C000: LDA #$2B / STA $D020 / JSR $FFD2 / LDA $2B / BNE $C000 / RTS
+CODE = bytes([0xA9, 0x2B, 0x8D, 0x20, 0xD0, 0x20, 0xD2, 0xFF, 0xA5, 0x2B, 0xD0, 0xF4, 0x60])
+
+
+def _records():
+    return list(sweep(CODE, 0xC000).records())
+
+
+def test_operand_addresses():
+    """Immediate/implied atlanır, branch hedefi hesaplanır"""
+    assert operand_addresses(_records()) == [None, 0xD020, 0xFFD2, 0x2B, 0xC000, None]
+    assert operand_addresses([0xD020, None]) == [0xD020, None]
+
+
+def test_enhanced_manager_matches_line_enhancer():
+    km = EnhancedC64KnowledgeManager()
+    comments = km.annotate_listing(_records(), KnowledgeLevel.BASIC)
+    assert comments[:4] == ["", "$D020=VIC_BORDER_COL", "$FFD2=BSOUT", "$2B=TXTTAB"]
+    assert comments[5] == ""
+    assert km.enhance_assembly_line("STA $D020").endswith("; " + comments[1])
+
+    km.annotate_listing([0xD020] * 100, KnowledgeLevel.BASIC)
+    assert km._address_comment.cache_info().hits > 0
+    assert km.annotate_listing(_records(), KnowledgeLevel.NATURAL) == [""] * 6
+
+
+def test_knowledge_manager_annotate_listing():
+    level = c64_knowledge_manager.KnowledgeLevel.ANNOTATED
+    km = c64_knowledge_manager.C64KnowledgeManager()
+    comments = km.annotate_listing(_records(), level)
+    assert comments[0] == "" and comments[2].startswith("BSOUT: ")
+    line = km.enhance_assembly_line("JSR $FFD2", level)
+    assert line == f"{'JSR $FFD2':<40} ; {comments[2]}"
+
+
+if __name__ == "__main__":
+    test_operand_addresses()
+    test_enhanced_manager_matches_line_enhancer()
+    test_knowledge_manager_annotate_listing()
+    print("✓ Listing yorumlama testleri başarılı")
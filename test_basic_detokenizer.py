@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BASIC detokenizer çekirdeği testi - çeviri tablosu ve satır akışı
+"""
+
+from basic_detokenizer import (BasicDetokenizer, build_translation_table, detokenize_line,
+                               iter_basic_lines)
+from enhanced_basic_decompiler import EnhancedBasicDecompiler, SpecialCharacterMode
+from hybrid_disassembler import HybridDisassembler
+
+# 10 PRINT "HI{CLR}";A$ / 20 POKE53280,0:SYS2064{WHT} / 30 GOTO10
+PRG = bytes([0x01, 0x08,
+             0x10, 0x08, 0x0A, 0x00, 0x99, 0x20, 0x22, 0x48, 0x49, 0x93, 0x22, 0x3B, 0x41, 0x24, 0x00,
+             0x1C, 0x08, 0x14, 0x00, 0x97, 0x35, 0x33, 0x32, 0x38, 0x30, 0x2C, 0x30, 0x3A,
+             0x9E, 0x32, 0x30, 0x36, 0x34, 0x05, 0x00,
+             0x20, 0x08, 0x1E, 0x00, 0x89, 0x31, 0x30, 0x00,
+             0x00, 0x00])
+
+
+def test_translation_table():
+    """256 giriş; token, ASCII ve yazdırılamayan byte'lar"""
+    table = build_translation_table()
+    assert len(table) == 256
+    assert table[0x99] == "PRINT" and table[0x41] == "A" and table[0x05] == "[05]"
+    assert table[0xFE] == "[FE]"
+    assert build_translation_table(unknown_token="TOKEN_{:02X}")[0xFE] == "TOKEN_FE"
+    assert build_translation_table(tokens=None)[0x99] == "[99]"
+
+
+def test_tokens_not_expanded_inside_quotes():
+    """Tırnak içindeki $80+ byte'lar token değil karakterdir"""
+    assert detokenize_line(bytes([0x99, 0x22, 0x99, 0x22, 0x99])) == 'PRINT"[99]"PRINT'
+    assert detokenize_line(b"") == ""
+
+
+def test_stream_lines_with_spans():
+    """Generator satır no, metin ve byte aralığı üretmeli"""
+    lines = list(iter_basic_lines(PRG, 2))
+    assert [(number, text) for number, text, _ in lines] == [
+        (10, 'PRINT "HI[93]";A$'), (20, "POKE53280,0:SYS2064[05]"), (30, "GOTO10")]
+    start, end = lines[1][2]
+    assert PRG[start:end] == PRG[0x11:0x25]
+    assert PRG[end - 1] == 0
+
+    assert BasicDetokenizer().detokenize_prg(PRG)[0] == '10 PRINT "HI[93]";A$'
+    hybrid = HybridDisassembler().analyze_basic_section(PRG[2:])
+    assert hybrid["basic_end_pos"] == len(PRG) - 2
+    assert hybrid["lines"][2]["raw_data"] == bytes([0x89, 0x31, 0x30])
+
+
+def test_truncated_program():
+    """Sonlandırıcısı olmayan son satır da akıtılmalı"""
+    lines = list(iter_basic_lines(bytes([0x01, 0x08, 0x0A, 0x00, 0x99, 0x41])))
+    assert lines == [(10, "PRINTA", (0, 6))]
+
+
+def test_special_char_mode_keeps_decompiler_state():
+    """Mod değişimi yalnızca çeviri tablolarını yenilemeli"""
+    decompiler = EnhancedBasicDecompiler()
+    decompiler.memory_map[0xC000] = "user_routine"
+    token_table = decompiler.token_table
+    decompiler.set_special_char_mode(SpecialCharacterMode.ESCAPED)
+    assert decompiler.memory_map[0xC000] == "user_routine"
+    assert decompiler.token_table is not token_table
+    assert decompiler.quote_table[0x93] == "\\x93"
+
+
+if __name__ == "__main__":
+    test_translation_table()
+    test_tokens_not_expanded_inside_quotes()
+    test_stream_lines_with_spans()
+    test_truncated_program()
+    test_special_char_mode_keeps_decompiler_state()
+    print("✓ BASIC detokenizer testleri başarılı")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+batch_scanner testi - headless paralel tarama
+"""
+
+import json
+import os
+import tempfile
+
+from batch_scanner import discover_files, run_batch, RESULTS_FILE
+from test_disk_image import build_test_d64
+
+
+def _make_tree(root):
+    os.makedirs(os.path.join(root, "sub"))
+    with open(os.path.join(root, "disk.d64"), "wb") as f:
+        f.write(build_test_d64())
+    with open(os.path.join(root, "sub", "hello.PRG"), "wb") as f:
+        f.write(bytes.fromhex("0108a94120d2ff60"))
+    with open(os.path.join(root, "notes.txt"), "w") as f:
+        f.write("yok say")
+
+
+def test_discover_files_filters_and_recurses():
+    with tempfile.TemporaryDirectory() as root:
+        _make_tree(root)
+        found = [os.path.relpath(p, root) for p in discover_files(root)]
+        assert found == ["disk.d64", os.path.join("sub", "hello.PRG")]
+        assert discover_files(root, recursive=False) == [os.path.join(root, "disk.d64")]
+
+
+def test_run_batch_streams_results():
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as out:
+        _make_tree(root)
+        report = run_batch(root, out, formats=["asm"], workers=1, use_cache=False)
+        assert report.images == 2
+        assert report.failed == 0
+        assert report.programs == 2
+
+        with open(os.path.join(out, RESULTS_FILE), encoding="utf-8") as f:
+            results = [json.loads(line) for line in f]
+        assert len(results) == 2
+        for result in results:
+            for path in result["outputs"]:
+                assert os.path.exists(path)
+        assert report.as_dict()["images_per_second"] > 0
+
+
+def test_basic_formats_write_distinct_files():
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as out:
+        _make_tree(root)
+        run_batch(root, out, formats=["qbasic", "commodorebasicv2"], workers=1, use_cache=False)
+        with open(os.path.join(out, RESULTS_FILE), encoding="utf-8") as f:
+            results = [json.loads(line) for line in f]
+        for result in results:
+            names = [os.path.basename(path) for path in result["outputs"]]
+            assert len(names) == len(set(names)) == 3
+            assert any(name.endswith("_qb.bas") for name in names)
+            assert any(name.endswith("_v2.bas") for name in names)
+
+
+def test_run_batch_tracks_results_in_database():
+    from database_manager import DatabaseManager
+
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as out:
+        _make_tree(root)
+        db_path = os.path.join(out, "tracked.db")
+        run_batch(root, out, formats=["asm", "pseudo", "qbasic", "commodorebasicv2"],
+                  workers=1, use_cache=False, track_db=db_path)
+        with DatabaseManager(db_path) as db:
+            stats = db.get_statistics()
+            callers = db.search_files("$FFD2", "symbol")
+            asm_hits = db.search_outputs("jsr", ["asm"])
+        # disk.d64 + diskteki program + hello.PRG (çıkarılan .prg ile aynı hash)
+        assert stats["total_files"] == 3
+        assert stats["format_stats"]["asm"]["success_count"] == 2
+        # Format istatistikleri uzantıya değil format adına göre tutulur
+        assert {"asm", "pseudo", "qbasic", "commodorebasicv2"} <= set(stats["format_stats"])
+        assert not {"bas", "txt"} & set(stats["format_stats"])
+        assert "hello.PRG" in {row["filename"] for row in callers}
+        assert asm_hits and all(row["target_format"] == "asm" for row in asm_hits)
+
+
+if __name__ == "__main__":
+    test_discover_files_filters_and_recurses()
+    test_run_batch_streams_results()
+    test_basic_formats_write_distinct_files()
+    test_run_batch_tracks_results_in_database()
+    print("✓ batch_scanner testleri başarılı")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Code analyzer testi - tek geçişli instruction akışı ve pattern aramaları
+"""
+
+from code_analyzer import CodeAnalyzer, InstructionStream, PatternType
+
+# $C000: LDX #$05 / loop: STA $0400,X / CLC / ADC #$01 / BCC +0 / DEX / BNE loop
+#        JSR $FFD2 / .BYTE $02 / RTS
+CODE = bytes([0xA2, 0x05, 0x9D, 0x00, 0x04, 0x18, 0x69, 0x01, 0x90, 0x00,
+              0xCA, 0xD0, 0xF5, 0x20, 0xD2, 0xFF, 0x02, 0x60])
+
+
+def test_stream_decodes_each_instruction_once():
+    """Operand byte'ları ayrı instruction olarak çözülmemeli"""
+    stream = InstructionStream(CODE, 0xC000)
+    assert list(stream.addresses) == [0xC000, 0xC002, 0xC005, 0xC006, 0xC008,
+                                      0xC00A, 0xC00B, 0xC00D, 0xC010, 0xC011]
+    assert stream.mnemonics[-2:] == [InstructionStream.DATA_MNEMONIC, 'RTS']
+    assert stream.operands[6] == 0xC002  # BNE hedefi
+    assert stream.indices('STA', 'LDX') == [0, 1]
+    assert stream.sequence_indices('DEX', 'BNE') == [5]
+    assert stream[1] == {'address': 0xC002, 'bytes': bytes([0x9D, 0x00, 0x04]),
+                         'length': 3, 'mnemonic': 'STA', 'operand': 0x0400}
+    assert stream.data_addresses() == [0xC010]
+
+    # Eksik son operand akışa girmemeli
+    assert len(InstructionStream(bytes([0xEA, 0xAD, 0x00]), 0x1000)) == 1
+
+
+def test_patterns_from_stream():
+    """Pattern'ler indeks aramalarıyla bulunmalı"""
+    analyzer = CodeAnalyzer(CODE, 0xC000)
+    result = analyzer.analyze_all_patterns()
+    found = {(p.pattern_type, p.start_address) for p in result.patterns}
+    assert (PatternType.COUNTING_LOOP, 0xC000) in found
+    assert (PatternType.ARRAY_ACCESS, 0xC000) in found
+    assert (PatternType.MATH_OPERATION, 0xC005) in found
+    assert (PatternType.SCREEN_MANIPULATION, 0xC002) in found
+    assert (PatternType.SUBROUTINE_CALL, 0xC00D) in found
+    loop = next(p for p in result.patterns if p.pattern_type == PatternType.COUNTING_LOOP)
+    assert loop.end_address == 0xC00B
+    assert result.memory_usage['screen_memory'] == 1
+    assert result.memory_usage['zero_page'] == 0
+    assert analyzer.data_areas == [0xC010]
+
+
+if __name__ == "__main__":
+    test_stream_decodes_each_instruction_once()
+    test_patterns_from_stream()
+    print("✓ Code analyzer testleri başarılı")
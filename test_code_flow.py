@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Code flow testi - basic block grafiği, çağrı grafiği ve atlama tabloları
+"""
+
+from code_flow import FlowGraph, EDGE_BRANCH, EDGE_DISPATCH, EDGE_FALL, EDGE_INDIRECT
+
+
+def test_blocks_edges_and_calls():
+    """Döngü, çağrı ve erişilemeyen veri"""
+    code = bytes([
+        0xA2, 0x00,        # $C000 LDX #$00
+        0xE8,              # $C002 INX
+        0xD0, 0xFD,        # $C003 BNE $C002
+        0x20, 0x0A, 0xC0,  # $C005 JSR $C00A
+        0x60,              # $C008 RTS
+        0xFF,              # $C009 veri (çözülmemeli)
+        0x20, 0xD2, 0xFF,  # $C00A JSR $FFD2
+        0x60,              # $C00D RTS
+    ])
+    flow = FlowGraph.from_code(code, 0xC000)
+    assert sorted(flow.blocks) == [0xC000, 0xC002, 0xC005, 0xC00A]
+    assert 0xC009 not in flow.instructions
+    assert flow.blocks[0xC000].successors == [(0xC002, EDGE_FALL)]
+    assert (0xC002, EDGE_BRANCH) in flow.blocks[0xC002].successors
+    assert (0xC005, EDGE_FALL) in flow.blocks[0xC002].successors
+    assert flow.blocks[0xC002].predecessors == [0xC000, 0xC002]
+    assert flow.call_graph[0xC000] == {0xC00A}
+    assert flow.call_graph[0xC00A] == {0xFFD2}
+    assert flow.blocks[0xC00A].function == 0xC00A
+    assert 0xFFD2 in flow.external_targets
+    assert flow.block_at(0xC003).start == 0xC002
+
+
+def test_indirect_jump_and_rts_dispatch():
+    """JMP ($xxxx) vektörü ve PHA/PHA/RTS dispatch tablosu"""
+    code = bytearray(0x40)
+    base = 0x1000
+    # $1000 LDX #$00 / LDA hi,X / PHA / LDA lo,X / PHA / RTS
+    code[0x00:0x0C] = bytes([0xA2, 0x00, 0xBD, 0x32, 0x10, 0x48, 0xBD, 0x30, 0x10, 0x48, 0x60, 0x00])
+    # Tablolar: lo @ $1030, hi @ $1032 -> hedefler $1020, $1028 (adres-1 saklanır)
+    code[0x30:0x34] = bytes([0x1F, 0x27, 0x10, 0x10])
+    code[0x20] = 0x60                                  # $1020 RTS
+    code[0x28:0x2B] = bytes([0x6C, 0x38, 0x10])        # $1028 JMP ($1038)
+    code[0x38:0x3A] = bytes([0x2C, 0x10])              # vektör -> $102C
+    code[0x2C] = 0x60                                  # $102C RTS
+
+    flow = FlowGraph.from_code(bytes(code), base)
+    assert flow.jump_tables[0x100A] == [0x1020, 0x1028]
+    assert (0x1020, EDGE_DISPATCH) in flow.blocks[0x1000].successors
+    assert flow.jump_tables[0x1028] == [0x102C]
+    assert flow.blocks[0x1028].successors == [(0x102C, EDGE_INDIRECT)]
+    assert all(flow.blocks[start].reachable for start in flow.blocks)
+
+
+def test_each_byte_decoded_once_with_limit():
+    """Uzun kodda sınır ve tekrar çözümleme olmamalı"""
+    code = bytes([0xEA] * 5000 + [0x4C, 0x00, 0x20])  # NOP'lar + JMP $2000
+    flow = FlowGraph.from_code(code, 0x2000)
+    assert len(flow.instructions) == 5001
+    assert len(flow.blocks) == 1
+    assert flow.blocks[0x2000].successors == [(0x2000, "jump")]
+
+    limited = FlowGraph.from_code(code, 0x2000, max_instructions=100)
+    assert len(limited.instructions) == 100
+
+
+def test_from_instructions_matches_decompiler_format():
+    """Decompiler tuple'ları korunmalı, tüm liste kapsanmalı"""
+    instructions = [
+        (0x0801, 'LDX', '#$00'),
+        (0x0803, 'INX', ''),
+        (0x0804, 'BNE', 0x0803),
+        (0x0806, 'RTS', ''),
+        (0x0807, 'LDA', 0xD020),
+    ]
+    flow = FlowGraph.from_instructions(instructions)
+    blocks = flow.as_blocks()
+    assert [instr for _, _, block in blocks for instr in block] == instructions
+    assert [(start, end) for start, end, _ in blocks] == [
+        (0x0801, 0x0801), (0x0803, 0x0804), (0x0806, 0x0806), (0x0807, 0x0807)]
+    assert not flow.blocks[0x0807].reachable
+
+
+if __name__ == "__main__":
+    test_blocks_edges_and_calls()
+    test_indirect_jump_and_rts_dispatch()
+    test_each_byte_decoded_once_with_limit()
+    test_from_instructions_matches_decompiler_format()
+    print("✓ Code flow testleri başarılı")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DatabaseManager testi - kalıcı WAL bağlantısı, toplu yazma ve blok hash
+"""
+
+import gc
+import hashlib
+import os
+import sqlite3
+import tempfile
+import weakref
+
+from database_manager import DatabaseManager
+
+
+def _count(db_path, table):
+    """Ayrı bir bağlantıdan commit edilmiş satır sayısı"""
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_batched_writes_and_counters():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "files.db")
+        db = DatabaseManager(db_path, batch_size=2)
+        assert db._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        file_id = db.add_processed_file("a.prg", "d64://a.prg", "PRG", 0x0801, data=b"\x01\x08\x00")
+        assert db.add_processed_file("a.prg", "d64://a.prg", "PRG", data=b"\x01\x08\x00") == file_id
+        assert _count(db_path, "processed_files") == 1  # dosya kaydı hemen commit edilir
+        db.add_format_conversion(file_id, "asm", True, 100)
+        assert _count(db_path, "format_conversions") == 0  # kuyrukta
+        db.add_format_conversion(file_id, "c", False, error_message="hata")
+        assert _count(db_path, "format_conversions") == 2  # 2 yazmada commit
+
+        db.add_format_conversion(file_id, "qbasic", True)
+        history = db.get_file_history(file_hash=hashlib.md5(b"\x01\x08\x00").hexdigest())
+        assert (history[0]["success_count"], history[0]["failure_count"]) == (2, 1)
+        assert [row["filename"] for row in db.search_files("a.p")] == ["a.prg"]
+        assert db.search_files("qbasic", "format")[0]["id"] == file_id
+        assert db.get_statistics()["format_stats"]["c"]["success_rate"] == 0.0
+
+        with sqlite3.connect(db_path) as conn:
+            indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"idx_files_filename", "idx_conversions_date"} <= indexes
+
+        db.add_format_conversion(file_id, "pdsx", True)
+        db.close()
+        assert _count(db_path, "format_conversions") == 4
+        db.close()  # ikinci close sorun çıkarmaz
+
+
+def test_no_write_lock_held_between_calls():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "shared.db")
+        db = DatabaseManager(db_path)
+        file_id = db.add_processed_file("a.prg", "a.prg", "PRG", 0x0801, data=b"\x01\x08\x60")
+        db.add_format_conversion(file_id, "asm", True)
+        assert not db._conn.in_transaction
+        # Aynı veritabanını paylaşan ikinci süreç/bağlantı beklemeden yazabilir
+        with sqlite3.connect(db_path, timeout=0) as other:
+            other.execute("UPDATE processed_files SET notes = 'gui' WHERE id = ?", (file_id,))
+
+        # Kapatılmadan bırakılan örnek çıkışa kadar tutulmaz, kuyruğu yine yazılır
+        probe = weakref.ref(db)
+        del db
+        gc.collect()
+        assert probe() is None
+        assert _count(db_path, "format_conversions") == 1
+
+
+def test_chunked_hash_matches_md5():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.bin")
+        data = os.urandom(3 * 1024 * 1024 + 17)
+        with open(path, "wb") as f:
+            f.write(data)
+        with DatabaseManager(os.path.join(tmp, "files.db")) as db:
+            assert db.calculate_file_hash(path) == hashlib.md5(data).hexdigest()
+            assert db.calculate_file_hash(os.path.join(tmp, "yok.bin")) == ""
+
+
+def test_content_symbol_and_byte_search():
+    # 10 SYS2061 + LDA #$41 / JSR $FFD2 / STA $D020 / JMP $C000
+    basic = bytes([0x0B, 0x08, 0x0A, 0x00, 0x9E]) + b"2061" + bytes([0x00, 0x00, 0x00])
+    code = bytes([0xA9, 0x41, 0x20, 0xD2, 0xFF, 0x8D, 0x20, 0xD0, 0x4C, 0x00, 0xC0])
+    program = b"\x01\x08" + basic + code
+    other = bytes([0x00, 0xC0, 0xAD, 0xD2, 0xFF, 0x60])
+    with tempfile.TemporaryDirectory() as tmp:
+        with DatabaseManager(os.path.join(tmp, "files.db")) as db:
+            file_id = db.add_processed_file("hello.prg", "hello.prg", "PRG", 0x0801, data=program)
+            other_id = db.add_processed_file("other.prg", "other.prg", "PRG", 0xC000, data=other)
+            db.add_processed_file("hello.prg", "hello.prg", "PRG", 0x0801, data=program)  # tekrar indekslenmez
+            db.add_format_conversion(file_id, "basic", True, output_text='10 SYS2061:PRINT "BORDER"')
+            db.add_format_conversion(file_id, "asm", True, output_text="JSR CHROUT ; border color")
+            db.add_format_conversion(other_id, "asm", True, output_text="LDA $FFD2")
+
+            assert {row["target_format"] for row in db.search_files("border", "content")} == {"basic", "asm"}
+            assert [row["target_format"] for row in db.search_files("border", "keyword")] == ["basic"]
+            assert [row["id"] for row in db.search_files("jsr chrout", "content")] == [file_id]
+            assert db.search_files('" OR', "content") == []
+
+            callers = db.find_references(address=0xFFD2, kind="call")
+            assert [row["id"] for row in callers] == [file_id]
+            assert {row["id"] for row in db.search_files("$FFD2", "symbol")} == {file_id, other_id}
+            assert db.find_references(address=0xD020)[0]["ref_kind"] == "write"
+            assert db.find_references(address=0xC000)[0]["ref_kind"] == "jump"
+            assert db.find_references(address=0x0B08) == []  # BASIC satırları taranmaz
+            if callers[0]["ref_name"]:
+                assert db.search_files(callers[0]["ref_name"].lower(), "symbol")[0]["id"] == file_id
+
+            # KERNAL diğer adı ve önek almamış hex görünümlü adlar
+            assert {row["id"] for row in db.search_files("chrout", "symbol")} == {file_id, other_id}
+            odd_id = db.add_processed_file("odd.prg", "odd.prg", "PRG", 0xC000,
+                                           data=bytes([0x00, 0xC0, 0x20, 0xDD, 0x0A, 0x60]))
+            assert db.search_files("ADD", "symbol") == []
+            assert [row["id"] for row in db.search_files("$ADD", "symbol")] == [odd_id]
+            assert [row["id"] for row in db.search_files("0x0add", "symbol")] == [odd_id]
+            assert [row["id"] for row in db.search_files("2781", "symbol")] == [odd_id]
+
+            assert [row["id"] for row in db.search_files("20 D2 FF", "bytes")] == [file_id]
+            assert {row["id"] for row in db.search_files("$D2,$FF", "bytes")} == {file_id, other_id}
+            assert {row["id"] for row in db.search_files("d2ff", "bytes")} == {file_id, other_id}
+            assert db.search_files("20 FF D2", "bytes") == []
+            try:
+                db.search_byte_pattern("2G")
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("ValueError bekleniyordu")
+
+
+if __name__ == "__main__":
+    test_batched_writes_and_counters()
+    test_no_write_lock_held_between_calls()
+    test_chunked_hash_matches_md5()
+    test_content_symbol_and_byte_search()
+    print("✓ DatabaseManager testleri başarılı")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Decompiler yapısal giriş testi - metin ayrıştırma ile aynı sonuç
+"""
+
+import os
+import tempfile
+
+import decompiler_c
+import decompiler_cpp
+import decompiler_qbasic
+from decompiler_records import InstructionRecordsMixin
+from linear_sweep import decode_prg_records
+
+# $0801: LDX #$00 / loop: STA $D020 / INX / BNE loop / JSR $FFD2 / RTS
+PRG = bytes([0x01, 0x08,
+             0xA2, 0x00, 0x8D, 0x20, 0xD0, 0xE8, 0xD0, 0xFA, 0x20, 0xD2, 0xFF, 0x60])
+
+LISTING = """$0801 A2 00     LDX #$00
+$0803 8D 20 D0  STA $D020
+$0806 E8        INX
+$0807 D0 FA     BNE $0803
+$0809 20 D2 FF  JSR $FFD2
+$080C 60        RTS
+"""
+
+
+def _decompile_text(module):
+    fd, path = tempfile.mkstemp(suffix=".asm")
+    with os.fdopen(fd, "w") as f:
+        f.write(LISTING)
+    try:
+        return module.Decompiler(path).decompile()
+    finally:
+        os.remove(path)
+
+
+def test_records_match_listing():
+    """Kayıtlardan ve metinden aynı talimat listesi ve çıktı"""
+    records = decode_prg_records(PRG)
+    assert records[0] == (0x0801, 0xA2, 0x00, 2)
+    for module in (decompiler_c, decompiler_cpp, decompiler_qbasic):
+        assert issubclass(module.Decompiler, InstructionRecordsMixin)
+        from_records = module.Decompiler.from_instructions(records)
+        assert from_records.load_instructions() == [
+            (0x0801, 'LDX', '#$00'), (0x0803, 'STA', 0xD020), (0x0806, 'INX', ''),
+            (0x0807, 'BNE', 0x0803), (0x0809, 'JSR', 0xFFD2), (0x080C, 'RTS', '')]
+        assert from_records.decompile() == _decompile_text(module)
+
+
+def test_decompile_prg_directly():
+    """decompile(prg_data) dosya olmadan çalışmalı"""
+    for module in (decompiler_c, decompiler_cpp, decompiler_qbasic):
+        output = module.Decompiler().decompile(PRG, 0x0801)
+        assert output == _decompile_text(module)
+
+
+if __name__ == "__main__":
+    test_records_match_listing()
+    test_decompile_prg_directly()
+    print("✓ Decompiler kayıt girişi testleri başarılı")
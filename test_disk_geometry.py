@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+disk_geometry testi - ortak track/sector ofset tabloları
+"""
+
+from disk_geometry import (sector_offset, sector_block, block_to_track_sector,
+                           sectors_in_track, get_offset_table)
+from c1541_python_emulator import C1541PythonEmulator
+
+
+def _reference_offset(track, sector, sectors_per_track):
+    """Eski döngüsel hesaplama (karşılaştırma için)"""
+    if not (1 <= track <= len(sectors_per_track)):
+        return -1
+    if sector >= sectors_per_track[track - 1]:
+        return -1
+    return (sum(sectors_per_track[:track - 1]) + sector) * 256
+
+
+def test_d64_table_matches_reference():
+    spt = [21 if t <= 17 else 19 if t <= 24 else 18 if t <= 30 else 17 for t in range(1, 36)]
+    for track in range(0, 40):
+        for sector in range(0, 25):
+            assert sector_offset(track, sector, ".d64") == _reference_offset(track, sector, spt)
+
+
+def test_format_aliases_and_bounds():
+    assert sector_offset(18, 0, "D64") == sector_offset(18, 0, ".d64") == 357 * 256
+    assert sector_offset(36, 0, "d71") == 683 * 256
+    assert sector_offset(40, 3, "d81") == (39 * 40 + 3) * 256
+    assert sector_offset(18, 0, ".tap") == -1
+    assert sector_offset(-1, 0, "d64") == -1
+    assert sector_block(18, 1, "d64") == 358
+    assert len(get_offset_table("d64")) == 36 * 256
+
+
+def test_block_round_trip():
+    for block in range(683):
+        track, sector = block_to_track_sector(block, "d64")
+        assert sector_block(track, sector, "d64") == block
+    assert block_to_track_sector(683, "d64") == (-1, -1)
+    assert sectors_in_track(31, "d64") == 17
+
+
+def test_c1541_uses_shared_geometry():
+    emulator = C1541PythonEmulator()
+    assert emulator.track_sector_to_logical_position(18, 0) == emulator.LOGICAL_BAM_POSITION
+    assert emulator.logical_position_to_track_sector(emulator.LOGICAL_BAM_POSITION) == (18, 0)
+    assert emulator.get_sectors_per_track(25) == 18
+
+
+if __name__ == "__main__":
+    test_d64_table_matches_reference()
+    test_format_aliases_and_bounds()
+    test_block_round_trip()
+    test_c1541_uses_shared_geometry()
+    print("✓ disk_geometry testleri başarılı")
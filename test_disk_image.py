@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DiskImage (mmap) testi - d64_reader ve C1541 emülatörü ile uyumluluk
+"""
+
+import os
+import tempfile
+
+from d64_reader import (DiskImage, open_image, read_image, read_directory,
+                        extract_prg_file, get_sector_offset, D64_SECTOR_COUNT)
+from c1541_python_emulator import C1541PythonEmulator
+
+
+def build_test_d64():
+    """İki sektörlük tek bir PRG içeren D64 imajı oluştur"""
+    data = bytearray(D64_SECTOR_COUNT * 256)
+
+    # Directory sektörü (18/1)
+    dir_off = get_sector_offset(18, 1, ".d64")
+    data[dir_off] = 0
+    data[dir_off + 1] = 0xFF
+    entry = dir_off + 2
+    data[entry + 2] = 0x82  # Kapalı PRG
+    data[entry + 3] = 17
+    data[entry + 4] = 0
+    name = b"HELLO"
+    data[entry + 5:entry + 5 + 16] = name + b"\xa0" * (16 - len(name))
+    data[entry + 28] = 2
+
+    # Dosya zinciri: 17/0 -> 17/1 (son sektörde 10 byte)
+    first = get_sector_offset(17, 0, ".d64")
+    data[first] = 17
+    data[first + 1] = 1
+    data[first + 2:first + 256] = bytes((i & 0xFF) for i in range(254))
+    second = get_sector_offset(17, 1, ".d64")
+    data[second] = 0
+    data[second + 1] = 10
+    data[second + 2:second + 12] = b"0123456789"
+    return bytes(data)
+
+
+def _write_temp(data):
+    fd, path = tempfile.mkstemp(suffix=".d64")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return path
+
+
+def test_open_image_matches_read_image():
+    """mmap imaj ile klasik okuma aynı sonucu vermeli"""
+    path = _write_temp(build_test_d64())
+    try:
+        classic, ext = read_image(path)
+        with DiskImage(path) as image:
+            assert len(image) == len(classic)
+            assert read_directory(image, ext) == read_directory(classic, ext)
+
+            entry = read_directory(image, ext)[0]
+            prg_mmap = extract_prg_file(image, entry["track"], entry["sector"], ext)
+            prg_classic = extract_prg_file(classic, entry["track"], entry["sector"], ext)
+            assert prg_mmap == prg_classic
+            assert isinstance(prg_mmap, bytes)
+            assert len(prg_mmap) == 254 + 10
+            assert image.read_chain(17, 0) == prg_mmap
+    finally:
+        os.remove(path)
+
+
+def test_sector_is_zero_copy_view():
+    """Sektörler memoryview olarak dönmeli"""
+    image = DiskImage.from_bytes(build_test_d64(), ".d64")
+    block = image.sector(17, 1)
+    assert isinstance(block, memoryview)
+    assert len(block) == 256
+    assert bytes(block[2:12]) == b"0123456789"
+    assert image.sector(36, 0) is None
+
+
+def test_iter_chain_is_lazy():
+    """Zincir bağlantıları sektör üretildikçe izlenmeli"""
+    data = bytearray(build_test_d64())
+    data[get_sector_offset(17, 0, ".d64")] = 99  # ikinci bağlantı geçersiz
+    chain = DiskImage.from_bytes(data, ".d64").iter_chain(17, 0)
+    assert len(next(chain)) == 254
+    try:
+        next(chain)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Geçersiz bağlantı ikinci sektörde hata vermeliydi")
+
+
+def test_close_with_live_views():
+    """Açık sektör görünümü varken close() imajı kullanılabilir bırakmalı"""
+    path = _write_temp(build_test_d64())
+    try:
+        image = DiskImage(path)
+        block = image.sector(17, 1)
+        try:
+            image.close()
+        except BufferError:
+            pass
+        else:
+            raise AssertionError("BufferError bekleniyordu")
+        assert image.read_chain(17, 0).endswith(b"0123456789")
+        block.release()
+        image.close()
+        assert image._file is None and image._mmap is None
+    finally:
+        os.remove(path)
+
+
+def test_c1541_accepts_disk_image():
+    """C1541 emülatörü DiskImage kabul etmeli"""
+    path = _write_temp(build_test_d64())
+    try:
+        image, ext = open_image(path)
+        try:
+            emulator = C1541PythonEmulator()
+            assert emulator.read_directory(image) == emulator.read_directory(bytes(image))
+            data = emulator.read_file_data(image, 17, 0)
+            assert data == emulator.read_file_data(bytes(image), 17, 0)
+            assert data.endswith(b"012345678")
+        finally:
+            image.close()
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    test_open_image_matches_read_image()
+    test_sector_is_zero_copy_view()
+    test_iter_chain_is_lazy()
+    test_close_with_live_views()
+    test_c1541_accepts_disk_image()
+    print("✓ DiskImage testleri başarılı")
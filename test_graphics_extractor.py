@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Grafik çıkarıcı testi - hizalı pencere puanlama, çakışma bastırma ve piksel çözme
+"""
+
+import random
+
+from graphics_extractor import (KOALA_SIZE, analyze_prg, bitmap_pixels, charset_pixels,
+                                color_pixels, find_graphics)
+
+
+def _charset():
+    def glyph(code):
+        edge = (code * 37) & 0x7E
+        middle = (code * 91) & 0x3C | 0x42
+        return bytes([0, edge, edge, middle, middle, edge, edge, 0])
+    return b"".join(glyph(code) for code in range(256))
+
+
+def _bitmap():
+    """Dama tahtası + daire, hücre düzeninde 320x200 hi-res"""
+    bitmap = bytearray(8192)
+    for y in range(200):
+        for x in range(320):
+            if ((x // 16 + y // 10) % 2) ^ ((x - 160) ** 2 + (y - 100) ** 2 < 3600):
+                bitmap[(y // 8) * 320 + (x // 8) * 8 + y % 8] |= 0x80 >> (x % 8)
+    return bytes(bitmap)
+
+
+def _code(size):
+    rng = random.Random(1)
+    return bytes(rng.randrange(256) for _ in range(size))
+
+
+def test_find_graphics_layout():
+    screen = bytes(0x20 if i % 40 > 20 else (i // 40) % 26 + 1 for i in range(1000)) + bytes(24)
+    colors = bytes((i // 40) % 3 + 1 for i in range(1000)) + bytes(24)
+    data = _code(4096) + _charset() + bytes(2048) + _bitmap() + screen + colors
+    blocks = [(b.kind, b.address, b.mode) for b in find_graphics(data, 0x0000)]
+    assert blocks == [('charset', 0x1000, ''), ('bitmap', 0x2000, 'hires'),
+                      ('screen', 0x4000, ''), ('color', 0x4400, '')]
+    assert find_graphics(_code(16384), 0x0801) == []
+
+
+def test_alignment_follows_load_address():
+    # $0801'de yüklenen PRG: charset $0800 hizası için ofset $07FF
+    prg = b"\x01\x08" + _code(0x07FF) + _charset()
+    result = analyze_prg(prg)
+    assert [(b['kind'], b['address'], b['offset']) for b in result['blocks']] == [('charset', 0x1000, 0x07FF)]
+
+    koala = b"\x00\x60" + _bitmap()[:8000] + bytes([0x12]) * 2000 + b"\x00"
+    assert len(koala) == KOALA_SIZE + 2
+    assert analyze_prg(koala)['blocks'][0]['kind'] == 'koala'
+
+
+def test_pixel_decoding():
+    rows = [list(row) for row in charset_pixels(_charset(), fg=1, bg=0)]
+    assert len(rows) == 128 and len(rows[0]) == 128
+    edge = (1 * 37) & 0x7E  # glyph 1, satır 1
+    assert rows[1][8:16] == [(edge >> (7 - i)) & 1 for i in range(8)]
+
+    bitmap = bytes([0b10000001]) + bytes(7999)
+    hires = [list(row) for row in bitmap_pixels(bitmap, bytes([0x52]) * 1000)]
+    assert hires[0][:8] == [5, 2, 2, 2, 2, 2, 2, 5] and hires[1][0] == 2
+
+    bitmap = bytes([0b00011011]) + bytes(7999)
+    multi = [list(row) for row in bitmap_pixels(bitmap, bytes([0x52]) * 1000, bytes([7]) * 1000,
+                                                 background=6, multicolor=True)]
+    assert multi[0][:8] == [6, 6, 5, 5, 2, 2, 7, 7]
+    assert [list(row) for row in color_pixels(bytes([0xF3]) * 1000)][24][39] == 3
+
+
+if __name__ == "__main__":
+    test_find_graphics_layout()
+    test_alignment_follows_load_address()
+    test_pixel_decoding()
+    print("✓ Grafik çıkarıcı testleri başarılı")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hex view modeli testi - satır biçimi, adrese atlama ve dirty satır takibi
+"""
+
+from hex_view import HexView
+
+
+def _legacy_row(data, start_address, row, width=16):
+    """Eski HexEditor.refresh_display satır biçimi"""
+    offset = row * width
+    hex_part = ""
+    ascii_part = ""
+    for col in range(width):
+        if offset + col < len(data):
+            byte = data[offset + col]
+            hex_part += f"{byte:02X} "
+            ascii_part += chr(byte) if 32 <= byte <= 126 else "."
+        else:
+            hex_part += "   "
+            ascii_part += " "
+    return f"{start_address + offset:04X}: " + hex_part + " | " + ascii_part
+
+
+def test_rows_match_legacy_format():
+    data = bytes(range(256)) + b"HELLO"
+    model = HexView(data, 0x0801)
+    assert model.row_count == 17
+    for row in range(model.row_count):
+        assert model.format_row(row) == _legacy_row(data, 0x0801, row)
+    assert model.format_rows(16, 40) == [_legacy_row(data, 0x0801, 16)]
+    assert HexView(b"").format_rows(0, 10) == []
+
+
+def test_jump_to_address():
+    model = HexView(bytes(0x10000), 0)
+    assert model.row_of_address(0xD020) == 0xD02
+    assert model.row_address(0xD02) == 0xD020
+    assert model.row_of_address(0x10000) is None
+    assert HexView(b"\x00" * 32, 0xC000).row_of_address(0xBFFF) is None
+
+
+def test_patch_in_place_marks_dirty_rows():
+    buffer = bytearray(64)
+    model = HexView(buffer, 0x1000)
+    assert model.patch(0x100E, [0xA9, 0x01, 0x8D, 0x20]) == range(0, 2)
+    assert buffer[14:18] == bytes([0xA9, 0x01, 0x8D, 0x20])  # kopyasız, yerinde
+    assert model.read(0x100E, 2) == b"\xA9\x01"
+    assert model.pop_dirty_rows(1, 3) == [1]
+    assert model.pop_dirty_rows() == [0]
+    assert model.pop_dirty_rows() == []
+    assert model.modified_rows == {0, 1}
+
+    for address, values, error in ((0x103F, b"\x00\x00", IndexError), (0x1000, [256], ValueError)):
+        try:
+            model.patch(address, values)
+        except error:
+            pass
+        else:
+            raise AssertionError(f"{error.__name__} bekleniyordu")
+
+    readonly = HexView(b"\x01\x02", 0)
+    readonly.patch(0, b"\xFF")
+    assert readonly.tobytes() == b"\xFF\x02"
+
+
+if __name__ == "__main__":
+    test_rows_match_legacy_format()
+    test_jump_to_address()
+    test_patch_in_place_marks_dirty_rows()
+    print("✓ Hex view testleri başarılı")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Derlenmiş C64 bilgi tabanı testi - ikili indeks, öncelik ve yeniden derleme
+"""
+
+import json
+import os
+import tempfile
+
+from c64_knowledge_base import (KnowledgeBase, compile_knowledge_base, get_knowledge_base,
+                                is_stale, parse_address)
+from c64_memory_manager import C64MemoryMapManager
+
+
+def _write(root, relative, data):
+    path = os.path.join(root, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def _make_rom_data(root):
+    _write(root, "zeropage/zeropage_vars.json", {
+        "$0002-$0004": {"name": "user_vars", "description": "genel"},
+        "$0003": {"name": "ZP3", "description": "özel"},
+    })
+    _write(root, "zeropage/user_zeropage.json", {
+        "$0002": {"name": "user_var1"}, "$0005": {"name": "user_var4"},
+    })
+    _write(root, "kernal/kernal_functions.json", {"$FFD2": {"name": "CHROUT", "size": 3}})
+    _write(root, "kernal/kernal_routines.json", {"$FFD2": {"name": "BSOUT"}})
+    _write(root, "kernal/io_registers.json", {"$D020": {"name": "EXTCOL", "bits": {"0": "renk"}}})
+    _write(root, "memory_maps/c64_memory_map.json", {
+        "$0000": {"end_addr": "$00FF", "name": "Zero Page"},
+        "$E000": {"end_addr": "$FFFF", "name": "KERNAL ROM", "type": "ROM"},
+    })
+    _write(root, "memory_maps/memory_areas.json", {
+        "$0000": {"end_addr": "$00FF", "name": "Zero Page (alan)"},
+        "$00FB": {"end_addr": "$00FE", "name": "Free ZP"},
+    })
+
+
+def test_parse_address():
+    assert parse_address("$D020") == parse_address("0xd020") == parse_address(53280) == 0xD020
+    assert parse_address("53280") == 0xD020 and parse_address("FF") == 0xFF
+    assert parse_address("$10000") is None and parse_address("xyz") is None
+
+
+def test_compile_and_lookup():
+    """Dar tanım geniş aralığı, ilk kaynak sonrakini, fallback boş slotu doldurur"""
+    with tempfile.TemporaryDirectory() as tmp:
+        _make_rom_data(tmp)
+        path = compile_knowledge_base(tmp)
+        with KnowledgeBase(path) as kb:
+            assert kb.name(0x0003) == "ZP3"
+            assert kb.name(0x0002) == kb.name(0x0004) == "user_vars"
+            assert kb.name(0x0005) == "user_var4"
+            assert kb.name(0xFFD2) == "CHROUT" and kb.name(0x1234) is None
+            chrout = kb.symbol(0xFFD2)
+            assert (chrout["type"], chrout["source"], chrout["size"]) == ("kernal", "KERNAL", 3)
+            assert kb.symbol(0xD020)["bits"] == {"0": "renk"}
+            assert kb.symbol(0x0004)["address"] == "$0002-$0004"
+
+            assert kb.region(0x00FC)["name"] == "Free ZP"
+            assert kb.region(0x0010)["name"] == "Zero Page"
+            kernal = kb.region(0xFFFF)
+            assert (kernal["start"], kernal["end"], kernal["memory_type"]) == (0xE000, 0xFFFF, "ROM")
+            assert kb.region(0x8000) is None and kb.symbol(0x10000) is None
+            assert kb.lookup(0xE123)["name"] == "KERNAL ROM"
+
+
+def test_rebuild_when_sources_change():
+    with tempfile.TemporaryDirectory() as tmp:
+        _make_rom_data(tmp)
+        path = os.path.join(tmp, "kb.bin")
+        assert is_stale(path, tmp)
+        compile_knowledge_base(tmp, path)
+        assert not is_stale(path, tmp)
+        _write(tmp, "kernal/kernal_functions.json", {"$FFD2": {"name": "CHROUT2", "size": 3}})
+        assert is_stale(path, tmp)
+
+        kb = get_knowledge_base(tmp, path)
+        assert kb is get_knowledge_base(tmp, path)
+        assert kb.name(0xFFD2) == "CHROUT2"
+        kb.close()
+
+
+def test_memory_manager_uses_knowledge_base():
+    with tempfile.TemporaryDirectory() as tmp:
+        _make_rom_data(tmp)
+        manager = C64MemoryMapManager(tmp)
+        assert manager.knowledge_base is not None
+        assert manager.get_routine_info(0xFFD2)["name"] == "CHROUT"
+        assert manager.get_routine_info(0xD020) is None
+        assert manager.get_memory_info(0xD020)["type"] == "io_register"
+        area = manager.get_memory_info(0xE010)
+        assert (area["type"], area["offset"]) == ("memory_area", 0x10)
+        assert manager.format_routine_call(0xFFD2, "qbasic") == "CHROUT"
+        manager.knowledge_base.close()
+
+
+if __name__ == "__main__":
+    test_parse_address()
+    test_compile_and_lookup()
+    test_rebuild_when_sources_change()
+    test_memory_manager_uses_knowledge_base()
+    print("✓ Bilgi tabanı testleri başarılı")
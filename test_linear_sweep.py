@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Linear sweep testi - toplu instruction sınırları ve aralık dolaşma
+"""
+
+import random
+
+import linear_sweep
+from disassembler import Disassembler
+
+
+def test_boundaries_and_operands():
+    """Sınırlar, operand'lar ve eksik son instruction"""
+    code = bytes([0xA9, 0x41, 0x20, 0xD2, 0xFF, 0x02, 0xBD, 0x00])
+    result = linear_sweep.sweep(code, 0x0801)
+    assert list(result.iter_range()) == [
+        (0x0801, 0xA9, 2, 0x41),
+        (0x0803, 0x20, 3, 0xFFD2),
+        (0x0806, 0x02, 1, None),
+        (0x0807, 0xBD, 3, None),
+    ]
+    assert result.truncated
+
+
+def test_iter_only_requested_range():
+    """Sadece istenen aralık dolaşılmalı"""
+    code = bytes([0xA9, 0x41, 0x20, 0xD2, 0xFF, 0x60]) * 100
+    result = linear_sweep.sweep(code, 0x1000)
+    assert list(result.iter_range(0x1006, 0x100C)) == [
+        (0x1006, 0xA9, 2, 0x41), (0x1008, 0x20, 3, 0xFFD2), (0x100B, 0x60, 1, None)]
+    assert list(result.iter_range(0x2000, 0x3000)) == []
+
+
+def test_matches_basic_disassembler():
+    """Rastgele kodda basic motor ile aynı instruction sınırları"""
+    random.seed(7)
+    code = bytes(random.randrange(256) for _ in range(4096))
+    result = linear_sweep.sweep(code, 0xC000, use_numpy=False)
+    expected = [line.split(":")[0] for line in Disassembler(0xC000, code).disassemble()]
+    assert [f"${address:04X}" for address, _, _, _ in result.iter_range()] == expected
+
+
+def test_numpy_matches_python():
+    """NumPy varsa iki yol aynı sonucu vermeli"""
+    if not linear_sweep.NUMPY_AVAILABLE:
+        return
+    random.seed(11)
+    for size in (0, 1, 2, 3, 1000, 65536):
+        code = bytes(random.randrange(256) for _ in range(size))
+        python_result = linear_sweep.sweep(code, use_numpy=False)
+        numpy_result = linear_sweep.sweep(code, use_numpy=True)
+        assert list(python_result.iter_range()) == list(numpy_result.iter_range())
+
+
+if __name__ == "__main__":
+    test_boundaries_and_operands()
+    test_iter_only_requested_range()
+    test_matches_basic_disassembler()
+    test_numpy_matches_python()
+    print("✓ Linear sweep testleri başarılı")
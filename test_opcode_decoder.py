@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Opcode Decoder testi - ortak 256 opcode tablosu ve motor uyumluluğu
+"""
+
+import json
+import os
+import tempfile
+
+import opcode_decoder
+from disassembler import Disassembler
+from opcode_manager import OpcodeManager
+
+
+def test_tables_cover_all_opcodes():
+    """Tüm diziler 256 eleman, resmi opcode'lar hex_opcode_map.json ile aynı"""
+    for table in (opcode_decoder.MNEMONIC_ID, opcode_decoder.LENGTH, opcode_decoder.MODE,
+                  opcode_decoder.CYCLES, opcode_decoder.PAGE_PENALTY,
+                  opcode_decoder.FLAGS_READ, opcode_decoder.FLAGS_WRITTEN, opcode_decoder.LEGAL):
+        assert len(table) == 256
+
+    with open(os.path.join(os.path.dirname(__file__), "hex_opcode_map.json"), encoding="utf-8") as f:
+        hex_map = json.load(f)
+    legal = {op for op in range(256) if opcode_decoder.LEGAL[op]}
+    assert legal == {int(key, 16) for key in hex_map}
+    for key, info in hex_map.items():
+        op = int(key, 16)
+        assert opcode_decoder.OPCODE_MNEMONICS[op] == info["mnemonic"]
+        assert opcode_decoder.LENGTH[op] == info["length"]
+
+
+def test_modes_cycles_and_flags():
+    """Adresleme modu, cycle ve flag bilgileri"""
+    assert opcode_decoder.addressing_mode_name(0xBD) == "absolute_x"
+    assert opcode_decoder.addressing_mode_class(0xB1) == "zeropage"
+    assert opcode_decoder.addressing_mode_class(0xA9) == "immediate"
+    assert opcode_decoder.CYCLES[0xBD] == 4 and opcode_decoder.PAGE_PENALTY[0xBD] == 1
+    assert opcode_decoder.CYCLES[0x9D] == 5 and opcode_decoder.PAGE_PENALTY[0x9D] == 0
+    assert opcode_decoder.FLAGS_READ[0x69] & opcode_decoder.FLAG_C
+    assert opcode_decoder.FLAGS_WRITTEN[0x69] & opcode_decoder.FLAG_V
+    assert opcode_decoder.FLAGS_READ[0xD0] == opcode_decoder.FLAG_Z
+    assert not opcode_decoder.is_legal(0xA7)
+    assert opcode_decoder.OPCODE_MNEMONICS[0xA7] == "LAX"
+
+
+def test_decode_and_format():
+    """Instruction çözme ve metne çevirme"""
+    code = bytes([0xBD, 0x00, 0xD0, 0x6C, 0xFC, 0xFF, 0xA9])
+    assert opcode_decoder.decode(code, 0) == (0xBD, 3, 0xD000)
+    assert opcode_decoder.format_instruction(0xBD, 0xD000) == "LDA $D000,X"
+    assert opcode_decoder.format_instruction(0x6C, 0xFFFC) == "JMP ($FFFC)"
+    assert opcode_decoder.format_instruction(0x0A) == "ASL A"
+    # Eksik operand
+    assert opcode_decoder.decode(code, 6) == (0xA9, 2, None)
+    assert opcode_decoder.format_instruction(0xA9, None) == ".BYTE $A9"
+
+
+def test_engines_share_table():
+    """Disassembler ve OpcodeManager aynı tabloyu kullanmalı"""
+    lines = Disassembler(0x1000, bytes([0xA9, 0x41, 0x91, 0xFB, 0x02, 0x60])).disassemble()
+    assert lines[0].endswith("LDA #$41")
+    assert lines[1].endswith("STA ($FB),Y")
+    assert lines[2].endswith(".BYTE $02")
+    assert lines[3].endswith("RTS")
+
+    manager = OpcodeManager()
+    assert manager.opcodes[0xBD] == ("LDA $%04X,X", 3, "LDA")
+    assert manager.opcodes[0x02] == (".BYTE $02", 1, "UNKNOWN")
+    assert manager.addressing_modes[0xBD] == "absolute_x"
+
+
+def test_pickle_cache_roundtrip():
+    """Pickle önbelleği yazılıp okunabilmeli"""
+    path = os.path.join(tempfile.mkdtemp(), "opcodes.pickle")
+    opcode_decoder.save_tables(path)
+    tables = opcode_decoder.load_tables(path)
+    assert tables is not None
+    assert tables["length"] == opcode_decoder.LENGTH
+    assert tables["mnemonics"] == opcode_decoder.MNEMONICS
+    os.remove(path)
+    assert opcode_decoder.load_tables(path) is None
+
+
+if __name__ == "__main__":
+    test_tables_cover_all_opcodes()
+    test_modes_cycles_and_flags()
+    test_decode_and_format()
+    test_engines_share_table()
+    test_pickle_cache_roundtrip()
+    print("✓ Opcode decoder testleri başarılı")
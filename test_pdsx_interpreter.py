@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pdsX yorumlayıcı testi - bytecode derleme ve atlama tablosu
+"""
+
+import contextlib
+import io
+
+from pdsx import (ARENA_BASE, ArrayInstance, Expr, MemoryManager, Op, PdsXRuntimeError, PdsXTypeError,
+                  build_block_table, classify_statement, compile_statement, pdsXInterpreter)
+
+
+def _run(code):
+    """Programı sessizce çalıştır, yorumlayıcıyı ve çıktıyı döndür"""
+    interpreter = pdsXInterpreter()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        interpreter.run(code)
+    return interpreter, output.getvalue()
+
+
+def test_classify_statement_matches_dispatch_order():
+    assert classify_statement("DIM A AS INTEGER") == Op.DIM
+    assert classify_statement("X = 1") == Op.ASSIGN
+    assert classify_statement("REM yorum") == Op.NOP
+    assert classify_statement("'yorum") == Op.NOP
+    assert classify_statement("RETURN") == Op.RETURN
+    assert classify_statement("READ #1, A") == Op.FILE  # FILE dalı DATA'dan önce
+    assert classify_statement("ELSEIF X THEN") == Op.IF
+    assert classify_statement("LOOP UNTIL X") == Op.DO
+    assert classify_statement("FOO(1)") == Op.EXPR
+
+
+def test_compile_statement_preparses_operands():
+    assert compile_statement('PRINT "a, b", X , Y').args == ('"a, b"', "X", "Y")
+    assert compile_statement("LET A = B + 1").args == ("A", "B + 1")
+    assert compile_statement("  X = Y == 2").args == ("X", "Y == 2")
+    assert compile_statement("FOR I=1 TO N STEP -2").args == ("FOR", "I", "1", "N", "-2")
+    assert compile_statement("NEXT").args == ("NEXT", None)
+    assert compile_statement("IF A > 1 THEN").args == ("IF", "A > 1")
+    assert compile_statement("LOOP WHILE K < 3").args == ("LOOP", "WHILE", "K < 3")
+    assert compile_statement("WHILE X < 3", "main") == (Op.WHILE, "WHILE X < 3", "main", ("WHILE", "X < 3"))
+    assert compile_statement("DIM A(3) AS INTEGER").args is None
+
+
+def test_parse_program_builds_bytecode_and_runs_loops():
+    interpreter, output = _run("S = 0\nFOR I = 1 TO 100\nS = S + I\nNEXT I\n"
+                               "IF S > 10 THEN\nPRINT \"big\", S\nELSE\nPRINT \"small\"\nEND IF\n"
+                               "K = 0\nDO\nK = K + 2\nLOOP UNTIL K >= 6\n")
+    assert [instruction.text for instruction in interpreter.bytecode] == \
+        [line for line, _scope in interpreter.program]
+    assert interpreter.current_scope()["S"] == 5050
+    assert interpreter.current_scope()["K"] == 6
+    assert "big 5050" in output and "small" not in output
+    assert len(interpreter.dispatch_table) == len(Op)
+
+
+def test_execute_command_caches_instructions():
+    interpreter = pdsXInterpreter()
+    for _ in range(3):
+        interpreter.execute_command("X = 5")
+    assert interpreter.current_scope()["X"] == 5
+    assert list(interpreter.instruction_cache) == [("X = 5", None)]
+    try:
+        interpreter.execute_command("SELECT CASE X")  # işleyici çağrı anında aranır
+    except Exception as e:
+        assert "PDSX" in str(e)
+    else:
+        raise AssertionError("Çalışma zamanı hatası bekleniyordu")
+
+
+def test_expressions_compile_once_and_resolve_slots():
+    interpreter = pdsXInterpreter()
+    scope = interpreter.current_scope()
+    scope.update({"A": 3, "B": 4, "K": 10, "L": [1, 2]})
+    assert interpreter.evaluate_expression("A * 2 + B") == 10
+    compiled = interpreter.expr_cache["A * 2 + B"]
+    assert compiled.kind == Expr.COMPLEX and compiled.payload[2] == ("A", "B")
+    scope["A"] = 5
+    assert interpreter.evaluate_expression("A * 2 + B") == 14
+    assert interpreter.expr_cache["A * 2 + B"] is compiled  # yeniden derlenmez
+
+    interpreter.global_vars["G"] = 1
+    assert interpreter.evaluate_expression("G + PI > 4") is True
+    assert interpreter.evaluate_expression("sum([x * K for x in L])") == 30  # iç içe kod nesnesi
+    assert interpreter.evaluate_expression(" 42 ") == 42
+    assert interpreter.evaluate_expression('"a b"') == "a b"
+    assert interpreter.evaluate_expression("ABS(-2)") == 2
+    assert interpreter.expr_cache["ABS(-2)"].kind == Expr.CALL
+    assert interpreter.evaluate_expression("A") == 5 and interpreter.expr_cache["A"].kind == Expr.VAR
+    for bad in ("YOK + 1", "1 +"):
+        try:
+            interpreter.evaluate_expression(bad)
+        except PdsXRuntimeError as e:
+            assert "Karmaşık ifade hatası" in str(e)
+        else:
+            raise AssertionError(f"{bad!r} hata vermeliydi")
+
+
+def test_block_table_resolves_partners():
+    lines = ["IF A THEN", "WHILE B", "EXIT WHILE", "WEND", "ELSE", "DO WHILE C", "EXIT DO",
+             "LOOP", "END IF", "FOR I = 1 TO 2", "EXIT FOR", "NEXT I", "WHILE D"]
+    targets = build_block_table([compile_statement(line) for line in lines])
+    assert targets[0] == 5      # IF yanlış -> ELSE'ten sonrası
+    assert targets[4] == 9      # ELSE -> END IF'ten sonrası
+    assert targets[1] == targets[2] == 4
+    assert targets[5] == targets[6] == 8
+    assert targets[10] == 12
+    assert targets[12] == 13    # kapanmamış WHILE -> program sonu
+    assert targets[3] is None and targets[9] is None
+
+
+def test_structured_jumps_and_labels():
+    interpreter, output = _run("\n".join([
+        "Y = 0", "N = 0",
+        "WHILE Y < 3", "Y = Y + 1", "I = 0", "WHILE I < 2", "I = I + 1", "N = N + 1", "WEND", "WEND",
+        "Z = 0", "WHILE Z < 100", "Z = Z + 1", "IF Z == 5 THEN", "EXIT WHILE", "END IF", "WEND",
+        "k = 0", "DO WHILE k < 4", "k = k + 1", "LOOP",
+        "DO", "k = k + 1", "IF k > 6 THEN", "EXIT DO", "END IF", "LOOP",
+        "C = 0", "GOSUB ARTIR", "GOSUB ARTIR", "GOTO SON", "C = 100",
+        "LABEL ARTIR", "C = C + 1", "RETURN",
+        "LABEL SON", "PRINT \"bitti\", C",
+    ]))
+    scope = interpreter.current_scope()
+    assert (scope["Y"], scope["N"], scope["Z"], scope["k"], scope["C"]) == (3, 6, 5, 7, 2)
+    assert interpreter.loop_stack == [] and interpreter.gosub_stack == []
+    assert interpreter.goto_labels["SON"] == len(interpreter.program) - 1
+    assert "bitti 2" in output
+
+
+def test_typed_array_storage_and_bulk_operations():
+    interpreter = pdsXInterpreter()
+    table, types = interpreter.type_table, interpreter.types
+    grid = ArrayInstance([3, 4], "DOUBLE", table, types)
+    assert grid.is_typed and grid.elements.typecode == "d" and len(grid) == 12
+    assert grid.get_element([2, 3]) == 0.0  # sıfırla başlatılır
+    grid.set_element([1, 2], 5)
+    assert grid.get_element([1, 2]) == 5.0 and grid.buffer().nbytes == 12 * 8
+
+    counts = ArrayInstance([4], "INTEGER", table, types)
+    counts.set_element([0], 2.9)
+    counts.set_element([1], "7")
+    assert counts.get_slice(0, 2) == [2, 7]
+    for indices, value, error in (([4], 1, PdsXRuntimeError), ([0], "x", PdsXTypeError)):
+        try:
+            counts.set_element(indices, value)
+        except error:
+            pass
+        else:
+            raise AssertionError(f"{error.__name__} bekleniyordu")
+    try:
+        ArrayInstance([2], "BYTE", table, types).set_element([0], 256)
+    except PdsXTypeError:
+        pass
+    else:
+        raise AssertionError("BYTE taşması hata vermeliydi")
+
+    grid.fill(1.5, 4, 4)
+    assert grid.get_slice(3, 9) == [0.0, 1.5, 1.5, 1.5, 1.5, 0.0]
+    counts.copy_from(grid, 3, dst_start=1, src_start=4)
+    assert counts.get_slice() == [2, 1, 1, 1]
+    names = ArrayInstance([3], "STRING", table, types)
+    assert not names.is_typed and names.get_element([0]) is None
+    names.fill(1)
+    assert names.get_slice() == ["1", "1", "1"]
+
+
+def test_memset_memcpy_map_to_array_buffers():
+    interpreter, _output = _run("\n".join([
+        "DIM A(4, 5) AS DOUBLE", "DIM B(4, 5) AS INTEGER", "DIM S(3) AS STRING",
+        "MEMSET A, 0.5", "MEMSET A(2, 0), 9, 5", "MEMCPY B, A, 15", "MEMCPY B(3, 0), A(2, 0), 2",
+        "MEMSET S(1), \"z\", 2",
+    ]))
+    scope = interpreter.current_scope()
+    assert scope["A"].get_slice(8, 12) == [0.5, 0.5, 9.0, 9.0]
+    assert scope["B"].get_slice(9, 17) == [0, 9, 9, 9, 9, 9, 9, 9]
+    assert scope["S"].get_slice() == [None, "z", "z"]
+
+
+def test_memory_manager_arena_reuses_size_classes():
+    manager = MemoryManager(initial_size=64)
+    small = manager.allocate(10, "BYTE")
+    values = manager.allocate(24, "DOUBLE")
+    large = manager.allocate(5000)
+    assert (small, values) == (ARENA_BASE, ARENA_BASE + 16)
+    assert large == ARENA_BASE + 48 and len(manager.arena) >= 5048
+
+    manager.write(values, 2.5, "DOUBLE", 1)
+    manager.set_value(small, "hi")
+    assert manager.read(values, "DOUBLE", 1) == 2.5 and manager.read_string(small) == "hi"
+    manager.set_value(values, [1, 2, 3])
+    assert manager.read(values + 16, "DOUBLE") == 3.0
+    assert bytes(manager.dereference(small)[:3]) == b"hi\x00"
+    manager.memset(large + 10, 0xAB, 4)
+    manager.memcpy(values, large + 8, 8)
+    assert manager.read_bytes(values, 8) == b"\x00\x00\xab\xab\xab\xab\x00\x00"
+
+    for operation in (lambda: manager.read(small + 8, "DOUBLE"), lambda: manager.write(small, 300, "BYTE")):
+        try:
+            operation()
+        except (PdsXRuntimeError, PdsXTypeError):
+            pass
+        else:
+            raise AssertionError("Geçersiz bellek erişimi hata vermeliydi")
+
+    manager.release(values)
+    assert manager.allocate(30) == values  # aynı boyut sınıfı yeniden kullanılır
+    assert manager.read_bytes(values, 8) == bytes(8)
+    manager.release(large)
+    assert manager.allocate(4500) == large
+    stats = manager.get_memory_stats()
+    assert stats["allocations"] == 3 and stats["total_allocated"] == 10 + 30 + 4500
+
+
+def test_pointers_use_arena_addresses():
+    interpreter, _output = _run("\n".join([
+        "MALLOC P SIZE 16 AS DOUBLE", "MALLOC Q SIZE 8 AS DOUBLE",
+        "*P = 1.5", "*Q = 4", "X = *P", "MEMSET P, 0, 8", "Y = *P",
+    ]))
+    scope = interpreter.current_scope()
+    assert (scope["X"], scope["Y"]) == (1.5, 0.0)
+    first, second = scope["P"], scope["Q"]
+    assert interpreter.memory_manager.contains(first.address)
+    assert first.add_offset(2).address == second.address  # bloklar arası aritmetik
+    assert second.dereference() == 4.0
+    interpreter.execute_command("FREE Q")
+    assert scope["Q"].address is None and interpreter.memory_manager.get_memory_stats()["allocations"] == 1
+    try:
+        first.add_offset(2)
+    except PdsXRuntimeError:
+        pass
+    else:
+        raise AssertionError("Serbest bırakılan bloğa aritmetik hata vermeliydi")
+
+
+if __name__ == "__main__":
+    test_classify_statement_matches_dispatch_order()
+    test_compile_statement_preparses_operands()
+    test_parse_program_builds_bytecode_and_runs_loops()
+    test_execute_command_caches_instructions()
+    test_expressions_compile_once_and_resolve_slots()
+    test_block_table_resolves_partners()
+    test_structured_jumps_and_labels()
+    test_typed_array_storage_and_bulk_operations()
+    test_memset_memcpy_map_to_array_buffers()
+    test_memory_manager_arena_reuses_size_classes()
+    test_pointers_use_arena_addresses()
+    print("✓ pdsX yorumlayıcı testleri başarılı")
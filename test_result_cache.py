@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+result_cache testi - içerik adresli disassembly/decompile önbelleği
+"""
+
+import os
+import tempfile
+
+import result_cache
+from result_cache import ResultCache, content_hash, engines_version
+
+PRG = bytes.fromhex("0108a94120d2ff60")
+
+
+def test_key_depends_on_every_component():
+    base = ResultCache.make_key(PRG, "improved", "asm", {"illegal": False}, "1")
+    assert base["content_hash"] == content_hash(PRG)
+    assert base == ResultCache.make_key(PRG, "improved", "asm", {"illegal": False}, "1")
+    variants = [
+        ResultCache.make_key(PRG + b"\x00", "improved", "asm", {"illegal": False}, "1"),
+        ResultCache.make_key(PRG, "advanced", "asm", {"illegal": False}, "1"),
+        ResultCache.make_key(PRG, "improved", "c", {"illegal": False}, "1"),
+        ResultCache.make_key(PRG, "improved", "asm", {"illegal": True}, "1"),
+        ResultCache.make_key(PRG, "improved", "asm", {"illegal": False}, "2"),
+    ]
+    assert len({v["cache_key"] for v in variants} | {base["cache_key"]}) == 6
+
+
+def test_get_put_and_get_or_compute():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResultCache(os.path.join(tmp, "cache.db"))
+        key = cache.make_key(PRG, "improved", "asm")
+        assert cache.get(key) is None
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return "LDA #$41"
+
+        assert cache.get_or_compute(key, compute) == "LDA #$41"
+        assert cache.get_or_compute(key, compute) == "LDA #$41"
+        assert len(calls) == 1
+        stats = cache.get_statistics()
+        assert stats["entries"] == 1 and stats["hits"] == 1
+        cache.close()
+
+        # Yeniden açılınca kayıt kalıcı olmalı
+        reopened = ResultCache(os.path.join(tmp, "cache.db"))
+        assert reopened.get(key) == "LDA #$41"
+        reopened.close()
+
+
+def test_lru_eviction_by_entry_count():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResultCache(os.path.join(tmp, "cache.db"), max_entries=10)
+        keys = [cache.make_key(bytes([i, 8, 0x60]), "improved", "asm") for i in range(10)]
+        for i, key in enumerate(keys):
+            cache.put(key, f"program {i}")
+        # İlk kaydı taze tut, sonra sınırı aş
+        assert cache.get(keys[0]) == "program 0"
+        cache.put(cache.make_key(b"\x00\x10\x60", "improved", "asm"), "yeni")
+        cache.evict()
+        assert cache.get_statistics()["entries"] <= 9
+        assert cache.get(keys[0]) == "program 0"
+        assert cache.get(keys[1]) is None
+        cache.close()
+
+
+def test_engines_version_follows_project_imports():
+    from improved_disassembler import ImprovedDisassembler
+
+    version = engines_version(ImprovedDisassembler)
+    assert version == engines_version(ImprovedDisassembler, None)
+    assert "opcode_decoder" in {module.__name__ for module in result_cache._project_imports(
+        result_cache._module_of(ImprovedDisassembler))}
+    # Bağımlı modülün kaynağı değişirse birleşik sürüm de değişir
+    saved = result_cache._engine_versions["opcode_decoder"]
+    result_cache._engine_versions["opcode_decoder"] = "degisti"
+    try:
+        assert engines_version(ImprovedDisassembler) != version
+    finally:
+        result_cache._engine_versions["opcode_decoder"] = saved
+
+
+if __name__ == "__main__":
+    test_key_depends_on_every_component()
+    test_get_put_and_get_or_compute()
+    test_lru_eviction_by_entry_count()
+    test_engines_version_follows_project_imports()
+    print("✓ result_cache testleri başarılı")
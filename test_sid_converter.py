@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SID converter testi - imza indeksi, init/play hesaplama ve PSID v2 başlığı
+"""
+
+import os
+import tempfile
+
+from sid_converter import (PSID_V2_DATA_OFFSET, SIDConverter, build_psid_header,
+                           find_sid_tunes, parse_psid_header, sid_write_sites)
+
+# $1000: JMP $1006 / JMP $1012
+#  init: LDA #$0F / STA $D418 / LDA #$00 / STA $D404 / RTS / NOP
+#  play: LDA #$21 / STA $D404 / STA $D400,X / RTS / LDA #$8D / ORA ($D4,X)
+PLAYER = bytes([
+    0x4C, 0x06, 0x10, 0x4C, 0x12, 0x10,
+    0xA9, 0x0F, 0x8D, 0x18, 0xD4, 0xA9, 0x00, 0x8D, 0x04, 0xD4, 0x60, 0xEA,
+    0xA9, 0x21, 0x8D, 0x04, 0xD4, 0x9D, 0x00, 0xD4, 0x60, 0xA9, 0x8D, 0x01, 0xD4,
+])
+PRG = b"\x00\x10" + PLAYER
+
+
+def test_write_sites_are_instruction_aligned():
+    sites = sid_write_sites(PLAYER, 0x1000)
+    assert sites == [(0x1008, 0xD418), (0x100D, 0xD404), (0x1014, 0xD404), (0x1017, 0xD400)]
+    assert sid_write_sites(PLAYER[:16], 0x1000) == []
+
+
+def test_detect_player_and_write_psid():
+    tunes = find_sid_tunes(PRG, "TUNE")
+    assert len(tunes) == 1
+    tune = tunes[0]
+    assert (tune.load_address, tune.init_address, tune.play_address) == (0x1000, 0x1000, 0x1003)
+    assert tune.registers == (0xD400, 0xD404, 0xD418) and not tune.embedded
+    assert find_sid_tunes(b"\x00\x10" + bytes(200)) == []
+
+    psid = tune.to_psid()
+    header = parse_psid_header(psid)
+    assert (header['magic'], header['version'], header['data_offset']) == ("PSID", 2, 0x7C)
+    assert (header['init_address'], header['play_address'], header['name']) == (0x1000, 0x1003, "TUNE")
+    assert psid[PSID_V2_DATA_OFFSET:] == PRG
+
+    # PRG içine gömülü PSID dosyası aynen geri okunur
+    embedded = find_sid_tunes(b"\x00\x08" + bytes(50) + psid)
+    assert len(embedded) == 1 and embedded[0].embedded and embedded[0].source_offset == 52
+    assert embedded[0].to_psid() == psid
+
+
+def test_converter_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        prg_path = os.path.join(tmp, "song.prg")
+        with open(prg_path, "wb") as f:
+            f.write(PRG)
+        converter = SIDConverter(os.path.join(tmp, "sid"))
+        assert converter.convert_prg_sid(prg_path)
+        with open(os.path.join(tmp, "sid", "song.sid"), "rb") as f:
+            assert parse_psid_header(f.read())['play_address'] == 0x1003
+        analysis = converter.analyze_sid(PRG)
+        assert analysis['sid_found'] and analysis['init_address'] == 0x1000
+        assert not converter.analyze_sid(bytes(10))['sid_found']
+    assert len(build_psid_header(0, 0x1000, 0x1003)) == PSID_V2_DATA_OFFSET
+
+
+if __name__ == "__main__":
+    test_write_sites_are_instruction_aligned()
+    test_detect_player_and_write_psid()
+    test_converter_files()
+    print("✓ SID converter testleri başarılı")
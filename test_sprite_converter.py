@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sprite converter testi - tek geçişli aday puanlama, VIC blok hizalama ve piksel çözme
+"""
+
+from sprite_converter import (SPRITE_SIZE, SpriteConverter, is_sprite_score, score_offsets,
+                              sprite_pixels, sprite_sheet_pixels)
+
+
+def _sprite(fill):
+    return bytes([fill] * 3) * 7 + bytes(SPRITE_SIZE - 21)
+
+
+def test_score_matches_per_candidate_check():
+    converter = SpriteConverter()
+    data = bytes(10) + _sprite(0x3C) + bytes([0xFF] * 70) + _sprite(0x81) + bytes(40)
+    offsets = range(0, len(data) - SPRITE_SIZE + 1)
+    nonzero, full = score_offsets(data, offsets, use_numpy=False)
+    for offset, count, full_count in zip(offsets, nonzero, full):
+        window = data[offset:offset + SPRITE_SIZE]
+        assert is_sprite_score(count, full_count) == converter.is_valid_sprite_data(window)
+
+
+def test_analyze_reports_vic_blocks():
+    # $0FF6 yüklenir: code_data[10] = $1000 -> bank 0, pointer 64
+    prg = bytes([0xF6, 0x0F]) + bytes(10) + _sprite(0x3C) + bytes(SPRITE_SIZE)
+    analysis = SpriteConverter().analyze_sprites(prg)
+    assert analysis['total_sprites'] == 2 and analysis['valid_sprites'] == 1
+    assert analysis['sprite_locations'][0]['offset'] == 2
+    block = analysis['vic_block_locations'][0]
+    assert (block['address'], block['offset'], block['bank'], block['pointer']) == (0x1000, 12, 0, 64)
+    assert block['data_density'] == 21 / SPRITE_SIZE
+    assert SpriteConverter().analyze_sprites(b"\x01")['vic_block_locations'] == []
+
+
+def test_sprite_pixels():
+    data = bytes([0b10000000, 0, 0b00000001]) + bytes(60)
+    hires = [list(row) for row in sprite_pixels(data)]
+    assert len(hires) == 21 and len(hires[0]) == 24
+    assert hires[0][0] == 1 and hires[0][23] == 1 and sum(hires[0]) == 2 and sum(hires[1]) == 0
+
+    # 01 10 11 00 -> MC0, sprite rengi, MC1, arka plan (her biri 2 piksel)
+    multi = [list(row) for row in sprite_pixels(bytes([0b01101100, 0, 0]) + bytes(60), True)]
+    assert multi[0][:8] == [1, 1, 2, 2, 3, 3, 0, 0]
+
+    height, width, grid = sprite_sheet_pixels([hires, hires, hires], columns=2)
+    assert (height, width) == (43, 49)
+    rows = [list(row) for row in grid]
+    assert rows[0][25] == rows[22][0] == 1 and rows[22][25] == 0
+
+
+if __name__ == "__main__":
+    test_score_matches_per_candidate_check()
+    test_analyze_reports_vic_blocks()
+    test_sprite_pixels()
+    print("✓ Sprite converter testleri başarılı")
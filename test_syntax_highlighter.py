@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Syntax highlighter testi - birleşik regex tokenizer'lar ve artımlı satır önbelleği
+(Tk penceresi gerektirmez)
+"""
+
+from syntax_highlighter import AsmTokenizer, BasicTokenizer, LineTokenCache, SyntaxHighlighter
+
+
+def _tags(tokens, line):
+    return [(tag, line[start:end]) for tag, start, end in tokens]
+
+
+def test_asm_tokenizer():
+    tokenizer = AsmTokenizer()
+    line = 'LOOP: LDA #$05 ; Load X'
+    assert _tags(tokenizer.tokenize_line(line), line) == [
+        ('label', 'LOOP:'), ('opcode', 'LDA'), ('hex', '#$05'), ('comment', '; Load X')]
+    line = '  STA $D020,X  .text "A B" 42 $1234 .pc'
+    assert _tags(tokenizer.tokenize_line(line), line) == [
+        ('opcode', 'STA'), ('directive', '.text'), ('string', '"A B"'),
+        ('number', '42'), ('hex', '$1234'), ('directive', '.pc')]
+    assert _tags(tokenizer.tokenize_line('STA $D020 X'), 'STA $D020 X')[1:] == [
+        ('memory', '$D020'), ('register', 'X')]
+    assert tokenizer.tokenize_line('') == []
+
+
+def test_basic_tokenizer():
+    tokenizer = BasicTokenizer()
+    line = '10 PRINT CHR$(147);"REM";LEN(A$):REM HI 5'
+    assert _tags(tokenizer.tokenize_line(line), line) == [
+        ('line_number', '10'), ('basic_keyword', 'PRINT'), ('basic_keyword', 'CHR$'),
+        ('basic_number', '147'), ('basic_string', '"REM"'), ('basic_keyword', 'LEN'),
+        ('basic_comment', 'REM HI 5')]
+    line = '20 X=FRE(0)+1.5'
+    assert _tags(tokenizer.tokenize_line(line), line) == [
+        ('line_number', '20'), ('basic_function', 'FRE'), ('basic_number', '0'),
+        ('basic_number', '1.5')]
+
+
+def test_line_cache_retokenizes_only_edited_range():
+    calls = []
+
+    def tokenize(line):
+        calls.append(line)
+        return [('t', 0, len(line))]
+
+    cache = LineTokenCache(tokenize)
+    lines = [f"LDA ${i:02X}" for i in range(1000)]
+    assert cache.update(lines) == (0, 0, 1000)
+    assert len(calls) == 1000
+
+    calls.clear()
+    edited = lines[:500] + ["NOP", "NOP"] + lines[501:]
+    assert cache.update(edited) == (500, 501, 502)
+    assert calls == ["NOP", "NOP"]
+    assert len(cache) == 1001 and cache.tokens[501] == [('t', 0, 3)]
+    assert cache.tokens[1000] == [('t', 0, len(lines[999]))]
+
+    calls.clear()
+    first, old_end, new_end = cache.update(edited)
+    assert first == old_end == new_end and calls == []
+
+    assert cache.update(edited[:10]) == (10, 1001, 10)
+    assert len(cache.tokens) == 10
+
+
+class _FakeText:
+    """after_idle kuyruğu ve modified bayrağı olan Tk'siz Text yerine geçen nesne"""
+
+    def __init__(self):
+        self.modified = False
+        self.idle = {}
+        self.next_id = 0
+
+    def edit_modified(self, flag=None):
+        if flag is None:
+            return self.modified
+        self.modified = flag
+
+    def after_idle(self, callback, *args):
+        self.next_id += 1
+        self.idle[self.next_id] = (callback, args)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        del self.idle[after_id]
+
+    def run_idle(self):
+        pending, self.idle = self.idle, {}
+        for callback, args in pending.values():
+            callback(*args)
+
+
+class _RecordingHighlighter(SyntaxHighlighter):
+    def __init__(self, widget):
+        self.calls = []
+        super().__init__(widget, auto_bind=False)
+
+    def highlight(self, start="1.0", end="end"):
+        self.calls.append("highlight")
+
+    def update_viewport(self):
+        self.calls.append("viewport")
+
+
+def test_edit_sync_survives_viewport_refreshes():
+    widget = _FakeText()
+    highlighter = _RecordingHighlighter(widget)
+    for _ in range(2):  # her düzenleme yeniden <<Modified>> üretebilmeli
+        widget.modified = True
+        highlighter._schedule_highlight(event=object())
+        highlighter._schedule_viewport()  # KeyRelease/Configure bekleyen senkronu iptal etmez
+        widget.run_idle()
+        assert highlighter.calls == ["highlight"] and widget.modified is False
+        highlighter.calls.clear()
+        highlighter._schedule_highlight(event=object())  # sıfırlamanın ürettiği olay
+        assert widget.idle == {}
+
+    highlighter._schedule_viewport()
+    highlighter._schedule_viewport()
+    widget.run_idle()
+    assert highlighter.calls == ["viewport"]
+
+
+if __name__ == "__main__":
+    test_asm_tokenizer()
+    test_basic_tokenizer()
+    test_line_cache_retokenizes_only_edited_range()
+    test_edit_sync_survives_viewport_refreshes()
+    print("✓ Syntax highlighter testleri başarılı")
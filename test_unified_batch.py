@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unified batch decompile testi - tek decode/analiz, paylaşılan IR
+"""
+
+import os
+import tempfile
+
+from improved_disassembler import ImprovedDisassembler
+from result_cache import ResultCache
+from unified_decompiler import UnifiedDecompiler, batch_decompile
+
+# $0801: LDX #$00 / loop: STA $D020 / INX / BNE loop / JSR $FFD2 / RTS
+PRG = bytes([0x01, 0x08,
+             0xA2, 0x00, 0x8D, 0x20, 0xD0, 0xE8, 0xD0, 0xFA, 0x20, 0xD2, 0xFF, 0x60])
+
+
+def test_ir_emitters_match_standalone_disassembler():
+    """Paylaşılan sweep ile üretilen çıktı tek başına disassembly ile aynı"""
+    builder = UnifiedDecompiler('asm', use_cache=False)
+    prg_bytes, start_addr = builder._preprocess_input(PRG, None)
+    ir = builder.build_ir(prg_bytes, start_addr, include_records=True)
+    assert ir.code_analysis is not None
+    assert ir.records[0] == (0x0801, 0xA2, 0x00, 2)
+
+    for fmt in ('asm', 'c', 'qbasic', 'pdsx'):
+        decompiler = UnifiedDecompiler(fmt, use_cache=False)
+        output = decompiler.decompile_ir(ir)
+        standalone = ImprovedDisassembler(start_addr, prg_bytes)
+        standalone.output_format = fmt
+        expected = decompiler._post_process_output(standalone.disassemble_to_format(prg_bytes))
+        assert output == expected
+        assert decompiler.get_code_analysis() is ir.code_analysis
+
+
+def test_shared_batch_matches_per_format_batch():
+    """Paylaşılan, paralel ve format başına mod aynı sonucu vermeli"""
+    with tempfile.TemporaryDirectory() as tmp:
+        formats = ['asm', 'c', 'qbasic', 'pdsx']
+        separate = batch_decompile(PRG, formats, result_cache=ResultCache(os.path.join(tmp, "a.db")),
+                                   shared_analysis=False)
+        shared = batch_decompile(PRG, formats, result_cache=ResultCache(os.path.join(tmp, "b.db")))
+        threaded = batch_decompile(PRG, formats + ['cpp'],
+                                   result_cache=ResultCache(os.path.join(tmp, "c.db")), parallel=True)
+        assert list(shared) == formats
+        assert shared == separate
+        assert {fmt: threaded[fmt] for fmt in formats} == shared
+        assert 'cpp' in threaded
+
+
+def test_shared_batch_uses_cache_before_analysis():
+    """Tüm formatlar önbellekteyse decode/analiz yapılmamalı"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResultCache(os.path.join(tmp, "cache.db"))
+        for fmt in ('asm', 'c'):
+            decompiler = UnifiedDecompiler(fmt, result_cache=cache)
+            prg_bytes, start_addr = decompiler._preprocess_input(PRG, None)
+            cache_key, cached = decompiler._lookup_cache(prg_bytes, start_addr, 'standard', True)
+            assert cached is None
+            cache.put(cache_key, f"önbellek {fmt}")
+
+        assert batch_decompile(PRG, ['asm', 'c', 'pseudocode'], result_cache=cache) == {
+            'asm': "önbellek asm", 'c': "önbellek c"}
+        cache.close()
+
+
+if __name__ == "__main__":
+    test_ir_emitters_match_standalone_disassembler()
+    test_shared_batch_matches_per_format_batch()
+    test_shared_batch_uses_cache_before_analysis()
+    print("✓ Unified batch decompile testleri başarılı")
@@ -25,14 +25,36 @@ unified = UnifiedDecompiler('c')  # Target format
 result = unified.decompile(prg_data, options={'enhanced_memory': True})
 """
 
+import importlib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Union, Any
 
 # Import our enhanced components
 from enhanced_c64_memory_manager import EnhancedC64MemoryManager
 from improved_disassembler import ImprovedDisassembler
 from code_analyzer import CodeAnalyzer, AnalysisResult
+from result_cache import ResultCache, get_default_cache, engines_version
+import linear_sweep
+
+
+@dataclass
+class DecompileIR:
+    """
+    Tek PRG için paylaşılan ara temsil (IR)
+    
+    Instruction sınırları ve code pattern analizi bir kez hesaplanır,
+    tüm format emitter'ları aynı IR üzerinden çalışır.
+    """
+    prg_bytes: bytes
+    start_address: int
+    sweep: linear_sweep.SweepResult
+    code_analyzer: Optional[CodeAnalyzer] = None
+    code_analysis: Optional[AnalysisResult] = None
+    records: Optional[List[tuple]] = None  # (adres, opcode, operand, mod) - kayıt tabanlı emitter'lar için
+
 
 class UnifiedDecompiler:
     """
@@ -75,12 +97,15 @@ class UnifiedDecompiler:
         }
     }
     
-    def __init__(self, target_format: str = 'c', **options):
+    def __init__(self, target_format: str = 'c', result_cache: Optional[ResultCache] = None,
+                 use_cache: bool = True, **options):
         """
         UnifiedDecompiler başlatma
         
         Args:
             target_format: Hedef format ('asm', 'c', 'qbasic', 'pdsx', 'pseudocode')
+            result_cache: Kullanılacak ResultCache (None ise varsayılan logs/result_cache.db)
+            use_cache: False ise önbellek hiç kullanılmaz
             **options: Format-specific seçenekler
         """
         if target_format not in self.SUPPORTED_FORMATS:
@@ -98,6 +123,10 @@ class UnifiedDecompiler:
         self.analysis_results = {}
         self.last_decompile_stats = {}
         self.last_code_analysis = None
+        self.last_cache_hit = False
+        
+        # Content-addressed result cache
+        self.result_cache = (result_cache or get_default_cache()) if use_cache else None
         
         print(f"🎯 UnifiedDecompiler başlatıldı - Target: {target_format.upper()}")
     
@@ -150,44 +179,19 @@ class UnifiedDecompiler:
         
         prg_bytes, start_addr = processed_data
         
+        # Result cache kontrolü - aynı PRG/format/seçenek daha önce işlendiyse tekrar çalıştırma
+        cache_key, cached = self._lookup_cache(prg_bytes, start_addr, analysis_level, enable_code_analysis)
+        if cached is not None:
+            return cached
+        
         # Components başlatma
         if not self.memory_manager:
             if not self.initialize_components():
                 return "❌ HATA: Component başlatma başarısız"
         
         try:
-            # Enhanced Disassembler oluştur
-            print(f"🔧 Disassembler başlatılıyor - Start: ${start_addr:04X}")
-            self.disassembler = ImprovedDisassembler(start_addr, prg_bytes)
-            self.disassembler.output_format = self.target_format
-            
-            # Enhanced memory integration
-            if hasattr(self.disassembler, 'enhanced_memory'):
-                self.disassembler.enhanced_memory = True
-                print("   ✅ Enhanced Memory integration aktif")
-            
-            # Code analysis (if enabled)
-            if enable_code_analysis and analysis_level in ['standard', 'advanced']:
-                print("🔍 Code pattern analysis başlıyor...")
-                try:
-                    self.code_analyzer = CodeAnalyzer(prg_bytes, start_addr)
-                    self.last_code_analysis = self.code_analyzer.analyze_all_patterns()
-                    print(f"   ✅ {len(self.last_code_analysis.patterns)} pattern tespit edildi")
-                except Exception as e:
-                    print(f"   ⚠️ Code analysis kısmi başarı: {e}")
-            
-            # Decompile işlemi
-            print(f"🚀 Decompile başlıyor - Format: {self.target_format.upper()}")
-            result = self.disassembler.disassemble_to_format(prg_bytes)
-            
-            # Post-processing (with code analysis enhancement)
-            final_result = self._post_process_output(result)
-            
-            # İstatistikleri güncelle
-            self._update_stats(prg_bytes, result)
-            
-            print(f"✅ Decompile tamamlandı - {len(final_result)} karakter")
-            return final_result
+            ir = self.build_ir(prg_bytes, start_addr, analysis_level, enable_code_analysis)
+            return self.decompile_ir(ir, cache_key)
             
         except Exception as e:
             error_msg = f"❌ DECOMPILE HATASI: {str(e)}"
@@ -196,6 +200,104 @@ class UnifiedDecompiler:
             print(f"TRACEBACK:\n{traceback.format_exc()}")
             return error_msg
     
+    def _lookup_cache(self, prg_bytes: bytes, start_addr: int,
+                      analysis_level: str, enable_code_analysis: bool):
+        """Cache anahtarını üret ve önbellekteki sonucu döndür
+
+        Returns:
+            (cache_key, cached) - cache kapalıysa (None, None), isabet yoksa cached None
+        """
+        self.last_cache_hit = False
+        if not self.result_cache:
+            return None, None
+        cache_key = self.result_cache.make_key(
+            start_addr.to_bytes(2, 'little') + bytes(prg_bytes),
+            engine='unified',
+            output_format=self.target_format,
+            options={
+                'options': self.options,
+                'analysis_level': analysis_level,
+                'enable_code_analysis': enable_code_analysis,
+            },
+            tool_version=engines_version(ImprovedDisassembler, sys.modules[__name__]))
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            self.last_cache_hit = True
+            self._update_stats(prg_bytes, cached)
+            print(f"♻️ Result cache isabeti - {len(cached)} karakter")
+        return cache_key, cached
+    
+    def build_ir(self, prg_bytes: bytes, start_addr: int,
+                 analysis_level: str = 'standard',
+                 enable_code_analysis: bool = True,
+                 include_records: bool = False) -> DecompileIR:
+        """
+        Decode ve code analysis'i bir kez yapıp paylaşılan IR'ı üret
+        
+        Args:
+            prg_bytes: _preprocess_input sonrası code data
+            start_addr: Başlangıç adresi
+            analysis_level: Analiz seviyesi ('basic', 'standard', 'advanced')
+            enable_code_analysis: Code pattern analysis aktif et
+            include_records: Kayıt tabanlı emitter'lar (C++) için instruction kayıtları
+        """
+        # Instruction sınırları - ImprovedDisassembler.disassemble_to_format ile aynı bölme
+        sweep_start, code_data = ImprovedDisassembler.split_prg(prg_bytes, start_addr)
+        ir = DecompileIR(prg_bytes, start_addr, linear_sweep.sweep(code_data, sweep_start))
+        
+        # Code analysis (if enabled)
+        if enable_code_analysis and analysis_level in ['standard', 'advanced']:
+            print("🔍 Code pattern analysis başlıyor...")
+            try:
+                ir.code_analyzer = CodeAnalyzer(prg_bytes, start_addr)
+                ir.code_analysis = ir.code_analyzer.analyze_all_patterns()
+                print(f"   ✅ {len(ir.code_analysis.patterns)} pattern tespit edildi")
+            except Exception as e:
+                print(f"   ⚠️ Code analysis kısmi başarı: {e}")
+        
+        if include_records:
+            ir.records = list(linear_sweep.sweep(prg_bytes, start_addr).records())
+        
+        return ir
+    
+    def decompile_ir(self, ir: DecompileIR, cache_key: Optional[str] = None) -> str:
+        """
+        Paylaşılan IR'dan target format çıktısını üret
+        
+        Args:
+            ir: build_ir sonucu
+            cache_key: Verilirse başarılı sonuç result cache'e yazılır
+        """
+        self.code_analyzer = ir.code_analyzer
+        self.last_code_analysis = ir.code_analysis
+        
+        # Enhanced Disassembler oluştur
+        print(f"🔧 Disassembler başlatılıyor - Start: ${ir.start_address:04X}")
+        self.disassembler = ImprovedDisassembler(ir.start_address, ir.prg_bytes)
+        self.disassembler.output_format = self.target_format
+        
+        # Enhanced memory integration
+        if hasattr(self.disassembler, 'enhanced_memory'):
+            self.disassembler.enhanced_memory = True
+            print("   ✅ Enhanced Memory integration aktif")
+        
+        # Decompile işlemi
+        print(f"🚀 Decompile başlıyor - Format: {self.target_format.upper()}")
+        result = self.disassembler.disassemble_to_format(ir.prg_bytes, sweep_result=ir.sweep)
+        
+        # Post-processing (with code analysis enhancement)
+        final_result = self._post_process_output(result)
+        
+        # İstatistikleri güncelle
+        self._update_stats(ir.prg_bytes, result)
+        
+        # Başarılı sonucu önbelleğe yaz
+        if cache_key and final_result:
+            self.result_cache.put(cache_key, final_result)
+        
+        print(f"✅ Decompile tamamlandı - {len(final_result)} karakter")
+        return final_result
+    
     def _preprocess_input(self, prg_data: Union[bytes, str], start_address: Optional[int]):
         """Input data'yı preprocess et"""
         
@@ -299,7 +401,8 @@ class UnifiedDecompiler:
             'output_lines': len(output.split('\n')),
             'target_format': self.target_format,
             'memory_manager_active': self.memory_manager is not None,
-            'enhanced_features': getattr(self.disassembler, 'enhanced_memory', False)
+            'enhanced_features': getattr(self.disassembler, 'enhanced_memory', False),
+            'cache_hit': self.last_cache_hit
         }
     
     def get_code_analysis(self) -> Optional[AnalysisResult]:
@@ -381,34 +484,132 @@ def quick_decompile(prg_data: Union[bytes, str],
     return decompiler.decompile(prg_data, start_address)
 
 
+# UnifiedDecompiler dışındaki, instruction kayıtlarıyla çalışan emitter'lar
+RECORD_EMITTERS = {
+    'cpp': 'decompiler_cpp',
+}
+
+
 def batch_decompile(prg_data: Union[bytes, str], 
                    formats: List[str] = None, 
-                   start_address: Optional[int] = None) -> Dict[str, str]:
+                   start_address: Optional[int] = None,
+                   result_cache: Optional[ResultCache] = None,
+                   shared_analysis: bool = True,
+                   parallel: bool = False,
+                   max_workers: Optional[int] = None) -> Dict[str, str]:
     """
     Birden fazla formatta decompile
     
+    shared_analysis açıkken component'ler, instruction decode ve code
+    analysis tek sefer yapılır; her format emitter'ı aynı DecompileIR
+    üzerinde çalışır. Kapalıysa her format için ayrı UnifiedDecompiler
+    baştan çalıştırılır.
+    
     Args:
         prg_data: PRG data
-        formats: Format listesi (None ise tümü)
+        formats: Format listesi (None ise tümü; RECORD_EMITTERS formatları da kabul edilir)
         start_address: Start address (optional)
+        result_cache: Paylaşılan ResultCache (None ise varsayılan)
+        shared_analysis: Decode/analiz sonucunu formatlar arasında paylaş
+        parallel: Emitter'ları thread havuzunda çalıştır (shared_analysis gerekir)
+        max_workers: Thread sayısı (None ise format sayısı)
     
     Returns:
         Format → result dictionary
     """
     if formats is None:
         formats = UnifiedDecompiler.SUPPORTED_FORMATS
+    formats = [fmt for fmt in formats if fmt != 'pseudocode']  # Skip unimplemented
+    
+    result_cache = result_cache or get_default_cache()
+    if not shared_analysis:
+        results = {}
+        for fmt in formats:
+            try:
+                decompiler = UnifiedDecompiler(fmt, result_cache=result_cache)
+                results[fmt] = decompiler.decompile(prg_data, start_address)
+            except Exception as e:
+                results[fmt] = f"❌ HATA: {str(e)}"
+        return results
+    
+    return _batch_decompile_shared(prg_data, formats, start_address, result_cache,
+                                   parallel, max_workers)
+
+
+def _record_emitter_key(result_cache: ResultCache, fmt: str, prg_bytes: bytes, start_addr: int):
+    """RECORD_EMITTERS formatı için cache anahtarı"""
+    module = importlib.import_module(RECORD_EMITTERS[fmt])
+    return result_cache.make_key(
+        start_addr.to_bytes(2, 'little') + bytes(prg_bytes),
+        engine=RECORD_EMITTERS[fmt],
+        output_format=fmt,
+        tool_version=engines_version(module))
+
+
+def _batch_decompile_shared(prg_data, formats, start_address, result_cache,
+                            parallel, max_workers) -> Dict[str, str]:
+    """Tek decode + tek analiz, ardından format başına emitter"""
+    # Input ve component'ler bir kez hazırlanır, tüm emitter'lar paylaşır
+    shared = UnifiedDecompiler('asm', use_cache=False)
+    processed_data = shared._preprocess_input(prg_data, start_address)
+    if not processed_data:
+        return {fmt: "❌ HATA: Geçersiz input data" for fmt in formats}
+    prg_bytes, start_addr = processed_data
     
     results = {}
+    decompilers = {}
+    pending = {}  # format → cache_key (önbellekte olmayanlar)
     for fmt in formats:
-        if fmt == 'pseudocode':  # Skip unimplemented
-            continue
         try:
-            decompiler = UnifiedDecompiler(fmt)
-            results[fmt] = decompiler.decompile(prg_data, start_address)
+            if fmt in RECORD_EMITTERS:
+                cache_key = cached = None
+                if result_cache:
+                    cache_key = _record_emitter_key(result_cache, fmt, prg_bytes, start_addr)
+                    cached = result_cache.get(cache_key)
+            else:
+                decompiler = UnifiedDecompiler(fmt, result_cache=result_cache)
+                cache_key, cached = decompiler._lookup_cache(prg_bytes, start_addr, 'standard', True)
+                decompilers[fmt] = decompiler
         except Exception as e:
             results[fmt] = f"❌ HATA: {str(e)}"
+            continue
+        if cached is not None:
+            results[fmt] = cached
+        else:
+            pending[fmt] = cache_key
+    
+    if pending:
+        if not shared.initialize_components():
+            results.update((fmt, "❌ HATA: Component başlatma başarısız") for fmt in pending)
+            pending = {}
+    
+    if pending:
+        ir = shared.build_ir(prg_bytes, start_addr,
+                             include_records=any(fmt in RECORD_EMITTERS for fmt in pending))
+        
+        def emit(fmt):
+            try:
+                if fmt in RECORD_EMITTERS:
+                    module = importlib.import_module(RECORD_EMITTERS[fmt])
+                    output = module.Decompiler.from_instructions(ir.records).decompile()
+                    if pending[fmt] and output:
+                        result_cache.put(pending[fmt], output)
+                    return output
+                decompiler = decompilers[fmt]
+                decompiler.memory_manager = shared.memory_manager
+                return decompiler.decompile_ir(ir, pending[fmt])
+            except Exception as e:
+                error_msg = f"❌ DECOMPILE HATASI: {str(e)}"
+                print(error_msg)
+                return error_msg
+        
+        if parallel and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers or len(pending)) as executor:
+                results.update(zip(pending, executor.map(emit, pending)))
+        else:
+            results.update((fmt, emit(fmt)) for fmt in pending)
     
-    return results
+    return {fmt: results[fmt] for fmt in formats}
 
 
 if __name__ == "__main__":